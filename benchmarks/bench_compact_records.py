@@ -0,0 +1,95 @@
+"""Benchmark compact records against dict-backed resource objects.
+
+Builds ``Log`` objects and compact ``Log`` records from the same rows and
+reports construction time, property-access time and the memory retained
+by the resulting list (tracemalloc).
+
+Usage:
+    python benchmarks/bench_compact_records.py
+    python benchmarks/bench_compact_records.py --rows 100000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+from pyvergeos.records import compact_factory
+from pyvergeos.resources.logs import Log
+
+
+def log_rows(count: int) -> list[dict[str, Any]]:
+    """Synthetic rows shaped like the ``logs`` table."""
+    return [
+        {
+            "$key": i,
+            "level": "message" if i % 7 else "warning",
+            "text": f"VM 'web-{i % 250:03d}' snapshot completed in {i % 90} seconds",
+            "timestamp": 1_700_000_000_000_000 + i * 1_000,
+            "user": "admin",
+            "object_type": "vm",
+            "object_name": f"web-{i % 250:03d}",
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def retained(build: Callable[[], list[Any]]) -> int:
+    """Return the bytes still allocated by the list ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000, help="records to build")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions")
+    args = parser.parse_args()
+
+    manager = MagicMock()
+    make_compact = compact_factory(Log)
+    builders: dict[str, Callable[[list[dict[str, Any]]], list[Any]]] = {
+        "Log (dict)": lambda rows: [Log(row, manager) for row in rows],
+        "compact Log": lambda rows: [make_compact(row) for row in rows],
+    }
+
+    print(f"{args.rows} log records")
+    print(f"{'model':<14}{'build':>10}{'access':>10}{'retained':>12}{'per record':>12}")
+    for label, build in builders.items():
+        # Rows are decoded fresh for every build, as they would be per request
+        memory = retained(lambda build=build: build(log_rows(args.rows)))
+        rows = log_rows(args.rows)
+        build_time = best_of(lambda build=build, rows=rows: build(rows), args.repeat)
+        objects = build(rows)
+        access_time = best_of(
+            lambda objects=objects: [(o.level_display, o["text"], o.key) for o in objects],
+            args.repeat,
+        )
+        print(
+            f"{label:<14}{build_time * 1e3:>8.1f}ms{access_time * 1e3:>8.1f}ms"
+            f"{memory / 1e6:>10.1f}MB{memory / args.rows:>11.0f}B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the cost of importing pyvergeos.
+
+Each run imports the package in a fresh interpreter (``-X importtime``)
+and reports the best cumulative import time and the number of pyvergeos
+modules loaded. With ``--budget-ms`` the script exits non-zero when the
+best time exceeds the budget, so it can guard against regressions in CI.
+
+Usage:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --repeat 10 --budget-ms 250
+    python benchmarks/bench_import_time.py --statement "from pyvergeos.resources import BillingManager"
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+#: Checkout whose pyvergeos is imported when it is not installed
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+#: One line of ``-X importtime`` output: self us | cumulative us | module
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """Run ``statement`` in a fresh interpreter.
+
+    Returns:
+        (seconds spent importing, pyvergeos modules loaded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = int(match[2]), match[3], match[4]
+        if len(indent) == 1:
+            # Top-level imports; nested ones are included in their parent
+            total_us += cumulative
+        if module.startswith("pyvergeos"):
+            modules.append(module)
+    return total_us / 1e6, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statement", default="import pyvergeos", help="code to time")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters to run")
+    parser.add_argument("--budget-ms", type=float, help="fail if the best time exceeds this")
+    args = parser.parse_args()
+
+    # site and the interpreter's own startup imports are measured too;
+    # subtract an empty run to isolate the statement.
+    baseline = min(measure("pass")[0] for _ in range(args.repeat))
+    runs = [measure(args.statement) for _ in range(args.repeat)]
+    best = min(seconds for seconds, _ in runs) - baseline
+    modules = runs[0][1]
+    resources = [m for m in modules if m.startswith("pyvergeos.resources.")]
+
+    print(f"statement: {args.statement}")
+    print(f"best import time: {best * 1e3:.1f}ms (of {args.repeat} runs)")
+    print(f"pyvergeos modules loaded: {len(modules)} ({len(resources)} resource modules)")
+
+    if args.budget_ms is not None and best * 1e3 > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f}ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
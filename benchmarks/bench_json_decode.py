@@ -0,0 +1,104 @@
+"""Benchmark JSON decoding of large API responses.
+
+Compares the previous decode path (``response.text`` to test for an empty
+body, then ``response.json()``) against decoding ``response.content`` once
+with each installed backend (stdlib ``json``, ``orjson``, ``msgspec``).
+Both time and peak memory (tracemalloc) are reported.
+
+Usage:
+    python benchmarks/bench_json_decode.py
+    python benchmarks/bench_json_decode.py --rows 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import requests
+
+from pyvergeos import codec
+from pyvergeos.client import handle_response
+
+
+def log_rows(count: int) -> list[dict[str, Any]]:
+    """Synthetic rows shaped like the ``logs`` table."""
+    return [
+        {
+            "$key": i,
+            "level": "message" if i % 7 else "warning",
+            "text": f"VM 'web-{i % 250:03d}' snapshot completed in {i % 90} seconds",
+            "timestamp": 1_700_000_000_000_000 + i * 1_000,
+            "user": "admin",
+            "object_type": "vm",
+            "object_name": f"web-{i % 250:03d}",
+        }
+        for i in range(count)
+    ]
+
+
+def make_response(body: bytes) -> requests.Response:
+    """Build a fresh requests.Response holding ``body``."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+def text_then_json(response: requests.Response) -> Any:
+    """The decode path used before the single-decode change."""
+    if response.text:
+        return response.json()
+    return None
+
+
+def measure(fn: Callable[[requests.Response], Any], body: bytes, repeat: int) -> tuple[float, int]:
+    """Return (best seconds, peak bytes) for decoding ``body`` with ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        response = make_response(body)
+        start = time.perf_counter()
+        fn(response)
+        best = min(best, time.perf_counter() - start)
+
+    response = make_response(body)
+    tracemalloc.start()
+    fn(response)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="rows in the payload")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions")
+    args = parser.parse_args()
+
+    body = json.dumps(log_rows(args.rows)).encode()
+    print(f"payload: {args.rows} rows, {len(body) / 1e6:.1f} MB")
+    print(f"{'decode path':<28}{'best time':>12}{'peak memory':>14}{'speedup':>10}")
+
+    baseline, peak = measure(text_then_json, body, args.repeat)
+    print(f"{'text + json() (before)':<28}{baseline * 1e3:>10.1f}ms{peak / 1e6:>12.1f}MB{1:>9.1f}x")
+
+    for backend in codec.BACKENDS:
+        try:
+            codec.set_json_decoder(backend)
+        except ImportError:
+            print(f"{'content + ' + backend:<28}{'not installed':>12}")
+            continue
+        elapsed, peak = measure(handle_response, body, args.repeat)
+        label = f"content + {backend}"
+        print(
+            f"{label:<28}{elapsed * 1e3:>10.1f}ms{peak / 1e6:>12.1f}MB{baseline / elapsed:>9.1f}x"
+        )
+    codec.set_json_decoder(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Run the SDK hot-path benchmark suite and store the results.
+
+Covers filter construction, resource object creation and attribute access,
+response decoding, ``iter_all`` paging and file upload/download throughput
+against the in-process API emulator (``pyvergeos.emulator``), and import
+time. Every benchmark reports the best of ``--repeat`` runs.
+
+Results are written as JSON to ``benchmarks/results/<version>.json`` (or
+``--output``). ``--compare`` loads an earlier results file, prints the
+change for every benchmark both files contain and exits non-zero when any
+of them got slower by more than ``--threshold``, so the results of one
+release can gate the next. Timings are absolute: compare only results from
+the same host, recorded in each file (see ``benchmarks/README.md``).
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --rows 1000000 --only resource
+    python benchmarks/run_benchmarks.py --no-save --compare /tmp/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+#: Checkout the suite belongs to; importable without ``pip install -e .``
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import requests  # noqa: E402
+from bench_import_time import measure as measure_import  # noqa: E402
+
+from pyvergeos import __version__  # noqa: E402
+from pyvergeos.client import handle_response  # noqa: E402
+from pyvergeos.emulator import VergeEmulator  # noqa: E402
+from pyvergeos.filters import Filter, build_filter  # noqa: E402
+from pyvergeos.resources.base import ResourceObject  # noqa: E402
+
+#: Default location of stored results
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+@dataclass
+class Result:
+    """Best time of one benchmark, with the size of the work it did."""
+
+    name: str
+    seconds: float
+    params: dict[str, Any] = field(default_factory=dict)
+    #: Units of work per run (rows, calls or bytes), used for throughput
+    ops: int = 1
+    unit: str = "op"
+
+    @property
+    def rate(self) -> float:
+        """Units of work per second."""
+        return self.ops / self.seconds if self.seconds else float("inf")
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def vm_rows(count: int) -> list[dict[str, Any]]:
+    """Synthetic rows shaped like the ``vms`` table."""
+    return [
+        {
+            "$key": i,
+            "name": f"web-{i:06d}",
+            "description": "",
+            "machine": i + 1000,
+            "cpu_cores": 2 + i % 6,
+            "ram": 2048 * (1 + i % 4),
+            "os_family": "linux" if i % 5 else "windows",
+            "is_snapshot": False,
+            "created": 1_700_000_000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+# -- benchmarks -------------------------------------------------------------
+
+
+def bench_filter(args: argparse.Namespace) -> Iterator[Result]:
+    """Filter builder chains and ``build_filter`` keyword filters."""
+    calls = 10_000
+
+    def chains() -> None:
+        for i in range(calls):
+            str(
+                Filter()
+                .eq("status", "running")
+                .and_()
+                .like("name", f"web-{i}*")
+                .and_()
+                .in_("cluster", [1, 2, 3])
+            )
+
+    def keywords() -> None:
+        for i in range(calls):
+            build_filter(status="running", name=f"web-{i}*", cluster=[1, 2, 3], enabled=True)
+
+    yield Result("filter.chain", best_of(chains, args.repeat), {"calls": calls}, calls, "call")
+    yield Result(
+        "filter.build_filter", best_of(keywords, args.repeat), {"calls": calls}, calls, "call"
+    )
+
+
+def bench_resource(args: argparse.Namespace) -> Iterator[Result]:
+    """ResourceObject construction and attribute access."""
+    rows = vm_rows(args.rows)
+    manager = MagicMock()
+    params = {"rows": args.rows}
+
+    def build() -> list[ResourceObject]:
+        return [ResourceObject(row, manager) for row in rows]
+
+    objects = build()
+
+    def access() -> None:
+        for obj in objects:
+            obj.name, obj.cpu_cores, obj.key  # noqa: B018
+
+    yield Result("resource.create", best_of(build, args.repeat), params, args.rows, "row")
+    yield Result("resource.access", best_of(access, args.repeat), params, args.rows, "row")
+
+
+def bench_decode(args: argparse.Namespace) -> Iterator[Result]:
+    """``handle_response`` decoding a large list response."""
+    body = json.dumps(vm_rows(args.rows)).encode()
+
+    def decode() -> None:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        handle_response(response)
+
+    params = {"rows": args.rows, "bytes": len(body)}
+    yield Result("response.decode", best_of(decode, args.repeat), params, args.rows, "row")
+
+
+def bench_paging(args: argparse.Namespace) -> Iterator[Result]:
+    """``iter_all`` over the emulator, offset and keyset pagination."""
+    rows = min(args.rows, 100_000)
+    emulator = VergeEmulator()
+    emulator.populate("vms", rows, name=lambda i: f"web-{i:06d}", is_snapshot=False)
+    client = emulator.client()
+    params = {"rows": rows, "page_size": args.page_size}
+    try:
+        for label, keyset in (("offset", False), ("keyset", True)):
+            seconds = best_of(
+                lambda keyset=keyset: sum(
+                    1 for _ in client.vms.iter_all(page_size=args.page_size, keyset=keyset)
+                ),
+                args.repeat,
+            )
+            yield Result(f"iter_all.{label}", seconds, params, rows, "row")
+    finally:
+        client.disconnect()
+
+
+def bench_files(args: argparse.Namespace) -> Iterator[Result]:
+    """``FileManager.upload`` and ``download`` through the emulator."""
+    size = args.file_mb * 1024 * 1024
+    emulator = VergeEmulator()
+    client = emulator.client()
+    params = {"bytes": size}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "bench.img"
+            source.write_bytes(bytes(range(256)) * (size // 256))
+            uploaded: list[Any] = []
+            upload = best_of(lambda: uploaded.append(client.files.upload(source)), args.repeat)
+            target = Path(tmp) / "copy.img"
+            download = best_of(
+                lambda: client.files.download(uploaded[0].key, destination=target, overwrite=True),
+                args.repeat,
+            )
+    finally:
+        client.disconnect()
+    yield Result("files.upload", upload, params, size, "byte")
+    yield Result("files.download", download, params, size, "byte")
+
+
+def bench_import(args: argparse.Namespace) -> Iterator[Result]:
+    """``import pyvergeos`` in a fresh interpreter."""
+    baseline = min(measure_import("pass")[0] for _ in range(args.repeat))
+    best = min(measure_import("import pyvergeos")[0] for _ in range(args.repeat))
+    yield Result("import.pyvergeos", max(best - baseline, 0.0))
+
+
+#: Benchmark groups, selectable with ``--only``
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], Iterator[Result]]] = {
+    "filter": bench_filter,
+    "resource": bench_resource,
+    "decode": bench_decode,
+    "paging": bench_paging,
+    "files": bench_files,
+    "import": bench_import,
+}
+
+
+# -- storage and comparison -------------------------------------------------
+
+
+def host_details() -> dict[str, Any]:
+    """Describe the machine results were measured on."""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def save(results: list[Result], path: Path, args: argparse.Namespace) -> None:
+    """Write ``results`` and the environment they were measured in to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": __version__,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "host": host_details(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def compare(results: list[Result], path: Path, threshold: float) -> list[str]:
+    """Print the change against the results stored in ``path``.
+
+    Returns:
+        Names of benchmarks that got slower by more than ``threshold``.
+    """
+    stored = json.loads(path.read_text())
+    previous = {item["name"]: item for item in stored["results"]}
+    print(f"\ncompared with {stored['version']} ({path}):")
+    if (stored.get("python"), stored.get("host")) != (platform.python_version(), host_details()):
+        print(
+            "  warning: measured on a different host or Python version; timings are absolute, "
+            "so regenerate the baseline on this machine (see benchmarks/README.md)"
+        )
+    regressions = []
+    for result in results:
+        before = previous.get(result.name)
+        if before is None:
+            continue
+        if before["params"] != result.params:
+            print(f"  {result.name:<22}skipped (parameters differ)")
+            continue
+        change = result.seconds / before["seconds"] - 1 if before["seconds"] else 0.0
+        marker = ""
+        if change > threshold:
+            marker = "  REGRESSION"
+            regressions.append(result.name)
+        print(f"  {result.name:<22}{change:>+8.1%}{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="rows for row benchmarks")
+    parser.add_argument("--page-size", type=int, default=1000, help="iter_all page size")
+    parser.add_argument("--file-mb", type=int, default=16, help="file transfer size in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    parser.add_argument(
+        "--only", action="append", choices=sorted(BENCHMARKS), help="run only these groups"
+    )
+    parser.add_argument("--output", type=Path, help="results file to write")
+    parser.add_argument("--no-save", action="store_true", help="do not write results")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    args = parser.parse_args()
+
+    results: list[Result] = []
+    print(f"{'benchmark':<22}{'best':>12}{'throughput':>20}")
+    for name in args.only or BENCHMARKS:
+        for result in BENCHMARKS[name](args):
+            results.append(result)
+            print(
+                f"{result.name:<22}{result.seconds * 1e3:>10.1f}ms"
+                f"{result.rate:>14,.0f} {result.unit}/s"
+            )
+
+    if not args.no_save:
+        path = args.output or RESULTS_DIR / f"{__version__}.json"
+        save(results, path, args)
+        print(f"\nresults written to {path}")
+
+    if args.compare is not None:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"FAIL: {len(regressions)} benchmark(s) over the {args.threshold:.0%} threshold")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
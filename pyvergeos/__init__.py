@@ -1,5 +1,10 @@
 """pyvergeos - Python SDK for the VergeOS REST API v4."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pyvergeos.__version__ import __version__
 from pyvergeos.client import VergeClient
 from pyvergeos.connection import VergeConnection
@@ -16,6 +21,7 @@ from pyvergeos.constants import (
 from pyvergeos.exceptions import (
     APIError,
     AuthenticationError,
+    BulkOperationError,
     ConflictError,
     NotConnectedError,
     NotFoundError,
@@ -25,33 +31,80 @@ from pyvergeos.exceptions import (
     VergeConnectionError,
     VergeError,
     VergeTimeoutError,
+    WaitCancelledError,
 )
 from pyvergeos.filters import Filter, build_filter
-from pyvergeos.resources.groups import (
-    Group,
-    GroupManager,
-    GroupMember,
-    GroupMemberManager,
-)
-from pyvergeos.resources.tenant_nodes import TenantNode, TenantNodeManager
-from pyvergeos.resources.vm_imports import (
-    VmImport,
-    VmImportLog,
-    VmImportLogManager,
-    VmImportManager,
-)
-from pyvergeos.resources.volume_vm_exports import (
-    VolumeVmExport,
-    VolumeVmExportManager,
-    VolumeVmExportStat,
-    VolumeVmExportStatManager,
-)
+
+if TYPE_CHECKING:
+    from pyvergeos.async_client import AsyncVergeClient
+    from pyvergeos.resources.groups import (
+        Group,
+        GroupManager,
+        GroupMember,
+        GroupMemberManager,
+    )
+    from pyvergeos.resources.tenant_nodes import TenantNode, TenantNodeManager
+    from pyvergeos.resources.vm_imports import (
+        VmImport,
+        VmImportLog,
+        VmImportLogManager,
+        VmImportManager,
+    )
+    from pyvergeos.resources.volume_vm_exports import (
+        VolumeVmExport,
+        VolumeVmExportManager,
+        VolumeVmExportStat,
+        VolumeVmExportStatManager,
+    )
+
+#: Names imported on first access, by the module that defines them. The
+#: async client pulls in asyncio and httpx; resource models load their
+#: whole module.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AsyncVergeClient": "pyvergeos.async_client",
+    "Group": "pyvergeos.resources.groups",
+    "GroupManager": "pyvergeos.resources.groups",
+    "GroupMember": "pyvergeos.resources.groups",
+    "GroupMemberManager": "pyvergeos.resources.groups",
+    "TenantNode": "pyvergeos.resources.tenant_nodes",
+    "TenantNodeManager": "pyvergeos.resources.tenant_nodes",
+    "VmImport": "pyvergeos.resources.vm_imports",
+    "VmImportLog": "pyvergeos.resources.vm_imports",
+    "VmImportLogManager": "pyvergeos.resources.vm_imports",
+    "VmImportManager": "pyvergeos.resources.vm_imports",
+    "VolumeVmExport": "pyvergeos.resources.volume_vm_exports",
+    "VolumeVmExportManager": "pyvergeos.resources.volume_vm_exports",
+    "VolumeVmExportStat": "pyvergeos.resources.volume_vm_exports",
+    "VolumeVmExportStatManager": "pyvergeos.resources.volume_vm_exports",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        # Submodules such as pyvergeos.resources.groups load on first access too
+        if not name.startswith("_"):
+            try:
+                return importlib.import_module(f"{__name__}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{__name__}.{name}":
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Version
     "__version__",
     # Client
     "VergeClient",
+    "AsyncVergeClient",
     "VergeConnection",
     # Constants
     "API_VERSION",
@@ -74,6 +127,8 @@ __all__ = [
     "VergeTimeoutError",
     "TaskError",
     "TaskTimeoutError",
+    "WaitCancelledError",
+    "BulkOperationError",
     # Filters
     "Filter",
     "build_filter",
@@ -0,0 +1,499 @@
+"""Asynchronous client for interacting with VergeOS API v4.
+
+Requires the optional ``async`` extra (``pip install pyvergeos[async]``),
+which provides ``httpx``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from pyvergeos.client import handle_response
+from pyvergeos.connection import AuthMethod, build_auth_header
+from pyvergeos.constants import (
+    API_VERSION,
+    CONTENT_TYPE_JSON,
+    DEFAULT_TIMEOUT,
+    HEADER_ACCEPT,
+    HEADER_CONTENT_TYPE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_CODES,
+    RETRY_TOTAL,
+)
+from pyvergeos.exceptions import (
+    AuthenticationError,
+    NotConnectedError,
+    VergeConnectionError,
+    VergeError,
+    VergeTimeoutError,
+)
+from pyvergeos.resources.async_base import AsyncResourceManager
+from pyvergeos.transport import retry_delay
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pyvergeos.auth import AsyncSessionTokenAuth
+    from pyvergeos.resources.base import ResourceManager
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum number of concurrent connections in the async pool
+ASYNC_MAX_CONNECTIONS = 100
+
+#: Default number of idle keep-alive connections retained by the async pool
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+def _import_httpx() -> Any:
+    """Import httpx, raising a helpful error if the extra is missing."""
+    try:
+        import httpx
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "AsyncVergeClient requires httpx. Install it with: pip install pyvergeos[async]"
+        ) from e
+    return httpx
+
+
+class AsyncVergeClient:
+    """Asyncio client for interacting with VergeOS API v4.
+
+    All requests share one pooled ``httpx.AsyncClient``, so hundreds of
+    in-flight requests can run concurrently on a single event loop.
+
+    Example:
+        >>> async with AsyncVergeClient(
+        ...     host="192.168.1.100",
+        ...     username="admin",
+        ...     password="secret",
+        ... ) as client:
+        ...     vms, nodes = await asyncio.gather(
+        ...         client.vms.list(),
+        ...         client.nodes.list(),
+        ...     )
+
+        # Any endpoint, using a synchronous manager as the template
+        >>> from pyvergeos.resources.alarms import AlarmManager
+        >>> alarms = client.manager(AlarmManager)
+        >>> active = await alarms.list()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        verify_ssl: bool = True,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_total: int = RETRY_TOTAL,
+        retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        retry_status_codes: frozenset[int] | None = None,
+        max_connections: int = ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections: int = ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+        transport: httpx.AsyncBaseTransport | None = None,
+        auth_method: AuthMethod | str | None = None,
+    ) -> None:
+        """Initialize AsyncVergeClient.
+
+        The client does not connect until :meth:`connect` is awaited or the
+        client is used as an async context manager.
+
+        Args:
+            host: VergeOS hostname or IP address.
+            username: Username for basic authentication.
+            password: Password for basic authentication.
+            token: API token for bearer authentication.
+            verify_ssl: Whether to verify SSL certificates.
+            timeout: Default request timeout in seconds.
+            retry_total: Number of retry attempts for transient failures.
+            retry_backoff_factor: Backoff factor for retry delay calculation.
+                Delay = backoff_factor * (2 ** retry_count).
+            retry_status_codes: HTTP status codes that trigger automatic retry.
+                Default: 429, 500, 502, 503, 504.
+            max_connections: Maximum concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            transport: Custom httpx transport (e.g. for proxies or testing).
+            auth_method: ``"basic"``, ``"token"`` or ``"session"`` (see
+                :class:`VergeClient`). Default: ``"token"`` when a token is
+                given, else ``"basic"``.
+
+        Raises:
+            ValueError: If neither token nor username/password provided, or
+                the auth method is unknown.
+        """
+        if not token and not (username and password):
+            raise ValueError("Either token or username/password required")
+
+        self.host = host
+        self._username = username
+        self._password = password
+        self._token = token
+        self._auth_method = AuthMethod(auth_method) if auth_method is not None else None
+        self._session_auth: AsyncSessionTokenAuth | None = None
+        self._verify_ssl = verify_ssl
+        self._timeout = timeout
+        self._retry_total = retry_total
+        self._retry_backoff_factor = retry_backoff_factor
+        self._retry_status_codes = (
+            retry_status_codes if retry_status_codes is not None else RETRY_STATUS_CODES
+        )
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._transport = transport
+
+        self.api_base_url = f"https://{host}/api/{API_VERSION}"
+        self._http: httpx.AsyncClient | None = None
+        self._is_connected = False
+        self.connected_at: datetime | None = None
+        self.vergeos_version: str | None = None
+        self.os_version: str | None = None
+        self.cloud_name: str | None = None
+
+        self._managers: dict[str, AsyncResourceManager[Any]] = {}
+
+    @classmethod
+    def from_env(cls) -> AsyncVergeClient:
+        """Create client from environment variables.
+
+        Uses the same variables as :meth:`VergeClient.from_env`.
+
+        Returns:
+            Configured (not yet connected) AsyncVergeClient instance.
+
+        Raises:
+            ValueError: If VERGE_HOST is not set.
+        """
+        import os
+
+        host = os.environ.get("VERGE_HOST")
+        if not host:
+            raise ValueError("VERGE_HOST environment variable not set")
+
+        verify_ssl_str = os.environ.get("VERGE_VERIFY_SSL", "true").lower()
+        verify_ssl = verify_ssl_str in ("true", "1", "yes")
+
+        return cls(
+            host=host,
+            username=os.environ.get("VERGE_USERNAME"),
+            password=os.environ.get("VERGE_PASSWORD"),
+            token=os.environ.get("VERGE_TOKEN"),
+            verify_ssl=verify_ssl,
+            timeout=int(os.environ.get("VERGE_TIMEOUT", str(DEFAULT_TIMEOUT))),
+            retry_total=int(os.environ.get("VERGE_RETRY_TOTAL", str(RETRY_TOTAL))),
+            retry_backoff_factor=float(
+                os.environ.get("VERGE_RETRY_BACKOFF", str(RETRY_BACKOFF_FACTOR))
+            ),
+            auth_method=os.environ.get("VERGE_AUTH_METHOD") or None,
+        )
+
+    async def connect(self) -> AsyncVergeClient:
+        """Open the connection pool and validate credentials.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            VergeConnectionError: If connection fails.
+            AuthenticationError: If authentication fails.
+        """
+        httpx = _import_httpx()
+
+        auth_method = self._auth_method
+        if auth_method is None:
+            auth_method = AuthMethod.TOKEN if self._token else AuthMethod.BASIC
+
+        if auth_method == AuthMethod.SESSION:
+            # The token header is added by the first login below
+            auth_header: dict[str, str] = {}
+        elif auth_method == AuthMethod.TOKEN:
+            auth_header = build_auth_header(AuthMethod.TOKEN, token=self._token)
+        else:
+            auth_header = build_auth_header(
+                AuthMethod.BASIC,
+                username=self._username,
+                password=self._password,
+            )
+
+        limits = httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive_connections,
+        )
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            verify=self._verify_ssl,
+            limits=limits,
+            retries=self._retry_total,
+        )
+        self._http = httpx.AsyncClient(
+            headers={
+                **auth_header,
+                HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON,
+                HEADER_ACCEPT: CONTENT_TYPE_JSON,
+            },
+            timeout=self._timeout,
+            transport=transport,
+        )
+
+        self._session_auth = None
+        if auth_method == AuthMethod.SESSION:
+            from pyvergeos.auth import AsyncSessionTokenAuth
+
+            self._session_auth = AsyncSessionTokenAuth(
+                self._http, self.host, self._username or "", self._password or ""
+            )
+            try:
+                await self._session_auth.ensure()
+            except Exception:
+                await self.disconnect()
+                raise
+
+        await self._validate_connection()
+        return self
+
+    async def _validate_connection(self) -> None:
+        """Validate connection by fetching system info."""
+        if self._http is None:
+            raise NotConnectedError("No connection object")
+
+        try:
+            resp = await self._http.request(
+                "GET",
+                f"{self.api_base_url}/system",
+                params={"fields": "$key,yb_version,os_version,cloud_name"},
+            )
+            response = handle_response(resp)
+        except AuthenticationError:
+            await self.disconnect()
+            raise
+        except VergeError as e:
+            await self.disconnect()
+            raise VergeConnectionError(f"Failed to connect to {self.host}: {e}") from e
+        except Exception as e:
+            await self.disconnect()
+            raise VergeConnectionError(f"Failed to connect to {self.host}: {e}") from e
+
+        # Response can be a dict or a list with one item
+        if isinstance(response, list) and len(response) > 0:
+            response = response[0]
+        if not isinstance(response, dict):
+            await self.disconnect()
+            raise VergeConnectionError(f"Unexpected response: HTTP {resp.status_code}")
+
+        self.vergeos_version = response.get("yb_version")
+        self.os_version = response.get("os_version")
+        self.cloud_name = response.get("cloud_name")
+        self.connected_at = datetime.now(timezone.utc)
+        self._is_connected = True
+
+    async def disconnect(self) -> None:
+        """Close the connection pool, revoking the session token if any."""
+        if self._session_auth is not None and self._http is not None:
+            await self._session_auth.logout()
+        self._session_auth = None
+        self._is_connected = False
+        self.connected_at = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if client is connected."""
+        return self._is_connected
+
+    @property
+    def version(self) -> str | None:
+        """Get VergeOS version (yb_version)."""
+        return self.vergeos_version
+
+    async def __aenter__(self) -> AsyncVergeClient:
+        if not self._is_connected:
+            await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        await self.disconnect()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Make an HTTP request to the VergeOS API.
+
+        Transient failures (status codes in ``retry_status_codes``) are
+        retried with exponential backoff, honoring ``Retry-After``.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH).
+            endpoint: API endpoint (without /api/v4 prefix).
+            params: Query parameters.
+            json_data: JSON body for POST/PUT/PATCH.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            Parsed JSON response or None for empty responses.
+
+        Raises:
+            NotConnectedError: If not connected.
+            AuthenticationError: For 401/403 responses.
+            NotFoundError: For 404 responses.
+            APIError: For other API errors.
+            VergeTimeoutError: If request times out.
+            VergeConnectionError: If connection fails.
+        """
+        if self._http is None or not self._is_connected:
+            raise NotConnectedError("Not connected to VergeOS")
+
+        httpx = _import_httpx()
+        url = f"{self.api_base_url}/{endpoint}"
+
+        logger.debug("%s %s params=%s", method, url, params)
+
+        auth = self._session_auth
+        token = await auth.ensure() if auth is not None else None
+        renewed = False
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._http.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json_data,
+                    timeout=timeout or self._timeout,
+                )
+            except httpx.TimeoutException as e:
+                raise VergeTimeoutError(f"Request to {url} timed out") from e
+            except httpx.TransportError as e:
+                raise VergeConnectionError(f"Connection to {self.host} failed: {e}") from e
+
+            if auth is not None and response.status_code == HTTPStatus.UNAUTHORIZED and not renewed:
+                # The session token expired or was revoked early
+                logger.debug("Session token rejected; renewing")
+                await auth.refresh(token)
+                renewed = True
+                continue
+
+            if response.status_code in self._retry_status_codes and attempt < self._retry_total:
+                attempt += 1
+                delay = retry_delay(attempt, self._retry_backoff_factor, response)
+                logger.debug(
+                    "Retrying %s %s after HTTP %s (attempt %d, %.1fs)",
+                    method,
+                    url,
+                    response.status_code,
+                    attempt,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            return handle_response(response)
+
+    def manager(
+        self,
+        manager_cls: type[ResourceManager[Any]],
+        base_filter: str | None = None,
+    ) -> AsyncResourceManager[Any]:
+        """Get an async manager mirroring a synchronous manager class.
+
+        Args:
+            manager_cls: Synchronous manager class providing the endpoint,
+                default fields and model class.
+            base_filter: Filter always combined with caller filters.
+
+        Returns:
+            Cached AsyncResourceManager for the manager's endpoint.
+        """
+        cache_key = f"{manager_cls.__module__}.{manager_cls.__qualname__}:{base_filter}"
+        if cache_key not in self._managers:
+            self._managers[cache_key] = AsyncResourceManager.from_manager(
+                self, manager_cls, base_filter=base_filter
+            )
+        return self._managers[cache_key]
+
+    def resource(self, endpoint: str) -> AsyncResourceManager[Any]:
+        """Get a generic async manager for any API endpoint.
+
+        Args:
+            endpoint: API endpoint (e.g. "machine_status").
+
+        Returns:
+            AsyncResourceManager returning plain ResourceObject results.
+        """
+        if endpoint not in self._managers:
+            self._managers[endpoint] = AsyncResourceManager(self, endpoint)
+        return self._managers[endpoint]
+
+    # Resource manager properties
+
+    @property
+    def vms(self) -> AsyncResourceManager[Any]:
+        """Access VM operations (snapshots excluded, as with ``VergeClient.vms``)."""
+        from pyvergeos.resources.vms import VMManager
+
+        return self.manager(VMManager, base_filter="is_snapshot eq false")
+
+    @property
+    def nodes(self) -> AsyncResourceManager[Any]:
+        """Access node operations."""
+        from pyvergeos.resources.nodes import NodeManager
+
+        return self.manager(NodeManager)
+
+    @property
+    def clusters(self) -> AsyncResourceManager[Any]:
+        """Access cluster operations."""
+        from pyvergeos.resources.clusters import ClusterManager
+
+        return self.manager(ClusterManager)
+
+    @property
+    def networks(self) -> AsyncResourceManager[Any]:
+        """Access network operations."""
+        from pyvergeos.resources.networks import NetworkManager
+
+        return self.manager(NetworkManager)
+
+    @property
+    def tenants(self) -> AsyncResourceManager[Any]:
+        """Access tenant operations."""
+        from pyvergeos.resources.tenant_manager import TenantManager
+
+        return self.manager(TenantManager)
+
+    @property
+    def tasks(self) -> AsyncResourceManager[Any]:
+        """Access task operations."""
+        from pyvergeos.resources.tasks import TaskManager
+
+        return self.manager(TaskManager)
+
+    @property
+    def alarms(self) -> AsyncResourceManager[Any]:
+        """Access alarm operations."""
+        from pyvergeos.resources.alarms import AlarmManager
+
+        return self.manager(AlarmManager)
+
+    @property
+    def logs(self) -> AsyncResourceManager[Any]:
+        """Access log operations."""
+        from pyvergeos.resources.logs import LogManager
+
+        return self.manager(LogManager)
@@ -0,0 +1,316 @@
+"""Session-token authentication.
+
+With basic auth every request carries the username and password, and the
+appserver verifies the password on each one. Session auth instead logs in
+once (``POST /api/sys/tokens``) and sends the returned token in the
+``x-yottabyte-token`` header. The token's expiry is tracked and it is
+renewed shortly before it expires, or when the server rejects it.
+
+Renewal is serialized: when many threads (or tasks) find the token
+expiring at the same moment, one of them logs in and the others wait for
+it and reuse the new token, so the login endpoint sees one request.
+
+Example:
+    >>> client = VergeClient(host, username="admin", password="...", auth_method="session")
+    >>> client._connection.token_expires
+    datetime.datetime(2026, 10, 16, 12, 15, tzinfo=datetime.timezone.utc)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from pyvergeos.connection import AuthMethod, build_auth_header
+from pyvergeos.constants import (
+    DEFAULT_TIMEOUT,
+    SESSION_TOKEN_ENDPOINT,
+    SESSION_TOKEN_LIFETIME,
+    SESSION_TOKEN_REFRESH_MARGIN,
+)
+from pyvergeos.exceptions import AuthenticationError, VergeConnectionError, VergeTimeoutError
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pyvergeos.connection import VergeConnection
+
+logger = logging.getLogger(__name__)
+
+
+def token_url(host: str) -> str:
+    """Return the session token endpoint URL for a host."""
+    return f"https://{host}/api/{SESSION_TOKEN_ENDPOINT}"
+
+
+def parse_token(response: Any) -> str:
+    """Extract the session token from a login response.
+
+    Raises:
+        AuthenticationError: If the response carries no token.
+    """
+    if isinstance(response, list) and response:
+        response = response[0]
+    if isinstance(response, dict):
+        token = response.get("$key")
+        if not token and isinstance(response.get("location"), str):
+            token = response["location"].rstrip("/").rsplit("/", 1)[-1]
+        if token:
+            return str(token)
+    raise AuthenticationError("Login response did not include a session token")
+
+
+def parse_expires(response: Any) -> float | None:
+    """Extract the ``expires`` epoch from a token record, if present."""
+    if isinstance(response, list) and response:
+        response = response[0]
+    if isinstance(response, dict):
+        expires = response.get("expires")
+        if isinstance(expires, (int, float)) and not isinstance(expires, bool) and expires > 0:
+            return float(expires)
+    return None
+
+
+class _SessionTokenState:
+    """Token, expiry and renewal schedule shared by the sync and async flavors."""
+
+    def __init__(self, username: str, password: str, refresh_margin: float) -> None:
+        if not username or not password:
+            raise ValueError("Username and password required for session auth")
+        self._username = username
+        self._password = password
+        self._refresh_margin = refresh_margin
+        self.token: str | None = None
+        self.expires: datetime | None = None
+        self._refresh_at = 0.0
+        #: Number of logins performed, for monitoring
+        self.logins = 0
+
+    def _login_body(self) -> dict[str, str]:
+        return {"login": self._username, "password": self._password}
+
+    def _is_fresh(self) -> bool:
+        return self.token is not None and time.time() < self._refresh_at
+
+    def _set_token(self, token: str, expires: float | None) -> None:
+        now = time.time()
+        if expires is None or expires <= now:
+            expires = now + SESSION_TOKEN_LIFETIME
+        lifetime = expires - now
+        # Renew ``refresh_margin`` seconds early, or halfway through tokens
+        # too short-lived for that margin.
+        margin = self._refresh_margin if lifetime > 2 * self._refresh_margin else lifetime / 2
+        self.token = token
+        self.expires = datetime.fromtimestamp(expires, tz=timezone.utc)
+        self._refresh_at = expires - margin
+        self.logins += 1
+        logger.debug("Obtained session token expiring at %s", self.expires.isoformat())
+
+    def _clear(self) -> None:
+        self.token = None
+        self.expires = None
+        self._refresh_at = 0.0
+
+
+class SessionTokenAuth(_SessionTokenState):
+    """Session-token authentication for :class:`~pyvergeos.VergeClient`.
+
+    The token is stored on the connection (``token``, ``token_expires``)
+    and applied to the HTTP session's headers.
+
+    Args:
+        connection: Connection whose session sends the requests.
+        username: Login name.
+        password: Password.
+        timeout: Timeout for login requests, in seconds.
+        refresh_margin: Renew the token this many seconds before it expires.
+    """
+
+    def __init__(
+        self,
+        connection: VergeConnection,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        refresh_margin: float = SESSION_TOKEN_REFRESH_MARGIN,
+    ) -> None:
+        super().__init__(username, password, refresh_margin)
+        self._connection = connection
+        self._timeout = timeout
+        self._lock = threading.Lock()
+
+    def ensure(self) -> str:
+        """Return a valid token, logging in first if it is missing or expiring.
+
+        Raises:
+            AuthenticationError: If the login is rejected.
+            VergeConnectionError: If the login request fails.
+            VergeTimeoutError: If the login request times out.
+        """
+        token = self.token
+        if token is not None and self._is_fresh():
+            return token
+        with self._lock:
+            if self.token is not None and self._is_fresh():
+                return self.token
+            return self._login()
+
+    def refresh(self, stale: str | None) -> str:
+        """Replace a token the server rejected.
+
+        Callers pass the token their request was sent with; if another
+        caller has already replaced it, the newer token is returned without
+        logging in again.
+        """
+        with self._lock:
+            if self.token is None or self.token == stale:
+                return self._login()
+            return self.token
+
+    def _login(self) -> str:
+        session = self._connection._session
+        if session is None:
+            raise VergeConnectionError("Session not initialized")
+        url = token_url(self._connection.host)
+
+        from pyvergeos.client import handle_response
+
+        try:
+            response = handle_response(
+                session.request(
+                    method="POST", url=url, json=self._login_body(), timeout=self._timeout
+                )
+            )
+            token = parse_token(response)
+            header = build_auth_header(AuthMethod.SESSION, token=token)
+            expires = parse_expires(response)
+            if expires is None:
+                record = handle_response(
+                    session.request(
+                        method="GET",
+                        url=f"{url}/{token}",
+                        params={"fields": "expires"},
+                        headers=header,
+                        timeout=self._timeout,
+                    )
+                )
+                expires = parse_expires(record)
+        except requests.exceptions.Timeout as e:
+            raise VergeTimeoutError(f"Login to {self._connection.host} timed out") from e
+        except requests.exceptions.ConnectionError as e:
+            raise VergeConnectionError(f"Connection to {self._connection.host} failed: {e}") from e
+
+        self._set_token(token, expires)
+        session.headers.update(header)
+        self._connection.token = token
+        self._connection.token_expires = self.expires
+        return token
+
+    def logout(self) -> None:
+        """Revoke the current token. Errors are logged and ignored."""
+        with self._lock:
+            token = self.token
+            session = self._connection._session
+            self._clear()
+        if token is None or session is None:
+            return
+        try:
+            session.request(
+                method="DELETE",
+                url=f"{token_url(self._connection.host)}/{token}",
+                timeout=self._timeout,
+            )
+        except Exception as e:  # Best effort on disconnect
+            logger.debug("Failed to revoke session token: %s", e)
+
+
+class AsyncSessionTokenAuth(_SessionTokenState):
+    """Session-token authentication for :class:`~pyvergeos.AsyncVergeClient`.
+
+    Args:
+        http: httpx client whose headers carry the token.
+        host: VergeOS hostname or IP address.
+        username: Login name.
+        password: Password.
+        refresh_margin: Renew the token this many seconds before it expires.
+    """
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        host: str,
+        username: str,
+        password: str,
+        refresh_margin: float = SESSION_TOKEN_REFRESH_MARGIN,
+    ) -> None:
+        super().__init__(username, password, refresh_margin)
+        self._http = http
+        self._host = host
+        self._lock: asyncio.Lock | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Created on first use so it belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def ensure(self) -> str:
+        """Return a valid token, logging in first if it is missing or expiring."""
+        token = self.token
+        if token is not None and self._is_fresh():
+            return token
+        async with self._get_lock():
+            if self.token is not None and self._is_fresh():
+                return self.token
+            return await self._login()
+
+    async def refresh(self, stale: str | None) -> str:
+        """Replace a token the server rejected (see :meth:`SessionTokenAuth.refresh`)."""
+        async with self._get_lock():
+            if self.token is None or self.token == stale:
+                return await self._login()
+            return self.token
+
+    async def _login(self) -> str:
+        from pyvergeos.client import handle_response
+        from pyvergeos.transport import _import_httpx
+
+        httpx = _import_httpx()
+        url = token_url(self._host)
+        try:
+            response = handle_response(await self._http.post(url, json=self._login_body()))
+            token = parse_token(response)
+            header = build_auth_header(AuthMethod.SESSION, token=token)
+            expires = parse_expires(response)
+            if expires is None:
+                record = handle_response(
+                    await self._http.get(
+                        f"{url}/{token}", params={"fields": "expires"}, headers=header
+                    )
+                )
+                expires = parse_expires(record)
+        except httpx.TimeoutException as e:
+            raise VergeTimeoutError(f"Login to {self._host} timed out") from e
+        except httpx.TransportError as e:
+            raise VergeConnectionError(f"Connection to {self._host} failed: {e}") from e
+
+        self._set_token(token, expires)
+        self._http.headers.update(header)
+        return token
+
+    async def logout(self) -> None:
+        """Revoke the current token. Errors are logged and ignored."""
+        token = self.token
+        self._clear()
+        if token is None:
+            return
+        try:
+            await self._http.delete(f"{token_url(self._host)}/{token}")
+        except Exception as e:  # Best effort on disconnect
+            logger.debug("Failed to revoke session token: %s", e)
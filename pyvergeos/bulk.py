@@ -0,0 +1,297 @@
+"""Bounded-concurrency execution of per-resource operations.
+
+Bulk helpers such as :meth:`ResourceManager.action_many` run one API call
+per item on a small worker pool and collect every outcome, successful or
+not, into a :class:`BulkResult` instead of stopping at the first error.
+
+Per-group caps keep the load spread out: with ``group_by`` and
+``per_group`` set, at most ``per_group`` calls run at once for items that
+share a group (e.g. VMs on the same node), while items from other groups
+keep the pool busy.
+
+Example:
+    >>> result = client.vms.action_many(keys, "poweron", concurrency=16)
+    >>> result.ok
+    False
+    >>> result.errors
+    {812: ConflictError('VM is already running')}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Hashable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from pyvergeos.constants import BULK_CONCURRENCY
+from pyvergeos.exceptions import BulkOperationError
+
+logger = logging.getLogger(__name__)
+
+#: Maps an item to the group its concurrency is capped by
+GroupFunc = Callable[[Any], Hashable]
+
+
+@dataclass
+class BulkItem:
+    """Outcome of one operation in a bulk call.
+
+    Attributes:
+        key: Resource key the operation ran on (the input index for
+            ``create_many``).
+        result: Value returned by the operation (None on failure).
+        error: Exception raised by the operation, if any.
+        task_key: Key of the task the operation started, if the response
+            referenced one.
+    """
+
+    key: Any
+    result: Any = None
+    error: Exception | None = None
+    task_key: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the operation succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BulkResult:
+    """Per-item outcomes of a bulk call, in input order."""
+
+    items: list[BulkItem] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every operation succeeded."""
+        return all(item.ok for item in self.items)
+
+    @property
+    def succeeded(self) -> list[Any]:
+        """Keys whose operation succeeded."""
+        return [item.key for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> list[Any]:
+        """Keys whose operation failed."""
+        return [item.key for item in self.items if not item.ok]
+
+    @property
+    def results(self) -> dict[Any, Any]:
+        """Map of key to result for successful operations."""
+        return {item.key: item.result for item in self.items if item.ok}
+
+    @property
+    def errors(self) -> dict[Any, Exception]:
+        """Map of key to exception for failed operations."""
+        return {item.key: item.error for item in self.items if item.error is not None}
+
+    @property
+    def task_keys(self) -> dict[Any, int]:
+        """Map of key to the task each operation started."""
+        return {item.key: item.task_key for item in self.items if item.task_key is not None}
+
+    def raise_for_errors(self) -> BulkResult:
+        """Raise if any operation failed.
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            BulkOperationError: If any operation failed. The exception
+                carries this result as ``result``.
+        """
+        errors = self.errors
+        if errors:
+            first_key, first_error = next(iter(errors.items()))
+            raise BulkOperationError(
+                f"{len(errors)} of {len(self.items)} operations failed "
+                f"(first: {first_key}: {first_error})",
+                result=self,
+            )
+        return self
+
+    def __iter__(self) -> Iterator[BulkItem]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return f"BulkResult(succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+
+
+def task_key_of(response: Any) -> int | None:
+    """Return the task key referenced by an action response, if any."""
+    if isinstance(response, dict):
+        task = response.get("task")
+        if isinstance(task, int) and not isinstance(task, bool):
+            return task
+        if isinstance(task, str) and task.isdigit():
+            return int(task)
+    return None
+
+
+def update_changes(
+    updates: Mapping[Any, Mapping[str, Any]] | Iterable[tuple[Any, Mapping[str, Any]]],
+) -> dict[Any, Mapping[str, Any]]:
+    """Return the attributes to set per key for an ``update_many`` call.
+
+    Raises:
+        ValueError: If a key appears more than once.
+    """
+    if isinstance(updates, Mapping):
+        return dict(updates)
+    changes: dict[Any, Mapping[str, Any]] = {}
+    for key, attributes in updates:
+        if key in changes:
+            raise ValueError(f"Duplicate key in updates: {key!r}")
+        changes[key] = attributes
+    return changes
+
+
+def _validate(concurrency: int, per_group: int | None) -> None:
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    if per_group is not None and per_group <= 0:
+        raise ValueError("per_group must be positive")
+
+
+def _groups(
+    keys: Sequence[Any], group_by: GroupFunc | None, per_group: int | None
+) -> list[Hashable] | None:
+    if group_by is None or per_group is None:
+        return None
+    return [group_by(key) for key in keys]
+
+
+def run_bulk(
+    keys: Sequence[Any],
+    operation: Callable[[Any], Any],
+    concurrency: int = BULK_CONCURRENCY,
+    *,
+    group_by: GroupFunc | None = None,
+    per_group: int | None = None,
+    track_tasks: bool = True,
+) -> BulkResult:
+    """Run ``operation(key)`` for every key on a bounded thread pool.
+
+    Within a group, items start in input order, so ``per_group=1`` (or
+    ``concurrency=1`` without groups) applies them strictly in order.
+
+    Args:
+        keys: Items to operate on.
+        operation: Called once per key; its return value becomes the item's
+            result. Exceptions are recorded per item, not raised.
+        concurrency: Maximum operations running at once.
+        group_by: Maps a key to its group (e.g. the node a VM runs on).
+        per_group: Maximum operations running at once within one group.
+        track_tasks: Record the task key referenced by each result.
+
+    Returns:
+        BulkResult with one item per key, in input order.
+
+    Raises:
+        ValueError: If ``concurrency`` or ``per_group`` is not positive.
+    """
+    _validate(concurrency, per_group)
+    items = [BulkItem(key) for key in keys]
+    groups = _groups(keys, group_by, per_group)
+
+    # Items waiting to start, per group. A group at its cap is skipped so
+    # that items from other groups can use the free workers.
+    waiting: dict[Hashable, deque[int]] = defaultdict(deque)
+    for index in range(len(items)):
+        waiting[groups[index] if groups else None].append(index)
+    active: dict[Hashable, int] = defaultdict(int)
+    running: dict[Future[Any], int] = {}
+
+    def run(index: int) -> Any:
+        return operation(items[index].key)
+
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, max(len(items), 1)), thread_name_prefix="pyvergeos-bulk"
+    ) as executor:
+        while waiting or running:
+            for group in list(waiting):
+                if len(running) >= concurrency:
+                    break
+                queue = waiting[group]
+                while queue and len(running) < concurrency:
+                    if groups and active[group] >= (per_group or concurrency):
+                        break
+                    index = queue.popleft()
+                    active[group] += 1
+                    running[executor.submit(run, index)] = index
+                if not queue:
+                    del waiting[group]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                active[groups[index] if groups else None] -= 1
+                _record(items[index], future, track_tasks)
+
+    return BulkResult(items)
+
+
+def _record(item: BulkItem, future: Future[Any], track_tasks: bool) -> None:
+    error = future.exception()
+    if error is None:
+        item.result = future.result()
+        if track_tasks:
+            item.task_key = task_key_of(item.result)
+    elif isinstance(error, Exception):
+        logger.debug("Bulk operation on %s failed: %s", item.key, error)
+        item.error = error
+    else:  # pragma: no cover - KeyboardInterrupt and friends
+        raise error
+
+
+async def run_bulk_async(
+    keys: Sequence[Any],
+    operation: Callable[[Any], Awaitable[Any]],
+    concurrency: int = BULK_CONCURRENCY,
+    *,
+    group_by: GroupFunc | None = None,
+    per_group: int | None = None,
+    track_tasks: bool = True,
+) -> BulkResult:
+    """Run ``await operation(key)`` for every key with bounded concurrency.
+
+    The asyncio counterpart of :func:`run_bulk`; arguments and result are
+    the same.
+    """
+    _validate(concurrency, per_group)
+    items = [BulkItem(key) for key in keys]
+    groups = _groups(keys, group_by, per_group)
+    limit = asyncio.Semaphore(concurrency)
+    group_limits: dict[Hashable, asyncio.Semaphore] = {}
+    if groups and per_group:
+        group_limits = {group: asyncio.Semaphore(per_group) for group in groups}
+
+    async def run(index: int) -> None:
+        item = items[index]
+        group_limit = group_limits.get(groups[index]) if groups else None
+        try:
+            if group_limit is not None:
+                # Take the group slot first so waiting items do not hold
+                # global slots other groups could use.
+                async with group_limit, limit:
+                    item.result = await operation(item.key)
+            else:
+                async with limit:
+                    item.result = await operation(item.key)
+            if track_tasks:
+                item.task_key = task_key_of(item.result)
+        except Exception as e:
+            logger.debug("Bulk operation on %s failed: %s", item.key, e)
+            item.error = e
+
+    await asyncio.gather(*(run(index) for index in range(len(items))))
+    return BulkResult(items)
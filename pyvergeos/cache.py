@@ -0,0 +1,283 @@
+"""In-memory cache for GET responses with per-endpoint TTLs.
+
+The cache sits beneath :meth:`VergeClient._request`. GET responses for
+endpoints with a TTL are stored until they expire or are evicted, and any
+POST, PUT or DELETE invalidates cached entries for the same endpoint.
+
+Example:
+    >>> client = VergeClient(host="...", token="...", cache=True)
+    >>> client.clusters.list()        # fetched from the API
+    >>> client.clusters.list()        # served from the cache
+    >>> client.cache.stats()
+    CacheStats(hits=1, misses=1, ...)
+
+    >>> # Custom TTLs (seconds); endpoints without a TTL are not cached
+    >>> cache = ResponseCache(ttls={"vms": 10, "machine_status": 0})
+    >>> client = VergeClient(host="...", token="...", cache=cache)
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from pyvergeos.constants import CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTLS
+
+#: Suffix of endpoints that perform actions on another endpoint's rows
+_ACTIONS_SUFFIX = "_actions"
+
+
+def endpoint_base(endpoint: str) -> str:
+    """Return the table an endpoint refers to.
+
+    Args:
+        endpoint: API endpoint such as ``"vms/12?action=poweron"``.
+
+    Returns:
+        The first path segment (``"vms"``).
+    """
+    return endpoint.split("?", 1)[0].strip("/").split("/", 1)[0]
+
+
+def invalidation_targets(endpoint: str) -> set[str]:
+    """Return the tables whose cached reads a write to ``endpoint`` affects.
+
+    Writes to an action endpoint (e.g. ``vm_actions``) also invalidate the
+    table the action operates on (``vms``).
+
+    Args:
+        endpoint: API endpoint written to.
+
+    Returns:
+        Set of endpoint bases to invalidate.
+    """
+    base = endpoint_base(endpoint)
+    targets = {base}
+    if base.endswith(_ACTIONS_SUFFIX):
+        subject = base[: -len(_ACTIONS_SUFFIX)]
+        targets.update({subject, f"{subject}s"})
+    return targets
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of response cache activity.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups for cacheable endpoints that went to the API.
+        evictions: Entries dropped to stay within the size limits.
+        invalidations: Entries dropped because of a write or explicit call.
+        entries: Entries currently held.
+        bytes: Approximate size of the held entries (when ``max_bytes`` is set).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    """A cached response."""
+
+    __slots__ = ("base", "value", "expires", "size")
+
+    def __init__(self, base: str, value: Any, expires: float, size: int) -> None:
+        self.base = base
+        self.value = value
+        self.expires = expires
+        self.size = size
+
+
+class ResponseCache:
+    """LRU cache of GET responses with per-endpoint TTLs.
+
+    Only endpoints with a positive TTL are cached. TTLs are looked up by the
+    endpoint's table (``vms/12`` uses the ``vms`` TTL) and default to
+    :data:`~pyvergeos.constants.DEFAULT_CACHE_TTLS`. Callers always receive
+    a private copy of the cached data.
+
+    The cache is thread-safe and may be shared by several clients.
+    :class:`~pyvergeos.client.VergeClient` keys its entries by host and
+    user (or API token), so clients never read each other's responses. A
+    write through any of them invalidates the endpoint for all.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = 0.0,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize ResponseCache.
+
+        Args:
+            ttls: Per-endpoint TTLs in seconds, merged over the defaults. A
+                TTL of 0 disables caching for that endpoint.
+            default_ttl: TTL for endpoints not listed in ``ttls`` (default:
+                0, i.e. not cached).
+            max_entries: Maximum number of cached responses.
+            max_bytes: Optional bound on the approximate JSON size of all
+                cached responses.
+
+        Raises:
+            ValueError: If a size limit is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.ttls: dict[str, float] = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL in seconds that applies to ``endpoint``."""
+        return self.ttls.get(endpoint_base(endpoint), self.default_ttl)
+
+    def get_or_fetch(self, key: Hashable, endpoint: str, fetch: Callable[[], Any]) -> Any:
+        """Return a cached response or fetch and store it.
+
+        Args:
+            key: Request key (see :func:`pyvergeos.coalesce.request_key`).
+            endpoint: API endpoint the request targets.
+            fetch: Function performing the request.
+
+        Returns:
+            A copy of the response data.
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return fetch()
+
+        base = endpoint_base(endpoint)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                value = entry.value
+                hit = True
+            else:
+                if entry is not None:
+                    self._drop(key)
+                self._misses += 1
+                generation = self._generation(base)
+                hit = False
+
+        if hit:
+            return copy.deepcopy(value)
+
+        value = fetch()
+        self._store(key, base, copy.deepcopy(value), now + ttl, generation)
+        return value
+
+    def _generation(self, base: str) -> tuple[int, int]:
+        """Version of an endpoint's data, bumped by writes. Caller must hold the lock."""
+        return self._epoch, self._generations.get(base, 0)
+
+    def _store(
+        self, key: Hashable, base: str, value: Any, expires: float, generation: tuple[int, int]
+    ) -> None:
+        """Store a fetched response unless the endpoint was written meanwhile."""
+        size = self._size_of(value) if self.max_bytes is not None else 0
+        with self._lock:
+            # A write that landed while the GET was in flight may not be
+            # reflected in the response; don't cache it.
+            if self._generation(base) != generation:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(base, value, expires, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @staticmethod
+    def _size_of(value: Any) -> int:
+        """Approximate memory footprint of a response as its JSON length."""
+        return len(json.dumps(value, default=str))
+
+    def invalidate(self, endpoint: str) -> int:
+        """Drop cached responses affected by a write to ``endpoint``.
+
+        Args:
+            endpoint: API endpoint written to (e.g. ``"vms/12"``).
+
+        Returns:
+            Number of entries removed.
+        """
+        targets = invalidation_targets(endpoint)
+        with self._lock:
+            for base in targets:
+                self._generations[base] = self._generations.get(base, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry.base in targets]
+            for key in stale:
+                self._drop(key)
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            self._epoch += 1
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of cache activity."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(entries={len(self)}, max_entries={self.max_entries})"
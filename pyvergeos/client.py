@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable
 
 import requests
+from requests.adapters import BaseAdapter
 
-from pyvergeos.connection import AuthMethod, VergeConnection, build_auth_header
+from pyvergeos import codec
+from pyvergeos.cache import ResponseCache
+from pyvergeos.coalesce import SingleFlight, request_key
+from pyvergeos.connection import AuthMethod, PoolStats, VergeConnection, build_auth_header
 from pyvergeos.constants import (
     CONTENT_TYPE_JSON,
     DEFAULT_TIMEOUT,
@@ -21,9 +30,14 @@ from pyvergeos.constants import (
     HTTP_NOT_FOUND,
     HTTP_SUCCESS_CODES,
     HTTP_UNPROCESSABLE_ENTITY,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     RETRY_BACKOFF_FACTOR,
+    RETRY_METHODS,
     RETRY_STATUS_CODES,
     RETRY_TOTAL,
+    STREAM_CHUNK_SIZE,
 )
 from pyvergeos.exceptions import (
     APIError,
@@ -35,8 +49,12 @@ from pyvergeos.exceptions import (
     VergeConnectionError,
     VergeTimeoutError,
 )
+from pyvergeos.metrics import RequestHook, RequestRecorder, emit
+from pyvergeos.ratelimit import RateLimiter
+from pyvergeos.transport import retry_delay
 
 if TYPE_CHECKING:
+    from pyvergeos.auth import SessionTokenAuth
     from pyvergeos.resources.alarms import AlarmManager
     from pyvergeos.resources.api_keys import APIKeyManager
     from pyvergeos.resources.auth_sources import (
@@ -140,13 +158,88 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Signature of request middleware: ``middleware(request, send) -> response``
+Middleware = Callable[..., Any]
+
+
+def handle_response(response: Any) -> dict[str, Any] | list[Any] | None:
+    """Decode a VergeOS API response or raise the matching exception.
+
+    Shared by the synchronous and asynchronous clients; ``response`` may be a
+    ``requests.Response`` or an ``httpx.Response``.
+
+    Args:
+        response: HTTP response object.
+
+    Returns:
+        Parsed JSON body, or None for empty responses.
+
+    Raises:
+        AuthenticationError: For 401/403 responses.
+        NotFoundError: For 404 responses.
+        ConflictError: For 409 responses.
+        ValidationError: For 422 responses.
+        APIError: For other error responses.
+    """
+    # Success responses
+    if response.status_code in HTTP_SUCCESS_CODES:
+        # Decode the raw body once with the configured backend rather than
+        # building ``response.text`` and then parsing it again.
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return codec.loads(content) if content else None
+        if response.text:
+            return response.json()  # type: ignore[no-any-return]
+        return None
+
+    if response.status_code == HTTP_NO_CONTENT:
+        return None
+
+    # Error responses
+    error_message = extract_error_message(response)
+
+    if response.status_code in HTTP_AUTH_FAILURE_CODES:
+        raise AuthenticationError(error_message, status_code=response.status_code)
+    elif response.status_code == HTTP_NOT_FOUND:
+        raise NotFoundError(error_message, status_code=response.status_code)
+    elif response.status_code == HTTP_CONFLICT:
+        raise ConflictError(error_message, status_code=response.status_code)
+    elif response.status_code == HTTP_UNPROCESSABLE_ENTITY:
+        raise ValidationError(error_message, status_code=response.status_code)
+    else:
+        raise APIError(error_message, status_code=response.status_code)
+
+
+def extract_error_message(response: Any) -> str:
+    """Extract error message from API response."""
+    try:
+        data = response.json()
+        # VergeOS uses 'err', 'error', or 'message' fields
+        for field in ("err", "error", "message"):
+            if field in data:
+                msg = data[field]
+                if isinstance(msg, str):
+                    return msg
+                elif isinstance(msg, dict) and "message" in msg:
+                    return str(msg["message"])
+        return str(data)
+    except (json.JSONDecodeError, KeyError):
+        return response.text or f"HTTP {response.status_code}"
+
 
 class VergeClient:
     """Main client for interacting with VergeOS API v4.
 
     Thread Safety:
-        This client is NOT thread-safe. Each thread should use its own
-        VergeClient instance, or external locking should be used.
+        Once connected, one client may be shared by many threads. API
+        requests and all manager methods (including ``iter_all`` prefetch,
+        the ``*_many`` bulk helpers and task futures) may be called
+        concurrently: they share the session's connection pool (sized by
+        ``pool_maxsize``), token refresh is serialized, and
+        ``coalesce_requests`` lets identical concurrent GETs share one
+        response. :meth:`connect`, :meth:`disconnect` and changes to client
+        settings are not synchronized and should happen while no other
+        thread is using the client.
 
     Example:
         >>> client = VergeClient(
@@ -177,6 +270,18 @@ class VergeClient:
         retry_total: int = RETRY_TOTAL,
         retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
         retry_status_codes: frozenset[int] | None = None,
+        http2: bool = False,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        tcp_keepalive: bool = False,
+        coalesce_requests: bool = False,
+        cache: ResponseCache | bool | None = None,
+        auth_method: AuthMethod | str | None = None,
+        rate_limit: RateLimiter | bool | None = None,
+        hooks: Iterable[RequestHook] | None = None,
+        middleware: Iterable[Middleware] | None = None,
+        transport: BaseAdapter | None = None,
     ) -> None:
         """Initialize VergeClient.
 
@@ -193,14 +298,59 @@ class VergeClient:
                 Delay = backoff_factor * (2 ** retry_count). Default: 1.
             retry_status_codes: HTTP status codes that trigger automatic retry.
                 Default: 429, 500, 502, 503, 504.
+            http2: Use the httpx-based HTTP/2 transport so concurrent requests
+                share one multiplexed TLS connection (requires
+                ``pip install pyvergeos[http2]``).
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum connections kept open to the host. Size this
+                to the number of threads sharing the client (default: 10).
+            pool_block: Block when all pooled connections are busy instead of
+                opening extra connections that are discarded afterwards.
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+            coalesce_requests: Share one in-flight response between threads
+                issuing the same GET (same endpoint and params) at the same
+                time, instead of sending one request per caller.
+            cache: Cache GET responses using per-endpoint TTLs. Pass ``True``
+                for a :class:`~pyvergeos.cache.ResponseCache` with the default
+                TTLs, or a configured ``ResponseCache``. Writes through the
+                client invalidate cached responses for the same endpoint.
+            auth_method: How to authenticate: ``"basic"``, ``"token"`` or
+                ``"session"``. Session auth logs in once with the username
+                and password and sends a session token, renewed before it
+                expires, instead of the password on every request. Default:
+                ``"token"`` when a token is given, else ``"basic"``.
+            rate_limit: Pace all requests of the client through one
+                :class:`~pyvergeos.ratelimit.RateLimiter`, which caps the
+                request rate and shrinks the number of concurrent requests
+                when the server answers 429/503 or slows down. Pass ``True``
+                for the default limits or a configured ``RateLimiter``.
+                Throttled requests are then retried by the client instead of
+                by the transport, so every thread backs off together.
+            hooks: Callables that receive a
+                :class:`~pyvergeos.metrics.RequestEvent` (endpoint template,
+                status, latency, retries, bytes, decode time) after each API
+                request. See :mod:`pyvergeos.metrics` for a Prometheus
+                aggregator and an OpenTelemetry exporter.
+            middleware: Callables wrapped around every HTTP send, outermost
+                first. Each is called as ``middleware(request, send)`` where
+                ``request`` is the dict of ``session.request`` arguments and
+                ``send(request)`` continues the chain; it returns the
+                response.
+            transport: ``requests`` transport adapter used instead of the
+                pooled HTTPS adapter, e.g.
+                :meth:`pyvergeos.emulator.VergeEmulator.adapter`. Transport
+                retries are disabled; not supported with ``http2``.
 
         Raises:
-            ValueError: If neither token nor username/password provided.
+            ValueError: If neither token nor username/password provided, or
+                the auth method is unknown.
         """
         self.host = host
         self._username = username
         self._password = password
         self._token = token
+        self._auth_method = AuthMethod(auth_method) if auth_method is not None else None
+        self._session_auth: SessionTokenAuth | None = None
         self._verify_ssl = verify_ssl
         self._timeout = timeout
         self._retry_total = retry_total
@@ -208,6 +358,29 @@ class VergeClient:
         self._retry_status_codes = (
             retry_status_codes if retry_status_codes is not None else RETRY_STATUS_CODES
         )
+        self._http2 = http2
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._tcp_keepalive = tcp_keepalive
+        self._singleflight: SingleFlight | None = SingleFlight() if coalesce_requests else None
+        self._cache: ResponseCache | None = None
+        # Cached responses are scoped to the system and identity that fetched
+        # them, so clients sharing one cache never see each other's rows.
+        identity = username or hashlib.sha256((token or "").encode()).hexdigest()
+        self._cache_scope = (host, identity)
+        if isinstance(cache, ResponseCache):
+            self._cache = cache
+        elif cache:
+            self._cache = ResponseCache()
+        self._rate_limiter: RateLimiter | None = None
+        if isinstance(rate_limit, RateLimiter):
+            self._rate_limiter = rate_limit
+        elif rate_limit:
+            self._rate_limiter = RateLimiter()
+        self._hooks: tuple[RequestHook, ...] = tuple(hooks or ())
+        self._middleware: tuple[Middleware, ...] = tuple(middleware or ())
+        self._transport = transport
 
         self._connection: VergeConnection | None = None
 
@@ -308,10 +481,18 @@ class VergeClient:
             VERGE_USERNAME: Username for basic auth
             VERGE_PASSWORD: Password for basic auth
             VERGE_TOKEN: API token for bearer auth
+            VERGE_AUTH_METHOD: basic, token or session (default: inferred)
             VERGE_VERIFY_SSL: Whether to verify SSL (default: true)
             VERGE_TIMEOUT: Request timeout in seconds (default: 30)
             VERGE_RETRY_TOTAL: Number of retry attempts (default: 3)
             VERGE_RETRY_BACKOFF: Retry backoff factor (default: 1)
+            VERGE_HTTP2: Use the HTTP/2 transport (default: false)
+            VERGE_POOL_MAXSIZE: Maximum pooled connections (default: 10)
+            VERGE_POOL_BLOCK: Block when the pool is exhausted (default: false)
+            VERGE_TCP_KEEPALIVE: Enable TCP keep-alive probes (default: false)
+            VERGE_COALESCE_REQUESTS: Coalesce identical concurrent GETs (default: false)
+            VERGE_CACHE: Cache GET responses with the default TTLs (default: false)
+            VERGE_RATE_LIMIT: Pace requests with the default rate limiter (default: false)
 
         Returns:
             Configured VergeClient instance.
@@ -325,6 +506,9 @@ class VergeClient:
         if not host:
             raise ValueError("VERGE_HOST environment variable not set")
 
+        def env_flag(name: str, default: bool) -> bool:
+            return os.environ.get(name, str(default)).lower() in ("true", "1", "yes")
+
         verify_ssl_str = os.environ.get("VERGE_VERIFY_SSL", "true").lower()
         verify_ssl = verify_ssl_str in ("true", "1", "yes")
 
@@ -339,6 +523,14 @@ class VergeClient:
             retry_backoff_factor=float(
                 os.environ.get("VERGE_RETRY_BACKOFF", str(RETRY_BACKOFF_FACTOR))
             ),
+            http2=env_flag("VERGE_HTTP2", False),
+            pool_maxsize=int(os.environ.get("VERGE_POOL_MAXSIZE", str(POOL_MAXSIZE))),
+            pool_block=env_flag("VERGE_POOL_BLOCK", POOL_BLOCK),
+            tcp_keepalive=env_flag("VERGE_TCP_KEEPALIVE", False),
+            coalesce_requests=env_flag("VERGE_COALESCE_REQUESTS", False),
+            cache=env_flag("VERGE_CACHE", False),
+            auth_method=os.environ.get("VERGE_AUTH_METHOD") or None,
+            rate_limit=env_flag("VERGE_RATE_LIMIT", False),
         )
 
     def connect(self) -> VergeClient:
@@ -352,17 +544,45 @@ class VergeClient:
             AuthenticationError: If authentication fails.
             ValueError: If credentials not provided.
         """
+        retry_status_codes = self._retry_status_codes
+        if self._rate_limiter is not None:
+            # Throttling responses must reach the limiter rather than be
+            # retried inside the transport; _send retries them instead.
+            retry_status_codes = retry_status_codes - self._rate_limiter.throttle_codes
+
         self._connection = VergeConnection(
             host=self.host,
             username=self._username or "",
             verify_ssl=self._verify_ssl,
             retry_total=self._retry_total,
             retry_backoff_factor=self._retry_backoff_factor,
-            retry_status_codes=self._retry_status_codes,
+            retry_status_codes=retry_status_codes,
+            http2=self._http2,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            tcp_keepalive=self._tcp_keepalive,
+            transport=self._transport,
         )
 
         # Determine auth method and build header
-        if self._token:
+        auth_method = self._auth_method
+        if auth_method is None:
+            auth_method = AuthMethod.TOKEN if self._token else AuthMethod.BASIC
+
+        self._session_auth = None
+        if auth_method == AuthMethod.SESSION:
+            from pyvergeos.auth import SessionTokenAuth
+
+            # The token header is added by the first login below
+            auth_header: dict[str, str] = {}
+            self._session_auth = SessionTokenAuth(
+                self._connection,
+                self._username or "",
+                self._password or "",
+                timeout=self._timeout,
+            )
+        elif auth_method == AuthMethod.TOKEN:
             auth_header = build_auth_header(AuthMethod.TOKEN, token=self._token)
             self._connection.token = self._token
         elif self._username and self._password:
@@ -386,6 +606,9 @@ class VergeClient:
             }
         )
 
+        if self._session_auth is not None:
+            self._session_auth.ensure()
+
         # Validate connection
         self._validate_connection()
 
@@ -441,16 +664,128 @@ class VergeClient:
             raise VergeConnectionError(f"Failed to connect to {self.host}: {e}") from e
 
     def disconnect(self) -> None:
-        """Disconnect from VergeOS and cleanup resources."""
+        """Disconnect from VergeOS and cleanup resources.
+
+        With session auth the session token is revoked first.
+        """
+        if self._session_auth is not None:
+            self._session_auth.logout()
+            self._session_auth = None
         if self._connection:
             self._connection.disconnect()
             self._connection = None
 
+    def _ensure_auth(self) -> None:
+        """Renew the session token if it is about to expire (session auth only).
+
+        Called before requests that bypass :meth:`_send`, such as file
+        uploads and downloads made directly on the HTTP session.
+        """
+        if self._session_auth is not None:
+            self._session_auth.ensure()
+
+    def _dispatch(self, session: Any, **kwargs: Any) -> Any:
+        """Send one request on ``session`` through the middleware and rate limiter.
+
+        Requests made directly on the HTTP session (file transfers) go
+        through here so they count against the client-wide limits.
+
+        Args:
+            session: HTTP session of the connection.
+            **kwargs: Arguments for ``session.request``.
+
+        Returns:
+            The HTTP response.
+        """
+        send: Callable[[dict[str, Any]], Any] = partial(self._send_paced, session)
+        for middleware in reversed(self._middleware):
+            send = partial(middleware, send=send)
+        return send(kwargs)
+
+    def _send_paced(self, session: Any, request: dict[str, Any]) -> Any:
+        limiter = self._rate_limiter
+        if limiter is None:
+            return session.request(**request)
+        with limiter.slot() as slot:
+            response = session.request(**request)
+            slot.record(response)
+        return response
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Register an instrumentation hook (see the ``hooks`` argument).
+
+        Example:
+            >>> from pyvergeos.metrics import RequestMetrics
+            >>> metrics = RequestMetrics()
+            >>> client.add_hook(metrics)
+        """
+        self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Unregister an instrumentation hook.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        hooks = list(self._hooks)
+        hooks.remove(hook)
+        self._hooks = tuple(hooks)
+
+    def add_middleware(self, middleware: Middleware) -> None:
+        """Wrap every HTTP send in ``middleware`` (see the ``middleware`` argument).
+
+        Middleware added later runs closer to the network.
+
+        Example:
+            >>> def tag(request, send):
+            ...     request["headers"] = {**request.get("headers", {}), "X-Job": "nightly"}
+            ...     return send(request)
+            >>> client.add_middleware(tag)
+        """
+        self._middleware = (*self._middleware, middleware)
+
     @property
     def is_connected(self) -> bool:
         """Check if client is connected."""
         return self._connection is not None and self._connection.is_connected
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection pool activity.
+
+        Use this to size ``pool_maxsize`` against the number of worker
+        threads: a growing ``connections_discarded`` means callers outnumber
+        pooled connections, and a high ``wait_time_avg`` with
+        ``pool_block=True`` means they queue for one.
+
+        Example:
+            >>> stats = client.pool_stats
+            >>> print(stats.connections_opened, stats.reuse_ratio)
+        """
+        if self._connection is None:
+            return PoolStats()
+        return self._connection.pool_stats()
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Response cache, or None when caching is disabled.
+
+        Example:
+            >>> client.cache.stats().hit_ratio
+            >>> client.cache.invalidate("vms")
+        """
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Client-wide rate limiter, or None when rate limiting is disabled.
+
+        Example:
+            >>> stats = client.rate_limiter.stats()
+            >>> print(stats.concurrency_limit, stats.throttled)
+        """
+        return self._rate_limiter
+
     @property
     def version(self) -> str | None:
         """Get VergeOS version (yb_version)."""
@@ -514,6 +849,66 @@ class VergeClient:
         if not self._connection or not self._connection.is_connected:
             raise NotConnectedError("Not connected to VergeOS")
 
+        if method.upper() != "GET":
+            try:
+                return self._send(method, endpoint, params, json_data, timeout)
+            finally:
+                if self._cache is not None:
+                    self._cache.invalidate(endpoint)
+
+        key = request_key(method, endpoint, params)
+
+        def fetch() -> dict[str, Any] | list[Any] | None:
+            if self._singleflight is not None:
+                return self._singleflight.do(
+                    key, lambda: self._send(method, endpoint, params, json_data, timeout)
+                )
+            return self._send(method, endpoint, params, json_data, timeout)
+
+        if self._cache is not None:
+            return self._cache.get_or_fetch(  # type: ignore[no-any-return]
+                (self._cache_scope, key), endpoint, fetch
+            )
+        return fetch()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Send a single HTTP request to the VergeOS API.
+
+        Takes the same arguments as :meth:`_request`, which layers the
+        response cache and request coalescing on top of this method.
+        Registered hooks receive one event per call, covering retries.
+        """
+        hooks = self._hooks
+        if not hooks:
+            return self._transmit(method, endpoint, params, json_data, timeout)
+        recorder = RequestRecorder(method, endpoint)
+        try:
+            return self._transmit(method, endpoint, params, json_data, timeout, recorder)
+        except Exception as e:
+            recorder.error = type(e).__name__
+            raise
+        finally:
+            emit(hooks, recorder.event())
+
+    def _transmit(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        timeout: int | None,
+        recorder: RequestRecorder | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        if not self._connection or not self._connection.is_connected:
+            raise NotConnectedError("Not connected to VergeOS")
+
         session = self._connection._session
         if session is None:
             raise NotConnectedError("Session not initialized")
@@ -522,62 +917,145 @@ class VergeClient:
 
         logger.debug("%s %s params=%s", method, url, params)
 
+        auth = self._session_auth
+        token = auth.ensure() if auth is not None else None
+        limiter = self._rate_limiter
+        renewed = False
+        attempt = 0
+
+        try:
+            while True:
+                response = self._dispatch(
+                    session,
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    timeout=timeout or self._timeout,
+                )
+                if recorder is not None:
+                    recorder.sent(response)
+                status = response.status_code
+                if auth is not None and status == HTTPStatus.UNAUTHORIZED and not renewed:
+                    # The session token expired or was revoked early: log in
+                    # again (once across concurrent callers) and resend.
+                    logger.debug("Session token rejected; renewing")
+                    token = auth.refresh(token)
+                    renewed = True
+                    continue
+                if (
+                    limiter is not None
+                    and status in limiter.throttle_codes
+                    and status in self._retry_status_codes
+                    and method.upper() in RETRY_METHODS
+                    and attempt < self._retry_total
+                ):
+                    # The limiter has already shrunk the window (and paused
+                    # all requests for Retry-After); back off and resend.
+                    attempt += 1
+                    logger.debug("HTTP %d from %s; retry %d", status, url, attempt)
+                    time.sleep(retry_delay(attempt, self._retry_backoff_factor, response))
+                    continue
+                if recorder is not None:
+                    with recorder.decoding():
+                        return self._handle_response(response)
+                return self._handle_response(response)
+
+        except requests.exceptions.Timeout as e:
+            raise VergeTimeoutError(f"Request to {url} timed out") from e
+        except requests.exceptions.ConnectionError as e:
+            raise VergeConnectionError(f"Connection to {self.host} failed: {e}") from e
+
+    def _stream(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Stream a GET response, yielding list elements as they are decoded.
+
+        The body is read in ``chunk_size`` pieces and parsed incrementally, so
+        memory use does not grow with the number of rows. Streamed requests
+        bypass the response cache and request coalescing.
+
+        Args:
+            endpoint: API endpoint (without /api/v4 prefix).
+            params: Query parameters.
+            timeout: Request timeout in seconds.
+            chunk_size: Bytes read from the socket at a time.
+
+        Yields:
+            Decoded elements of the JSON array (a single object response is
+            yielded as one item).
+
+        Raises:
+            NotConnectedError: If not connected.
+            APIError: For error responses (see :meth:`_request`).
+            VergeTimeoutError: If the request times out.
+            VergeConnectionError: If the connection fails.
+        """
+        if not self._connection or not self._connection.is_connected:
+            raise NotConnectedError("Not connected to VergeOS")
+
+        session = self._connection._session
+        if session is None:
+            raise NotConnectedError("Session not initialized")
+
+        url = f"{self._connection.api_base_url}/{endpoint}"
+
+        logger.debug("GET %s params=%s (streaming)", url, params)
+        self._ensure_auth()
+        hooks = self._hooks
+        recorder = RequestRecorder("GET", endpoint, streamed=True) if hooks else None
+
         try:
-            response = session.request(
-                method=method,
+            response = self._dispatch(
+                session,
+                method="GET",
                 url=url,
                 params=params,
-                json=json_data,
                 timeout=timeout or self._timeout,
+                stream=True,
             )
-
-            return self._handle_response(response)
+            if recorder is not None:
+                recorder.sent(response)
+            try:
+                if response.status_code not in HTTP_SUCCESS_CODES:
+                    self._handle_response(response)
+                    return
+                chunks = response.iter_content(chunk_size=chunk_size)
+                if recorder is not None:
+                    chunks = recorder.count_chunks(chunks)
+                for item in codec.iter_json_array(chunks):
+                    if item is not None:
+                        yield item
+            finally:
+                response.close()
 
         except requests.exceptions.Timeout as e:
+            if recorder is not None:
+                recorder.error = VergeTimeoutError.__name__
             raise VergeTimeoutError(f"Request to {url} timed out") from e
-        except requests.exceptions.ConnectionError as e:
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            if recorder is not None:
+                recorder.error = VergeConnectionError.__name__
             raise VergeConnectionError(f"Connection to {self.host} failed: {e}") from e
+        except Exception as e:
+            if recorder is not None:
+                recorder.error = type(e).__name__
+            raise
+        finally:
+            if recorder is not None:
+                emit(hooks, recorder.event())
 
-    def _handle_response(self, response: requests.Response) -> dict[str, Any] | list[Any] | None:
+    def _handle_response(self, response: Any) -> dict[str, Any] | list[Any] | None:
         """Handle API response and raise appropriate exceptions."""
-        # Success responses
-        if response.status_code in HTTP_SUCCESS_CODES:
-            if response.text:
-                return response.json()  # type: ignore[no-any-return]
-            return None
-
-        if response.status_code == HTTP_NO_CONTENT:
-            return None
-
-        # Error responses
-        error_message = self._extract_error_message(response)
-
-        if response.status_code in HTTP_AUTH_FAILURE_CODES:
-            raise AuthenticationError(error_message, status_code=response.status_code)
-        elif response.status_code == HTTP_NOT_FOUND:
-            raise NotFoundError(error_message, status_code=response.status_code)
-        elif response.status_code == HTTP_CONFLICT:
-            raise ConflictError(error_message, status_code=response.status_code)
-        elif response.status_code == HTTP_UNPROCESSABLE_ENTITY:
-            raise ValidationError(error_message, status_code=response.status_code)
-        else:
-            raise APIError(error_message, status_code=response.status_code)
+        return handle_response(response)
 
-    def _extract_error_message(self, response: requests.Response) -> str:
+    def _extract_error_message(self, response: Any) -> str:
         """Extract error message from API response."""
-        try:
-            data = response.json()
-            # VergeOS uses 'err', 'error', or 'message' fields
-            for field in ("err", "error", "message"):
-                if field in data:
-                    msg = data[field]
-                    if isinstance(msg, str):
-                        return msg
-                    elif isinstance(msg, dict) and "message" in msg:
-                        return str(msg["message"])
-            return str(data)
-        except (json.JSONDecodeError, KeyError):
-            return response.text or f"HTTP {response.status_code}"
+        return extract_error_message(response)
 
     # Resource manager properties
 
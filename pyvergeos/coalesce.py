@@ -0,0 +1,128 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+When several threads share one VergeClient and issue the same GET at the
+same moment (for example 50 workers polling ``system`` or ``clusters``),
+only the first caller performs the HTTP request. Callers that arrive while
+it is in flight wait for it and receive a copy of the same response.
+
+Example:
+    >>> flight = SingleFlight()
+    >>> result = flight.do(("GET", "clusters", ()), lambda: fetch_clusters())
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections.abc import Hashable, Mapping
+from typing import Any, Callable, TypeVar
+
+R = TypeVar("R")
+
+
+def request_key(method: str, endpoint: str, params: Mapping[str, Any] | None = None) -> Hashable:
+    """Build the coalescing key for a request.
+
+    Parameter order does not matter: ``{"a": 1, "b": 2}`` and
+    ``{"b": 2, "a": 1}`` produce the same key.
+
+    Args:
+        method: HTTP method.
+        endpoint: API endpoint (without /api/v4 prefix).
+        params: Query parameters.
+
+    Returns:
+        Hashable key identifying the request.
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), endpoint, items)
+
+
+class _Call:
+    """A request in flight and the callers waiting on it."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key.
+
+    The first caller for a key runs the function; callers arriving before it
+    finishes block and receive a deep copy of its result (or the same
+    exception), so one caller mutating a returned dict cannot affect
+    another. Results are not cached: once the call completes, the next
+    caller starts a new one.
+
+    Attributes:
+        calls: Number of calls actually executed.
+        coalesced: Number of callers served by another caller's call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Key identifying identical calls (see :func:`request_key`).
+            fn: Function performing the call.
+
+        Returns:
+            The function result (a deep copy for coalesced callers).
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._inflight.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._inflight[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            # Followers copy from a private snapshot so the leader is free to
+            # mutate the object it gets back. No waiters can join once the
+            # call is removed from the in-flight table.
+            with self._lock:
+                del self._inflight[key]
+                waiters = call.waiters
+            if waiters:
+                call.result = copy.deepcopy(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    @property
+    def inflight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._inflight)
@@ -0,0 +1,222 @@
+"""JSON decoding backend for API responses.
+
+Responses are decoded straight from the raw body bytes with the fastest
+available backend:
+
+* ``orjson`` if installed,
+* otherwise ``msgspec`` if installed,
+* otherwise the standard library ``json`` module.
+
+No extra dependency is required; install ``orjson`` or ``msgspec`` to
+speed up large list responses (``logs``, ``vms``, billing exports).
+
+:func:`iter_json_array` decodes a JSON array incrementally from a stream of
+byte chunks, for responses too large to hold in memory.
+
+Example:
+    >>> from pyvergeos import codec
+    >>> codec.json_backend()
+    'orjson'
+    >>> codec.set_json_decoder("json")     # force the standard library
+    >>> codec.set_json_decoder(my_loads)   # any callable taking bytes
+    >>> codec.set_json_decoder(None)       # back to auto-detection
+"""
+
+from __future__ import annotations
+
+import codecs
+import importlib
+import json
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any, Callable, Union
+
+#: Callable turning a JSON document (bytes or str) into Python objects
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+#: Backends tried, in order, when auto-detecting
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_backend(name: str) -> JSONDecoder:
+    """Return the decode function for a named backend.
+
+    Raises:
+        ImportError: If the backend's package is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    # Optional backends are imported by name so type checking does not
+    # depend on which of them happen to be installed.
+    if name == "orjson":
+        orjson = importlib.import_module("orjson")
+        return orjson.loads  # type: ignore[no-any-return]
+    if name == "msgspec":
+        msgspec = importlib.import_module("msgspec")
+        msgspec_decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data: bytes | str) -> Any:
+            try:
+                return msgspec_decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return msgspec_loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}")
+
+
+def _detect() -> tuple[str, JSONDecoder]:
+    """Pick the first installed backend."""
+    for name in BACKENDS:
+        try:
+            return name, _load_backend(name)
+        except ImportError:
+            continue
+    return "json", json.loads  # pragma: no cover - json is always available
+
+
+_backend, _decoder = _detect()
+
+
+def json_backend() -> str:
+    """Return the name of the active decoder ("orjson", "msgspec", "json" or "custom")."""
+    return _backend
+
+
+def set_json_decoder(decoder: str | JSONDecoder | None) -> None:
+    """Select the JSON decoder used for API responses.
+
+    Args:
+        decoder: A backend name ("orjson", "msgspec", "json"), a callable
+            accepting ``bytes`` and returning Python objects, or None to
+            restore auto-detection.
+
+    Raises:
+        ImportError: If the named backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    global _backend, _decoder
+    if decoder is None:
+        _backend, _decoder = _detect()
+    elif isinstance(decoder, str):
+        _backend, _decoder = decoder, _load_backend(decoder)
+    else:
+        _backend, _decoder = "custom", decoder
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document with the active backend.
+
+    Args:
+        data: Raw JSON (usually ``response.content``).
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON (all backends raise a
+            ``ValueError`` subclass).
+    """
+    return _decoder(data)
+
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]}" + _WHITESPACE
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after ``pos``."""
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Incrementally decode a JSON array, yielding elements as they complete.
+
+    Only the current, partially received element is buffered, so memory use
+    is bounded by the size of one element plus one chunk regardless of the
+    length of the array. Elements are decoded with the standard library
+    decoder, which supports resuming mid-document.
+
+    A document that is not an array (e.g. a single object) is buffered in
+    full and yielded as one item.
+
+    Args:
+        chunks: UTF-8 encoded body chunks (e.g. ``response.iter_content()``).
+
+    Yields:
+        Decoded array elements.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    stream = iter(chunks)
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    count = 0
+    expect_value = True
+
+    chunk: bytes | None
+    for chunk in chain(stream, [None]):
+        final = chunk is None
+        text = utf8.decode(b"", final=True) if chunk is None else utf8.decode(chunk)
+        buf = buf[pos:] + text
+        pos = 0
+
+        while True:
+            pos = _skip_whitespace(buf, pos)
+            if pos >= len(buf):
+                break
+
+            if not started:
+                if buf[pos] != "[":
+                    # Not an array: wait for the whole document.
+                    if not final:
+                        break
+                    yield loads(buf[pos:])
+                    return
+                started = True
+                pos += 1
+                continue
+
+            char = buf[pos]
+            if char == "]":
+                if expect_value and count:
+                    raise ValueError(f"Trailing comma in JSON array at position {pos}")
+                # Consume the rest of the body so the connection can be reused.
+                rest = buf[pos + 1 :] + "".join(utf8.decode(c) for c in stream)
+                if rest.strip(_WHITESPACE):
+                    raise ValueError("Extra data after JSON array")
+                return
+            if char == ",":
+                if expect_value:
+                    raise ValueError(f"Unexpected ',' in JSON array at position {pos}")
+                expect_value = True
+                pos += 1
+                continue
+            if not expect_value:
+                raise ValueError(f"Expected ',' or ']' in JSON array at position {pos}")
+
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # Element incomplete; wait for more data
+            # A scalar ends only at a delimiter; "1." or "1.5e" may go on in
+            # the next chunk.
+            scalar = not isinstance(value, (dict, list, str))
+            if scalar and not final and (end >= len(buf) or buf[end] not in _DELIMITERS):
+                break
+            yield value
+            count += 1
+            expect_value = False
+            pos = end
+
+    if started:
+        raise ValueError("Unterminated JSON array")
@@ -0,0 +1,270 @@
+"""Column-oriented result sets for large list queries.
+
+Turning each row of a 50k-row stats history into a ``ResourceObject``
+costs a dict, a manager reference and per-row attribute lookups. A
+:class:`ColumnSet` stores one array per field instead, so numeric columns
+take 8 bytes per value and can be aggregated with vectorized math.
+
+Columns are NumPy arrays when NumPy is installed, and stdlib
+:class:`array.array` objects otherwise. NumPy is not a dependency; install it
+to get ``ndarray`` columns.
+
+Column types are inferred from the values:
+
+========================  ==================  ==========================
+Values                    NumPy               stdlib fallback
+========================  ==================  ==========================
+integers                  ``int64``           ``array('q')``
+floats, or ints + nulls   ``float64`` (NaN)   ``array('d')`` (NaN)
+booleans                  ``bool``            ``array('b')`` (0/1)
+anything else             ``object``          ``list``
+========================  ==================  ==========================
+
+Example:
+    >>> cols = vm.stats.history_columnar(fields=["timestamp", "total_cpu"])
+    >>> cols["total_cpu"].mean()
+    12.7
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+#: Column backends, in order of preference when auto-detecting
+BACKENDS = ("numpy", "array")
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def column_name(field: str) -> str:
+    """Return the column name a field selector produces.
+
+    Example:
+        >>> column_name("machine#status#node as node_key")
+        'node_key'
+    """
+    return field.rsplit(" as ", 1)[-1].strip()
+
+
+def _numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def resolve_backend(backend: str | None) -> str:
+    """Pick the column backend.
+
+    Args:
+        backend: "numpy", "array", or None to use NumPy when installed.
+
+    Returns:
+        The backend name.
+
+    Raises:
+        ImportError: If "numpy" is requested but not installed.
+        ValueError: If the backend name is unknown.
+    """
+    if backend is None:
+        return "numpy" if _numpy() is not None else "array"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown column backend {backend!r}; expected one of {BACKENDS}")
+    if backend == "numpy" and _numpy() is None:
+        raise ImportError(
+            "numpy is required for backend='numpy'. Install it with: pip install numpy"
+        )
+    return backend
+
+
+class _ColumnBuilder:
+    """Accumulates one column, narrowing to a typed array where possible.
+
+    Values go straight into a typed array, widened as needed (int to
+    float, anything to object), so no per-row Python list is kept for
+    numeric columns.
+    """
+
+    __slots__ = ("kind", "data", "leading_nulls")
+
+    def __init__(self, leading_nulls: int = 0) -> None:
+        self.kind: str | None = None
+        self.data: Any = None
+        self.leading_nulls = leading_nulls
+
+    def _start(self, kind: str) -> None:
+        nulls = self.leading_nulls
+        self.kind = kind
+        if kind == "int" and nulls:
+            kind = self.kind = "float"
+        if kind == "int":
+            self.data = array("q")
+        elif kind == "float":
+            self.data = array("d", [math.nan]) * nulls
+        elif kind == "bool" and not nulls:
+            self.data = array("b")
+        else:
+            self.kind = "object"
+            self.data = [None] * nulls
+
+    def _widen(self, kind: str) -> None:
+        if kind == "float":
+            self.data = array("d", self.data)
+        else:
+            self.data = self.data.tolist() if self.kind != "bool" else [bool(v) for v in self.data]
+        self.kind = kind
+
+    def append(self, value: Any) -> None:
+        kind = self.kind
+        if kind == "object":
+            self.data.append(value)
+            return
+        if value is None:
+            if kind is None:
+                self.leading_nulls += 1
+                return
+            if kind != "float":
+                self._widen("float" if kind == "int" else "object")
+            self.data.append(math.nan if self.kind == "float" else None)
+            return
+
+        if isinstance(value, bool):
+            new = "bool"
+        elif isinstance(value, int):
+            new = "int" if _INT64_MIN <= value <= _INT64_MAX else "object"
+        elif isinstance(value, float):
+            new = "float"
+        else:
+            new = "object"
+
+        if kind is None:
+            self._start(new)
+        elif new != kind:
+            if {kind, new} == {"int", "float"}:
+                if kind == "int":
+                    self._widen("float")
+            else:
+                self._widen("object")
+
+        if self.kind == "float":
+            self.data.append(float(value))
+        else:
+            self.data.append(value)
+
+    def finish(self, rows: int, backend: str) -> Any:
+        """Return the finished column for ``backend``."""
+        if self.kind is None:
+            self._start("object")
+        np = _numpy() if backend == "numpy" else None
+        if np is None:
+            return self.data
+        if self.kind in ("int", "float", "bool") and not self.data:
+            return np.array(
+                [], dtype={"int": np.int64, "float": np.float64, "bool": bool}[self.kind]
+            )
+        if self.kind == "int":
+            return np.frombuffer(self.data, dtype=np.int64)
+        if self.kind == "float":
+            return np.frombuffer(self.data, dtype=np.float64)
+        if self.kind == "bool":
+            return np.frombuffer(self.data, dtype=np.int8).astype(bool)
+        column = np.empty(rows, dtype=object)
+        for i, value in enumerate(self.data):
+            # Item by item, so list values are not broadcast into the array
+            column[i] = value
+        return column
+
+
+class ColumnSet(Mapping[str, Any]):
+    """Query results stored column by column.
+
+    Behaves as a read-only mapping of column name to array. ``len()`` is the
+    number of columns; :attr:`num_rows` is the number of rows.
+
+    Attributes:
+        backend: "numpy" or "array".
+    """
+
+    def __init__(self, columns: dict[str, Any], num_rows: int, backend: str) -> None:
+        self._columns = columns
+        self._num_rows = num_rows
+        self.backend = backend
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows."""
+        return self._num_rows
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names, in field order."""
+        return list(self._columns)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the rows as plain dicts."""
+        columns = list(self._columns.items())
+        for i in range(self._num_rows):
+            yield {name: column[i] for name, column in columns}
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnSet(rows={self._num_rows}, columns={self.columns!r}, backend={self.backend!r})"
+        )
+
+
+def to_columns(
+    rows: Iterable[Mapping[str, Any]],
+    fields: Sequence[str] | None = None,
+    backend: str | None = None,
+) -> ColumnSet:
+    """Build a :class:`ColumnSet` from row dicts.
+
+    Rows are consumed one at a time, so a streamed iterator is never held
+    in memory as a whole.
+
+    Args:
+        rows: Rows as returned by the API.
+        fields: Field selectors (aliases such as ``"a#b as c"`` are resolved
+            to ``c``). Without fields, columns are discovered from the rows.
+        backend: "numpy", "array" or None (NumPy when installed).
+
+    Returns:
+        ColumnSet with one column per field.
+
+    Raises:
+        ImportError: If "numpy" is requested but not installed.
+        ValueError: If the backend name is unknown.
+    """
+    backend = resolve_backend(backend)
+    builders: dict[str, _ColumnBuilder] = {}
+    if fields:
+        builders = {column_name(f): _ColumnBuilder() for f in fields}
+    discover = not fields
+
+    count = 0
+    for row in rows:
+        if discover:
+            for name in row:
+                if name not in builders:
+                    builders[name] = _ColumnBuilder(leading_nulls=count)
+        for name, builder in builders.items():
+            builder.append(row.get(name))
+        count += 1
+
+    columns = {name: builder.finish(count, backend) for name, builder in builders.items()}
+    return ColumnSet(columns, count, backend)
@@ -1,30 +1,219 @@
 """Connection and session management for VergeOS API."""
 
+import queue
+import socket
+import threading
+import time
 from base64 import b64encode
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
 from pyvergeos.constants import (
     API_VERSION,
+    HEADER_SESSION_TOKEN,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     RETRY_BACKOFF_FACTOR,
     RETRY_METHODS,
     RETRY_STATUS_CODES,
     RETRY_TOTAL,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
 )
 
+if TYPE_CHECKING:
+    from pyvergeos.transport import HTTPXSession
+
 
 class AuthMethod(Enum):
-    """Authentication methods supported by VergeOS API."""
+    """Authentication methods supported by VergeOS API.
+
+    ``BASIC`` sends the username and password with every request and
+    ``TOKEN`` sends an API key as a bearer token. ``SESSION`` exchanges the
+    username and password once for a session token, which is renewed
+    before it expires.
+    """
 
     BASIC = "basic"
     TOKEN = "token"
+    SESSION = "session"
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of connection pool activity.
+
+    Attributes:
+        requests: Connections checked out of the pool (one per HTTP attempt).
+        connections_opened: New connections created.
+        connections_reused: Checkouts served by an existing pooled connection.
+        connections_discarded: Connections closed because the pool was full
+            when they were returned (raise ``pool_maxsize`` if this grows).
+        connections_in_use: Connections currently checked out.
+        connections_idle: Open connections waiting in the pool.
+        wait_time_total: Total seconds callers spent waiting for a connection.
+        wait_time_max: Longest single wait for a connection, in seconds.
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    connections_discarded: int = 0
+    connections_in_use: int = 0
+    connections_idle: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Average seconds spent waiting for a connection per checkout."""
+        return self.wait_time_total / self.requests if self.requests else 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of checkouts served by an existing connection."""
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+
+class _PoolCounters:
+    """Thread-safe counters fed by the instrumented urllib3 pools."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.releases = 0
+        self.opened = 0
+        self.discarded = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.pools: list[HTTPConnectionPool] = []
+
+    def record_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+
+    def record_release(self) -> None:
+        with self._lock:
+            self.releases += 1
+
+    def record_open(self) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def record_discard(self) -> None:
+        with self._lock:
+            self.discarded += 1
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            idle = 0
+            for pool in self.pools:
+                pooled = getattr(pool.pool, "queue", None) or []
+                idle += sum(1 for conn in pooled if conn is not None and conn.sock is not None)
+            return PoolStats(
+                requests=self.checkouts,
+                connections_opened=self.opened,
+                connections_reused=max(0, self.checkouts - self.opened),
+                connections_discarded=self.discarded,
+                connections_in_use=max(0, self.checkouts - self.releases),
+                connections_idle=idle,
+                wait_time_total=self.wait_total,
+                wait_time_max=self.wait_max,
+            )
+
+
+def tcp_keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive probes on pooled connections.
+
+    Keeps idle pooled connections from being silently dropped by firewalls
+    and load balancers between the client and the appserver.
+
+    Returns:
+        urllib3-style ``(level, option, value)`` tuples, including the
+        default ``TCP_NODELAY`` option.
+    """
+    options: list[tuple[int, int, int]] = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools record :class:`PoolStats`."""
+
+    def __init__(self, *args: Any, socket_options: Optional[list[Any]] = None, **kwargs: Any):
+        self._counters = _PoolCounters()
+        self._socket_options = socket_options
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        counters = self._counters
+
+        class _CountingQueue(queue.LifoQueue):  # type: ignore[type-arg]
+            def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+                try:
+                    super().put(item, block, timeout)
+                except queue.Full:
+                    counters.record_discard()
+                    raise
+
+        def instrument(base: type[HTTPConnectionPool]) -> type[HTTPConnectionPool]:
+            class _InstrumentedPool(base):  # type: ignore[valid-type,misc]
+                QueueCls = _CountingQueue
+
+                def __init__(self, *args: Any, **kwargs: Any) -> None:
+                    super().__init__(*args, **kwargs)
+                    counters.pools.append(self)
+
+                def _new_conn(self) -> Any:
+                    counters.record_open()
+                    return super()._new_conn()
+
+                def _get_conn(self, timeout: Optional[float] = None) -> Any:
+                    start = time.monotonic()
+                    conn = super()._get_conn(timeout)
+                    counters.record_checkout(time.monotonic() - start)
+                    return conn
+
+                def _put_conn(self, conn: Any) -> None:
+                    counters.record_release()
+                    super()._put_conn(conn)
+
+            return _InstrumentedPool
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": instrument(HTTPConnectionPool),
+            "https": instrument(HTTPSConnectionPool),
+        }
+
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of pool activity for this adapter."""
+        return self._counters.snapshot()
 
 
 @dataclass
@@ -35,8 +224,8 @@ class VergeConnection:
         host: VergeOS hostname or IP address.
         username: Username for authentication.
         api_base_url: Computed API base URL.
-        token: Authentication token (Basic or Bearer).
-        token_expires: Token expiration time (if applicable).
+        token: Authentication token (bearer API key or session token).
+        token_expires: Session token expiration time (None for API keys).
         verify_ssl: Whether to verify SSL certificates. When False, the
             InsecureRequestWarning suppression is process-global — it will
             silence warnings for all clients in the same process, even those
@@ -44,6 +233,19 @@ class VergeConnection:
         retry_total: Number of retry attempts for transient failures.
         retry_backoff_factor: Backoff factor for retry delay calculation.
         retry_status_codes: HTTP status codes that trigger automatic retry.
+        http2: Use the httpx-based HTTP/2 transport instead of requests, so
+            concurrent requests are multiplexed over one TLS connection.
+            Requires the ``http2`` extra.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept open to the host.
+            Size this to the number of threads sharing the client.
+        pool_block: When all ``pool_maxsize`` connections are busy, block
+            until one is free instead of opening a throwaway connection.
+        tcp_keepalive: Enable TCP keep-alive probes on pooled connections so
+            idle connections are not silently dropped by middleboxes.
+        transport: ``requests`` transport adapter to mount instead of the
+            pooled, retrying HTTPS adapter (e.g. the API emulator). Not
+            supported with ``http2``.
         connected_at: Timestamp when connection was established.
         vergeos_version: VergeOS version from system endpoint.
         is_connected: Whether connection is active.
@@ -58,20 +260,50 @@ class VergeConnection:
     retry_total: int = RETRY_TOTAL
     retry_backoff_factor: float = RETRY_BACKOFF_FACTOR
     retry_status_codes: Iterable[int] = RETRY_STATUS_CODES
+    http2: bool = False
+    pool_connections: int = POOL_CONNECTIONS
+    pool_maxsize: int = POOL_MAXSIZE
+    pool_block: bool = POOL_BLOCK
+    tcp_keepalive: bool = False
+    transport: Optional[BaseAdapter] = field(default=None, repr=False)
     connected_at: Optional[datetime] = None
     vergeos_version: Optional[str] = None
     os_version: Optional[str] = None
     cloud_name: Optional[str] = None
     is_connected: bool = False
 
-    _session: Optional[requests.Session] = field(default=None, repr=False)
+    _session: Optional[Union[requests.Session, "HTTPXSession"]] = field(default=None, repr=False)
+    _adapter: Optional[InstrumentedHTTPAdapter] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.api_base_url = f"https://{self.host}/api/{API_VERSION}"
 
+        if self.http2:
+            if self.transport is not None:
+                raise ValueError("A custom transport adapter cannot be used with http2")
+            if self._session is None:
+                from pyvergeos.transport import HTTPXSession
+
+                self._session = HTTPXSession(
+                    http2=True,
+                    verify=self.verify_ssl,
+                    retry_total=self.retry_total,
+                    retry_backoff_factor=self.retry_backoff_factor,
+                    retry_status_codes=self.retry_status_codes,
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize,
+                    socket_options=tcp_keepalive_socket_options() if self.tcp_keepalive else None,
+                )
+            return
+
         # Create session (done here so it can be mocked in tests)
         if self._session is None:
             self._session = requests.Session()
+        session = cast(requests.Session, self._session)
+
+        if self.transport is not None:
+            session.mount("https://", self.transport)
+            return
 
         # Configure retry strategy with configurable parameters
         retry_strategy = Retry(
@@ -80,15 +312,18 @@ class VergeConnection:
             status_forcelist=list(self.retry_status_codes),
             allowed_methods=list(RETRY_METHODS),
         )
-        adapter = HTTPAdapter(
+        adapter = InstrumentedHTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=1,
-            pool_maxsize=10,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            socket_options=tcp_keepalive_socket_options() if self.tcp_keepalive else None,
         )
-        self._session.mount("https://", adapter)
+        session.mount("https://", adapter)
+        self._adapter = adapter
 
         if not self.verify_ssl:
-            self._session.verify = False
+            session.verify = False
             # Suppress InsecureRequestWarning. Note: this is process-global —
             # setting verify_ssl=False on any client silences warnings for all
             # clients in the same process.
@@ -102,6 +337,19 @@ class VergeConnection:
                 category=urllib3.exceptions.InsecureRequestWarning,
             )
 
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of connection pool activity.
+
+        Returns:
+            PoolStats for the active transport (all zeros if unavailable).
+        """
+        if self._adapter is not None:
+            return self._adapter.pool_stats()
+        stats = getattr(self._session, "pool_stats", None)
+        if callable(stats):
+            return cast(PoolStats, stats())
+        return PoolStats()
+
     def is_token_valid(self) -> bool:
         """Check if the current token/credentials are valid.
 
@@ -143,10 +391,10 @@ def build_auth_header(
         method: Authentication method to use.
         username: Username for basic auth.
         password: Password for basic auth.
-        token: API token for token auth.
+        token: API token for token auth, or session token for session auth.
 
     Returns:
-        Dictionary with Authorization header.
+        Dictionary with the Authorization (or session token) header.
 
     Raises:
         ValueError: If required credentials not provided.
@@ -160,4 +408,8 @@ def build_auth_header(
         if not token:
             raise ValueError("Token required for token auth")
         return {"Authorization": f"Bearer {token}"}
+    elif method == AuthMethod.SESSION:
+        if not token:
+            raise ValueError("Session token required for session auth")
+        return {HEADER_SESSION_TOKEN: token}
     raise ValueError(f"Unknown auth method: {method}")
@@ -34,6 +34,19 @@ TASK_WAIT_TIMEOUT = 300
 #: Timeout for file chunk uploads
 UPLOAD_CHUNK_TIMEOUT = 120
 
+#: Seconds before a session token expires at which it is renewed
+SESSION_TOKEN_REFRESH_MARGIN = 60
+
+#: Assumed session token lifetime when the server does not report one
+SESSION_TOKEN_LIFETIME = 900
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+#: Bytes read per chunk when streaming large list responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # =============================================================================
 # Retry Configuration
 # =============================================================================
@@ -58,6 +71,94 @@ RETRY_STATUS_CODES = frozenset(
 #: HTTP methods that are safe to retry
 RETRY_METHODS = frozenset({"GET", "PUT", "DELETE", "POST"})
 
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+#: Default request rate cap of the client-wide rate limiter (requests/second)
+RATE_LIMIT_RATE = 50.0
+
+#: Requests the rate limiter lets through at once after an idle period
+RATE_LIMIT_BURST = 20
+
+#: Upper bound of the rate limiter's concurrency window
+RATE_LIMIT_MAX_CONCURRENCY = 16
+
+#: Concurrency window multiplier applied when the server is congested
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+
+#: Latency, as a multiple of the baseline, treated as congestion
+RATE_LIMIT_LATENCY_TOLERANCE = 3.0
+
+#: HTTP status codes that signal throttling to the rate limiter
+RATE_LIMIT_THROTTLE_CODES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,  # 429
+        HTTPStatus.SERVICE_UNAVAILABLE,  # 503
+    }
+)
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+#: Upper bounds (seconds) of the request latency histogram buckets
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# =============================================================================
+# Connection Pool
+# =============================================================================
+
+#: Number of per-host connection pools to cache
+POOL_CONNECTIONS = 1
+
+#: Maximum number of connections kept open per host
+POOL_MAXSIZE = 10
+
+#: Block callers when all pooled connections are busy instead of opening extra ones
+POOL_BLOCK = False
+
+#: Idle seconds before TCP keep-alive probes start (when tcp_keepalive is enabled)
+TCP_KEEPALIVE_IDLE = 60
+
+#: Seconds between TCP keep-alive probes
+TCP_KEEPALIVE_INTERVAL = 15
+
+#: Unanswered probes before the connection is considered dead
+TCP_KEEPALIVE_COUNT = 4
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+#: Maximum number of GET responses held by the response cache
+CACHE_MAX_ENTRIES = 1024
+
+#: Per-endpoint TTLs (seconds) used by the response cache. Reference data
+#: that rarely changes is kept for minutes; live status only briefly.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "settings": 300,
+    "clusters": 300,
+    "cluster_tiers": 300,
+    "storage_tiers": 300,
+    "nvidia_vgpu_profiles": 3600,
+    "machine_status": 2,
+}
+
+# =============================================================================
+# Batch Lookups
+# =============================================================================
+
+#: Maximum keys per ``$key in (...)`` query issued by ``get_many``
+GET_MANY_CHUNK_SIZE = 200
+
+#: Maximum URL-encoded length of a generated ``in (...)`` filter, keeping
+#: request URLs well below the common 8 KB server limit
+MAX_IN_FILTER_LENGTH = 4096
+
+#: Default number of concurrent calls made by bulk operations (action_many)
+BULK_CONCURRENCY = 8
+
 # =============================================================================
 # Polling Intervals (in seconds)
 # =============================================================================
@@ -68,6 +169,34 @@ POLL_INTERVAL = 2
 #: Interval for file/job status polling
 POLL_INTERVAL_FAST = 0.5
 
+#: First wait after the immediate first probe of a status poll; waits then
+#: grow toward the caller's poll interval
+POLL_INITIAL_INTERVAL = 0.1
+
+#: Factor by which the wait between status polls grows after each probe
+POLL_BACKOFF_MULTIPLIER = 2.0
+
+#: Random spread (fraction of the wait) added to each poll wait so that
+#: clients waiting on the same operation do not poll in lockstep
+POLL_JITTER = 0.2
+
+#: Longest wait for a newly created object to become visible through the API
+READY_TIMEOUT = 10
+
+#: Longest wait for a NAS service deployed from the Services recipe to appear
+NAS_DEPLOY_TIMEOUT = 30
+
+#: Consecutive transient poll failures after which the task watcher fails the
+#: futures it watches
+TASK_WATCH_MAX_FAILURES = 5
+
+#: Longest wait between task status polls while a webhook receiver is pushing
+#: task events; these polls only catch events that were lost
+TASK_EVENT_FALLBACK_INTERVAL = 30
+
+#: Task events that make VergeOS notify a task event receiver
+TASK_EVENT_TRIGGERS = ("complete", "error")
+
 # =============================================================================
 # HTTP Status Code Groups
 # =============================================================================
@@ -113,6 +242,12 @@ CONTENT_TYPE_OCTET_STREAM = "application/octet-stream"
 #: Authorization header name
 HEADER_AUTHORIZATION = "Authorization"
 
+#: Header carrying a session token obtained from ``/api/sys/tokens``
+HEADER_SESSION_TOKEN = "x-yottabyte-token"
+
+#: Session token endpoint, relative to ``https://<host>/api``
+SESSION_TOKEN_ENDPOINT = "sys/tokens"
+
 #: Content-Type header name
 HEADER_CONTENT_TYPE = "Content-Type"
 
@@ -0,0 +1,795 @@
+"""In-process emulator of the VergeOS ``/api/v4`` surface.
+
+Unit tests mock ``requests`` and integration tests need a live system. The
+emulator sits in between: a small in-memory API that the SDK talks to
+through its normal request path, so client-side performance work can be
+measured reproducibly without hardware.
+
+It emulates what the SDK relies on:
+
+* Every endpoint is a table of records. ``GET`` lists with ``filter``,
+  ``fields``, ``sort``, ``limit`` and ``offset``, or fetches one record.
+  ``POST``, ``PUT`` and ``DELETE`` create, update and delete records.
+* Actions (``POST vm_actions`` or ``PUT vms/1?action=...``) start a task
+  that moves from ``running`` to ``idle`` over ``task_duration`` seconds.
+* ``files`` accepts chunked ``PUT files/<key>?filepos=N`` uploads and
+  serves ``?download=1``.
+* Session tokens (``/api/sys/tokens``) for ``auth_method="session"``.
+* Latency, jitter and error injection (random or scripted, with
+  ``Retry-After``).
+
+The emulator is reached in-process through a ``requests`` adapter
+(:meth:`VergeEmulator.client`), through an ``httpx`` transport for
+:class:`~pyvergeos.AsyncVergeClient` (:meth:`VergeEmulator.async_transport`),
+or over a localhost socket (:meth:`VergeEmulator.serve`).
+
+Example:
+    >>> emulator = VergeEmulator(latency=0.005)
+    >>> emulator.populate("vms", 1000, name=lambda i: f"vm{i}", ram=2048, is_snapshot=False)
+    >>> client = emulator.client()
+    >>> len(client.vms.list(filter="ram ge 2048", limit=100))
+    100
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import json
+import random
+import re
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pyvergeos.constants import (
+    API_VERSION,
+    HEADER_SESSION_TOKEN,
+    SESSION_TOKEN_ENDPOINT,
+    SESSION_TOKEN_LIFETIME,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pyvergeos.client import VergeClient
+
+#: Host name used for in-process emulator clients
+EMULATOR_HOST = "emulator.invalid"
+
+_SYSTEM_RECORD = {
+    "$key": 1,
+    "yb_version": "26.0.0",
+    "os_version": "26.0",
+    "cloud_name": "emulator",
+}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<str>'(?:[^']|'')*')|(?P<num>-?\d+(?:\.\d+)?)(?![\w.])"
+    r"|(?P<punct>[(),])|(?P<word>[^\s(),']+))"
+)
+
+
+class FilterSyntaxError(ValueError):
+    """Raised for a ``filter`` expression the emulator cannot parse."""
+
+
+Predicate = Callable[[dict[str, Any]], bool]
+
+
+def _like(pattern: str) -> re.Pattern[str]:
+    regex = "".join(".*" if ch == "%" else "." if ch == "_" else re.escape(ch) for ch in pattern)
+    return re.compile(f"^{regex}$", re.IGNORECASE | re.DOTALL)
+
+
+def _compare(left: Any, op: str, right: Any) -> bool:
+    if op == "like":
+        return left is not None and bool(_like(str(right)).match(str(left)))
+    numeric = (int, float)
+    if not (
+        isinstance(left, numeric)
+        and isinstance(right, numeric)
+        or left is None
+        or right is None
+        or isinstance(left, bool)
+        or isinstance(right, bool)
+    ):
+        left, right = str(left), str(right)
+    if op == "eq":
+        return bool(left == right)
+    if op == "ne":
+        return bool(left != right)
+    if left is None or right is None:
+        return False
+    try:
+        if op == "gt":
+            return bool(left > right)
+        if op == "ge":
+            return bool(left >= right)
+        if op == "lt":
+            return bool(left < right)
+        if op == "le":
+            return bool(left <= right)
+    except TypeError:
+        return False
+    raise FilterSyntaxError(f"Unknown operator: {op}")
+
+
+def parse_filter(expression: str) -> Predicate:
+    """Compile an OData-style ``filter`` expression into a predicate.
+
+    Supports ``eq``, ``ne``, ``gt``, ``ge``, ``lt``, ``le``, ``like`` and
+    ``in (...)`` comparisons joined by ``and``/``or``, with parentheses.
+
+    Raises:
+        FilterSyntaxError: If the expression cannot be parsed.
+    """
+    tokens: list[tuple[str, Any]] = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = _TOKEN.match(expression, pos)
+        if not match or match.end() == pos:
+            raise FilterSyntaxError(f"Cannot parse filter at: {expression[pos:]!r}")
+        pos = match.end()
+        if match["str"] is not None:
+            tokens.append(("value", match["str"][1:-1].replace("''", "'")))
+        elif match["num"] is not None:
+            number = match["num"]
+            tokens.append(("value", float(number) if "." in number else int(number)))
+        elif match["punct"] is not None:
+            tokens.append((match["punct"], match["punct"]))
+        else:
+            word = match["word"]
+            literals = {"true": True, "false": False, "null": None}
+            if word.lower() in literals:
+                tokens.append(("value", literals[word.lower()]))
+            else:
+                tokens.append(("word", word))
+
+    index = 0
+
+    def peek() -> tuple[str, Any] | None:
+        return tokens[index] if index < len(tokens) else None
+
+    def take(kind: str | None = None) -> tuple[str, Any]:
+        nonlocal index
+        token = peek()
+        if token is None or (kind is not None and token[0] != kind):
+            raise FilterSyntaxError(f"Unexpected end or token in filter: {expression!r}")
+        index += 1
+        return token
+
+    def keyword(word: str) -> bool:
+        token = peek()
+        return token is not None and token[0] == "word" and str(token[1]).lower() == word
+
+    def parse_or() -> Predicate:
+        terms = [parse_and()]
+        while keyword("or"):
+            take()
+            terms.append(parse_and())
+        return terms[0] if len(terms) == 1 else lambda row: any(t(row) for t in terms)
+
+    def parse_and() -> Predicate:
+        factors = [parse_factor()]
+        while keyword("and"):
+            take()
+            factors.append(parse_factor())
+        return factors[0] if len(factors) == 1 else lambda row: all(f(row) for f in factors)
+
+    def parse_factor() -> Predicate:
+        token = peek()
+        if token is not None and token[0] == "(":
+            take("(")
+            inner = parse_or()
+            take(")")
+            return inner
+        field = str(take("word")[1])
+        op = str(take("word")[1]).lower()
+        if op == "in":
+            take("(")
+            values = [take("value")[1]]
+            while (token := peek()) is not None and token[0] == ",":
+                take(",")
+                values.append(take("value")[1])
+            take(")")
+            return lambda row: any(_compare(row.get(field), "eq", v) for v in values)
+        value = take("value")[1]
+        if op not in ("eq", "ne", "gt", "ge", "lt", "le", "like"):
+            raise FilterSyntaxError(f"Unknown operator: {op}")
+        return lambda row: _compare(row.get(field), op, value)
+
+    predicate = parse_or()
+    if index != len(tokens):
+        raise FilterSyntaxError(f"Unexpected trailing tokens in filter: {expression!r}")
+    return predicate
+
+
+def _split_fields(fields: str) -> list[str]:
+    """Split a ``fields`` parameter on commas outside parentheses."""
+    parts, depth, current = [], 0, ""
+    for ch in fields:
+        if ch == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += (ch == "(") - (ch == ")")
+        current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _select(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    if fields is None:
+        return dict(record)
+    selected: dict[str, Any] = {}
+    for spec in fields:
+        source, _, alias = spec.partition(" as ")
+        source, alias = source.strip(), (alias.strip() or source.strip())
+        if alias in record:
+            selected[alias] = record[alias]
+        elif source in record:
+            selected[alias] = record[source]
+    return selected
+
+
+@dataclass
+class _ErrorRule:
+    endpoint: re.Pattern[str]
+    method: str | None
+    status: int
+    times: int
+    retry_after: float | None
+
+
+class VergeEmulator:
+    """In-memory VergeOS API.
+
+    Thread-safe: one emulator can serve many concurrent clients.
+
+    Args:
+        latency: Seconds added to every request.
+        jitter: Random extra latency, up to this many seconds.
+        error_rate: Fraction of requests answered with ``error_status``.
+        error_status: Status of randomly injected errors.
+        retry_after: ``Retry-After`` seconds sent with injected errors.
+        task_duration: Seconds a task started by an action takes to finish.
+        seed: Seed for jitter and random errors, for reproducible runs.
+        credentials: Accepted ``{username: password}`` pairs. When None,
+            any credentials are accepted.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = HTTPStatus.SERVICE_UNAVAILABLE,
+        retry_after: float | None = None,
+        task_duration: float = 1.0,
+        seed: int | None = None,
+        credentials: dict[str, str] | None = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.task_duration = task_duration
+        self.credentials = credentials
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tables: dict[str, dict[str, dict[str, Any]]] = {}
+        self._next_key: dict[str, int] = {}
+        self._task_timing: dict[str, tuple[float, float]] = {}
+        self._files: dict[str, bytearray] = {}
+        self._tokens: dict[str, float] = {}
+        self._error_rules: list[_ErrorRule] = []
+        #: Requests handled, per ``"METHOD table"``
+        self.requests: dict[str, int] = {}
+        self.add("system", **_SYSTEM_RECORD)
+
+    # -- data -----------------------------------------------------------------
+
+    def add(self, table: str, **fields: Any) -> dict[str, Any]:
+        """Insert a record and return it (``$key`` is assigned if missing)."""
+        with self._lock:
+            return self._insert(table, fields)
+
+    def populate(self, table: str, count: int, **fields: Any) -> list[dict[str, Any]]:
+        """Insert ``count`` records.
+
+        Field values may be callables taking the record index, e.g.
+        ``name=lambda i: f"vm{i}"``.
+        """
+        with self._lock:
+            return [
+                self._insert(table, {k: v(i) if callable(v) else v for k, v in fields.items()})
+                for i in range(count)
+            ]
+
+    def records(self, table: str) -> list[dict[str, Any]]:
+        """Return copies of all records in a table."""
+        with self._lock:
+            return [self._view(table, r) for r in self._tables.get(table, {}).values()]
+
+    def file_content(self, key: int | str) -> bytes:
+        """Return the bytes uploaded to a file record."""
+        with self._lock:
+            return bytes(self._files.get(str(key), b""))
+
+    def inject_error(
+        self,
+        endpoint: str,
+        status: int = HTTPStatus.SERVICE_UNAVAILABLE,
+        times: int = 1,
+        method: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Answer the next ``times`` matching requests with ``status``.
+
+        Args:
+            endpoint: Regular expression matched against the path after
+                ``/api/v4/`` (e.g. ``"vms"`` or ``"^files/\\d+$"``).
+            status: HTTP status to return.
+            times: Number of requests to fail.
+            method: Only fail this HTTP method (default: any).
+            retry_after: ``Retry-After`` seconds to send.
+        """
+        with self._lock:
+            self._error_rules.append(
+                _ErrorRule(re.compile(endpoint), method, status, times, retry_after)
+            )
+
+    def _insert(self, table: str, fields: dict[str, Any]) -> dict[str, Any]:
+        rows = self._tables.setdefault(table, {})
+        key = fields.get("$key")
+        if key is None:
+            key = self._next_key.get(table, len(rows) + 1)
+            while str(key) in rows:
+                key += 1
+        if isinstance(key, int):
+            self._next_key[table] = max(self._next_key.get(table, 1), key + 1)
+        record = {"$key": key, **{k: v for k, v in fields.items() if k != "$key"}}
+        rows[str(key)] = record
+        return dict(record)
+
+    def _view(self, table: str, record: dict[str, Any]) -> dict[str, Any]:
+        view = dict(record)
+        if table == "tasks":
+            timing = self._task_timing.get(str(record["$key"]))
+            if timing is not None and view.get("status") == "running":
+                started, duration = timing
+                done = (time.monotonic() - started) / duration if duration > 0 else 1.0
+                if done >= 1:
+                    view.update(status="idle", progress=100)
+                else:
+                    view["progress"] = int(done * 100)
+        return view
+
+    # -- request handling -----------------------------------------------------
+
+    def delay(self) -> float:
+        """Seconds to wait before answering a request."""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer a request after the configured latency.
+
+        Returns:
+            (status, headers, body).
+        """
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
+        return self.respond(method, url, body, headers)
+
+    def respond(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer a request immediately (no injected latency)."""
+        method = method.upper()
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        path = unquote(parts.path)
+
+        token_prefix = f"/api/{SESSION_TOKEN_ENDPOINT}"
+        if path.startswith(token_prefix):
+            return self._tokens_endpoint(method, path[len(token_prefix) :].strip("/"), body)
+
+        api_prefix = f"/api/{API_VERSION}/"
+        if not path.startswith(api_prefix):
+            return _json(HTTPStatus.NOT_FOUND, {"err": f"Unknown path: {path}"})
+        resource = path[len(api_prefix) :].strip("/")
+        table, _, key = resource.partition("/")
+
+        with self._lock:
+            self.requests[f"{method} {table}"] = self.requests.get(f"{method} {table}", 0) + 1
+            failure = self._injected_error(method, resource)
+        if failure is not None:
+            return failure
+        if not self._authorized(headers):
+            return _json(HTTPStatus.UNAUTHORIZED, {"err": "Invalid credentials"})
+
+        try:
+            if method == "GET":
+                return self._get(table, key, query)
+            payload = _decode_body(body, headers)
+            if method == "POST":
+                return self._post(table, payload)
+            if method == "PUT":
+                return self._put(table, key, query, payload, body)
+            if method == "DELETE":
+                return self._delete(table, key)
+        except FilterSyntaxError as e:
+            return _json(HTTPStatus.BAD_REQUEST, {"err": str(e)})
+        return _json(HTTPStatus.METHOD_NOT_ALLOWED, {"err": f"{method} not supported"})
+
+    def _injected_error(
+        self, method: str, resource: str
+    ) -> tuple[int, dict[str, str], bytes] | None:
+        for rule in self._error_rules:
+            if rule.method is not None and rule.method.upper() != method:
+                continue
+            if not rule.endpoint.search(resource):
+                continue
+            rule.times -= 1
+            if rule.times <= 0:
+                self._error_rules.remove(rule)
+            return _json(rule.status, {"err": "Injected error"}, rule.retry_after)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return _json(self.error_status, {"err": "Injected error"}, self.retry_after)
+        return None
+
+    def _authorized(self, headers: dict[str, str]) -> bool:
+        token = headers.get(HEADER_SESSION_TOKEN)
+        if token is not None:
+            with self._lock:
+                expires = self._tokens.get(token)
+            return expires is not None and expires > time.time()
+        if self.credentials is None:
+            return True
+        auth = headers.get("authorization", "")
+        if auth.startswith("Basic "):
+            user, _, password = base64.b64decode(auth[6:]).decode().partition(":")
+            return self.credentials.get(user) == password
+        return auth.startswith("Bearer ")
+
+    def _tokens_endpoint(
+        self, method: str, token: str, body: bytes | None
+    ) -> tuple[int, dict[str, str], bytes]:
+        if method == "POST":
+            login = _decode_body(body, {}) or {}
+            user, password = login.get("login"), login.get("password")
+            if self.credentials is not None and self.credentials.get(str(user)) != password:
+                return _json(HTTPStatus.UNAUTHORIZED, {"err": "Invalid login"})
+            expires = time.time() + SESSION_TOKEN_LIFETIME
+            with self._lock:
+                token = f"{self._random.getrandbits(128):032x}"
+                self._tokens[token] = expires
+            return _json(
+                HTTPStatus.CREATED,
+                {"$key": token, "location": f"/sys/tokens/{token}", "expires": expires},
+            )
+        with self._lock:
+            found = self._tokens.get(token)
+            if method == "DELETE":
+                self._tokens.pop(token, None)
+        if found is None:
+            return _json(HTTPStatus.NOT_FOUND, {"err": "Token not found"})
+        return _json(HTTPStatus.OK, {"$key": token, "expires": found})
+
+    def _get(
+        self, table: str, key: str, query: dict[str, str]
+    ) -> tuple[int, dict[str, str], bytes]:
+        if table == "files" and key and "download" in query:
+            with self._lock:
+                content = self._files.get(key)
+            if content is None:
+                return _json(HTTPStatus.NOT_FOUND, {"err": "File not found"})
+            return HTTPStatus.OK, {"Content-Type": "application/octet-stream"}, bytes(content)
+
+        fields = query.get("fields")
+        selected = None if fields in (None, "", "all", "most", "summary") else _split_fields(fields)
+        with self._lock:
+            rows = self._tables.get(table, {})
+            if key:
+                record = rows.get(key)
+                if record is None:
+                    return _json(HTTPStatus.NOT_FOUND, {"err": f"{table}/{key} not found"})
+                return _json(HTTPStatus.OK, _select(self._view(table, record), selected))
+            records = [self._view(table, r) for r in rows.values()]
+
+        if query.get("filter"):
+            predicate = parse_filter(query["filter"])
+            records = [r for r in records if predicate(r)]
+        for spec in reversed(_split_fields(query.get("sort", ""))):
+            descending = spec.startswith("-")
+            name = spec.lstrip("+-")
+            records.sort(key=lambda r: _sort_key(r.get(name)), reverse=descending)
+        offset = int(query.get("offset") or 0)
+        limit = int(query.get("limit") or 0)
+        records = records[offset : offset + limit] if limit > 0 else records[offset:]
+        return _json(HTTPStatus.OK, [_select(r, selected) for r in records])
+
+    def _post(self, table: str, payload: Any) -> tuple[int, dict[str, str], bytes]:
+        fields = payload if isinstance(payload, dict) else {}
+        with self._lock:
+            if table.endswith("_actions"):
+                owner = fields.get(table[: -len("_actions")])
+                action = self._insert(table, fields)
+                task = self._start_task(f"{fields.get('action', 'action')}", owner)
+                response = {"$key": action["$key"], "task": task}
+            else:
+                record = self._insert(table, fields)
+                if table == "files":
+                    self._files[str(record["$key"])] = bytearray()
+                response = {"$key": record["$key"]}
+            response["location"] = f"/{API_VERSION}/{table}/{response['$key']}"
+        return _json(HTTPStatus.CREATED, response)
+
+    def _put(
+        self,
+        table: str,
+        key: str,
+        query: dict[str, str],
+        payload: Any,
+        body: bytes | None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            record = self._tables.get(table, {}).get(key)
+            if record is None:
+                return _json(HTTPStatus.NOT_FOUND, {"err": f"{table}/{key} not found"})
+            if "action" in query:
+                task = self._start_task(query["action"], record["$key"])
+                return _json(HTTPStatus.OK, {"task": task})
+            if table == "files" and "filepos" in query:
+                content = self._files.setdefault(key, bytearray())
+                data = body or b""
+                pos = int(query["filepos"])
+                if len(content) < pos:
+                    content.extend(b"\0" * (pos - len(content)))
+                content[pos : pos + len(data)] = data
+                record["filesize"] = len(content)
+                return HTTPStatus.OK, {}, b""
+            if isinstance(payload, dict):
+                record.update({k: v for k, v in payload.items() if k != "$key"})
+        return HTTPStatus.OK, {}, b""
+
+    def _delete(self, table: str, key: str) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            if self._tables.get(table, {}).pop(key, None) is None:
+                return _json(HTTPStatus.NOT_FOUND, {"err": f"{table}/{key} not found"})
+            if table == "files":
+                self._files.pop(key, None)
+        return HTTPStatus.OK, {}, b""
+
+    def _start_task(self, action: str, owner: Any) -> Any:
+        task = self._insert(
+            "tasks",
+            {"name": action, "action": action, "owner": owner, "status": "running", "progress": 0},
+        )
+        self._task_timing[str(task["$key"])] = (time.monotonic(), self.task_duration)
+        return task["$key"]
+
+    # -- front ends -----------------------------------------------------------
+
+    def adapter(self) -> EmulatorAdapter:
+        """Return a ``requests`` adapter that answers from this emulator."""
+        return EmulatorAdapter(self)
+
+    def client(self, **kwargs: Any) -> VergeClient:
+        """Return a connected VergeClient that talks to this emulator in-process.
+
+        Args:
+            **kwargs: Extra VergeClient arguments (e.g. ``rate_limit``,
+                ``hooks``). Credentials default to ``admin``/``admin``.
+        """
+        from pyvergeos.client import VergeClient
+
+        kwargs.setdefault("host", EMULATOR_HOST)
+        if "token" not in kwargs:
+            kwargs.setdefault("username", "admin")
+            kwargs.setdefault("password", "admin")
+        return VergeClient(transport=self.adapter(), **kwargs)
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """Return an ``httpx`` transport for ``AsyncVergeClient(transport=...)``.
+
+        Latency is awaited with ``asyncio.sleep``, so concurrent requests
+        overlap as they would against a real server.
+        """
+        from pyvergeos.transport import _import_httpx
+
+        httpx = _import_httpx()
+        emulator = self
+
+        class _Transport(httpx.AsyncBaseTransport):  # type: ignore[name-defined,misc]
+            async def handle_async_request(self, request: Any) -> Any:
+                delay = emulator.delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                status, headers, body = emulator.respond(
+                    request.method, str(request.url), await request.aread(), dict(request.headers)
+                )
+                return httpx.Response(status, headers=headers, content=body)
+
+        return _Transport()
+
+    def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        certfile: str | None = None,
+        keyfile: str | None = None,
+    ) -> EmulatorServer:
+        """Serve the emulator on a local socket in a background thread.
+
+        The SDK always connects over HTTPS, so pass a certificate to point
+        a VergeClient at the server (with ``verify_ssl=False`` for a
+        self-signed one). Without a certificate the server speaks plain
+        HTTP, for other tools.
+
+        Args:
+            host: Address to bind.
+            port: Port to bind (0 picks a free port).
+            certfile: PEM certificate for HTTPS.
+            keyfile: PEM private key (if not included in ``certfile``).
+        """
+        return EmulatorServer(self, host, port, certfile, keyfile)
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (1, value)
+    return (2, str(value))
+
+
+def _decode_body(body: bytes | None, headers: dict[str, str]) -> Any:
+    if not body or "octet-stream" in headers.get("content-type", ""):
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _json(
+    status: int, payload: Any, retry_after: float | None = None
+) -> tuple[int, dict[str, str], bytes]:
+    headers = {"Content-Type": "application/json"}
+    if retry_after is not None:
+        headers["Retry-After"] = f"{retry_after:g}"
+    return int(status), headers, json.dumps(payload).encode()
+
+
+class EmulatorAdapter(BaseAdapter):
+    """``requests`` transport adapter that answers from a :class:`VergeEmulator`."""
+
+    def __init__(self, emulator: VergeEmulator) -> None:
+        super().__init__()
+        self.emulator = emulator
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        """Answer a prepared request."""
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+        status, headers, content = self.emulator.handle(
+            request.method or "GET", request.url or "", body, dict(request.headers)
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTPStatus(status).phrase
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers["Content-Length"] = str(len(content))
+        response.raw = io.BytesIO(content)
+        response.url = request.url or ""
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class EmulatorServer:
+    """A :class:`VergeEmulator` served on a local socket.
+
+    Attributes:
+        host: ``address:port`` to pass as VergeClient's ``host``.
+        url: Base URL of the server.
+    """
+
+    def __init__(
+        self,
+        emulator: VergeEmulator,
+        host: str,
+        port: int,
+        certfile: str | None,
+        keyfile: str | None,
+    ) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, content = emulator.handle(
+                    self.command, self.path, body, dict(self.headers.items())
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        scheme = "http"
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            scheme = "https"
+        address, bound_port = self._server.server_address[:2]
+        if isinstance(address, bytes):
+            address = address.decode()
+        self.host = f"{address}:{bound_port}"
+        self.url = f"{scheme}://{self.host}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> EmulatorServer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
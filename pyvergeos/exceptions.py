@@ -4,7 +4,7 @@ Note: Exception names are prefixed with 'Verge' to avoid shadowing
 Python builtins (ConnectionError, TimeoutError).
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class VergeError(Exception):
@@ -75,3 +75,17 @@ class TaskTimeoutError(TaskError):
     """Task wait timed out."""
 
     pass
+
+
+class WaitCancelledError(VergeError):
+    """A wait was cancelled before the operation finished."""
+
+    pass
+
+
+class BulkOperationError(VergeError):
+    """One or more operations in a bulk call failed."""
+
+    def __init__(self, message: str, result: Any = None) -> None:
+        super().__init__(message)
+        self.result = result
@@ -1,7 +1,11 @@
 """OData-style filter expression builder for VergeOS API queries."""
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from typing import Any, Union
+from urllib.parse import quote
+
+from pyvergeos.constants import GET_MANY_CHUNK_SIZE, MAX_IN_FILTER_LENGTH
 
 
 class FilterOperator(Enum):
@@ -177,3 +181,49 @@ def build_filter(**kwargs: Any) -> str:
             parts.append(f"{field} eq {_format_value(value)}")
 
     return " and ".join(parts)
+
+
+def chunk_in_filters(
+    field: str,
+    values: Iterable[Any],
+    max_values: int = GET_MANY_CHUNK_SIZE,
+    max_length: int = MAX_IN_FILTER_LENGTH,
+) -> Iterator[tuple[list[Any], str]]:
+    """Split a long ``in (...)`` filter into queries that fit in a URL.
+
+    Each chunk holds at most ``max_values`` values, and its filter stays
+    under ``max_length`` characters once URL-encoded.
+
+    Args:
+        field: Field to match (e.g. "$key").
+        values: Values to match.
+        max_values: Maximum values per chunk.
+        max_length: Maximum URL-encoded filter length per chunk.
+
+    Yields:
+        Tuples of (values in the chunk, filter string).
+
+    Example:
+        >>> list(chunk_in_filters("$key", [1, 2, 3], max_values=2))
+        [([1, 2], '$key in (1,2)'), ([3], '$key in (3)')]
+    """
+    prefix = f"{field} in ("
+    # Fixed overhead: the prefix, the closing parenthesis
+    base_length = len(quote(prefix, safe="")) + len(quote(")", safe=""))
+    separator_length = len(quote(",", safe=""))
+
+    chunk: list[Any] = []
+    formatted: list[str] = []
+    length = base_length
+    for value in values:
+        text = _format_value(value)
+        size = len(quote(text, safe="")) + (separator_length if chunk else 0)
+        if chunk and (len(chunk) >= max_values or length + size > max_length):
+            yield chunk, prefix + ",".join(formatted) + ")"
+            chunk, formatted, length = [], [], base_length
+            size = len(quote(text, safe=""))
+        chunk.append(value)
+        formatted.append(text)
+        length += size
+    if chunk:
+        yield chunk, prefix + ",".join(formatted) + ")"
@@ -0,0 +1,293 @@
+"""Futures for VergeOS tasks, resolved by one shared polling thread.
+
+Actions such as ``vm.clone()`` start a task and return at once. A
+:class:`TaskFuture` tracks that task: it is a
+:class:`concurrent.futures.Future` whose result is the finished
+:class:`~pyvergeos.resources.tasks.Task`. Its exception is a
+:class:`~pyvergeos.exceptions.TaskError` if the task fails.
+
+All futures of a client are watched by one :class:`TaskWatcher` thread.
+Each poll fetches every unfinished task with ``$key in (...)`` queries, so
+hundreds of operations can be in flight without a thread or a polling loop
+per wait. The thread starts when the first future is created and exits
+when no futures are left. A running
+:class:`~pyvergeos.webhook_receiver.TaskEventReceiver` wakes the thread
+whenever VergeOS pushes a task event, so futures resolve without waiting
+for the next poll.
+
+Example:
+    >>> from pyvergeos.futures import as_completed, gather
+    >>> futures = [client.tasks.future(vm.clone(name=f"{vm.name}-copy")) for vm in vms]
+    >>> for future in as_completed(futures, timeout=900):
+    ...     print(future.key, future.result().status)
+    >>> tasks = gather(futures)
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from pyvergeos.constants import (
+    POLL_INITIAL_INTERVAL,
+    POLL_INTERVAL,
+    RETRY_STATUS_CODES,
+    TASK_WATCH_MAX_FAILURES,
+)
+from pyvergeos.exceptions import (
+    APIError,
+    NotFoundError,
+    TaskError,
+    TaskTimeoutError,
+    VergeConnectionError,
+    VergeTimeoutError,
+)
+from pyvergeos.polling import backoff_delays
+
+if TYPE_CHECKING:
+    from pyvergeos.resources.tasks import Task, TaskManager
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed poll is worth repeating (connection errors, 5xx, 429)."""
+    if isinstance(error, (VergeConnectionError, VergeTimeoutError)):
+        return True
+    if isinstance(error, APIError) and not isinstance(error, NotFoundError):
+        status = error.status_code
+        return status is not None and (status in RETRY_STATUS_CODES or status >= 500)
+    return False
+
+
+class TaskFuture(concurrent.futures.Future["Task"]):
+    """Future that resolves when a VergeOS task finishes.
+
+    ``result()`` returns the finished Task. If the task fails (and the
+    future was created with ``raise_on_error=True``), ``result()`` raises
+    TaskError. Cancelling the future stops watching the task; it does not
+    cancel the task in VergeOS (use ``client.tasks.cancel()`` for that).
+
+    Attributes:
+        key: Task $key.
+        response: Action response the task was taken from, if any.
+    """
+
+    def __init__(self, key: int, response: dict[str, Any] | None = None) -> None:
+        super().__init__()
+        self.key = key
+        self.response = response
+
+    def __repr__(self) -> str:
+        return f"<TaskFuture key={self.key} state={self._state}>"
+
+
+class TaskWatcher:
+    """Background poller that resolves the TaskFutures of one client.
+
+    Args:
+        tasks: Task manager used to fetch task status.
+        poll_interval: Longest wait between polls. Polling restarts fast
+            whenever a new future is added.
+        initial_interval: Wait after the first poll of a new or woken batch.
+        max_failures: Consecutive transient poll failures (connection
+            errors, timeouts, 5xx) tolerated before every watched future is
+            failed with the last error. Other errors fail them at once.
+    """
+
+    def __init__(
+        self,
+        tasks: TaskManager,
+        poll_interval: float = POLL_INTERVAL,
+        initial_interval: float = POLL_INITIAL_INTERVAL,
+        max_failures: int = TASK_WATCH_MAX_FAILURES,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.initial_interval = initial_interval
+        self.max_failures = max_failures
+        self._tasks = tasks
+        self._cond = threading.Condition()
+        self._pending: dict[int, list[tuple[TaskFuture, bool]]] = {}
+        self._thread: threading.Thread | None = None
+        self._woken = False
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks being watched."""
+        with self._cond:
+            return len(self._pending)
+
+    def watch(
+        self, key: int, response: dict[str, Any] | None = None, *, raise_on_error: bool = True
+    ) -> TaskFuture:
+        """Return a future for task ``key`` and start watching it.
+
+        Args:
+            key: Task $key.
+            response: Action response the task was taken from.
+            raise_on_error: Resolve the future with TaskError if the task
+                fails. When False, the failed Task is the result.
+        """
+        future = TaskFuture(key, response)
+        with self._cond:
+            self._pending.setdefault(key, []).append((future, raise_on_error))
+            self._woken = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pyvergeos-task-watcher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def wake(self, keys: Iterable[int] | None = None) -> bool:
+        """Poll now and restart the backoff, e.g. after a task event arrived.
+
+        Args:
+            keys: Tasks the event was about. When given, the watcher is
+                only woken if it watches one of them.
+
+        Returns:
+            True if the watcher was woken.
+        """
+        with self._cond:
+            if keys is not None and not any(key in self._pending for key in keys):
+                return False
+            self._woken = True
+            self._cond.notify()
+            return True
+
+    def _delays(self) -> Iterator[float]:
+        return backoff_delays(self.poll_interval, initial_interval=self.initial_interval)
+
+    def _run(self) -> None:
+        from pyvergeos.resources.tasks import _DEFAULT_LIST_FIELDS
+
+        delays = self._delays()
+        failures = 0
+        while True:
+            with self._cond:
+                self._drop_cancelled()
+                if not self._pending:
+                    self._thread = None
+                    return
+                if self._woken:
+                    self._woken = False
+                    delays = self._delays()
+                keys = list(self._pending)
+
+            try:
+                tasks = self._tasks.get_many(keys, fields=_DEFAULT_LIST_FIELDS, ignore_missing=True)
+            except Exception as e:
+                failures += 1
+                if _is_transient(e) and failures < self.max_failures:
+                    # Try again on the backoff schedule rather than failing every wait
+                    logger.debug("Task watcher poll failed (attempt %d): %s", failures, e)
+                    with self._cond:
+                        if not self._woken:
+                            self._cond.wait(next(delays))
+                    continue
+                # Hand the error to everyone waiting, as tasks.wait() would raise it
+                logger.debug("Task watcher poll failed: %s", e)
+                failures = 0
+                for key in keys:
+                    self._resolve(key, e)
+                continue
+
+            failures = 0
+            found = {task.key: task for task in tasks}
+            for key in keys:
+                task = found.get(key)
+                if task is None:
+                    self._resolve(key, NotFoundError(f"Task {key} not found"))
+                elif task.is_complete or task.has_error:
+                    self._resolve(key, task)
+
+            with self._cond:
+                if self._pending and not self._woken:
+                    self._cond.wait(next(delays))
+
+    def _drop_cancelled(self) -> None:
+        for key in list(self._pending):
+            waiters = [(f, r) for f, r in self._pending[key] if not f.cancelled()]
+            if waiters:
+                self._pending[key] = waiters
+            else:
+                del self._pending[key]
+
+    def _resolve(self, key: int, outcome: Task | BaseException) -> None:
+        with self._cond:
+            waiters = self._pending.pop(key, [])
+        for future, raise_on_error in waiters:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            elif outcome.has_error and raise_on_error:
+                message = outcome.get("error", "Task failed")
+                future.set_exception(TaskError(str(message), task_id=key))
+            else:
+                future.set_result(outcome)
+
+
+def as_completed(
+    futures: Iterable[concurrent.futures.Future[Any]], timeout: float | None = None
+) -> Iterator[concurrent.futures.Future[Any]]:
+    """Yield futures as they finish, like :func:`concurrent.futures.as_completed`.
+
+    Args:
+        futures: TaskFutures (or any other futures).
+        timeout: Maximum seconds to wait for all of them (None = no limit).
+
+    Raises:
+        TimeoutError: If futures are unfinished after ``timeout``
+            (``concurrent.futures.TimeoutError``).
+    """
+    return concurrent.futures.as_completed(futures, timeout=timeout)
+
+
+def gather(
+    futures: Iterable[concurrent.futures.Future[Any]],
+    timeout: float | None = None,
+    *,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Wait for all futures and return their results in order.
+
+    Args:
+        futures: TaskFutures (or any other futures).
+        timeout: Maximum seconds to wait (None = no limit).
+        return_exceptions: Put the exception of a failed future in its
+            place in the result instead of raising it.
+
+    Returns:
+        Results (finished Task objects for TaskFutures), in the order of
+        ``futures``.
+
+    Raises:
+        TaskTimeoutError: If futures are unfinished after ``timeout``.
+            ``task_id`` is the first unfinished task, if known.
+        TaskError: If a task failed and ``return_exceptions`` is False (the
+            first failure in order is raised).
+    """
+    futures = list(futures)
+    _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    if not_done:
+        first = next(f for f in futures if f in not_done)
+        raise TaskTimeoutError(
+            f"{len(not_done)} of {len(futures)} tasks did not complete within {timeout} seconds",
+            task_id=getattr(first, "key", None),
+        )
+
+    results: list[Any] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
@@ -0,0 +1,416 @@
+"""Per-request instrumentation hooks and metric exporters.
+
+Every API request sent by :class:`~pyvergeos.VergeClient` produces one
+:class:`RequestEvent` (after retries and session-token renewal) that is
+passed to each registered hook. Hooks are plain callables:
+
+    >>> client.add_hook(lambda event: print(event.method, event.endpoint, event.latency))
+
+Two ready-made hooks aggregate or export the events:
+
+* :class:`RequestMetrics` keeps per-endpoint latency histograms, status
+  counts, retries, bytes and decode time, and renders them in the
+  Prometheus text exposition format.
+* :class:`OpenTelemetryHook` records each request as an OpenTelemetry
+  client span (requires ``pip install opentelemetry-api``).
+
+Endpoints are reported as templates, with record keys replaced by
+``{key}`` (``vms/42`` becomes ``vms/{key}``), so metrics stay bounded in
+size no matter how many objects are touched.
+
+Example:
+    >>> metrics = RequestMetrics()
+    >>> client = VergeClient(host, token=token, hooks=[metrics])
+    >>> client.vms.list()
+    >>> for stats in metrics.slowest(5):
+    ...     print(stats.method, stats.endpoint, stats.latency_avg)
+    >>> print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import parse_qs
+
+from pyvergeos.constants import METRICS_LATENCY_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+#: Path segments treated as record keys: integers and long hex ids
+_KEY_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{32,})$")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Return the endpoint with record keys replaced by ``{key}``.
+
+    Query parameters are dropped except ``action``, so that different
+    actions on one table stay separate.
+
+    Example:
+        >>> endpoint_template("vms/42")
+        'vms/{key}'
+        >>> endpoint_template("vms/42?action=poweron&fields=all")
+        'vms/{key}?action=poweron'
+    """
+    path, _, query = endpoint.partition("?")
+    template = "/".join(
+        "{key}" if _KEY_SEGMENT.match(part) else part for part in path.strip("/").split("/")
+    )
+    action = parse_qs(query).get("action")
+    if action:
+        template = f"{template}?action={action[0]}"
+    return template
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """One API request as seen by instrumentation hooks.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: Endpoint template (record keys replaced by ``{key}``).
+        status_code: Final HTTP status, or None if no response was received.
+        latency: Seconds from the first send to the decoded result,
+            including retries.
+        retries: Requests resent after throttling, token renewal or (with
+            the default transport) transient failures.
+        bytes_sent: Request body size in bytes.
+        bytes_received: Response body size in bytes.
+        decode_time: Seconds spent decoding the response body.
+        started_at: Epoch time the request started, in nanoseconds.
+        error: Exception class name if the request raised, else None.
+        streamed: Whether the response was streamed (``stream()``).
+    """
+
+    method: str
+    endpoint: str
+    status_code: int | None
+    latency: float
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    decode_time: float = 0.0
+    started_at: int = 0
+    error: str | None = None
+    streamed: bool = False
+
+
+#: Signature of an instrumentation hook
+RequestHook = Callable[[RequestEvent], None]
+
+
+def emit(hooks: Iterable[RequestHook], event: RequestEvent) -> None:
+    """Pass ``event`` to each hook; hook failures are logged, never raised."""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:  # Instrumentation must not break requests
+            logger.warning("Request hook %r failed", hook, exc_info=True)
+
+
+def _body_size(body: Any) -> int:
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+class RequestRecorder:
+    """Collects the measurements of one request while it is being sent.
+
+    Args:
+        method: HTTP method.
+        endpoint: Endpoint path (converted to a template).
+        streamed: Whether the response body is streamed.
+    """
+
+    def __init__(self, method: str, endpoint: str, streamed: bool = False) -> None:
+        self.method = method.upper()
+        self.endpoint = endpoint_template(endpoint)
+        self.streamed = streamed
+        self.status_code: int | None = None
+        self.sends = 0
+        self.transport_retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.decode_time = 0.0
+        self.error: str | None = None
+        self._started_at = time.time_ns()
+        self._start = time.perf_counter()
+
+    def sent(self, response: Any) -> None:
+        """Record a response received for one send of the request."""
+        self.sends += 1
+        self.status_code = int(response.status_code)
+        # requests keeps the prepared request; HTTPXResponse wraps httpx's
+        request = getattr(response, "request", None)
+        if request is None:
+            request = getattr(getattr(response, "raw", None), "request", None)
+        self.bytes_sent += _body_size(getattr(request, "body", None)) or _body_size(
+            getattr(request, "content", None)
+        )
+        if not self.streamed:
+            self.bytes_received += _body_size(getattr(response, "content", None))
+        # Retries made inside urllib3 before this response was returned
+        history = getattr(getattr(getattr(response, "raw", None), "retries", None), "history", None)
+        if isinstance(history, tuple):
+            self.transport_retries += len(history)
+
+    @contextmanager
+    def decoding(self) -> Iterator[None]:
+        """Time the decoding of the response body."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.decode_time += time.perf_counter() - start
+
+    def count_chunks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass streamed body chunks through, counting their bytes."""
+        for chunk in chunks:
+            self.bytes_received += len(chunk)
+            yield chunk
+
+    def event(self) -> RequestEvent:
+        """Build the event for the finished request."""
+        return RequestEvent(
+            method=self.method,
+            endpoint=self.endpoint,
+            status_code=self.status_code,
+            latency=time.perf_counter() - self._start,
+            retries=max(0, self.sends - 1) + self.transport_retries,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            decode_time=self.decode_time,
+            started_at=self._started_at,
+            error=self.error,
+            streamed=self.streamed,
+        )
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for one method and endpoint template.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: Endpoint template.
+        count: Number of requests.
+        errors: Requests that raised an exception.
+        retries: Total retries.
+        statuses: Request count per HTTP status (0 when no response).
+        latency_sum: Total latency in seconds.
+        latency_max: Slowest request in seconds.
+        bucket_counts: Requests per latency bucket (not cumulative); the
+            last entry counts requests slower than every bucket bound.
+        bytes_sent: Total request body bytes.
+        bytes_received: Total response body bytes.
+        decode_time: Total seconds spent decoding responses.
+    """
+
+    method: str
+    endpoint: str
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    bucket_counts: list[int] = field(default_factory=list)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    decode_time: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        """Mean latency in seconds."""
+        return self.latency_sum / self.count if self.count else 0.0
+
+
+class RequestMetrics:
+    """Hook that aggregates request events into per-endpoint metrics.
+
+    Thread-safe; one instance can be shared by several clients.
+
+    Args:
+        buckets: Upper bounds of the latency histogram buckets, in seconds.
+        prefix: Metric name prefix used by :meth:`to_prometheus`.
+    """
+
+    def __init__(
+        self, buckets: Iterable[float] = METRICS_LATENCY_BUCKETS, prefix: str = "pyvergeos"
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], EndpointStats] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record one request event."""
+        key = (event.method, event.endpoint)
+        index = next(
+            (i for i, bound in enumerate(self.buckets) if event.latency <= bound),
+            len(self.buckets),
+        )
+        status = event.status_code or 0
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = EndpointStats(
+                    event.method, event.endpoint, bucket_counts=[0] * (len(self.buckets) + 1)
+                )
+                self._stats[key] = stats
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.retries += event.retries
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.latency_sum += event.latency
+            stats.latency_max = max(stats.latency_max, event.latency)
+            stats.bucket_counts[index] += 1
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+            stats.decode_time += event.decode_time
+
+    def snapshot(self) -> list[EndpointStats]:
+        """Return a copy of the per-endpoint metrics."""
+        with self._lock:
+            return [
+                EndpointStats(
+                    **{
+                        **vars(stats),
+                        "statuses": dict(stats.statuses),
+                        "bucket_counts": list(stats.bucket_counts),
+                    }
+                )
+                for stats in self._stats.values()
+            ]
+
+    def slowest(self, n: int = 10) -> list[EndpointStats]:
+        """Return the ``n`` endpoints with the most total latency.
+
+        Total rather than mean latency ranks both slow endpoints and chatty
+        ones (many fast requests) near the top.
+        """
+        return sorted(self.snapshot(), key=lambda s: s.latency_sum, reverse=True)[:n]
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        stats = sorted(self.snapshot(), key=lambda s: (s.endpoint, s.method))
+        lines = [
+            f"# HELP {p}_request_duration_seconds API request latency, including retries.",
+            f"# TYPE {p}_request_duration_seconds histogram",
+        ]
+        for s in stats:
+            labels = _labels(method=s.method, endpoint=s.endpoint)
+            cumulative = 0
+            for bound, count in zip(self.buckets, s.bucket_counts):
+                cumulative += count
+                lines.append(
+                    f'{p}_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}'
+                )
+            lines.append(f'{p}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {s.count}')
+            lines.append(f"{p}_request_duration_seconds_sum{{{labels}}} {s.latency_sum:.6f}")
+            lines.append(f"{p}_request_duration_seconds_count{{{labels}}} {s.count}")
+
+        lines += [
+            f"# HELP {p}_requests_total API requests by final status (0: no response).",
+            f"# TYPE {p}_requests_total counter",
+        ]
+        for s in stats:
+            for status, count in sorted(s.statuses.items()):
+                labels = _labels(method=s.method, endpoint=s.endpoint, status=str(status))
+                lines.append(f"{p}_requests_total{{{labels}}} {count}")
+
+        counters = [
+            ("request_errors_total", "API requests that raised an exception.", "errors"),
+            ("request_retries_total", "API requests resent after a failure.", "retries"),
+            ("request_bytes_sent_total", "Request body bytes sent.", "bytes_sent"),
+            ("response_bytes_received_total", "Response body bytes received.", "bytes_received"),
+            ("response_decode_seconds_total", "Time spent decoding responses.", "decode_time"),
+        ]
+        for name, help_text, attr in counters:
+            lines += [f"# HELP {p}_{name} {help_text}", f"# TYPE {p}_{name} counter"]
+            for s in stats:
+                value = getattr(s, attr)
+                text = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(
+                    f"{p}_{name}{{{_labels(method=s.method, endpoint=s.endpoint)}}} {text}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, escaping backslashes, quotes and newlines."""
+    return ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+
+
+def _import_opentelemetry() -> Any:
+    """Import ``opentelemetry.trace`` or raise a helpful ImportError."""
+    try:
+        return importlib.import_module("opentelemetry.trace")
+    except ImportError as e:
+        raise ImportError(
+            "OpenTelemetry export requires opentelemetry-api. "
+            "Install it with: pip install opentelemetry-api"
+        ) from e
+
+
+class OpenTelemetryHook:
+    """Hook that records each request as an OpenTelemetry client span.
+
+    Spans are named ``"{method} {endpoint}"`` and carry the HTTP semantic
+    convention attributes plus ``pyvergeos.*`` attributes for retries, bytes
+    and decode time. Requests that fail or return an error status are marked
+    with an error status.
+
+    Args:
+        tracer: Tracer to use (default: ``trace.get_tracer("pyvergeos")``).
+        host: Value for the ``server.address`` attribute.
+    """
+
+    def __init__(self, tracer: Any | None = None, host: str | None = None) -> None:
+        self._trace = _import_opentelemetry()
+        self._tracer = tracer if tracer is not None else self._trace.get_tracer("pyvergeos")
+        self._host = host
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record one request event as a span."""
+        attributes: dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+            "pyvergeos.retries": event.retries,
+            "pyvergeos.bytes_sent": event.bytes_sent,
+            "pyvergeos.bytes_received": event.bytes_received,
+            "pyvergeos.decode_time": event.decode_time,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        if self._host:
+            attributes["server.address"] = self._host
+
+        span = self._tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=event.started_at,
+            attributes=attributes,
+        )
+        failed = event.error is not None or (event.status_code or 0) >= 400
+        if failed:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=event.started_at + int(event.latency * 1e9))
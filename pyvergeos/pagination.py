@@ -0,0 +1,232 @@
+"""Keyset (cursor) pagination for large tables.
+
+Offset pagination (``limit``/``offset``) makes the server skip ``offset``
+rows for every page, which is O(n²) over a full scan, and it skips or
+repeats rows when rows are inserted or deleted while iterating. Keyset
+pagination instead sorts on a column and asks for rows *after* the last
+one seen (``$key gt 1234``), so every page costs the same and concurrent
+changes never shift the window.
+
+Example:
+    >>> for row in iter_keyset(client, "logs", {"fields": "$key,text"}, key_field="timestamp"):
+    ...     print(row["text"])
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from pyvergeos.client import VergeClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Primary key column used as the default cursor
+KEY_FIELD = "$key"
+
+
+def filter_literal(value: Any) -> str:
+    """Format a cursor value for use in an OData filter."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _with_fields(fields: str | None, *required: str) -> str | None:
+    """Ensure the cursor columns are part of an explicit field list."""
+    if not fields:
+        return fields
+    names = fields.split(",")
+    names.extend(name for name in required if name not in names)
+    return ",".join(names)
+
+
+def iter_offset_pages(
+    fetch: Callable[[int, int], list[T]],
+    page_size: int = 100,
+    prefetch: int = 0,
+) -> Iterator[list[T]]:
+    """Iterate over ``limit``/``offset`` pages, optionally fetching ahead.
+
+    With ``prefetch=0`` pages are requested one after another. With
+    ``prefetch=N`` the first page is fetched on its own; if it is full, the
+    next ``N`` pages are requested concurrently from a thread pool and each
+    page consumed triggers the request for the page after them. At most
+    ``N + 1`` pages are held at once, and at most ``N`` requests past the
+    end of the table are wasted.
+
+    Args:
+        fetch: Callable taking ``(limit, offset)`` and returning one page.
+        page_size: Rows requested per page.
+        prefetch: Number of pages to request ahead of the one being consumed.
+
+    Yields:
+        Non-empty pages in offset order.
+
+    Raises:
+        ValueError: If ``page_size`` is not positive or ``prefetch`` is negative.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    batch = fetch(page_size, 0)
+    if batch:
+        yield batch
+    if len(batch) < page_size:
+        return
+
+    offset = page_size
+    if not prefetch:
+        while True:
+            batch = fetch(page_size, offset)
+            if batch:
+                yield batch
+            if len(batch) < page_size:
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="pyvergeos-prefetch")
+    pending: deque[Future[list[T]]] = deque()
+    try:
+        for _ in range(prefetch):
+            pending.append(executor.submit(fetch, page_size, offset))
+            offset += page_size
+        while True:
+            batch = pending.popleft().result()
+            if len(batch) < page_size:
+                if batch:
+                    yield batch
+                return
+            pending.append(executor.submit(fetch, page_size, offset))
+            offset += page_size
+            yield batch
+    finally:
+        # Drop pages past the end (or after the caller stopped iterating) and
+        # wait for running requests so none outlive the iterator.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_keyset(
+    client: VergeClient,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    page_size: int = 100,
+    key_field: str = KEY_FIELD,
+    descending: bool = False,
+    prefetch: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over every row of an endpoint using keyset pagination.
+
+    With ``key_field="$key"`` each page asks for ``$key gt <last key>``.
+    Any other column (e.g. ``timestamp`` for log tables) need not be unique,
+    so pages ask for ``<field> ge <last value>`` and rows already returned
+    for that value are skipped.
+
+    Args:
+        client: Client used for requests.
+        endpoint: API endpoint (e.g. "logs").
+        params: Base query parameters (``filter``, ``fields``, ...). Any
+            ``sort``, ``limit`` and ``offset`` are replaced.
+        page_size: Rows requested per page.
+        key_field: Column to order and page by.
+        descending: Walk from the largest value down instead of ascending.
+        prefetch: Request the next page in the background while the current
+            one is consumed. Each page depends on the previous page's last
+            row, so keyset pagination can only run one page ahead.
+
+    Yields:
+        Raw row dicts in ``key_field`` order.
+
+    Raises:
+        ValueError: If ``page_size`` is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    base = dict(params or {})
+    for name in ("sort", "limit", "offset"):
+        base.pop(name, None)
+    base_filter = base.pop("filter", None)
+    fields = _with_fields(base.pop("fields", None), KEY_FIELD, key_field)
+    if fields:
+        base["fields"] = fields
+    base["sort"] = f"-{key_field}" if descending else key_field
+
+    unique = key_field == KEY_FIELD
+    strict_op, inclusive_op = ("lt", "le") if descending else ("gt", "ge")
+
+    def fetch(limit: int, cursor: Any) -> list[dict[str, Any]]:
+        conditions = [f"({base_filter})"] if base_filter else []
+        if cursor is not None:
+            op = strict_op if unique else inclusive_op
+            conditions.append(f"{key_field} {op} {filter_literal(cursor)}")
+
+        page_params = dict(base, limit=limit)
+        if conditions:
+            page_params["filter"] = " and ".join(conditions)
+
+        response = client._request("GET", endpoint, params=page_params)
+        if response is None:
+            return []
+        return response if isinstance(response, list) else [response]
+
+    cursor: Any = None
+    seen_at_cursor: set[Any] = set()
+    limit = page_size
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyvergeos-prefetch")
+    next_page: Callable[[], list[dict[str, Any]]] = partial(fetch, limit, cursor)
+
+    try:
+        while True:
+            rows = next_page()
+            page = []
+            for row in rows:
+                value = row.get(key_field)
+                if not unique and value == cursor and row.get(KEY_FIELD) in seen_at_cursor:
+                    continue
+                page.append(row)
+                if value != cursor:
+                    cursor = value
+                    seen_at_cursor = set()
+                if not unique:
+                    seen_at_cursor.add(row.get(KEY_FIELD))
+
+            last = len(rows) < limit
+            if not page and not last:
+                # A full page of rows sharing one value that were all returned
+                # already: widen the page until it gets past them.
+                limit *= 2
+                logger.debug(
+                    "Keyset page on %s stalled at %s=%r; widening to %d",
+                    endpoint,
+                    key_field,
+                    cursor,
+                    limit,
+                )
+            else:
+                limit = page_size
+
+            if not last:
+                # The next cursor is known as soon as this page has arrived.
+                if prefetch:
+                    next_page = executor.submit(fetch, limit, cursor).result
+                else:
+                    next_page = partial(fetch, limit, cursor)
+
+            yield from page
+            if last:
+                return
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
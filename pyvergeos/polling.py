@@ -0,0 +1,339 @@
+"""Adaptive status polling shared by the SDK's wait helpers.
+
+Waiting on a task, query or job means fetching its status until it
+finishes. Instead of sleeping a fixed interval between fetches, a
+:class:`Poller`:
+
+* probes once immediately, so operations that are already done (or finish
+  within a round trip) return without any wait;
+* then waits :data:`~pyvergeos.constants.POLL_INITIAL_INTERVAL` and doubles
+  the wait after every probe up to the caller's ``poll_interval``, so short
+  operations are noticed quickly and long ones are polled at the usual
+  rate;
+* spreads each wait by a random jitter so that many clients waiting on the
+  same operation do not poll in lockstep;
+* measures its deadline on the monotonic clock and never sleeps past it;
+* stops with :class:`~pyvergeos.exceptions.WaitCancelledError` as soon as
+  an optional ``threading.Event`` is set.
+
+Every wait is counted in process-wide statistics (:func:`poll_stats`), so
+polling load can be compared across releases or configurations. Waits
+that end in an error, or that are left unfinished, are counted too.
+
+Example:
+    >>> from pyvergeos.polling import poll_stats
+    >>> client.tasks.wait(task_key)
+    >>> poll_stats().polls_per_wait
+    3.0
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Callable, TypeVar
+
+from pyvergeos.constants import (
+    POLL_BACKOFF_MULTIPLIER,
+    POLL_INITIAL_INTERVAL,
+    POLL_INTERVAL_FAST,
+    POLL_JITTER,
+    READY_TIMEOUT,
+)
+from pyvergeos.exceptions import NotFoundError, WaitCancelledError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PollStats:
+    """Snapshot of process-wide polling statistics.
+
+    Attributes:
+        completed: Waits that saw their operation finish.
+        timed_out: Waits that reached their timeout.
+        cancelled: Waits stopped by their cancel event.
+        failed: Waits ended by an error, such as a probe that raised or a
+            failed task.
+        abandoned: Waits left before they finished, such as a
+            ``wait_many(..., return_when="each")`` iterator the caller
+            stopped reading.
+        polls: Status probes made by all waits.
+        completed_polls: Status probes made by completed waits.
+        completed_time: Total seconds spent in completed waits.
+    """
+
+    completed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    abandoned: int = 0
+    polls: int = 0
+    completed_polls: int = 0
+    completed_time: float = 0.0
+
+    @property
+    def polls_per_wait(self) -> float:
+        """Average status probes per completed wait."""
+        return self.completed_polls / self.completed if self.completed else 0.0
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Average seconds per completed wait."""
+        return self.completed_time / self.completed if self.completed else 0.0
+
+
+class _StatsCollector:
+    """Thread-safe accumulator behind :func:`poll_stats`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = PollStats()
+
+    def record(self, outcome: str, polls: int, elapsed: float) -> None:
+        with self._lock:
+            s = self._stats
+            self._stats = PollStats(
+                completed=s.completed + (outcome == "completed"),
+                timed_out=s.timed_out + (outcome == "timed_out"),
+                cancelled=s.cancelled + (outcome == "cancelled"),
+                failed=s.failed + (outcome == "failed"),
+                abandoned=s.abandoned + (outcome == "abandoned"),
+                polls=s.polls + polls,
+                completed_polls=s.completed_polls + (polls if outcome == "completed" else 0),
+                completed_time=s.completed_time + (elapsed if outcome == "completed" else 0.0),
+            )
+
+    def snapshot(self) -> PollStats:
+        with self._lock:
+            return self._stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = PollStats()
+
+
+_stats = _StatsCollector()
+
+
+def poll_stats() -> PollStats:
+    """Return polling statistics for all waits in this process."""
+    return _stats.snapshot()
+
+
+def reset_poll_stats() -> None:
+    """Clear the statistics returned by :func:`poll_stats`."""
+    _stats.reset()
+
+
+def backoff_delays(
+    poll_interval: float,
+    *,
+    initial_interval: float = POLL_INITIAL_INTERVAL,
+    multiplier: float = POLL_BACKOFF_MULTIPLIER,
+    jitter: float = POLL_JITTER,
+) -> Iterator[float]:
+    """Yield waits that grow from ``initial_interval`` to ``poll_interval``.
+
+    Each wait is spread by up to ``jitter`` (a fraction of it) either way.
+
+    Example:
+        >>> delays = backoff_delays(1, jitter=0)
+        >>> [next(delays) for _ in range(6)]
+        [0.1, 0.2, 0.4, 0.8, 1, 1]
+    """
+    interval = min(initial_interval, poll_interval)
+    while True:
+        delay = interval
+        interval = min(interval * multiplier, poll_interval)
+        if jitter:
+            delay *= 1 + random.uniform(-jitter, jitter)
+        yield delay
+
+
+class Poller:
+    """Schedule of status probes for one wait.
+
+    Iterating yields once per probe. The first probe is immediate; before
+    each later one the poller sleeps with exponential backoff and jitter.
+    Iteration ends when the deadline passes, so code after the loop
+    handles the timeout. Call :meth:`finish` when the operation is done.
+
+    Used as a context manager, the poller also counts waits that end
+    another way: an exception leaving the block counts as failed, and
+    leaving it early (or closing a generator suspended inside it) counts
+    as abandoned.
+
+    Args:
+        timeout: Maximum seconds to wait (None = no limit). With 0 the
+            poller probes once.
+        poll_interval: Longest wait between probes.
+        cancel: Event that stops the wait when set.
+        initial_interval: Wait before the second probe.
+        multiplier: Factor by which the wait grows after each probe.
+        jitter: Random spread of each wait, as a fraction of it.
+
+    Example:
+        >>> with Poller(timeout=60, poll_interval=2) as poller:
+        ...     for _ in poller:
+        ...         job = fetch_job()
+        ...         if job["status"] == "complete":
+        ...             poller.finish()
+        ...             break
+        ...     else:
+        ...         raise VergeTimeoutError("job did not complete")
+    """
+
+    def __init__(
+        self,
+        timeout: float | None,
+        poll_interval: float,
+        *,
+        cancel: threading.Event | None = None,
+        initial_interval: float = POLL_INITIAL_INTERVAL,
+        multiplier: float = POLL_BACKOFF_MULTIPLIER,
+        jitter: float = POLL_JITTER,
+    ) -> None:
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.polls = 0
+        self._cancel = cancel
+        self._delays = backoff_delays(
+            poll_interval, initial_interval=initial_interval, multiplier=multiplier, jitter=jitter
+        )
+        self._start = time.monotonic()
+        self._deadline = self._start + timeout if timeout is not None else None
+        self._done = False
+        self._outcome: str | None = None
+
+    def __enter__(self) -> Poller:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self._record("failed")
+        else:
+            self.close()
+
+    def __iter__(self) -> Iterator[int]:
+        while True:
+            if self._cancel is not None and self._cancel.is_set():
+                self._record("cancelled")
+                raise WaitCancelledError("Wait cancelled")
+            self.polls += 1
+            yield self.polls
+            if self._done:
+                return
+
+            delay = next(self._delays)
+            if self._deadline is not None:
+                now = time.monotonic()
+                remaining = self._deadline - now
+                if remaining <= 0:
+                    self._record("timed_out", now)
+                    return
+                delay = min(delay, remaining)
+            if self._cancel is not None:
+                self._cancel.wait(delay)
+            else:
+                time.sleep(delay)
+
+    def finish(self) -> None:
+        """Mark the wait as completed."""
+        if not self._done:
+            self._done = True
+            self._record("completed")
+
+    def close(self) -> None:
+        """End the wait, counting it as abandoned if it has no outcome yet."""
+        self._record("abandoned")
+
+    def _record(self, outcome: str, now: float | None = None) -> None:
+        # Each wait is counted once, under its first outcome
+        if self._outcome is None:
+            self._outcome = outcome
+            if now is None:
+                now = time.monotonic()
+            _stats.record(outcome, self.polls, now - self._start)
+
+
+def poll_until(
+    probe: Callable[[], T],
+    done: Callable[[T], bool],
+    *,
+    timeout: float | None,
+    poll_interval: float,
+    on_timeout: Callable[[T], Exception],
+    cancel: threading.Event | None = None,
+) -> T:
+    """Call ``probe`` until ``done`` accepts its result.
+
+    Args:
+        probe: Fetches the current state.
+        done: Returns True when the state is final.
+        timeout: Maximum seconds to wait (None = no limit).
+        poll_interval: Longest wait between probes.
+        on_timeout: Builds the exception raised on timeout from the last
+            state seen.
+        cancel: Event that stops the wait when set.
+
+    Returns:
+        The first state ``done`` accepted.
+
+    Raises:
+        WaitCancelledError: If ``cancel`` is set first.
+        Exception: Whatever ``on_timeout`` returns, when the timeout passes.
+    """
+    with Poller(timeout, poll_interval, cancel=cancel) as poller:
+        for _ in poller:
+            state = probe()
+            if done(state):
+                poller.finish()
+                return state
+    raise on_timeout(state)
+
+
+def wait_until_found(
+    lookup: Callable[[], T],
+    *,
+    timeout: float = READY_TIMEOUT,
+    poll_interval: float = POLL_INTERVAL_FAST,
+) -> T:
+    """Call ``lookup`` until it stops raising NotFoundError.
+
+    Used to fetch an object right after creating it, when the create
+    response did not include its ``$key`` and the object may take a moment
+    to become visible.
+
+    Args:
+        lookup: Fetches the object, raising NotFoundError while it is missing.
+        timeout: Maximum seconds to wait.
+        poll_interval: Longest wait between lookups.
+
+    Returns:
+        What ``lookup`` returned.
+
+    Raises:
+        NotFoundError: The last lookup's error, if the object is still
+            missing after ``timeout``.
+    """
+    error = NotFoundError("Object not found")
+    with Poller(timeout, poll_interval) as poller:
+        for _ in poller:
+            try:
+                result = lookup()
+            except NotFoundError as e:
+                error = e
+                continue
+            poller.finish()
+            return result
+    raise error
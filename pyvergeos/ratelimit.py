@@ -0,0 +1,287 @@
+"""Client-wide adaptive rate limiting.
+
+Retrying a throttled request with backoff protects only that request,
+while every other thread keeps sending at full speed. A
+:class:`RateLimiter` shared by all requests of a client slows the whole
+client down instead:
+
+* A token bucket caps the request rate (``rate`` requests per second, with
+  bursts of up to ``burst``).
+* A concurrency window limits how many requests are in flight. It grows by
+  one request per window of successful requests (additive increase) and is
+  halved when the server answers 429 or 503, or when latency climbs well
+  above its baseline (multiplicative decrease).
+* A ``Retry-After`` header pauses every request of the client until the
+  given time, not just the one that received it.
+
+Example:
+    >>> client = VergeClient(host, token=token, rate_limit=RateLimiter(rate=20))
+    >>> client.rate_limiter.stats()
+    RateLimiterStats(concurrency_limit=7.5, in_flight=3, ...)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from pyvergeos.constants import (
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_LATENCY_TOLERANCE,
+    RATE_LIMIT_MAX_CONCURRENCY,
+    RATE_LIMIT_RATE,
+    RATE_LIMIT_THROTTLE_CODES,
+)
+from pyvergeos.transport import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+#: Latency samples needed before latency inflation is acted on
+_LATENCY_WARMUP = 20
+
+#: Smoothing factor of the latency moving average
+_LATENCY_ALPHA = 0.1
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Snapshot of rate limiter state.
+
+    Attributes:
+        concurrency_limit: Current concurrency window.
+        in_flight: Requests currently holding a slot.
+        requests: Requests that have been admitted.
+        throttled: Responses with a throttling status (429, 503).
+        latency_backoffs: Window decreases caused by latency inflation.
+        wait_time_total: Total seconds callers waited to be admitted.
+        paused_until: Epoch time a ``Retry-After`` pause ends (0 if none).
+        latency_baseline: Baseline request latency in seconds.
+        latency_average: Smoothed recent request latency in seconds.
+    """
+
+    concurrency_limit: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+    throttled: int = 0
+    latency_backoffs: int = 0
+    wait_time_total: float = 0.0
+    paused_until: float = 0.0
+    latency_baseline: float = 0.0
+    latency_average: float = 0.0
+
+
+class RateLimiter:
+    """Token bucket plus AIMD concurrency window shared by a client's requests.
+
+    Args:
+        rate: Maximum requests per second (None for no rate cap).
+        burst: Requests that may be sent at once after an idle period.
+        max_concurrency: Upper bound of the concurrency window.
+        min_concurrency: Lower bound of the concurrency window.
+        decrease_factor: Window multiplier applied on congestion.
+        latency_tolerance: Shrink the window when the smoothed latency
+            exceeds this multiple of the baseline (None to ignore latency).
+        throttle_codes: Status codes treated as throttling.
+
+    Raises:
+        ValueError: If a bound or factor is out of range.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = RATE_LIMIT_RATE,
+        burst: int = RATE_LIMIT_BURST,
+        max_concurrency: int = RATE_LIMIT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        decrease_factor: float = RATE_LIMIT_DECREASE_FACTOR,
+        latency_tolerance: float | None = RATE_LIMIT_LATENCY_TOLERANCE,
+        throttle_codes: Iterable[int] = RATE_LIMIT_THROTTLE_CODES,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("need 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if latency_tolerance is not None and latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.throttle_codes = frozenset(int(code) for code in throttle_codes)
+
+        self._cond = threading.Condition()
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._latency_avg = 0.0
+        self._latency_baseline = 0.0
+        self._samples = 0
+        self._requests = 0
+        self._throttled = 0
+        self._latency_backoffs = 0
+        self._wait_total = 0.0
+
+    @property
+    def concurrency_limit(self) -> float:
+        """Current concurrency window."""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then take a slot.
+
+        Waits for any ``Retry-After`` pause to end, for a free slot in the
+        concurrency window and for a token from the bucket.
+        """
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0 and self._in_flight < max(1, int(self._limit)):
+                    wait = self._take_token(now)
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                elif wait > 0:
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            self._in_flight += 1
+            self._requests += 1
+            self._wait_total += time.monotonic() - start
+
+    def _take_token(self, now: float) -> float:
+        """Take a bucket token; return 0, or the seconds until one is available."""
+        if self.rate is None:
+            return 0.0
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def release(self) -> None:
+        """Return a slot taken by :meth:`acquire`."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def record(
+        self, status_code: int, latency: float, headers: Mapping[str, Any] | None = None
+    ) -> None:
+        """Feed the outcome of a request back into the limiter.
+
+        Args:
+            status_code: HTTP status of the response.
+            latency: Seconds from sending the request to the response.
+            headers: Response headers (for ``Retry-After``).
+        """
+        now = time.monotonic()
+        with self._cond:
+            if status_code in self.throttle_codes:
+                self._throttled += 1
+                retry_after = parse_retry_after(headers.get("Retry-After") if headers else None)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                    logger.debug("Rate limiter paused for %.1fs (Retry-After)", retry_after)
+                self._decrease(now, f"HTTP {status_code}")
+            elif self._latency_inflated(latency):
+                self._latency_backoffs += 1
+                self._decrease(now, f"latency {self._latency_avg:.3f}s")
+            elif self._limit < self.max_concurrency:
+                # Additive increase: about one slot per window of successes
+                self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def _latency_inflated(self, latency: float) -> bool:
+        self._samples += 1
+        if self._samples == 1:
+            self._latency_avg = self._latency_baseline = latency
+            return False
+        self._latency_avg += _LATENCY_ALPHA * (latency - self._latency_avg)
+        if self._latency_avg < self._latency_baseline:
+            self._latency_baseline = self._latency_avg
+        else:
+            # Let the baseline follow slow, lasting changes
+            self._latency_baseline += 0.01 * (self._latency_avg - self._latency_baseline)
+        return (
+            self.latency_tolerance is not None
+            and self._samples > _LATENCY_WARMUP
+            and self._latency_avg > self._latency_baseline * self.latency_tolerance
+        )
+
+    def _decrease(self, now: float, reason: str) -> None:
+        # Responses to requests sent before the last decrease reflect the old
+        # window; shrink at most once per round trip.
+        if now - self._last_decrease < max(self._latency_avg, 0.05):
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_concurrency, self._limit * self.decrease_factor)
+        logger.debug("Rate limiter window reduced to %.1f (%s)", self._limit, reason)
+
+    @contextmanager
+    def slot(self) -> Iterator[_Slot]:
+        """Hold a slot for one request.
+
+        Example:
+            >>> with limiter.slot() as slot:
+            ...     response = session.request("GET", url)
+            ...     slot.record(response)
+        """
+        self.acquire()
+        try:
+            yield _Slot(self)
+        finally:
+            self.release()
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the limiter state."""
+        with self._cond:
+            paused = self._paused_until - time.monotonic()
+            return RateLimiterStats(
+                concurrency_limit=self._limit,
+                in_flight=self._in_flight,
+                requests=self._requests,
+                throttled=self._throttled,
+                latency_backoffs=self._latency_backoffs,
+                wait_time_total=self._wait_total,
+                paused_until=time.time() + paused if paused > 0 else 0.0,
+                latency_baseline=self._latency_baseline,
+                latency_average=self._latency_avg,
+            )
+
+
+class _Slot:
+    """An admitted request; reports its response back to the limiter."""
+
+    __slots__ = ("_limiter", "_start")
+
+    def __init__(self, limiter: RateLimiter) -> None:
+        self._limiter = limiter
+        self._start = time.monotonic()
+
+    def record(self, response: Any) -> None:
+        """Record a response (anything with ``status_code`` and ``headers``)."""
+        headers = getattr(response, "headers", None)
+        self._limiter.record(
+            int(response.status_code),
+            time.monotonic() - self._start,
+            headers if isinstance(headers, Mapping) else None,
+        )
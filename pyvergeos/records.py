@@ -0,0 +1,189 @@
+"""Compact read-only records for read-mostly resource models.
+
+``ResourceObject`` is a ``dict`` subclass with a per-instance ``__dict__``
+holding its manager reference, and attribute access falls back through a
+Python-level ``__getattr__``. For models created by the tens of thousands
+(``Log``, ``BillingRecord``, ``TaskEvent``, ``MachineStatsHistory``) a
+compact record stores the row as a tuple instead. The record class is
+generated once per model and set of columns, and carries a copy of the
+model's properties, so ``record.level_display`` or ``record.created_at``
+work unchanged.
+
+Compact records are read-only and not bound to a manager: ``refresh()``,
+``save()``, ``delete()`` and properties that call the API are not
+available, and ``isinstance(record, Log)`` is False.
+
+Example:
+    >>> logs = client.logs.list(limit=50000, compact=True)
+    >>> logs[0].level_display, logs[0]["text"]
+    ('Audit', 'User admin logged in')
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from pyvergeos.resources.base import ResourceObject
+
+#: Names never copied from the model onto a compact record class
+_SKIPPED = frozenset({"__init__", "__getattr__", "__setattr__", "__dict__", "__weakref__"})
+
+
+class CompactRecord(tuple):  # type: ignore[type-arg]
+    """Read-only resource record stored as a tuple of column values.
+
+    Supports the read side of the ``ResourceObject`` interface: item and
+    attribute access by field name, ``get()``, ``keys()``, ``items()``,
+    ``in`` and ``key``.
+    """
+
+    __slots__ = ()
+
+    #: Column names, in value order
+    _fields: tuple[str, ...] = ()
+    #: Column name to tuple index
+    _index: dict[str, int] = {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a field value, or ``default`` if the field is absent."""
+        i = self._index.get(name)
+        return default if i is None else tuple.__getitem__(self, i)
+
+    def __getitem__(self, name: Any) -> Any:
+        if isinstance(name, str):
+            i = self._index.get(name)
+            if i is None:
+                raise KeyError(name)
+            return tuple.__getitem__(self, i)
+        return tuple.__getitem__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        i = self._index.get(name)
+        if i is None:
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
+        return tuple.__getitem__(self, i)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        if isinstance(other, CompactRecord):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def keys(self) -> tuple[str, ...]:
+        """Field names."""
+        return self._fields
+
+    def values(self) -> tuple[Any, ...]:
+        """Field values, in field order."""
+        return tuple(tuple.__iter__(self))
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """(name, value) pairs."""
+        return zip(self._fields, tuple.__iter__(self))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict."""
+        return dict(zip(self._fields, tuple.__iter__(self)))
+
+    @property
+    def _manager(self) -> Any:
+        raise AttributeError(f"{type(self).__name__} is a compact record without a manager")
+
+    @property
+    def key(self) -> int:
+        """Resource primary key ($key).
+
+        Raises:
+            ValueError: If the record has no $key.
+        """
+        k = self.get("$key")
+        if k is None:
+            raise ValueError("Resource has no $key - may not be persisted")
+        return int(k)
+
+    def __repr__(self) -> str:
+        key = self.get("$key", "?")
+        name = self.get("name", "")
+        return f"<{type(self).__name__} key={key} name={name!r}>"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (self.to_dict(),))
+
+
+def _model_namespace(model: type[ResourceObject]) -> dict[str, Any]:
+    """Collect the attributes a model adds on top of ``ResourceObject``."""
+    from pyvergeos.resources.base import ResourceObject
+
+    namespace: dict[str, Any] = {}
+    for klass in reversed(model.__mro__):
+        if not issubclass(klass, ResourceObject) or klass is ResourceObject:
+            continue
+        for name, value in vars(klass).items():
+            if name in _SKIPPED or (name.startswith("__") and name != "__repr__"):
+                continue
+            namespace[name] = value
+    return namespace
+
+
+@lru_cache(maxsize=256)
+def record_class(model: type[ResourceObject], fields: tuple[str, ...]) -> type[CompactRecord]:
+    """Return the compact record class for a model and column layout.
+
+    Args:
+        model: ResourceObject subclass whose properties are copied.
+        fields: Column names, in value order.
+
+    Returns:
+        A ``CompactRecord`` subclass named ``Compact<Model>``.
+    """
+    namespace = _model_namespace(model)
+    namespace.update(
+        {
+            "__slots__": (),
+            "__doc__": f"Compact read-only form of :class:`{model.__name__}`.",
+            "__module__": model.__module__,
+            "_fields": fields,
+            "_index": {name: i for i, name in enumerate(fields)},
+        }
+    )
+    return type(f"Compact{model.__name__}", (CompactRecord,), namespace)
+
+
+def compact_factory(model: type[ResourceObject]) -> Callable[[Mapping[str, Any]], CompactRecord]:
+    """Return a function turning API rows into compact ``model`` records.
+
+    Rows of one query share their column layout, so the record class is
+    looked up once per distinct set of keys.
+
+    Args:
+        model: ResourceObject subclass to mirror.
+
+    Returns:
+        Callable taking a row dict and returning a compact record.
+    """
+    classes: dict[tuple[str, ...], type[CompactRecord]] = {}
+
+    def make(row: Mapping[str, Any]) -> CompactRecord:
+        fields = tuple(row)
+        cls = classes.get(fields)
+        if cls is None:
+            cls = classes[fields] = record_class(model, fields)
+        return cls(row.values())
+
+    return make
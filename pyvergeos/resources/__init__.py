@@ -1,247 +1,516 @@
-"""Resource managers for VergeOS API resources."""
+"""Resource managers for VergeOS API resources.
+
+Resource modules are imported on first use: ``from pyvergeos.resources
+import BillingManager`` loads ``pyvergeos.resources.billing`` (and what it imports)
+but none of the other resource modules.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyvergeos.resources.api_keys import APIKey, APIKeyCreated, APIKeyManager
+    from pyvergeos.resources.auth_sources import (
+        AuthSource,
+        AuthSourceManager,
+        AuthSourceState,
+        AuthSourceStateManager,
+    )
+    from pyvergeos.resources.base import ResourceManager, ResourceObject
+    from pyvergeos.resources.billing import BillingManager, BillingRecord
+    from pyvergeos.resources.certificates import Certificate, CertificateManager
+    from pyvergeos.resources.cloud_snapshots import (
+        CloudSnapshot,
+        CloudSnapshotManager,
+        CloudSnapshotTenant,
+        CloudSnapshotTenantManager,
+        CloudSnapshotVM,
+        CloudSnapshotVMManager,
+    )
+    from pyvergeos.resources.cloudinit_files import CloudInitFile, CloudInitFileManager
+    from pyvergeos.resources.cluster_tiers import (
+        ClusterTier,
+        ClusterTierManager,
+        ClusterTierStats,
+        ClusterTierStatsHistoryLong,
+        ClusterTierStatsHistoryShort,
+        ClusterTierStatus,
+    )
+    from pyvergeos.resources.devices import Device, DeviceManager
+    from pyvergeos.resources.diagnostics import SystemDiagnostic, SystemDiagnosticManager
+    from pyvergeos.resources.gpu import (
+        NodeGpu,
+        NodeGpuInstance,
+        NodeGpuInstanceManager,
+        NodeGpuManager,
+        NodeGpuStats,
+        NodeGpuStatsHistory,
+        NodeGpuStatsManager,
+        NodeHostGpuDevice,
+        NodeHostGpuDeviceManager,
+        NodeVgpuDevice,
+        NodeVgpuDeviceManager,
+        NodeVgpuProfile,
+        NodeVgpuProfileManager,
+        NvidiaVgpuProfile,
+        NvidiaVgpuProfileManager,
+    )
+    from pyvergeos.resources.lldp import NodeLLDPNeighbor, NodeLLDPNeighborManager
+    from pyvergeos.resources.machine_stats import (
+        MachineLog,
+        MachineLogManager,
+        MachineStats,
+        MachineStatsHistory,
+        MachineStatsManager,
+        MachineStatus,
+        MachineStatusManager,
+    )
+    from pyvergeos.resources.nas_antivirus import (
+        NasServiceAntivirus,
+        NasServiceAntivirusManager,
+        VolumeAntivirus,
+        VolumeAntivirusInfection,
+        VolumeAntivirusInfectionManager,
+        VolumeAntivirusLog,
+        VolumeAntivirusLogManager,
+        VolumeAntivirusManager,
+        VolumeAntivirusStats,
+        VolumeAntivirusStatsManager,
+        VolumeAntivirusStatus,
+        VolumeAntivirusStatusManager,
+    )
+    from pyvergeos.resources.nas_cifs import NASCIFSShare, NASCIFSShareManager
+    from pyvergeos.resources.nas_nfs import NASNFSShare, NASNFSShareManager
+    from pyvergeos.resources.nas_services import (
+        CIFSSettings,
+        NASService,
+        NASServiceManager,
+        NFSSettings,
+    )
+    from pyvergeos.resources.nas_users import NASUser, NASUserManager
+    from pyvergeos.resources.nas_volume_browser import NASVolumeFile, NASVolumeFileManager
+    from pyvergeos.resources.nas_volume_syncs import NASVolumeSync, NASVolumeSyncManager
+    from pyvergeos.resources.nas_volumes import (
+        NASVolume,
+        NASVolumeManager,
+        NASVolumeSnapshot,
+        NASVolumeSnapshotManager,
+    )
+    from pyvergeos.resources.network_stats import (
+        IPSecActiveConnection,
+        IPSecActiveConnectionManager,
+        NetworkDashboard,
+        NetworkDashboardManager,
+        NetworkMonitorStats,
+        NetworkMonitorStatsHistory,
+        NetworkMonitorStatsManager,
+        WireGuardPeerStatus,
+        WireGuardPeerStatusManager,
+    )
+    from pyvergeos.resources.nic_stats import (
+        MachineNicFabricStatus,
+        MachineNicFabricStatusManager,
+        MachineNicStats,
+        MachineNicStatsManager,
+        MachineNicStatus,
+        MachineNicStatusManager,
+    )
+    from pyvergeos.resources.nics import NIC, MachineNICManager, NICManager
+    from pyvergeos.resources.nodes import (
+        Node,
+        NodeDriver,
+        NodeDriverManager,
+        NodeManager,
+        NodePCIDevice,
+        NodePCIDeviceManager,
+        NodeSriovNicDevice,
+        NodeSriovNicDeviceManager,
+        NodeUSBDevice,
+        NodeUSBDeviceManager,
+    )
+    from pyvergeos.resources.oidc_applications import (
+        OidcApplication,
+        OidcApplicationGroup,
+        OidcApplicationGroupManager,
+        OidcApplicationLog,
+        OidcApplicationLogManager,
+        OidcApplicationManager,
+        OidcApplicationUser,
+        OidcApplicationUserManager,
+    )
+    from pyvergeos.resources.permissions import Permission, PermissionManager
+    from pyvergeos.resources.queries import (
+        NodeQueryManager,
+        QueryManager,
+        QueryResult,
+        ServiceContainerQueryManager,
+        TenantNodeQueryManager,
+        VNetQueryManager,
+    )
+    from pyvergeos.resources.recipe_common import (
+        RecipeQuestion,
+        RecipeQuestionManager,
+        RecipeSection,
+        RecipeSectionManager,
+    )
+    from pyvergeos.resources.resource_groups import (
+        ResourceGroup,
+        ResourceGroupManager,
+        ResourceRule,
+        ResourceRuleManager,
+    )
+    from pyvergeos.resources.shared_objects import SharedObject, SharedObjectManager
+    from pyvergeos.resources.site_syncs import (
+        SiteSyncIncoming,
+        SiteSyncIncomingLogManager,
+        SiteSyncIncomingManager,
+        SiteSyncIncomingVerified,
+        SiteSyncIncomingVerifiedManager,
+        SiteSyncLog,
+        SiteSyncOutgoing,
+        SiteSyncOutgoingLogManager,
+        SiteSyncOutgoingManager,
+        SiteSyncQueueItem,
+        SiteSyncQueueManager,
+        SiteSyncRemoteSnap,
+        SiteSyncRemoteSnapManager,
+        SiteSyncSchedule,
+        SiteSyncScheduleManager,
+        SiteSyncStats,
+        SiteSyncStatsHistory,
+        SiteSyncStatsManager,
+    )
+    from pyvergeos.resources.sites import Site, SiteManager
+    from pyvergeos.resources.snapshot_profiles import (
+        SnapshotProfile,
+        SnapshotProfileManager,
+        SnapshotProfilePeriod,
+        SnapshotProfilePeriodManager,
+    )
+    from pyvergeos.resources.tags import (
+        Tag,
+        TagCategory,
+        TagCategoryManager,
+        TagManager,
+        TagMember,
+        TagMemberManager,
+    )
+    from pyvergeos.resources.tenant_external_ips import (
+        TenantExternalIP,
+        TenantExternalIPManager,
+    )
+    from pyvergeos.resources.tenant_layer2 import TenantLayer2Manager, TenantLayer2Network
+    from pyvergeos.resources.tenant_manager import Tenant, TenantManager
+    from pyvergeos.resources.tenant_network_blocks import (
+        TenantNetworkBlock,
+        TenantNetworkBlockManager,
+    )
+    from pyvergeos.resources.tenant_recipes import (
+        TenantRecipe,
+        TenantRecipeInstance,
+        TenantRecipeInstanceManager,
+        TenantRecipeLog,
+        TenantRecipeLogManager,
+        TenantRecipeManager,
+    )
+    from pyvergeos.resources.tenant_snapshots import TenantSnapshot, TenantSnapshotManager
+    from pyvergeos.resources.tenant_stats import (
+        TenantDashboard,
+        TenantDashboardManager,
+        TenantLog,
+        TenantLogManager,
+        TenantStats,
+        TenantStatsHistory,
+        TenantStatsManager,
+    )
+    from pyvergeos.resources.tenant_storage import TenantStorage, TenantStorageManager
+    from pyvergeos.resources.updates import (
+        UpdateBranch,
+        UpdateBranchManager,
+        UpdateDashboard,
+        UpdateDashboardManager,
+        UpdateLog,
+        UpdateLogManager,
+        UpdatePackage,
+        UpdatePackageManager,
+        UpdateSettings,
+        UpdateSettingsManager,
+        UpdateSource,
+        UpdateSourceManager,
+        UpdateSourcePackage,
+        UpdateSourcePackageManager,
+        UpdateSourceStatus,
+        UpdateSourceStatusManager,
+    )
+    from pyvergeos.resources.vm_recipes import (
+        VmRecipe,
+        VmRecipeInstance,
+        VmRecipeInstanceManager,
+        VmRecipeLog,
+        VmRecipeLogManager,
+        VmRecipeManager,
+    )
+    from pyvergeos.resources.webhooks import Webhook, WebhookHistory, WebhookManager
+
+#: Exported names, by the resource module that defines them
+_MODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "api_keys": ("APIKey", "APIKeyCreated", "APIKeyManager"),
+    "auth_sources": (
+        "AuthSource",
+        "AuthSourceManager",
+        "AuthSourceState",
+        "AuthSourceStateManager",
+    ),
+    "base": ("ResourceManager", "ResourceObject"),
+    "billing": ("BillingManager", "BillingRecord"),
+    "certificates": ("Certificate", "CertificateManager"),
+    "cloud_snapshots": (
+        "CloudSnapshot",
+        "CloudSnapshotManager",
+        "CloudSnapshotTenant",
+        "CloudSnapshotTenantManager",
+        "CloudSnapshotVM",
+        "CloudSnapshotVMManager",
+    ),
+    "cloudinit_files": ("CloudInitFile", "CloudInitFileManager"),
+    "cluster_tiers": (
+        "ClusterTier",
+        "ClusterTierManager",
+        "ClusterTierStats",
+        "ClusterTierStatsHistoryLong",
+        "ClusterTierStatsHistoryShort",
+        "ClusterTierStatus",
+    ),
+    "devices": ("Device", "DeviceManager"),
+    "diagnostics": ("SystemDiagnostic", "SystemDiagnosticManager"),
+    "gpu": (
+        "NodeGpu",
+        "NodeGpuInstance",
+        "NodeGpuInstanceManager",
+        "NodeGpuManager",
+        "NodeGpuStats",
+        "NodeGpuStatsHistory",
+        "NodeGpuStatsManager",
+        "NodeHostGpuDevice",
+        "NodeHostGpuDeviceManager",
+        "NodeVgpuDevice",
+        "NodeVgpuDeviceManager",
+        "NodeVgpuProfile",
+        "NodeVgpuProfileManager",
+        "NvidiaVgpuProfile",
+        "NvidiaVgpuProfileManager",
+    ),
+    "lldp": ("NodeLLDPNeighbor", "NodeLLDPNeighborManager"),
+    "machine_stats": (
+        "MachineLog",
+        "MachineLogManager",
+        "MachineStats",
+        "MachineStatsHistory",
+        "MachineStatsManager",
+        "MachineStatus",
+        "MachineStatusManager",
+    ),
+    "nas_antivirus": (
+        "NasServiceAntivirus",
+        "NasServiceAntivirusManager",
+        "VolumeAntivirus",
+        "VolumeAntivirusInfection",
+        "VolumeAntivirusInfectionManager",
+        "VolumeAntivirusLog",
+        "VolumeAntivirusLogManager",
+        "VolumeAntivirusManager",
+        "VolumeAntivirusStats",
+        "VolumeAntivirusStatsManager",
+        "VolumeAntivirusStatus",
+        "VolumeAntivirusStatusManager",
+    ),
+    "nas_cifs": ("NASCIFSShare", "NASCIFSShareManager"),
+    "nas_nfs": ("NASNFSShare", "NASNFSShareManager"),
+    "nas_services": ("CIFSSettings", "NASService", "NASServiceManager", "NFSSettings"),
+    "nas_users": ("NASUser", "NASUserManager"),
+    "nas_volume_browser": ("NASVolumeFile", "NASVolumeFileManager"),
+    "nas_volume_syncs": ("NASVolumeSync", "NASVolumeSyncManager"),
+    "nas_volumes": (
+        "NASVolume",
+        "NASVolumeManager",
+        "NASVolumeSnapshot",
+        "NASVolumeSnapshotManager",
+    ),
+    "network_stats": (
+        "IPSecActiveConnection",
+        "IPSecActiveConnectionManager",
+        "NetworkDashboard",
+        "NetworkDashboardManager",
+        "NetworkMonitorStats",
+        "NetworkMonitorStatsHistory",
+        "NetworkMonitorStatsManager",
+        "WireGuardPeerStatus",
+        "WireGuardPeerStatusManager",
+    ),
+    "nic_stats": (
+        "MachineNicFabricStatus",
+        "MachineNicFabricStatusManager",
+        "MachineNicStats",
+        "MachineNicStatsManager",
+        "MachineNicStatus",
+        "MachineNicStatusManager",
+    ),
+    "nics": ("NIC", "MachineNICManager", "NICManager"),
+    "nodes": (
+        "Node",
+        "NodeDriver",
+        "NodeDriverManager",
+        "NodeManager",
+        "NodePCIDevice",
+        "NodePCIDeviceManager",
+        "NodeSriovNicDevice",
+        "NodeSriovNicDeviceManager",
+        "NodeUSBDevice",
+        "NodeUSBDeviceManager",
+    ),
+    "oidc_applications": (
+        "OidcApplication",
+        "OidcApplicationGroup",
+        "OidcApplicationGroupManager",
+        "OidcApplicationLog",
+        "OidcApplicationLogManager",
+        "OidcApplicationManager",
+        "OidcApplicationUser",
+        "OidcApplicationUserManager",
+    ),
+    "permissions": ("Permission", "PermissionManager"),
+    "queries": (
+        "NodeQueryManager",
+        "QueryManager",
+        "QueryResult",
+        "ServiceContainerQueryManager",
+        "TenantNodeQueryManager",
+        "VNetQueryManager",
+    ),
+    "recipe_common": (
+        "RecipeQuestion",
+        "RecipeQuestionManager",
+        "RecipeSection",
+        "RecipeSectionManager",
+    ),
+    "resource_groups": (
+        "ResourceGroup",
+        "ResourceGroupManager",
+        "ResourceRule",
+        "ResourceRuleManager",
+    ),
+    "shared_objects": ("SharedObject", "SharedObjectManager"),
+    "site_syncs": (
+        "SiteSyncIncoming",
+        "SiteSyncIncomingLogManager",
+        "SiteSyncIncomingManager",
+        "SiteSyncIncomingVerified",
+        "SiteSyncIncomingVerifiedManager",
+        "SiteSyncLog",
+        "SiteSyncOutgoing",
+        "SiteSyncOutgoingLogManager",
+        "SiteSyncOutgoingManager",
+        "SiteSyncQueueItem",
+        "SiteSyncQueueManager",
+        "SiteSyncRemoteSnap",
+        "SiteSyncRemoteSnapManager",
+        "SiteSyncSchedule",
+        "SiteSyncScheduleManager",
+        "SiteSyncStats",
+        "SiteSyncStatsHistory",
+        "SiteSyncStatsManager",
+    ),
+    "sites": ("Site", "SiteManager"),
+    "snapshot_profiles": (
+        "SnapshotProfile",
+        "SnapshotProfileManager",
+        "SnapshotProfilePeriod",
+        "SnapshotProfilePeriodManager",
+    ),
+    "tags": (
+        "Tag",
+        "TagCategory",
+        "TagCategoryManager",
+        "TagManager",
+        "TagMember",
+        "TagMemberManager",
+    ),
+    "tenant_external_ips": ("TenantExternalIP", "TenantExternalIPManager"),
+    "tenant_layer2": ("TenantLayer2Manager", "TenantLayer2Network"),
+    "tenant_manager": ("Tenant", "TenantManager"),
+    "tenant_network_blocks": ("TenantNetworkBlock", "TenantNetworkBlockManager"),
+    "tenant_recipes": (
+        "TenantRecipe",
+        "TenantRecipeInstance",
+        "TenantRecipeInstanceManager",
+        "TenantRecipeLog",
+        "TenantRecipeLogManager",
+        "TenantRecipeManager",
+    ),
+    "tenant_snapshots": ("TenantSnapshot", "TenantSnapshotManager"),
+    "tenant_stats": (
+        "TenantDashboard",
+        "TenantDashboardManager",
+        "TenantLog",
+        "TenantLogManager",
+        "TenantStats",
+        "TenantStatsHistory",
+        "TenantStatsManager",
+    ),
+    "tenant_storage": ("TenantStorage", "TenantStorageManager"),
+    "updates": (
+        "UpdateBranch",
+        "UpdateBranchManager",
+        "UpdateDashboard",
+        "UpdateDashboardManager",
+        "UpdateLog",
+        "UpdateLogManager",
+        "UpdatePackage",
+        "UpdatePackageManager",
+        "UpdateSettings",
+        "UpdateSettingsManager",
+        "UpdateSource",
+        "UpdateSourceManager",
+        "UpdateSourcePackage",
+        "UpdateSourcePackageManager",
+        "UpdateSourceStatus",
+        "UpdateSourceStatusManager",
+    ),
+    "vm_recipes": (
+        "VmRecipe",
+        "VmRecipeInstance",
+        "VmRecipeInstanceManager",
+        "VmRecipeLog",
+        "VmRecipeLogManager",
+        "VmRecipeManager",
+    ),
+    "webhooks": ("Webhook", "WebhookHistory", "WebhookManager"),
+}
+
+_EXPORTS = {name: module for module, names in _MODULE_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        # Submodules such as pyvergeos.resources.groups load on first access too
+        if not name.startswith("_"):
+            try:
+                return importlib.import_module(f"{__name__}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{__name__}.{name}":
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from pyvergeos.resources.api_keys import APIKey, APIKeyCreated, APIKeyManager
-from pyvergeos.resources.auth_sources import (
-    AuthSource,
-    AuthSourceManager,
-    AuthSourceState,
-    AuthSourceStateManager,
-)
-from pyvergeos.resources.base import ResourceManager, ResourceObject
-from pyvergeos.resources.billing import BillingManager, BillingRecord
-from pyvergeos.resources.certificates import Certificate, CertificateManager
-from pyvergeos.resources.cloud_snapshots import (
-    CloudSnapshot,
-    CloudSnapshotManager,
-    CloudSnapshotTenant,
-    CloudSnapshotTenantManager,
-    CloudSnapshotVM,
-    CloudSnapshotVMManager,
-)
-from pyvergeos.resources.cloudinit_files import CloudInitFile, CloudInitFileManager
-from pyvergeos.resources.cluster_tiers import (
-    ClusterTier,
-    ClusterTierManager,
-    ClusterTierStats,
-    ClusterTierStatsHistoryLong,
-    ClusterTierStatsHistoryShort,
-    ClusterTierStatus,
-)
-from pyvergeos.resources.devices import Device, DeviceManager
-from pyvergeos.resources.diagnostics import SystemDiagnostic, SystemDiagnosticManager
-from pyvergeos.resources.gpu import (
-    NodeGpu,
-    NodeGpuInstance,
-    NodeGpuInstanceManager,
-    NodeGpuManager,
-    NodeGpuStats,
-    NodeGpuStatsHistory,
-    NodeGpuStatsManager,
-    NodeHostGpuDevice,
-    NodeHostGpuDeviceManager,
-    NodeVgpuDevice,
-    NodeVgpuDeviceManager,
-    NodeVgpuProfile,
-    NodeVgpuProfileManager,
-    NvidiaVgpuProfile,
-    NvidiaVgpuProfileManager,
-)
-from pyvergeos.resources.lldp import NodeLLDPNeighbor, NodeLLDPNeighborManager
-from pyvergeos.resources.machine_stats import (
-    MachineLog,
-    MachineLogManager,
-    MachineStats,
-    MachineStatsHistory,
-    MachineStatsManager,
-    MachineStatus,
-    MachineStatusManager,
-)
-from pyvergeos.resources.nas_antivirus import (
-    NasServiceAntivirus,
-    NasServiceAntivirusManager,
-    VolumeAntivirus,
-    VolumeAntivirusInfection,
-    VolumeAntivirusInfectionManager,
-    VolumeAntivirusLog,
-    VolumeAntivirusLogManager,
-    VolumeAntivirusManager,
-    VolumeAntivirusStats,
-    VolumeAntivirusStatsManager,
-    VolumeAntivirusStatus,
-    VolumeAntivirusStatusManager,
-)
-from pyvergeos.resources.nas_cifs import NASCIFSShare, NASCIFSShareManager
-from pyvergeos.resources.nas_nfs import NASNFSShare, NASNFSShareManager
-from pyvergeos.resources.nas_services import (
-    CIFSSettings,
-    NASService,
-    NASServiceManager,
-    NFSSettings,
-)
-from pyvergeos.resources.nas_users import NASUser, NASUserManager
-from pyvergeos.resources.nas_volume_browser import NASVolumeFile, NASVolumeFileManager
-from pyvergeos.resources.nas_volume_syncs import NASVolumeSync, NASVolumeSyncManager
-from pyvergeos.resources.nas_volumes import (
-    NASVolume,
-    NASVolumeManager,
-    NASVolumeSnapshot,
-    NASVolumeSnapshotManager,
-)
-from pyvergeos.resources.network_stats import (
-    IPSecActiveConnection,
-    IPSecActiveConnectionManager,
-    NetworkDashboard,
-    NetworkDashboardManager,
-    NetworkMonitorStats,
-    NetworkMonitorStatsHistory,
-    NetworkMonitorStatsManager,
-    WireGuardPeerStatus,
-    WireGuardPeerStatusManager,
-)
-from pyvergeos.resources.nic_stats import (
-    MachineNicFabricStatus,
-    MachineNicFabricStatusManager,
-    MachineNicStats,
-    MachineNicStatsManager,
-    MachineNicStatus,
-    MachineNicStatusManager,
-)
-from pyvergeos.resources.nics import NIC, MachineNICManager, NICManager
-from pyvergeos.resources.nodes import (
-    Node,
-    NodeDriver,
-    NodeDriverManager,
-    NodeManager,
-    NodePCIDevice,
-    NodePCIDeviceManager,
-    NodeSriovNicDevice,
-    NodeSriovNicDeviceManager,
-    NodeUSBDevice,
-    NodeUSBDeviceManager,
-)
-from pyvergeos.resources.oidc_applications import (
-    OidcApplication,
-    OidcApplicationGroup,
-    OidcApplicationGroupManager,
-    OidcApplicationLog,
-    OidcApplicationLogManager,
-    OidcApplicationManager,
-    OidcApplicationUser,
-    OidcApplicationUserManager,
-)
-from pyvergeos.resources.permissions import Permission, PermissionManager
-from pyvergeos.resources.queries import (
-    NodeQueryManager,
-    QueryManager,
-    QueryResult,
-    ServiceContainerQueryManager,
-    TenantNodeQueryManager,
-    VNetQueryManager,
-)
-from pyvergeos.resources.recipe_common import (
-    RecipeQuestion,
-    RecipeQuestionManager,
-    RecipeSection,
-    RecipeSectionManager,
-)
-from pyvergeos.resources.resource_groups import (
-    ResourceGroup,
-    ResourceGroupManager,
-    ResourceRule,
-    ResourceRuleManager,
-)
-from pyvergeos.resources.shared_objects import SharedObject, SharedObjectManager
-from pyvergeos.resources.site_syncs import (
-    SiteSyncIncoming,
-    SiteSyncIncomingLogManager,
-    SiteSyncIncomingManager,
-    SiteSyncIncomingVerified,
-    SiteSyncIncomingVerifiedManager,
-    SiteSyncLog,
-    SiteSyncOutgoing,
-    SiteSyncOutgoingLogManager,
-    SiteSyncOutgoingManager,
-    SiteSyncQueueItem,
-    SiteSyncQueueManager,
-    SiteSyncRemoteSnap,
-    SiteSyncRemoteSnapManager,
-    SiteSyncSchedule,
-    SiteSyncScheduleManager,
-    SiteSyncStats,
-    SiteSyncStatsHistory,
-    SiteSyncStatsManager,
-)
-from pyvergeos.resources.sites import Site, SiteManager
-from pyvergeos.resources.snapshot_profiles import (
-    SnapshotProfile,
-    SnapshotProfileManager,
-    SnapshotProfilePeriod,
-    SnapshotProfilePeriodManager,
-)
-from pyvergeos.resources.tags import (
-    Tag,
-    TagCategory,
-    TagCategoryManager,
-    TagManager,
-    TagMember,
-    TagMemberManager,
-)
-from pyvergeos.resources.tenant_external_ips import (
-    TenantExternalIP,
-    TenantExternalIPManager,
-)
-from pyvergeos.resources.tenant_layer2 import TenantLayer2Manager, TenantLayer2Network
-from pyvergeos.resources.tenant_manager import Tenant, TenantManager
-from pyvergeos.resources.tenant_network_blocks import (
-    TenantNetworkBlock,
-    TenantNetworkBlockManager,
-)
-from pyvergeos.resources.tenant_recipes import (
-    TenantRecipe,
-    TenantRecipeInstance,
-    TenantRecipeInstanceManager,
-    TenantRecipeLog,
-    TenantRecipeLogManager,
-    TenantRecipeManager,
-)
-from pyvergeos.resources.tenant_snapshots import TenantSnapshot, TenantSnapshotManager
-from pyvergeos.resources.tenant_stats import (
-    TenantDashboard,
-    TenantDashboardManager,
-    TenantLog,
-    TenantLogManager,
-    TenantStats,
-    TenantStatsHistory,
-    TenantStatsManager,
-)
-from pyvergeos.resources.tenant_storage import TenantStorage, TenantStorageManager
-from pyvergeos.resources.updates import (
-    UpdateBranch,
-    UpdateBranchManager,
-    UpdateDashboard,
-    UpdateDashboardManager,
-    UpdateLog,
-    UpdateLogManager,
-    UpdatePackage,
-    UpdatePackageManager,
-    UpdateSettings,
-    UpdateSettingsManager,
-    UpdateSource,
-    UpdateSourceManager,
-    UpdateSourcePackage,
-    UpdateSourcePackageManager,
-    UpdateSourceStatus,
-    UpdateSourceStatusManager,
-)
-from pyvergeos.resources.vm_recipes import (
-    VmRecipe,
-    VmRecipeInstance,
-    VmRecipeInstanceManager,
-    VmRecipeLog,
-    VmRecipeLogManager,
-    VmRecipeManager,
-)
-from pyvergeos.resources.webhooks import Webhook, WebhookHistory, WebhookManager
 
 __all__ = [
     "APIKey",
@@ -381,53 +381,17 @@ class AlarmManager(ResourceManager[Alarm]):
     def _to_history_model(self, data: dict[str, Any]) -> AlarmHistory:
         return AlarmHistory(data, self)
 
-    def list(
+    def _list_params(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
-        limit: int | None = None,
-        offset: int | None = None,
         *,
         level: str | builtins.list[str] | None = None,
         owner_type: str | None = None,
         include_snoozed: bool = False,
         **filter_kwargs: Any,
-    ) -> builtins.list[Alarm]:
-        """List alarms with optional filtering.
-
-        By default, only returns active (non-snoozed) alarms.
-
-        Args:
-            filter: OData filter string.
-            fields: List of fields to return.
-            limit: Maximum number of results.
-            offset: Skip this many results.
-            level: Filter by severity level (or list of levels).
-                   Values: critical, error, warning, message, audit, summary, debug.
-            owner_type: Filter by owner type.
-                        Values: VM, Network, Node, Tenant, User, System, CloudSnapshot.
-            include_snoozed: If True, include snoozed alarms (default: False).
-            **filter_kwargs: Additional filter arguments.
-
-        Returns:
-            List of Alarm objects sorted by created date (newest first).
-
-        Example:
-            >>> # All active alarms
-            >>> alarms = client.alarms.list()
-
-            >>> # Critical alarms only
-            >>> critical = client.alarms.list(level="critical")
-
-            >>> # Critical and error alarms
-            >>> severe = client.alarms.list(level=["critical", "error"])
-
-            >>> # VM alarms
-            >>> vm_alarms = client.alarms.list(owner_type="VM")
-
-            >>> # Include snoozed alarms
-            >>> all_alarms = client.alarms.list(include_snoozed=True)
-        """
+    ) -> dict[str, Any]:
+        """Build list parameters, keeping only active alarms like :meth:`list`."""
         conditions: builtins.list[str] = []
 
         if filter:
@@ -470,6 +434,66 @@ class AlarmManager(ResourceManager[Alarm]):
             params["filter"] = combined_filter
         if fields:
             params["fields"] = ",".join(fields)
+
+        return params
+
+    def list(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        level: str | builtins.list[str] | None = None,
+        owner_type: str | None = None,
+        include_snoozed: bool = False,
+        compact: bool = False,
+        **filter_kwargs: Any,
+    ) -> builtins.list[Alarm]:
+        """List alarms with optional filtering.
+
+        By default, only returns active (non-snoozed) alarms.
+
+        Args:
+            filter: OData filter string.
+            fields: List of fields to return.
+            limit: Maximum number of results.
+            offset: Skip this many results.
+            level: Filter by severity level (or list of levels).
+                   Values: critical, error, warning, message, audit, summary, debug.
+            owner_type: Filter by owner type.
+                        Values: VM, Network, Node, Tenant, User, System, CloudSnapshot.
+            include_snoozed: If True, include snoozed alarms (default: False).
+            compact: Return compact read-only records instead of resource objects.
+            **filter_kwargs: Additional filter arguments.
+
+        Returns:
+            List of Alarm objects sorted by created date (newest first).
+
+        Example:
+            >>> # All active alarms
+            >>> alarms = client.alarms.list()
+
+            >>> # Critical alarms only
+            >>> critical = client.alarms.list(level="critical")
+
+            >>> # Critical and error alarms
+            >>> severe = client.alarms.list(level=["critical", "error"])
+
+            >>> # VM alarms
+            >>> vm_alarms = client.alarms.list(owner_type="VM")
+
+            >>> # Include snoozed alarms
+            >>> all_alarms = client.alarms.list(include_snoozed=True)
+        """
+        params = self._list_params(
+            filter,
+            fields,
+            level=level,
+            owner_type=owner_type,
+            include_snoozed=include_snoozed,
+            **filter_kwargs,
+        )
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
@@ -483,10 +507,11 @@ class AlarmManager(ResourceManager[Alarm]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_critical(
         self,
@@ -117,12 +117,17 @@ class NetworkAliasManager(ResourceManager[NetworkAlias]):
     def _to_model(self, data: dict[str, Any]) -> NetworkAlias:
         return NetworkAlias(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self.network_key} and type eq 'ipalias'"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         ip: str | None = None,
         hostname: str | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[NetworkAlias]:
         """List IP aliases for this network.
@@ -132,6 +137,7 @@ class NetworkAliasManager(ResourceManager[NetworkAlias]):
             fields: List of fields to return.
             ip: Filter by exact IP address.
             hostname: Filter by exact hostname/name.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -141,10 +147,7 @@ class NetworkAliasManager(ResourceManager[NetworkAlias]):
             fields = self._default_fields.copy()
 
         # Build filter for this network and type='ipalias'
-        filters: builtins.list[str] = [
-            f"vnet eq {self.network_key}",
-            "type eq 'ipalias'",
-        ]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if ip:
             escaped_ip = ip.replace("'", "''")
@@ -170,10 +173,11 @@ class NetworkAliasManager(ResourceManager[NetworkAlias]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -220,6 +220,8 @@ class APIKeyManager(ResourceManager[APIKey]):
         limit: int | None = None,
         offset: int | None = None,
         user: int | str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[APIKey]:
         """List API keys with optional filtering.
@@ -230,6 +232,7 @@ class APIKeyManager(ResourceManager[APIKey]):
             limit: Maximum number of results.
             offset: Skip this many results.
             user: Filter by user - can be user $key (int) or username (str).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -286,7 +289,8 @@ class APIKeyManager(ResourceManager[APIKey]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
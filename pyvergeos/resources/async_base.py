@@ -0,0 +1,471 @@
+"""Base asynchronous resource manager providing CRUD operations."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pyvergeos.bulk import BulkResult, GroupFunc, run_bulk_async, update_changes
+from pyvergeos.constants import BULK_CONCURRENCY
+from pyvergeos.exceptions import NotFoundError
+from pyvergeos.filters import build_filter, chunk_in_filters
+from pyvergeos.pagination import KEY_FIELD
+from pyvergeos.resources.base import ResourceManager, ResourceObject, model_for_manager
+
+if TYPE_CHECKING:
+    from pyvergeos.async_client import AsyncVergeClient
+
+T = TypeVar("T", bound="ResourceObject")
+
+
+class AsyncResourceManager(Generic[T]):
+    """Asynchronous counterpart of :class:`ResourceManager`.
+
+    Provides the same CRUD operations as the synchronous manager, but every
+    call is a coroutine executed on the :class:`AsyncVergeClient` connection
+    pool. Results are the same model classes the synchronous SDK returns, so
+    read-only properties (``vm.is_running``, ``node.status``, ...) work as
+    usual. Model methods that perform API calls (``refresh``, ``power_on``,
+    ...) are synchronous and should not be used; call the async manager
+    instead.
+
+    Example:
+        >>> async with AsyncVergeClient.from_env() as client:
+        ...     vms = await client.vms.list(fields=["$key", "name"])
+        ...     async for node in client.nodes.iter_all():
+        ...         print(node.name)
+    """
+
+    def __init__(
+        self,
+        client: AsyncVergeClient,
+        endpoint: str,
+        model: type[T] | None = None,
+        default_fields: builtins.list[str] | None = None,
+        base_filter: str | None = None,
+    ) -> None:
+        """Initialize AsyncResourceManager.
+
+        Args:
+            client: Async client used for requests.
+            endpoint: API endpoint (e.g. "vms").
+            model: ResourceObject subclass used for results.
+            default_fields: Fields requested when ``fields`` is not given.
+            base_filter: Filter always combined with caller filters
+                (e.g. "is_snapshot eq false" for VMs).
+        """
+        self._client = client
+        self._endpoint = endpoint
+        self._model: type[Any] = model or ResourceObject
+        self._default_fields = default_fields
+        self._base_filter = base_filter
+
+    @classmethod
+    def from_manager(
+        cls,
+        client: AsyncVergeClient,
+        manager_cls: type[ResourceManager[Any]],
+        base_filter: str | None = None,
+    ) -> AsyncResourceManager[Any]:
+        """Build an async manager mirroring a synchronous manager class.
+
+        The endpoint, default field set and model class are taken from
+        ``manager_cls``.
+
+        Args:
+            client: Async client used for requests.
+            manager_cls: Synchronous manager class (e.g. ``NodeManager``).
+            base_filter: Filter always combined with caller filters.
+
+        Returns:
+            AsyncResourceManager for the same endpoint.
+        """
+        model: type[Any] = model_for_manager(manager_cls)
+        return cls(
+            client,
+            manager_cls._endpoint,
+            model=model,
+            default_fields=getattr(manager_cls, "_default_fields", None),
+            base_filter=base_filter,
+        )
+
+    def _build_filter(self, filter: str | None, filter_kwargs: dict[str, Any]) -> str | None:
+        """Combine caller filter, shorthand kwargs and the base filter."""
+        if not filter and filter_kwargs:
+            filter = build_filter(**filter_kwargs) or None
+        if self._base_filter:
+            return f"({filter}) and {self._base_filter}" if filter else self._base_filter
+        return filter
+
+    async def list(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        **filter_kwargs: Any,
+    ) -> builtins.list[T]:
+        """List resources with optional filtering.
+
+        Args:
+            filter: OData filter string.
+            fields: List of fields to return.
+            limit: Maximum number of results.
+            offset: Skip this many results.
+            **filter_kwargs: Shorthand filter arguments.
+
+        Returns:
+            List of resource objects.
+        """
+        params: dict[str, Any] = {}
+
+        combined = self._build_filter(filter, filter_kwargs)
+        if combined:
+            params["filter"] = combined
+
+        if fields is None:
+            fields = self._default_fields
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+
+        response = await self._client._request("GET", self._endpoint, params=params)
+
+        if response is None:
+            return []
+
+        if not isinstance(response, list):
+            return [self._to_model(response)]
+
+        return [self._to_model(item) for item in response]
+
+    async def get(
+        self,
+        key: int | None = None,
+        *,
+        name: str | None = None,
+        fields: builtins.list[str] | None = None,
+    ) -> T:
+        """Get a single resource by key or name.
+
+        Args:
+            key: Resource $key (ID).
+            name: Resource name (will search if key not provided).
+            fields: List of fields to return.
+
+        Returns:
+            Resource object.
+
+        Raises:
+            NotFoundError: If resource not found.
+            ValueError: If neither key nor name provided.
+        """
+        if key is not None:
+            params: dict[str, Any] = {}
+            if fields is None:
+                fields = self._default_fields
+            if fields:
+                params["fields"] = ",".join(fields)
+
+            response = await self._client._request("GET", f"{self._endpoint}/{key}", params=params)
+            if response is None:
+                raise NotFoundError(f"{self._endpoint}/{key} not found")
+            if not isinstance(response, dict):
+                raise NotFoundError(f"{self._endpoint}/{key} returned invalid response")
+            return self._to_model(response)
+
+        if name is not None:
+            escaped_name = name.replace("'", "''")
+            results = await self.list(filter=f"name eq '{escaped_name}'", fields=fields, limit=1)
+            if not results:
+                raise NotFoundError(f"{self._endpoint} with name '{name}' not found")
+            return results[0]
+
+        raise ValueError("Either key or name must be provided")
+
+    async def get_many(
+        self,
+        keys: Iterable[int | str],
+        fields: builtins.list[str] | None = None,
+        *,
+        ignore_missing: bool = False,
+    ) -> builtins.list[T]:
+        """Get several resources by key with chunked ``$key in (...)`` queries.
+
+        The chunk requests run concurrently.
+
+        Args:
+            keys: Resource $keys. Duplicates are fetched once.
+            fields: List of fields to return. ``$key`` is always included.
+            ignore_missing: Leave keys that do not exist out of the result
+                instead of raising.
+
+        Returns:
+            Resource objects in the order of ``keys``.
+
+        Raises:
+            NotFoundError: If any key does not exist (the message lists the
+                missing keys), unless ``ignore_missing`` is set.
+        """
+        keys = builtins.list(keys)
+        params: dict[str, Any] = {}
+        if fields is None:
+            fields = self._default_fields
+        if fields:
+            if KEY_FIELD not in fields:
+                fields = [*fields, KEY_FIELD]
+            params["fields"] = ",".join(fields)
+
+        responses = await asyncio.gather(
+            *(
+                self._client._request(
+                    "GET", self._endpoint, params=dict(params, filter=key_filter, limit=len(chunk))
+                )
+                for chunk, key_filter in chunk_in_filters(KEY_FIELD, dict.fromkeys(keys))
+            )
+        )
+        found: dict[str, T] = {}
+        for response in responses:
+            if response is None:
+                continue
+            for row in response if isinstance(response, builtins.list) else [response]:
+                found[str(row.get(KEY_FIELD))] = self._to_model(row)
+
+        missing = [key for key in dict.fromkeys(keys) if str(key) not in found]
+        if missing and not ignore_missing:
+            listed = ", ".join(str(key) for key in missing)
+            raise NotFoundError(f"{self._endpoint} not found for keys: {listed}")
+
+        return [found[str(key)] for key in keys if str(key) in found]
+
+    async def create(self, **kwargs: Any) -> T:
+        """Create a new resource.
+
+        Args:
+            **kwargs: Resource attributes.
+
+        Returns:
+            Created resource object.
+        """
+        response = await self._client._request("POST", self._endpoint, json_data=kwargs)
+        if response is None:
+            raise ValueError("No response from create operation")
+        if not isinstance(response, dict):
+            raise ValueError("Create operation returned invalid response")
+        return self._to_model(response)
+
+    async def update(self, key: int, **kwargs: Any) -> T:
+        """Update an existing resource.
+
+        Args:
+            key: Resource $key (ID).
+            **kwargs: Attributes to update.
+
+        Returns:
+            Updated resource object.
+        """
+        response = await self._client._request("PUT", f"{self._endpoint}/{key}", json_data=kwargs)
+        if not isinstance(response, dict):
+            return await self.get(key)
+        return self._to_model(response)
+
+    async def delete(self, key: int) -> None:
+        """Delete a resource.
+
+        Args:
+            key: Resource $key (ID).
+        """
+        await self._client._request("DELETE", f"{self._endpoint}/{key}")
+
+    async def action(self, key: int, action_name: str, **kwargs: Any) -> dict[str, Any] | None:
+        """Execute an action on a resource.
+
+        Args:
+            key: Resource $key (ID).
+            action_name: Name of the action (e.g., "poweron", "snapshot").
+            **kwargs: Action parameters.
+
+        Returns:
+            Action response (often includes task information).
+        """
+        endpoint = f"{self._endpoint}/{key}?action={action_name}"
+        response = await self._client._request("PUT", endpoint, json_data=kwargs)
+        if isinstance(response, dict):
+            return response
+        return None
+
+    async def action_many(
+        self,
+        keys: Iterable[int],
+        action_name: str,
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        group_by: GroupFunc | None = None,
+        per_group: int | None = None,
+        **kwargs: Any,
+    ) -> BulkResult:
+        """Execute an action on many resources with bounded concurrency.
+
+        Args:
+            keys: Resource $keys.
+            action_name: Name of the action (e.g., "poweron", "snapshot").
+            concurrency: Maximum calls in flight.
+            group_by: Callable mapping a key to its group.
+            per_group: Maximum calls in flight per group.
+            **kwargs: Action parameters, sent with every call.
+
+        Returns:
+            BulkResult with per-key results, errors and started task keys.
+
+        Raises:
+            ValueError: If ``concurrency`` or ``per_group`` is not positive.
+        """
+        return await run_bulk_async(
+            builtins.list(keys),
+            lambda key: self.action(key, action_name, **kwargs),
+            concurrency,
+            group_by=group_by,
+            per_group=per_group,
+        )
+
+    async def create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+    ) -> BulkResult:
+        """Create many resources concurrently.
+
+        Args:
+            items: Attributes for each resource, as passed to :meth:`create`.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+
+        Returns:
+            BulkResult keyed by input index, with the created objects as
+            results.
+        """
+        items = builtins.list(items)
+        return await run_bulk_async(
+            range(len(items)),
+            lambda index: self.create(**items[index]),
+            1 if ordered else concurrency,
+            track_tasks=False,
+        )
+
+    async def update_many(
+        self,
+        updates: Mapping[int, Mapping[str, Any]] | Iterable[tuple[int, Mapping[str, Any]]],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+    ) -> BulkResult:
+        """Update many resources concurrently.
+
+        Args:
+            updates: Mapping of key to attributes, or ``(key, attributes)``
+                pairs, as passed to :meth:`update`.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+
+        Returns:
+            BulkResult keyed by resource key, with the updated objects as
+            results.
+
+        Raises:
+            ValueError: If a key appears more than once.
+        """
+        changes = update_changes(updates)
+        return await run_bulk_async(
+            builtins.list(changes),
+            lambda key: self.update(key, **changes[key]),
+            1 if ordered else concurrency,
+            track_tasks=False,
+        )
+
+    async def delete_many(
+        self,
+        keys: Iterable[int],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+    ) -> BulkResult:
+        """Delete many resources concurrently.
+
+        Args:
+            keys: Resource $keys.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+
+        Returns:
+            BulkResult keyed by resource key.
+        """
+        return await run_bulk_async(
+            builtins.list(keys), self.delete, 1 if ordered else concurrency, track_tasks=False
+        )
+
+    def _to_model(self, data: dict[str, Any]) -> T:
+        """Convert API response to model object."""
+        return self._model(data, self)  # type: ignore[no-any-return]
+
+    async def iter_all(
+        self, page_size: int = 100, *, prefetch: int = 0, **kwargs: Any
+    ) -> AsyncIterator[T]:
+        """Iterate through all resources, handling pagination automatically.
+
+        Args:
+            page_size: Number of items per page.
+            prefetch: Number of pages to request concurrently ahead of the
+                one being consumed (0 fetches pages one after another). At
+                most ``prefetch + 1`` pages are held in memory.
+            **kwargs: Additional list arguments (filter, fields, shorthand filters).
+
+        Yields:
+            Resource objects.
+
+        Raises:
+            ValueError: If ``prefetch`` is negative.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
+        batch = await self.list(limit=page_size, offset=0, **kwargs)
+        offset = page_size
+        pending: deque[asyncio.Task[builtins.list[T]]] = deque()
+        try:
+            while True:
+                if len(batch) < page_size:
+                    for item in batch:
+                        yield item
+                    break  # Last page
+                while len(pending) < prefetch:
+                    pending.append(
+                        asyncio.ensure_future(self.list(limit=page_size, offset=offset, **kwargs))
+                    )
+                    offset += page_size
+                for item in batch:
+                    yield item
+                if pending:
+                    batch = await pending.popleft()
+                else:
+                    batch = await self.list(limit=page_size, offset=offset, **kwargs)
+                    offset += page_size
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Iterate over all resources (uses iter_all with default page size)."""
+        return self.iter_all()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(endpoint={self._endpoint!r})"
@@ -139,6 +139,11 @@ class AuthSourceStateManager(ResourceManager["AuthSourceState"]):
         super().__init__(client)
         self._auth_source_key = auth_source_key
 
+    def _scope_filter(self) -> str | None:
+        if self._auth_source_key is None:
+            return None
+        return f"auth_source eq {self._auth_source_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -146,6 +151,8 @@ class AuthSourceStateManager(ResourceManager["AuthSourceState"]):
         limit: int | None = None,
         offset: int | None = None,
         auth_source: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[AuthSourceState]:
         """List auth source states with optional filtering.
@@ -156,6 +163,7 @@ class AuthSourceStateManager(ResourceManager["AuthSourceState"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             auth_source: Filter by auth source key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -170,13 +178,12 @@ class AuthSourceStateManager(ResourceManager["AuthSourceState"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add auth_source filter (from scope or parameter)
-        source_key = self._auth_source_key
-        if source_key is None and auth_source is not None:
-            source_key = auth_source
-
-        if source_key is not None:
-            filters.append(f"auth_source eq {source_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if auth_source is not None and self._auth_source_key is None:
+            filters.append(f"auth_source eq {auth_source}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -204,7 +211,8 @@ class AuthSourceStateManager(ResourceManager["AuthSourceState"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -489,6 +497,8 @@ class AuthSourceManager(ResourceManager["AuthSource"]):
         limit: int | None = None,
         offset: int | None = None,
         driver: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[AuthSource]:
         """List auth sources with optional filtering.
@@ -499,6 +509,7 @@ class AuthSourceManager(ResourceManager["AuthSource"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             driver: Filter by driver type (azure, google, gitlab, etc.).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -550,7 +561,8 @@ class AuthSourceManager(ResourceManager["AuthSource"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar, get_args
 
+from pyvergeos.bulk import BulkResult, GroupFunc, run_bulk, update_changes
+from pyvergeos.columnar import ColumnSet, to_columns
+from pyvergeos.constants import BULK_CONCURRENCY, STREAM_CHUNK_SIZE
 from pyvergeos.exceptions import NotFoundError
-from pyvergeos.filters import build_filter
+from pyvergeos.filters import build_filter, chunk_in_filters
+from pyvergeos.pagination import KEY_FIELD, iter_keyset, iter_offset_pages
+from pyvergeos.records import compact_factory
 
 if TYPE_CHECKING:
     from pyvergeos.client import VergeClient
@@ -85,6 +91,24 @@ class ResourceObject(dict[str, Any]):
         return f"<{type(self).__name__} key={key} name={name!r}>"
 
 
+def model_for_manager(manager_cls: type[ResourceManager[Any]]) -> type[ResourceObject]:
+    """Return the model class a synchronous manager is parameterized with.
+
+    Args:
+        manager_cls: ResourceManager subclass (e.g. ``VMManager``).
+
+    Returns:
+        The ``ResourceObject`` subclass from ``ResourceManager[Model]``, or
+        ``ResourceObject`` if the manager is not parameterized.
+    """
+    for klass in manager_cls.__mro__:
+        for base in getattr(klass, "__orig_bases__", ()):
+            for arg in get_args(base):
+                if isinstance(arg, type) and issubclass(arg, ResourceObject):
+                    return arg
+    return ResourceObject
+
+
 class ResourceManager(Generic[T]):
     """Base class for resource managers.
 
@@ -94,6 +118,9 @@ class ResourceManager(Generic[T]):
 
     _endpoint: str = ""
 
+    #: Column ``iter_all(keyset=True)`` orders and pages by
+    _keyset_field: str = KEY_FIELD
+
     def __init__(self, client: VergeClient) -> None:
         self._client = client
 
@@ -103,6 +130,8 @@ class ResourceManager(Generic[T]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[T]:
         """List resources with optional filtering.
@@ -112,6 +141,8 @@ class ResourceManager(Generic[T]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records (see
+                :mod:`pyvergeos.records`) instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -136,14 +167,15 @@ class ResourceManager(Generic[T]):
             params["offset"] = offset
 
         response = self._client._request("GET", self._endpoint, params=params)
+        to_model = self._model_func(compact)
 
         if response is None:
             return []
 
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -189,6 +221,59 @@ class ResourceManager(Generic[T]):
 
         raise ValueError("Either key or name must be provided")
 
+    def get_many(
+        self,
+        keys: Iterable[int | str],
+        fields: builtins.list[str] | None = None,
+        *,
+        ignore_missing: bool = False,
+    ) -> builtins.list[T]:
+        """Get several resources by key with as few requests as possible.
+
+        Keys are looked up with ``$key in (...)`` filters, about 200 keys
+        per request, with each filter kept short enough for the request URL.
+
+        Args:
+            keys: Resource $keys. Duplicates are fetched once.
+            fields: List of fields to return. ``$key`` is always included.
+            ignore_missing: Leave keys that do not exist out of the result
+                instead of raising.
+
+        Returns:
+            Resource objects in the order of ``keys``.
+
+        Raises:
+            NotFoundError: If any key does not exist (the message lists the
+                missing keys), unless ``ignore_missing`` is set.
+
+        Example:
+            >>> drives = client.vms.get_many([12, 7, 31], fields=["name", "status"])
+        """
+        keys = builtins.list(keys)
+        params: dict[str, Any] = {}
+        if fields is None:
+            fields = getattr(self, "_default_fields", None)
+        if fields:
+            if KEY_FIELD not in fields:
+                fields = [*fields, KEY_FIELD]
+            params["fields"] = ",".join(fields)
+
+        found: dict[str, T] = {}
+        for chunk, key_filter in chunk_in_filters(KEY_FIELD, dict.fromkeys(keys)):
+            chunk_params = dict(params, filter=key_filter, limit=len(chunk))
+            response = self._client._request("GET", self._endpoint, params=chunk_params)
+            if response is None:
+                continue
+            for row in response if isinstance(response, builtins.list) else [response]:
+                found[str(row.get(KEY_FIELD))] = self._to_model(row)
+
+        missing = [key for key in dict.fromkeys(keys) if str(key) not in found]
+        if missing and not ignore_missing:
+            listed = ", ".join(str(key) for key in missing)
+            raise NotFoundError(f"{self._endpoint} not found for keys: {listed}")
+
+        return [found[str(key)] for key in keys if str(key) in found]
+
     def create(self, **kwargs: Any) -> T:
         """Create a new resource.
 
@@ -248,6 +333,200 @@ class ResourceManager(Generic[T]):
             return response
         return None
 
+    def action_many(
+        self,
+        keys: Iterable[int],
+        action_name: str,
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        group_by: str | GroupFunc | None = None,
+        per_group: int | None = None,
+        **kwargs: Any,
+    ) -> BulkResult:
+        """Execute an action on many resources with bounded concurrency.
+
+        Each key gets its own ``PUT ?action=`` call; up to ``concurrency``
+        calls run at once on a thread pool. Failures are recorded per key
+        rather than raised, so one bad key does not stop the rest.
+
+        Args:
+            keys: Resource $keys.
+            action_name: Name of the action (e.g., "poweron", "snapshot").
+            concurrency: Maximum calls in flight.
+            group_by: Field (e.g. "machine#cluster as cluster_key") or
+                callable mapping a key to its group. Field values are looked
+                up with :meth:`get_many`.
+            per_group: Maximum calls in flight per group, to avoid piling
+                load on one node or cluster.
+            **kwargs: Action parameters, sent with every call.
+
+        Returns:
+            BulkResult with per-key results, errors and started task keys.
+
+        Raises:
+            ValueError: If ``concurrency`` or ``per_group`` is not positive.
+
+        Example:
+            >>> result = client.vms.action_many(
+            ...     keys, "poweron", concurrency=16,
+            ...     group_by="machine#cluster as cluster_key", per_group=4,
+            ... )
+            >>> result.failed
+            [812]
+        """
+        keys = builtins.list(keys)
+        return run_bulk(
+            keys,
+            lambda key: self.action(key, action_name, **kwargs),
+            concurrency,
+            group_by=self._group_func(keys, group_by),
+            per_group=per_group,
+        )
+
+    def create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        group_by: str | Callable[[Mapping[str, Any]], Hashable] | None = None,
+        per_group: int | None = None,
+    ) -> BulkResult:
+        """Create many resources, several requests at a time.
+
+        Args:
+            items: Attributes for each resource, as passed to :meth:`create`.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+            group_by: Attribute name (e.g. "network") or callable mapping an
+                item to its group.
+            per_group: Maximum requests in flight per group. With
+                ``per_group=1`` each group is created in input order while
+                different groups proceed in parallel.
+
+        Returns:
+            BulkResult keyed by input index, with the created objects as
+            results.
+
+        Raises:
+            ValueError: If ``concurrency`` or ``per_group`` is not positive.
+
+        Example:
+            >>> report = client.tags.create_many(
+            ...     [{"name": f"env-{n}", "category": 3} for n in names], concurrency=16
+            ... )
+            >>> report.failed
+            [4]
+        """
+        items = builtins.list(items)
+        group_func: GroupFunc | None = None
+        if group_by is not None:
+            item_group = group_by
+
+            def group_func(index: int) -> Hashable:
+                if isinstance(item_group, str):
+                    return items[index].get(item_group)
+                return item_group(items[index])
+
+        return run_bulk(
+            range(len(items)),
+            lambda index: self.create(**items[index]),
+            1 if ordered else concurrency,
+            group_by=group_func,
+            per_group=per_group,
+            track_tasks=False,
+        )
+
+    def update_many(
+        self,
+        updates: Mapping[int, Mapping[str, Any]] | Iterable[tuple[int, Mapping[str, Any]]],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        group_by: str | GroupFunc | None = None,
+        per_group: int | None = None,
+    ) -> BulkResult:
+        """Update many resources, several requests at a time.
+
+        Args:
+            updates: Mapping of key to attributes, or ``(key, attributes)``
+                pairs, as passed to :meth:`update`.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+            group_by: Field or callable mapping a key to its group (see
+                :meth:`action_many`).
+            per_group: Maximum requests in flight per group.
+
+        Returns:
+            BulkResult keyed by resource key, with the updated objects as
+            results.
+
+        Raises:
+            ValueError: If a key appears more than once, or ``concurrency``
+                or ``per_group`` is not positive.
+
+        Example:
+            >>> client.vms.update_many({k: {"ram": 8192} for k in keys}).raise_for_errors()
+        """
+        changes = update_changes(updates)
+        keys = builtins.list(changes)
+        return run_bulk(
+            keys,
+            lambda key: self.update(key, **changes[key]),
+            1 if ordered else concurrency,
+            group_by=self._group_func(keys, group_by),
+            per_group=per_group,
+            track_tasks=False,
+        )
+
+    def delete_many(
+        self,
+        keys: Iterable[int],
+        concurrency: int = BULK_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        group_by: str | GroupFunc | None = None,
+        per_group: int | None = None,
+    ) -> BulkResult:
+        """Delete many resources, several requests at a time.
+
+        Args:
+            keys: Resource $keys.
+            concurrency: Maximum requests in flight.
+            ordered: Send one request at a time, in input order.
+            group_by: Field or callable mapping a key to its group (see
+                :meth:`action_many`).
+            per_group: Maximum requests in flight per group.
+
+        Returns:
+            BulkResult keyed by resource key.
+
+        Raises:
+            ValueError: If ``concurrency`` or ``per_group`` is not positive.
+        """
+        keys = builtins.list(keys)
+        return run_bulk(
+            keys,
+            self.delete,
+            1 if ordered else concurrency,
+            group_by=self._group_func(keys, group_by),
+            per_group=per_group,
+            track_tasks=False,
+        )
+
+    def _group_func(
+        self, keys: builtins.list[Any], group_by: str | GroupFunc | None
+    ) -> GroupFunc | None:
+        """Resolve a ``group_by`` field name into a key-to-group function."""
+        if not isinstance(group_by, str):
+            return group_by
+        column = group_by.rsplit(" as ", 1)[-1]
+        groups = {
+            str(obj.key): obj.get(column)
+            for obj in self.get_many(keys, fields=[group_by], ignore_missing=True)
+        }
+        return lambda key: groups.get(str(key))
+
     def _to_model(self, data: dict[str, Any]) -> T:
         """Convert API response to model object.
 
@@ -255,25 +534,301 @@ class ResourceManager(Generic[T]):
         """
         return ResourceObject(data, self)  # type: ignore[return-value]
 
-    def iter_all(self, page_size: int = 100, **kwargs: Any) -> Iterator[T]:
+    def _model_func(self, compact: bool = False) -> Callable[[dict[str, Any]], Any]:
+        """Return the row converter for list calls.
+
+        With ``compact`` rows become compact read-only records mirroring the
+        manager's model class instead of ``_to_model`` objects.
+        """
+        if compact:
+            return compact_factory(model_for_manager(type(self)))
+        return self._to_model
+
+    def stream(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        sort: str | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        compact: bool = False,
+        **filter_kwargs: Any,
+    ) -> Iterator[T]:
+        """Stream resources, yielding each one as it is decoded.
+
+        Unlike :meth:`list`, the response is parsed incrementally from the
+        socket, so exporting very large tables (100k log rows, billing
+        history) runs in constant memory. Stop iterating early to close the
+        connection without reading the rest of the response.
+
+        Args:
+            filter: OData filter string.
+            fields: List of fields to return (defaults to the manager's
+                default field set, if it has one).
+            limit: Maximum number of results.
+            offset: Skip this many results.
+            sort: Sort expression (e.g. "name" or "-timestamp").
+            chunk_size: Bytes read from the socket at a time.
+            compact: Yield compact read-only records instead of resource
+                objects.
+            **filter_kwargs: Shorthand filter arguments.
+
+        Yields:
+            Resource objects.
+
+        Example:
+            >>> with open("vms.csv", "w") as f:
+            ...     for vm in client.vms.stream(fields=["$key", "name", "ram"]):
+            ...         f.write(f"{vm.key},{vm.name},{vm.ram}\n")
+        """
+        params = self._list_params(filter=filter, fields=fields, **filter_kwargs)
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if sort:
+            params["sort"] = sort
+
+        yield from self._stream_params(params, chunk_size, compact)
+
+    def _scope_filter(self) -> str | None:
+        """Return the filter limiting this manager to its parent object.
+
+        Managers bound to a parent (a VM's drives, a task's events) override
+        this. :meth:`_list_params` adds it to every query so all listing
+        modes stay within the parent.
+        """
+        return None
+
+    def _list_params(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build filter and field query parameters as :meth:`list` would.
+
+        Used by :meth:`stream`, keyset :meth:`iter_all` and the columnar
+        methods. The manager's :meth:`_scope_filter` is always included;
+        managers whose ``list()`` adds other implicit filters or default
+        fields override this so those modes return the same rows.
+        """
+        params: dict[str, Any] = {}
+
+        if not filter and filter_kwargs:
+            filter = build_filter(**filter_kwargs)
+        scope = self._scope_filter()
+        if scope and filter:
+            params["filter"] = f"{scope} and ({filter})"
+        elif scope or filter:
+            params["filter"] = scope or filter
+
+        if fields is None:
+            fields = getattr(self, "_default_fields", None)
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        return params
+
+    def list_columnar(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        sort: str | None = None,
+        backend: str | None = None,
+        **filter_kwargs: Any,
+    ) -> ColumnSet:
+        """List resources as column arrays instead of objects.
+
+        Takes the same filters as :meth:`list`. Rows are streamed straight
+        into one typed array per field, so no per-row objects are created.
+        Numeric columns become ``int64``/``float64`` arrays (NumPy when
+        installed, :class:`array.array` otherwise).
+
+        Args:
+            filter: OData filter string.
+            fields: Fields to return, one column each (defaults to the
+                manager's default fields).
+            limit: Maximum number of results.
+            offset: Skip this many results.
+            sort: Sort expression (e.g. "-timestamp").
+            backend: "numpy", "array", or None to use NumPy when installed.
+            **filter_kwargs: Shorthand filter arguments.
+
+        Returns:
+            ColumnSet mapping column names to arrays.
+
+        Example:
+            >>> cols = client.billing.list_columnar(fields=["created", "used_ram"])
+            >>> cols["used_ram"].mean()
+        """
+        params = self._list_params(filter=filter, fields=fields, **filter_kwargs)
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if sort:
+            params["sort"] = sort
+
+        selected = params["fields"].split(",") if "fields" in params else None
+        rows = self._client._stream(self._endpoint, params=params)
+        return to_columns(rows, selected, backend)
+
+    def iter_columnar(
+        self,
+        fields: builtins.list[str] | None = None,
+        page_size: int = 10000,
+        *,
+        keyset: bool = False,
+        prefetch: int = 0,
+        backend: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ColumnSet]:
+        """Iterate over all resources as one column batch per page.
+
+        Args:
+            fields: Fields to return, one column each.
+            page_size: Rows per batch.
+            keyset: Use keyset pagination (see :meth:`iter_all`).
+            prefetch: Pages to request ahead (see :meth:`iter_all`).
+            backend: "numpy", "array", or None to use NumPy when installed.
+            **kwargs: Additional filter arguments.
+
+        Yields:
+            ColumnSet per page of up to ``page_size`` rows.
+
+        Example:
+            >>> batches = client.billing.iter_columnar(["created", "used_ram"], keyset=True)
+            >>> peak = max(batch["used_ram"].max() for batch in batches)
+        """
+        params = self._list_params(fields=fields, **kwargs)
+        selected = params["fields"].split(",") if "fields" in params else None
+
+        if keyset:
+            rows = iter_keyset(
+                self._client,
+                self._endpoint,
+                params,
+                page_size,
+                key_field=self._keyset_field,
+                prefetch=prefetch > 0,
+            )
+            while True:
+                batch = to_columns(islice(rows, page_size), selected, backend)
+                if not batch.num_rows:
+                    return
+                yield batch
+                if batch.num_rows < page_size:
+                    return
+
+        def fetch(limit: int, offset: int) -> builtins.list[dict[str, Any]]:
+            return self._fetch_rows(dict(params, limit=limit, offset=offset))
+
+        for page in iter_offset_pages(fetch, page_size, prefetch):
+            yield to_columns(page, selected, backend)
+
+    def _fetch_rows(self, params: dict[str, Any]) -> builtins.list[dict[str, Any]]:
+        """Fetch one page of raw rows with prepared query parameters."""
+        response = self._client._request("GET", self._endpoint, params=params)
+        if response is None:
+            return []
+        return response if isinstance(response, builtins.list) else [response]
+
+    def _stream_params(
+        self, params: dict[str, Any], chunk_size: int, compact: bool = False
+    ) -> Iterator[T]:
+        """Stream the endpoint with prepared query parameters."""
+        to_model = self._model_func(compact)
+        for item in self._client._stream(self._endpoint, params=params, chunk_size=chunk_size):
+            yield to_model(item)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        *,
+        keyset: bool = False,
+        prefetch: int = 0,
+        compact: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[T]:
         """Iterate through all resources, handling pagination automatically.
 
+        By default pages are fetched with ``limit``/``offset``. With
+        ``keyset=True`` results are ordered by the manager's keyset column
+        (``$key``, or a timestamp for log-like tables) and each page asks for
+        rows after the last one seen. Every page then costs the same on the
+        server, and rows inserted or deleted during the scan cannot cause
+        others to be skipped or repeated. Use it for large tables such as
+        ``logs``, ``task_events`` and ``billing``.
+
+        ``prefetch`` hides round-trip latency on full-table scans: while one
+        page is being consumed, up to ``prefetch`` following pages are
+        requested concurrently from background threads. At most
+        ``prefetch + 1`` pages are held in memory. Keyset pages depend on the
+        previous page, so with ``keyset=True`` any ``prefetch`` fetches one
+        page ahead.
+
         Args:
             page_size: Number of items per page.
+            keyset: Use keyset (cursor) pagination instead of offsets.
+            prefetch: Number of pages to request ahead of the one being
+                consumed (0 fetches pages strictly one after another).
+            compact: Yield compact read-only records instead of resource
+                objects. Pages are then fetched with the same query as
+                :meth:`stream` rather than through :meth:`list`.
             **kwargs: Additional filter arguments.
 
         Yields:
             Resource objects.
+
+        Raises:
+            ValueError: If ``page_size`` is not positive or ``prefetch`` is
+                negative.
+
+        Example:
+            >>> for log in client.logs.iter_all(keyset=True, page_size=1000, level="audit"):
+            ...     archive(log)
+            >>> for vm in client.vms.iter_all(page_size=500, prefetch=4):
+            ...     export(vm)
         """
-        offset = 0
-        while True:
-            batch = self.list(limit=page_size, offset=offset, **kwargs)
-            if not batch:
-                break
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        to_model = self._model_func(compact)
+
+        if keyset:
+            params = self._list_params(**kwargs)
+            for row in iter_keyset(
+                self._client,
+                self._endpoint,
+                params,
+                page_size,
+                key_field=self._keyset_field,
+                prefetch=prefetch > 0,
+            ):
+                yield to_model(row)
+            return
+
+        if compact:
+            params = self._list_params(**kwargs)
+
+            def fetch_compact(limit: int, offset: int) -> builtins.list[Any]:
+                rows = self._fetch_rows(dict(params, limit=limit, offset=offset))
+                return [to_model(row) for row in rows]
+
+            for batch in iter_offset_pages(fetch_compact, page_size, prefetch):
+                yield from batch
+            return
+
+        def fetch(limit: int, offset: int) -> builtins.list[T]:
+            return self.list(limit=limit, offset=offset, **kwargs)
+
+        for batch in iter_offset_pages(fetch, page_size, prefetch):
             yield from batch
-            if len(batch) < page_size:
-                break  # Last page
-            offset += page_size
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over all resources (uses iter_all with default page size)."""
@@ -26,9 +26,11 @@ Example:
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.constants import STREAM_CHUNK_SIZE
 from pyvergeos.exceptions import NotFoundError
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
@@ -462,6 +464,7 @@ class BillingManager(ResourceManager[BillingRecord]):
     """
 
     _endpoint = "billing"
+    _keyset_field = "created"
 
     _default_fields = [
         "$key",
@@ -519,6 +522,7 @@ class BillingManager(ResourceManager[BillingRecord]):
         *,
         since: datetime | int | None = None,
         until: datetime | int | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BillingRecord]:
         """List billing records.
@@ -530,11 +534,38 @@ class BillingManager(ResourceManager[BillingRecord]):
             offset: Skip this many results.
             since: Return records created after this time (datetime or epoch).
             until: Return records created before this time (datetime or epoch).
+            compact: Return compact read-only records (same properties as
+                BillingRecord, a fraction of the memory) for large result sets.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of BillingRecord objects, sorted by created descending.
         """
+        params = self._build_params(filter, fields, limit, offset, since=since, until=until)
+
+        response = self._client._request("GET", self._endpoint, params=params)
+        to_model = self._model_func(compact)
+
+        if response is None:
+            return []
+
+        if isinstance(response, list):
+            return [to_model(item) for item in response]
+
+        return [to_model(response)]
+
+    def _build_params(
+        self,
+        filter: str | None,  # noqa: A002
+        fields: builtins.list[str] | None,
+        limit: int | None,
+        offset: int | None,
+        *,
+        since: datetime | int | None,
+        until: datetime | int | None,
+        sort: str = "-created",
+    ) -> dict[str, Any]:
+        """Build query parameters for list() and stream()."""
         if fields is None:
             fields = self._default_fields
 
@@ -553,7 +584,7 @@ class BillingManager(ResourceManager[BillingRecord]):
 
         combined_filter = " and ".join(filters) if filters else None
 
-        params: dict[str, Any] = {"sort": "-created"}
+        params: dict[str, Any] = {"sort": sort}
         if combined_filter:
             params["filter"] = combined_filter
         if fields:
@@ -563,15 +594,59 @@ class BillingManager(ResourceManager[BillingRecord]):
         if offset is not None:
             params["offset"] = offset
 
-        response = self._client._request("GET", self._endpoint, params=params)
+        return params
 
-        if response is None:
-            return []
+    def _list_params(
+        self,
+        filter: str | None = None,  # noqa: A002
+        fields: builtins.list[str] | None = None,
+        *,
+        since: datetime | int | None = None,
+        until: datetime | int | None = None,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters with the billing time-range filters."""
+        return self._build_params(filter, fields, None, None, since=since, until=until)
 
-        if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+    def stream(
+        self,
+        filter: str | None = None,  # noqa: A002
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        sort: str | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        since: datetime | int | None = None,
+        until: datetime | int | None = None,
+        compact: bool = False,
+        **filter_kwargs: Any,
+    ) -> Iterator[BillingRecord]:
+        """Stream billing records in constant memory.
 
-        return [self._to_model(response)]
+        Accepts the same arguments as :meth:`list`; records are yielded as
+        they are decoded instead of being collected into a list.
+
+        Args:
+            filter: OData filter string.
+            fields: List of fields to return.
+            limit: Maximum number of results (default: all).
+            offset: Skip this many results.
+            sort: Sort expression (default: "-created", newest first).
+            chunk_size: Bytes read from the socket at a time.
+            since: Return records created after this time (datetime or epoch).
+            until: Return records created before this time (datetime or epoch).
+            compact: Yield compact read-only records instead of BillingRecord
+                objects.
+            **filter_kwargs: Shorthand filter arguments.
+
+        Yields:
+            BillingRecord objects.
+        """
+        params = self._build_params(
+            filter, fields, limit, offset, since=since, until=until, sort=sort or "-created"
+        )
+        yield from self._stream_params(params, chunk_size, compact)
 
     def get(  # type: ignore[override]
         self,
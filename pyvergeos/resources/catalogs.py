@@ -119,6 +119,11 @@ class CatalogRepositoryStatusManager(ResourceManager["CatalogRepositoryStatus"])
         super().__init__(client)
         self._repository_key = repository_key
 
+    def _scope_filter(self) -> str | None:
+        if self._repository_key is None:
+            return None
+        return f"repository eq {self._repository_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -126,6 +131,8 @@ class CatalogRepositoryStatusManager(ResourceManager["CatalogRepositoryStatus"])
         limit: int | None = None,
         offset: int | None = None,
         repository: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CatalogRepositoryStatus]:
         """List repository status records with optional filtering.
@@ -136,6 +143,7 @@ class CatalogRepositoryStatusManager(ResourceManager["CatalogRepositoryStatus"])
             limit: Maximum number of results.
             offset: Skip this many results.
             repository: Filter by repository key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -150,13 +158,12 @@ class CatalogRepositoryStatusManager(ResourceManager["CatalogRepositoryStatus"])
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add repository filter (from scope or parameter)
-        repo_key = self._repository_key
-        if repo_key is None and repository is not None:
-            repo_key = repository
-
-        if repo_key is not None:
-            filters.append(f"repository eq {repo_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if repository is not None and self._repository_key is None:
+            filters.append(f"repository eq {repository}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -181,7 +188,8 @@ class CatalogRepositoryStatusManager(ResourceManager["CatalogRepositoryStatus"])
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -306,6 +314,11 @@ class CatalogRepositoryLogManager(ResourceManager["CatalogRepositoryLog"]):
         super().__init__(client)
         self._repository_key = repository_key
 
+    def _scope_filter(self) -> str | None:
+        if self._repository_key is None:
+            return None
+        return f"catalog_repository eq {self._repository_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -314,6 +327,8 @@ class CatalogRepositoryLogManager(ResourceManager["CatalogRepositoryLog"]):
         offset: int | None = None,
         catalog_repository: int | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CatalogRepositoryLog]:
         """List repository logs with optional filtering.
@@ -325,6 +340,7 @@ class CatalogRepositoryLogManager(ResourceManager["CatalogRepositoryLog"]):
             offset: Skip this many results.
             catalog_repository: Filter by repository key. Ignored if scoped.
             level: Filter by log level.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -339,13 +355,12 @@ class CatalogRepositoryLogManager(ResourceManager["CatalogRepositoryLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add repository filter (from scope or parameter)
-        repo_key = self._repository_key
-        if repo_key is None and catalog_repository is not None:
-            repo_key = catalog_repository
-
-        if repo_key is not None:
-            filters.append(f"catalog_repository eq {repo_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if catalog_repository is not None and self._repository_key is None:
+            filters.append(f"catalog_repository eq {catalog_repository}")
 
         # Add level filter
         if level is not None:
@@ -377,7 +392,8 @@ class CatalogRepositoryLogManager(ResourceManager["CatalogRepositoryLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -516,6 +532,11 @@ class CatalogLogManager(ResourceManager["CatalogLog"]):
         super().__init__(client)
         self._catalog_key = catalog_key
 
+    def _scope_filter(self) -> str | None:
+        if self._catalog_key is None:
+            return None
+        return f"catalog eq '{self._catalog_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -524,6 +545,8 @@ class CatalogLogManager(ResourceManager["CatalogLog"]):
         offset: int | None = None,
         catalog: str | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CatalogLog]:
         """List catalog logs with optional filtering.
@@ -535,6 +558,7 @@ class CatalogLogManager(ResourceManager["CatalogLog"]):
             offset: Skip this many results.
             catalog: Filter by catalog key. Ignored if manager is scoped.
             level: Filter by log level.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -549,13 +573,12 @@ class CatalogLogManager(ResourceManager["CatalogLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add catalog filter (from scope or parameter)
-        cat_key = self._catalog_key
-        if cat_key is None and catalog is not None:
-            cat_key = catalog
-
-        if cat_key is not None:
-            filters.append(f"catalog eq '{cat_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if catalog is not None and self._catalog_key is None:
+            filters.append(f"catalog eq '{catalog}'")
 
         # Add level filter
         if level is not None:
@@ -587,7 +610,8 @@ class CatalogLogManager(ResourceManager["CatalogLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -794,6 +818,11 @@ class CatalogManager(ResourceManager["Catalog"]):
         super().__init__(client)
         self._repository_key = repository_key
 
+    def _scope_filter(self) -> str | None:
+        if self._repository_key is None:
+            return None
+        return f"repository eq {self._repository_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -802,6 +831,8 @@ class CatalogManager(ResourceManager["Catalog"]):
         offset: int | None = None,
         repository: int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Catalog]:
         """List catalogs with optional filtering.
@@ -813,6 +844,7 @@ class CatalogManager(ResourceManager["Catalog"]):
             offset: Skip this many results.
             repository: Filter by repository key. Ignored if manager is scoped.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -837,13 +869,12 @@ class CatalogManager(ResourceManager["Catalog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add repository filter (from scope or parameter)
-        repo_key = self._repository_key
-        if repo_key is None and repository is not None:
-            repo_key = repository
-
-        if repo_key is not None:
-            filters.append(f"repository eq {repo_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if repository is not None and self._repository_key is None:
+            filters.append(f"repository eq {repository}")
 
         # Add enabled filter
         if enabled is not None:
@@ -872,7 +903,8 @@ class CatalogManager(ResourceManager["Catalog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -1229,6 +1261,8 @@ class CatalogRepositoryManager(ResourceManager["CatalogRepository"]):
         offset: int | None = None,
         type: str | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CatalogRepository]:
         """List repositories with optional filtering.
@@ -1240,6 +1274,7 @@ class CatalogRepositoryManager(ResourceManager["CatalogRepository"]):
             offset: Skip this many results.
             type: Filter by repository type.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -1295,7 +1330,8 @@ class CatalogRepositoryManager(ResourceManager["CatalogRepository"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
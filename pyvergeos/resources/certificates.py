@@ -333,6 +333,7 @@ class CertificateManager(ResourceManager[Certificate]):
         cert_type: str | None = None,
         valid: bool | None = None,
         include_keys: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Certificate]:
         """List certificates with optional filtering.
@@ -345,6 +346,7 @@ class CertificateManager(ResourceManager[Certificate]):
             cert_type: Filter by certificate type (Manual, LetsEncrypt, SelfSigned).
             valid: Filter by valid status (True for valid only).
             include_keys: Include sensitive key material (public, private, chain).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -393,10 +395,11 @@ class CertificateManager(ResourceManager[Certificate]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response if item and item.get("$key")]
+        return [to_model(item) for item in response if item and item.get("$key")]
 
     def list_valid(self, **kwargs: Any) -> builtins.list[Certificate]:
         """List only valid (unexpired) certificates.
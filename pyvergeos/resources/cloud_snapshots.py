@@ -264,12 +264,17 @@ class CloudSnapshotVMManager(ResourceManager[CloudSnapshotVM]):
     def _to_model(self, data: dict[str, Any]) -> CloudSnapshotVM:
         return CloudSnapshotVM(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"cloud_snapshot eq {self._snapshot_key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CloudSnapshotVM]:
         """List VMs in this cloud snapshot.
@@ -279,12 +284,13 @@ class CloudSnapshotVMManager(ResourceManager[CloudSnapshotVM]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
             List of CloudSnapshotVM objects.
         """
-        conditions: builtins.list[str] = [f"cloud_snapshot eq {self._snapshot_key}"]
+        conditions: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             conditions.append(f"({filter})")
@@ -311,10 +317,11 @@ class CloudSnapshotVMManager(ResourceManager[CloudSnapshotVM]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -388,12 +395,17 @@ class CloudSnapshotTenantManager(ResourceManager[CloudSnapshotTenant]):
     def _to_model(self, data: dict[str, Any]) -> CloudSnapshotTenant:
         return CloudSnapshotTenant(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"cloud_snapshot eq {self._snapshot_key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CloudSnapshotTenant]:
         """List tenants in this cloud snapshot.
@@ -403,12 +415,13 @@ class CloudSnapshotTenantManager(ResourceManager[CloudSnapshotTenant]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
             List of CloudSnapshotTenant objects.
         """
-        conditions: builtins.list[str] = [f"cloud_snapshot eq {self._snapshot_key}"]
+        conditions: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             conditions.append(f"({filter})")
@@ -435,10 +448,11 @@ class CloudSnapshotTenantManager(ResourceManager[CloudSnapshotTenant]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -738,6 +752,41 @@ class CloudSnapshotManager(ResourceManager[CloudSnapshot]):
             )
         return self._tenant_managers[snapshot_key]
 
+    def _list_params(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        *,
+        include_expired: bool = False,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters, excluding expired snapshots like :meth:`list`."""
+        conditions: builtins.list[str] = []
+
+        # Exclude expired snapshots by default
+        if not include_expired:
+            now = int(time.time())
+            conditions.append(f"(expires eq 0 or expires gt {now})")
+
+        if filter:
+            conditions.append(f"({filter})")
+
+        if filter_kwargs:
+            conditions.append(build_filter(**filter_kwargs))
+
+        combined_filter = " and ".join(conditions) if conditions else None
+
+        if fields is None:
+            fields = _DEFAULT_SNAPSHOT_FIELDS
+
+        params: dict[str, Any] = {}
+        if combined_filter:
+            params["filter"] = combined_filter
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        return params
+
     def list(
         self,
         filter: str | None = None,
@@ -748,6 +797,7 @@ class CloudSnapshotManager(ResourceManager[CloudSnapshot]):
         include_expired: bool = False,
         include_vms: bool = False,
         include_tenants: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CloudSnapshot]:
         """List cloud snapshots.
@@ -760,11 +810,16 @@ class CloudSnapshotManager(ResourceManager[CloudSnapshot]):
             include_expired: Include expired snapshots.
             include_vms: Include VMs for each snapshot.
             include_tenants: Include tenants for each snapshot.
+            compact: Return compact read-only records instead of resource
+                objects. Cannot be combined with include_vms or include_tenants.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
             List of CloudSnapshot objects sorted by creation time (newest first).
 
+        Raises:
+            ValueError: If compact is combined with include_vms or include_tenants.
+
         Example:
             >>> # All active snapshots
             >>> snapshots = client.cloud_snapshots.list()
@@ -778,29 +833,10 @@ class CloudSnapshotManager(ResourceManager[CloudSnapshot]):
             ...     include_tenants=True,
             ... )
         """
-        conditions: builtins.list[str] = []
-
-        # Exclude expired snapshots by default
-        if not include_expired:
-            now = int(time.time())
-            conditions.append(f"(expires eq 0 or expires gt {now})")
-
-        if filter:
-            conditions.append(f"({filter})")
-
-        if filter_kwargs:
-            conditions.append(build_filter(**filter_kwargs))
+        if compact and (include_vms or include_tenants):
+            raise ValueError("compact cannot be combined with include_vms or include_tenants")
 
-        combined_filter = " and ".join(conditions) if conditions else None
-
-        if fields is None:
-            fields = _DEFAULT_SNAPSHOT_FIELDS
-
-        params: dict[str, Any] = {}
-        if combined_filter:
-            params["filter"] = combined_filter
-        if fields:
-            params["fields"] = ",".join(fields)
+        params = self._list_params(filter, fields, include_expired=include_expired, **filter_kwargs)
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
@@ -815,6 +851,10 @@ class CloudSnapshotManager(ResourceManager[CloudSnapshot]):
         if not isinstance(response, list):
             response = [response]
 
+        if compact:
+            to_model = self._model_func(compact)
+            return [to_model(item) for item in response]
+
         snapshots: builtins.list[CloudSnapshot] = []
         for item in response:
             snapshot_vms = None
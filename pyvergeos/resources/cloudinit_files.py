@@ -242,6 +242,7 @@ class CloudInitFileManager(ResourceManager[CloudInitFile]):
         vm_key: int | None = None,
         name: str | None = None,
         render: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CloudInitFile]:
         """List cloud-init files with optional filtering.
@@ -257,6 +258,7 @@ class CloudInitFileManager(ResourceManager[CloudInitFile]):
             vm_key: Filter by VM $key.
             name: Filter by file name (exact match or wildcard ``*``).
             render: Filter by render type (No, Variables, Jinja2).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -312,10 +314,11 @@ class CloudInitFileManager(ResourceManager[CloudInitFile]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -525,7 +528,9 @@ class CloudInitFileManager(ResourceManager[CloudInitFile]):
 
         url = f"{self._client._connection.api_base_url}/{endpoint}"
 
-        response = session.request(
+        self._client._ensure_auth()
+        response = self._client._dispatch(
+            session,
             method="GET",
             url=url,
             params=params,
@@ -542,11 +547,12 @@ class CloudInitFileManager(ResourceManager[CloudInitFile]):
                 status_code=response.status_code,
             )
 
+        content: bytes = response.content
         if as_bytes:
-            return response.content
+            return content
 
         # Return as string (UTF-8)
-        return response.content.decode("utf-8")
+        return content.decode("utf-8")
 
     def list_for_vm(self, vm_key: int) -> builtins.list[CloudInitFile]:
         """List all cloud-init files for a specific VM.
@@ -591,6 +597,9 @@ class VMCloudInitFileManager(CloudInitFileManager):
             raise ValueError("VM has no key")
         return int(key)
 
+    def _scope_filter(self) -> str:
+        return f"owner eq 'vms/{self.vm_key}'"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -600,6 +609,7 @@ class VMCloudInitFileManager(CloudInitFileManager):
         *,
         name: str | None = None,
         render: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[CloudInitFile]:
         """List cloud-init files for this VM.
@@ -611,6 +621,7 @@ class VMCloudInitFileManager(CloudInitFileManager):
             offset: Skip this many results.
             name: Filter by file name (exact match or wildcard ``*``).
             render: Filter by render type (No, Variables, Jinja2).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -624,6 +635,7 @@ class VMCloudInitFileManager(CloudInitFileManager):
             vm_key=self.vm_key,
             name=name,
             render=render,
+            compact=compact,
             **filter_kwargs,
         )
 
@@ -913,6 +913,9 @@ class ClusterTierManager(ResourceManager[ClusterTier]):
     def _to_model(self, data: dict[str, Any]) -> ClusterTier:
         return ClusterTier(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"cluster eq {self._cluster_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -921,6 +924,7 @@ class ClusterTierManager(ResourceManager[ClusterTier]):
         offset: int | None = None,
         *,
         tier: int | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[ClusterTier]:
         """List cluster tiers.
@@ -931,6 +935,7 @@ class ClusterTierManager(ResourceManager[ClusterTier]):
             limit: Maximum number of results.
             offset: Skip this many results.
             tier: Filter by tier number (0-5).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -944,7 +949,7 @@ class ClusterTierManager(ResourceManager[ClusterTier]):
         params: dict[str, Any] = {}
 
         # Build filter scoped to this cluster
-        filters = [f"cluster eq {self._cluster_key}"]
+        filters = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -977,10 +982,11 @@ class ClusterTierManager(ResourceManager[ClusterTier]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
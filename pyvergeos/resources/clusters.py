@@ -559,6 +559,7 @@ class ClusterManager(ResourceManager[Cluster]):
         enabled: bool | None = None,
         compute: bool | None = None,
         storage: bool | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Cluster]:
         """List clusters with optional filtering.
@@ -572,6 +573,7 @@ class ClusterManager(ResourceManager[Cluster]):
             enabled: Filter by enabled status.
             compute: Filter by compute capability.
             storage: Filter by storage capability.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -630,10 +632,11 @@ class ClusterManager(ResourceManager[Cluster]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -305,6 +305,9 @@ class DeviceManager(ResourceManager[Device]):
     def _to_model(self, data: dict[str, Any]) -> Device:
         return Device(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"machine eq {self._machine_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -324,6 +327,7 @@ class DeviceManager(ResourceManager[Device]):
         ]
         | None = None,
         enabled_only: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Device]:
         """List devices attached to this machine.
@@ -335,6 +339,7 @@ class DeviceManager(ResourceManager[Device]):
             offset: Skip this many results.
             device_type: Filter by device type.
             enabled_only: Only return enabled devices.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -353,7 +358,7 @@ class DeviceManager(ResourceManager[Device]):
         if fields is None:
             fields = self._default_fields
 
-        filters = [f"machine eq {self._machine_key}"]
+        filters = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -383,10 +388,11 @@ class DeviceManager(ResourceManager[Device]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(
         self,
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import builtins
-import time
 from typing import TYPE_CHECKING, Any, Literal
 
 from pyvergeos.exceptions import NotFoundError, VergeTimeoutError
+from pyvergeos.polling import poll_until
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -120,6 +120,8 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SystemDiagnostic]:
         """List system diagnostics.
@@ -129,6 +131,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
 
         Returns:
             List of SystemDiagnostic objects.
@@ -140,6 +143,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
@@ -229,7 +233,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
         Args:
             key: Diagnostic $key.
             timeout: Maximum seconds to wait.
-            poll_interval: Seconds between polls.
+            poll_interval: Longest wait between polls.
 
         Returns:
             Completed SystemDiagnostic.
@@ -237,16 +241,15 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
         Raises:
             VergeTimeoutError: If diagnostic doesn't complete within timeout.
         """
-        deadline = time.monotonic() + timeout
-        while True:
-            diag = self.get(key)
-            if diag.status in ("complete", "error"):
-                return diag
-            if time.monotonic() >= deadline:
-                raise VergeTimeoutError(
-                    f"Diagnostic {key} did not complete within {timeout}s (status: {diag.status})"
-                )
-            time.sleep(poll_interval)
+        return poll_until(
+            lambda: self.get(key),
+            lambda diag: diag.status in ("complete", "error"),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_timeout=lambda diag: VergeTimeoutError(
+                f"Diagnostic {key} did not complete within {timeout}s (status: {diag.status})"
+            ),
+        )
 
     def send_to_support(self, key: int) -> None:
         """Send a completed diagnostic bundle to Verge.io support.
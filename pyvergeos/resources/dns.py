@@ -159,12 +159,17 @@ class DNSRecordManager(ResourceManager[DNSRecord]):
     def _to_model(self, data: dict[str, Any]) -> DNSRecord:
         return DNSRecord(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"zone eq {self.zone_key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         host: str | None = None,
         record_type: RecordType | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[DNSRecord]:
         """List DNS records in this zone.
@@ -174,6 +179,7 @@ class DNSRecordManager(ResourceManager[DNSRecord]):
             fields: List of fields to return.
             host: Filter by exact hostname.
             record_type: Filter by record type (A, CNAME, MX, etc.).
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -183,9 +189,7 @@ class DNSRecordManager(ResourceManager[DNSRecord]):
             fields = self._default_fields.copy()
 
         # Build filter for this zone
-        filters: builtins.list[str] = [
-            f"zone eq {self.zone_key}",
-        ]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if host is not None:
             escaped_host = host.replace("'", "''")
@@ -210,10 +214,11 @@ class DNSRecordManager(ResourceManager[DNSRecord]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -522,6 +527,11 @@ class DNSZoneManager(ResourceManager[DNSZone]):
 
         return response
 
+    def _scope_filter(self) -> str:
+        if self._view is not None:
+            return f"view eq {self._view.key}"
+        return f"view#vnet eq {self.network_key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,
@@ -529,6 +539,7 @@ class DNSZoneManager(ResourceManager[DNSZone]):
         domain: str | None = None,
         zone_type: ZoneType | None = None,
         include_records: bool = False,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[DNSZone]:
         """List DNS zones for this network or view.
@@ -539,6 +550,7 @@ class DNSZoneManager(ResourceManager[DNSZone]):
             domain: Filter by exact domain name.
             zone_type: Filter by zone type.
             include_records: Include records in each zone (not yet implemented).
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -556,6 +568,7 @@ class DNSZoneManager(ResourceManager[DNSZone]):
                 fields=fields,
                 domain=domain,
                 zone_type=zone_type,
+                compact=compact,
             )
 
         # Otherwise iterate all views for this network
@@ -580,6 +593,7 @@ class DNSZoneManager(ResourceManager[DNSZone]):
                     fields=fields,
                     domain=domain,
                     zone_type=zone_type,
+                    compact=compact,
                 )
             )
 
@@ -593,6 +607,7 @@ class DNSZoneManager(ResourceManager[DNSZone]):
         fields: builtins.list[str] | None = None,
         domain: str | None = None,
         zone_type: ZoneType | None = None,
+        compact: bool = False,
     ) -> builtins.list[DNSZone]:
         """List zones for a specific view."""
         if fields is None:
@@ -624,7 +639,11 @@ class DNSZoneManager(ResourceManager[DNSZone]):
             return []
 
         if not isinstance(response, list):
-            return [self._to_model(response, view_key=view_key, view_name=view_name)]
+            response = [response]
+
+        if compact:
+            to_model = self._model_func(compact)
+            return [to_model(item) for item in response]
 
         return [self._to_model(item, view_key=view_key, view_name=view_name) for item in response]
 
@@ -132,10 +132,15 @@ class DNSViewManager(ResourceManager[DNSView]):
     def _to_model(self, data: dict[str, Any]) -> DNSView:
         return DNSView(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self.network_key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[DNSView]:
         """List DNS views for this network.
@@ -143,6 +148,7 @@ class DNSViewManager(ResourceManager[DNSView]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -151,7 +157,7 @@ class DNSViewManager(ResourceManager[DNSView]):
         if fields is None:
             fields = self._default_fields.copy()
 
-        filters: builtins.list[str] = [f"vnet eq {self.network_key}"]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             filters.append(f"({filter})")
@@ -168,10 +174,11 @@ class DNSViewManager(ResourceManager[DNSView]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -6,6 +6,7 @@ import builtins
 import logging
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.filters import build_filter
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -125,11 +126,40 @@ class DriveManager(ResourceManager[Drive]):
     def _to_model(self, data: dict[str, Any]) -> Drive:
         return Drive(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"machine eq {self.machine_key}"
+
+    def _list_params(
+        self,
+        filter: str | None = None,  # noqa: A002
+        fields: builtins.list[str] | None = None,
+        media: str | None = None,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters for this VM's drives."""
+        # Build filter for this VM's machine
+        machine_filter = self._scope_filter()
+        if media:
+            machine_filter = f"{machine_filter} and media eq '{media}'"
+        if filter:
+            machine_filter = f"{machine_filter} and ({filter})"
+        if filter_kwargs:
+            machine_filter = f"{machine_filter} and {build_filter(**filter_kwargs)}"
+
+        return {
+            "filter": machine_filter,
+            "fields": ",".join(fields or self._default_fields),
+        }
+
     def list(  # type: ignore[override]  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: list[str] | None = None,
         media: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> list[Drive]:
         """List drives for this VM.
@@ -138,37 +168,31 @@ class DriveManager(ResourceManager[Drive]):
             filter: Additional OData filter string.
             fields: List of fields to return.
             media: Filter by media type (disk, cdrom, efidisk).
+            limit: Maximum number of results.
+            offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
             List of Drive objects.
         """
-        # Use default fields if not specified
-        if fields is None:
-            fields = self._default_fields
-
-        # Build filter for this VM's machine
-        machine_filter = f"machine eq {self.machine_key}"
-        if media:
-            machine_filter = f"{machine_filter} and media eq '{media}'"
-        if filter:
-            machine_filter = f"{machine_filter} and ({filter})"
-
-        params: dict[str, Any] = {
-            "filter": machine_filter,
-            "fields": ",".join(fields),
-            "sort": "+orderid",
-        }
+        params = self._list_params(filter, fields, media=media, **kwargs)
+        params["sort"] = "+orderid"
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
 
         response = self._client._request("GET", self._endpoint, params=params)
 
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -163,6 +163,8 @@ class FileManager(ResourceManager[File]):
         limit: int | None = None,
         offset: int | None = None,
         file_type: str | builtins.list[str] | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[File]:
         """List files in the media catalog.
@@ -173,6 +175,7 @@ class FileManager(ResourceManager[File]):
             limit: Maximum number of results.
             offset: Skip this many results.
             file_type: Filter by file type(s) - "iso", "qcow2", "vmdk", etc.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -201,7 +204,12 @@ class FileManager(ResourceManager[File]):
             ]
 
         results = super().list(
-            filter=filter, fields=fields, limit=limit, offset=offset, **filter_kwargs
+            filter=filter,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            compact=compact,
+            **filter_kwargs,
         )
 
         # Apply file_type filter client-side (more flexible)
@@ -300,7 +308,10 @@ class FileManager(ResourceManager[File]):
             create_body["preferred_tier"] = str(tier)
 
         url = f"{connection.api_base_url}/files"
-        response = session.post(url, json=create_body, timeout=DEFAULT_TIMEOUT)
+        self._client._ensure_auth()
+        response = self._client._dispatch(
+            session, method="POST", url=url, json=create_body, timeout=DEFAULT_TIMEOUT
+        )
 
         if response.status_code not in HTTP_SUCCESS_CODES:
             raise ValidationError(f"Failed to create file entry: {response.text}")
@@ -322,9 +333,12 @@ class FileManager(ResourceManager[File]):
         try:
             # Pre-read chunks and submit to thread pool
             def _upload_chunk(chunk_data: bytes, chunk_offset: int) -> int:
+                self._client._ensure_auth()
                 chunk_url = f"{url}/{file_id}?filepos={chunk_offset}"
-                chunk_response = session.put(
-                    chunk_url,
+                chunk_response = self._client._dispatch(
+                    session,
+                    method="PUT",
+                    url=chunk_url,
                     data=chunk_data,
                     headers={HEADER_CONTENT_TYPE: CONTENT_TYPE_OCTET_STREAM},
                     timeout=UPLOAD_CHUNK_TIMEOUT,
@@ -454,7 +468,10 @@ class FileManager(ResourceManager[File]):
         logger.info("Downloading '%s' to '%s'", download_name, output_path)
 
         # Stream download
-        response = session.get(download_url, stream=True, timeout=DEFAULT_TIMEOUT)
+        self._client._ensure_auth()
+        response = self._client._dispatch(
+            session, method="GET", url=download_url, stream=True, timeout=DEFAULT_TIMEOUT
+        )
         if response.status_code not in HTTP_SUCCESS_CODES:
             raise NotFoundError(f"Download failed: {response.text}")
 
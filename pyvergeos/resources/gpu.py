@@ -200,6 +200,7 @@ class NvidiaVgpuProfileManager(ResourceManager[NvidiaVgpuProfile]):
         offset: int | None = None,
         *,
         profile_type: Literal["A", "B", "C", "Q"] | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NvidiaVgpuProfile]:
         """List NVIDIA vGPU profiles.
@@ -214,6 +215,7 @@ class NvidiaVgpuProfileManager(ResourceManager[NvidiaVgpuProfile]):
                 - B: Virtual Desktops (vPC)
                 - C: AI/ML/Training (vCS or vWS)
                 - Q: Virtual Workstations (vWS)
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -254,10 +256,11 @@ class NvidiaVgpuProfileManager(ResourceManager[NvidiaVgpuProfile]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(
         self,
@@ -516,6 +519,11 @@ class NodeGpuManager(ResourceManager[NodeGpu]):
     def _to_model(self, data: dict[str, Any]) -> NodeGpu:
         return NodeGpu(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -525,6 +533,7 @@ class NodeGpuManager(ResourceManager[NodeGpu]):
         *,
         mode: Literal["none", "gpu", "nvidia_vgpu"] | None = None,
         enabled_only: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeGpu]:
         """List node GPUs.
@@ -536,6 +545,7 @@ class NodeGpuManager(ResourceManager[NodeGpu]):
             offset: Skip this many results.
             mode: Filter by GPU mode.
             enabled_only: Only return GPUs with a mode set (not 'none').
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -559,8 +569,9 @@ class NodeGpuManager(ResourceManager[NodeGpu]):
         if filter:
             filters.append(filter)
 
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if mode is not None:
             filters.append(f"mode eq '{mode}'")
@@ -584,10 +595,11 @@ class NodeGpuManager(ResourceManager[NodeGpu]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(
         self,
@@ -1126,12 +1138,17 @@ class NodeGpuInstanceManager(ResourceManager[NodeGpuInstance]):
     def _to_model(self, data: dict[str, Any]) -> NodeGpuInstance:
         return NodeGpuInstance(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"gpu eq {self._gpu_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeGpuInstance]:
         """List GPU instances.
@@ -1141,6 +1158,7 @@ class NodeGpuInstanceManager(ResourceManager[NodeGpuInstance]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1149,7 +1167,7 @@ class NodeGpuInstanceManager(ResourceManager[NodeGpuInstance]):
         if fields is None:
             fields = self._default_fields
 
-        filters = [f"gpu eq {self._gpu_key}"]
+        filters = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -1172,10 +1190,11 @@ class NodeGpuInstanceManager(ResourceManager[NodeGpuInstance]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
 
 # =============================================================================
@@ -1345,6 +1364,11 @@ class NodeVgpuDeviceManager(ResourceManager[NodeVgpuDevice]):
     def _to_model(self, data: dict[str, Any]) -> NodeVgpuDevice:
         return NodeVgpuDevice(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -1353,6 +1377,7 @@ class NodeVgpuDeviceManager(ResourceManager[NodeVgpuDevice]):
         offset: int | None = None,
         *,
         vendor: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeVgpuDevice]:
         """List vGPU-capable devices.
@@ -1363,6 +1388,7 @@ class NodeVgpuDeviceManager(ResourceManager[NodeVgpuDevice]):
             limit: Maximum number of results.
             offset: Skip this many results.
             vendor: Filter by vendor name (contains).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1376,8 +1402,9 @@ class NodeVgpuDeviceManager(ResourceManager[NodeVgpuDevice]):
         if filter:
             filters.append(filter)
 
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if vendor is not None:
             escaped = vendor.replace("'", "''")
@@ -1400,10 +1427,11 @@ class NodeVgpuDeviceManager(ResourceManager[NodeVgpuDevice]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(  # type: ignore[override]
         self,
@@ -1598,6 +1626,11 @@ class NodeHostGpuDeviceManager(ResourceManager[NodeHostGpuDevice]):
     def _to_model(self, data: dict[str, Any]) -> NodeHostGpuDevice:
         return NodeHostGpuDevice(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -1606,6 +1639,7 @@ class NodeHostGpuDeviceManager(ResourceManager[NodeHostGpuDevice]):
         offset: int | None = None,
         *,
         vendor: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeHostGpuDevice]:
         """List host GPU devices.
@@ -1616,6 +1650,7 @@ class NodeHostGpuDeviceManager(ResourceManager[NodeHostGpuDevice]):
             limit: Maximum number of results.
             offset: Skip this many results.
             vendor: Filter by vendor name (contains).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1629,8 +1664,9 @@ class NodeHostGpuDeviceManager(ResourceManager[NodeHostGpuDevice]):
         if filter:
             filters.append(filter)
 
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if vendor is not None:
             escaped = vendor.replace("'", "''")
@@ -1653,10 +1689,11 @@ class NodeHostGpuDeviceManager(ResourceManager[NodeHostGpuDevice]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(  # type: ignore[override]
         self,
@@ -1810,6 +1847,11 @@ class NodeVgpuProfileManager(ResourceManager[NodeVgpuProfile]):
     def _to_model(self, data: dict[str, Any]) -> NodeVgpuProfile:
         return NodeVgpuProfile(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._physical_gpu_key is None:
+            return None
+        return f"physical_gpu eq {self._physical_gpu_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -1818,6 +1860,7 @@ class NodeVgpuProfileManager(ResourceManager[NodeVgpuProfile]):
         offset: int | None = None,
         *,
         profile_type: Literal["A", "B", "C", "Q"] | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeVgpuProfile]:
         """List vGPU profiles.
@@ -1828,6 +1871,7 @@ class NodeVgpuProfileManager(ResourceManager[NodeVgpuProfile]):
             limit: Maximum number of results.
             offset: Skip this many results.
             profile_type: Filter by profile type.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1841,8 +1885,9 @@ class NodeVgpuProfileManager(ResourceManager[NodeVgpuProfile]):
         if filter:
             filters.append(filter)
 
-        if self._physical_gpu_key is not None:
-            filters.append(f"physical_gpu eq {self._physical_gpu_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if profile_type is not None:
             filters.append(f"profile_type eq '{profile_type}'")
@@ -1864,10 +1909,11 @@ class NodeVgpuProfileManager(ResourceManager[NodeVgpuProfile]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(
         self,
@@ -115,12 +115,17 @@ class GroupMemberManager(ResourceManager[GroupMember]):
         """Convert API response to GroupMember object."""
         return GroupMember(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"parent_group eq {self._group_key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[GroupMember]:
         """List members of this group.
@@ -130,6 +135,7 @@ class GroupMemberManager(ResourceManager[GroupMember]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -143,7 +149,7 @@ class GroupMemberManager(ResourceManager[GroupMember]):
         params: dict[str, Any] = {}
 
         # Build filter - always filter by parent group
-        filters: builtins.list[str] = [f"parent_group eq {self._group_key}"]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -172,7 +178,8 @@ class GroupMemberManager(ResourceManager[GroupMember]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def add_user(self, user_key: int) -> GroupMember:
         """Add a user to this group.
@@ -457,6 +464,8 @@ class GroupManager(ResourceManager[Group]):
         offset: int | None = None,
         enabled: bool | None = None,
         include_system: bool = True,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Group]:
         """List groups with optional filtering.
@@ -468,6 +477,7 @@ class GroupManager(ResourceManager[Group]):
             offset: Skip this many results.
             enabled: Filter by enabled status.
             include_system: Include system groups (default True).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -527,7 +537,8 @@ class GroupManager(ResourceManager[Group]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def list_enabled(self) -> builtins.list[Group]:
         """List all enabled groups.
@@ -124,6 +124,9 @@ class NetworkHostManager(ResourceManager[NetworkHost]):
     def _to_model(self, data: dict[str, Any]) -> NetworkHost:
         return NetworkHost(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self.network_key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,
@@ -131,6 +134,8 @@ class NetworkHostManager(ResourceManager[NetworkHost]):
         hostname: str | None = None,
         ip: str | None = None,
         host_type: HostType | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[NetworkHost]:
         """List DHCP/DNS host overrides for this network.
@@ -141,6 +146,7 @@ class NetworkHostManager(ResourceManager[NetworkHost]):
             hostname: Filter by exact hostname.
             ip: Filter by exact IP address.
             host_type: Filter by type ('host' or 'domain').
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -150,9 +156,7 @@ class NetworkHostManager(ResourceManager[NetworkHost]):
             fields = self._default_fields.copy()
 
         # Build filter for this network
-        filters: builtins.list[str] = [
-            f"vnet eq {self.network_key}",
-        ]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if hostname:
             escaped_hostname = hostname.replace("'", "''")
@@ -181,10 +185,11 @@ class NetworkHostManager(ResourceManager[NetworkHost]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -372,12 +372,21 @@ class IPSecConnectionManager(ResourceManager[IPSecConnection]):
 
         return self._ipsec_key
 
+    def _scope_filter(self) -> str:
+        ipsec_key = self._get_ipsec_config()
+        if ipsec_key is None:
+            # Not configured yet, so no rows can belong to it
+            return f"ipsec#vnet eq {self._network.key}"
+        return f"ipsec eq {ipsec_key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[IPSecConnection]:
         """List IPSec connections on this network.
@@ -387,20 +396,20 @@ class IPSecConnectionManager(ResourceManager[IPSecConnection]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (e.g., name="Site-B").
 
         Returns:
             List of IPSecConnection objects.
         """
-        ipsec_key = self._get_ipsec_config()
-        if ipsec_key is None:
+        if self._get_ipsec_config() is None:
             return []
 
         # Build parameters
         params: dict[str, Any] = {}
 
         # Build filter - always include ipsec parent filter
-        filters = [f"ipsec eq {ipsec_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -423,10 +432,11 @@ class IPSecConnectionManager(ResourceManager[IPSecConnection]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -721,12 +731,17 @@ class IPSecPolicyManager(ResourceManager[IPSecPolicy]):
         data["_connection_name"] = self._connection.name
         return IPSecPolicy(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"phase1 eq {self._connection.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[IPSecPolicy]:
         """List Phase 2 policies for this connection.
@@ -736,6 +751,7 @@ class IPSecPolicyManager(ResourceManager[IPSecPolicy]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (e.g., name="LAN").
 
         Returns:
@@ -744,7 +760,7 @@ class IPSecPolicyManager(ResourceManager[IPSecPolicy]):
         params: dict[str, Any] = {}
 
         # Build filter - always include phase1 parent filter
-        filters = [f"phase1 eq {self._connection.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -767,10 +783,11 @@ class IPSecPolicyManager(ResourceManager[IPSecPolicy]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
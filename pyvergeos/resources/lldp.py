@@ -122,12 +122,19 @@ class NodeLLDPNeighborManager(ResourceManager[NodeLLDPNeighbor]):
     def _to_model(self, data: dict[str, Any]) -> NodeLLDPNeighbor:
         return NodeLLDPNeighbor(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeLLDPNeighbor]:
         """List LLDP neighbors.
@@ -139,6 +146,7 @@ class NodeLLDPNeighborManager(ResourceManager[NodeLLDPNeighbor]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
 
         Returns:
             List of NodeLLDPNeighbor objects.
@@ -147,8 +155,9 @@ class NodeLLDPNeighborManager(ResourceManager[NodeLLDPNeighbor]):
             fields = self._default_fields
 
         filters: builtins.list[str] = []
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
         if filter:
             filters.append(f"({filter})")
 
@@ -165,9 +174,10 @@ class NodeLLDPNeighborManager(ResourceManager[NodeLLDPNeighbor]):
         response = self._client._request("GET", self._endpoint, params=params)
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def list_by_nic(self, nic_key: int) -> builtins.list[NodeLLDPNeighbor]:
         """List LLDP neighbors discovered on a specific NIC.
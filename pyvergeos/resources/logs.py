@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.constants import STREAM_CHUNK_SIZE
 from pyvergeos.exceptions import NotFoundError
 from pyvergeos.filters import build_filter
 from pyvergeos.resources.base import ResourceManager, ResourceObject
@@ -201,6 +203,7 @@ class LogManager(ResourceManager[Log]):
     """
 
     _endpoint = "logs"
+    _keyset_field = "timestamp"
 
     def __init__(self, client: VergeClient) -> None:
         super().__init__(client)
@@ -222,6 +225,7 @@ class LogManager(ResourceManager[Log]):
         since: datetime | None = None,
         before: datetime | None = None,
         errors_only: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Log]:
         """List logs with optional filtering.
@@ -241,6 +245,8 @@ class LogManager(ResourceManager[Log]):
             since: Return logs since this datetime.
             before: Return logs before this datetime.
             errors_only: Shortcut to filter for error and critical logs only.
+            compact: Return compact read-only records (same properties as
+                Log, a fraction of the memory) for large result sets.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -261,6 +267,50 @@ class LogManager(ResourceManager[Log]):
             >>> # Search for specific text
             >>> logs = client.logs.list(text="snapshot")
         """
+        params = self._build_params(
+            filter,
+            fields,
+            limit,
+            offset,
+            level=level,
+            object_type=object_type,
+            user=user,
+            text=text,
+            since=since,
+            before=before,
+            errors_only=errors_only,
+            filter_kwargs=filter_kwargs,
+        )
+
+        response = self._client._request("GET", self._endpoint, params=params)
+        to_model = self._model_func(compact)
+
+        if response is None:
+            return []
+
+        if not isinstance(response, list):
+            return [to_model(response)]
+
+        return [to_model(item) for item in response]
+
+    def _build_params(
+        self,
+        filter: str | None,
+        fields: builtins.list[str] | None,
+        limit: int | None,
+        offset: int | None,
+        *,
+        level: str | builtins.list[str] | None,
+        object_type: str | None,
+        user: str | None,
+        text: str | None,
+        since: datetime | None,
+        before: datetime | None,
+        errors_only: bool,
+        filter_kwargs: dict[str, Any],
+        sort: str = "-timestamp",
+    ) -> dict[str, Any]:
+        """Build query parameters for list() and stream()."""
         conditions: builtins.list[str] = []
 
         if filter:
@@ -334,17 +384,107 @@ class LogManager(ResourceManager[Log]):
             params["offset"] = offset
 
         # Sort by timestamp descending (newest first)
-        params["sort"] = "-timestamp"
+        params["sort"] = sort
 
-        response = self._client._request("GET", self._endpoint, params=params)
+        return params
 
-        if response is None:
-            return []
+    def _list_params(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        *,
+        level: str | builtins.list[str] | None = None,
+        object_type: str | None = None,
+        user: str | None = None,
+        text: str | None = None,
+        since: datetime | None = None,
+        before: datetime | None = None,
+        errors_only: bool = False,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters with the log-specific filters."""
+        return self._build_params(
+            filter,
+            fields,
+            None,
+            None,
+            level=level,
+            object_type=object_type,
+            user=user,
+            text=text,
+            since=since,
+            before=before,
+            errors_only=errors_only,
+            filter_kwargs=filter_kwargs,
+        )
+
+    def stream(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        *,
+        sort: str | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        level: str | builtins.list[str] | None = None,
+        object_type: str | None = None,
+        user: str | None = None,
+        text: str | None = None,
+        since: datetime | None = None,
+        before: datetime | None = None,
+        errors_only: bool = False,
+        compact: bool = False,
+        **filter_kwargs: Any,
+    ) -> Iterator[Log]:
+        """Stream logs in constant memory, yielding each as it is decoded.
 
-        if not isinstance(response, list):
-            return [self._to_model(response)]
+        Accepts the same filters as :meth:`list`, but returns every matching
+        log unless ``limit`` is given.
+
+        Args:
+            filter: OData filter string.
+            fields: List of fields to return.
+            limit: Maximum number of results (default: all).
+            offset: Skip this many results.
+            sort: Sort expression (default: "-timestamp", newest first).
+            chunk_size: Bytes read from the socket at a time.
+            level: Filter by severity level (or list of levels).
+            object_type: Filter by object type.
+            user: Filter logs by user (contains search).
+            text: Filter logs containing this text (contains search).
+            since: Return logs since this datetime.
+            before: Return logs before this datetime.
+            errors_only: Shortcut to filter for error and critical logs only.
+            compact: Yield compact read-only records instead of Log objects.
+            **filter_kwargs: Additional filter arguments.
 
-        return [self._to_model(item) for item in response]
+        Yields:
+            Log objects.
+
+        Example:
+            >>> import csv
+            >>> with open("audit.csv", "w", newline="") as f:
+            ...     writer = csv.writer(f)
+            ...     for log in client.logs.stream(level="audit", since=since):
+            ...         writer.writerow([log.created_at, log.user, log.text])
+        """
+        params = self._build_params(
+            filter,
+            fields,
+            limit,
+            offset,
+            level=level,
+            object_type=object_type,
+            user=user,
+            text=text,
+            since=since,
+            before=before,
+            errors_only=errors_only,
+            filter_kwargs=filter_kwargs,
+            sort=sort or "-timestamp",
+        )
+        yield from self._stream_params(params, chunk_size, compact)
 
     def list_errors(
         self,
@@ -27,11 +27,15 @@ Example:
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
+from pyvergeos.columnar import ColumnSet, to_columns
 from pyvergeos.exceptions import NotFoundError
 from pyvergeos.filters import build_filter
+from pyvergeos.pagination import iter_keyset
+from pyvergeos.records import compact_factory
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -355,6 +359,10 @@ class MachineStatsManager(ResourceManager[MachineStats]):
     def _to_history_model(self, data: dict[str, Any]) -> MachineStatsHistory:
         return MachineStatsHistory(data, self)
 
+    def _history_model_func(self, compact: bool) -> Callable[[dict[str, Any]], Any]:
+        """Return the row-to-object function for history queries."""
+        return compact_factory(MachineStatsHistory) if compact else self._to_history_model
+
     def get(self, fields: builtins.list[str] | None = None) -> MachineStats:  # type: ignore[override]
         """Get current machine statistics.
 
@@ -395,6 +403,7 @@ class MachineStatsManager(ResourceManager[MachineStats]):
         since: datetime | int | None = None,
         until: datetime | int | None = None,
         fields: builtins.list[str] | None = None,
+        compact: bool = False,
     ) -> builtins.list[MachineStatsHistory]:
         """Get short-term stats history (high resolution).
 
@@ -404,6 +413,8 @@ class MachineStatsManager(ResourceManager[MachineStats]):
             since: Return records after this time (datetime or epoch).
             until: Return records before this time (datetime or epoch).
             fields: List of fields to return.
+            compact: Return compact read-only records (same properties as
+                MachineStatsHistory, a fraction of the memory).
 
         Returns:
             List of MachineStatsHistory objects, sorted by timestamp descending.
@@ -415,6 +426,7 @@ class MachineStatsManager(ResourceManager[MachineStats]):
             since=since,
             until=until,
             fields=fields,
+            compact=compact,
         )
 
     def history_long(
@@ -424,6 +436,7 @@ class MachineStatsManager(ResourceManager[MachineStats]):
         since: datetime | int | None = None,
         until: datetime | int | None = None,
         fields: builtins.list[str] | None = None,
+        compact: bool = False,
     ) -> builtins.list[MachineStatsHistory]:
         """Get long-term stats history (lower resolution, longer retention).
 
@@ -433,6 +446,8 @@ class MachineStatsManager(ResourceManager[MachineStats]):
             since: Return records after this time (datetime or epoch).
             until: Return records before this time (datetime or epoch).
             fields: List of fields to return.
+            compact: Return compact read-only records (same properties as
+                MachineStatsHistory, a fraction of the memory).
 
         Returns:
             List of MachineStatsHistory objects, sorted by timestamp descending.
@@ -444,6 +459,7 @@ class MachineStatsManager(ResourceManager[MachineStats]):
             since=since,
             until=until,
             fields=fields,
+            compact=compact,
         )
 
     def _get_history(
@@ -454,8 +470,35 @@ class MachineStatsManager(ResourceManager[MachineStats]):
         since: datetime | int | None = None,
         until: datetime | int | None = None,
         fields: builtins.list[str] | None = None,
+        compact: bool = False,
     ) -> builtins.list[MachineStatsHistory]:
         """Internal helper to get history from short or long endpoint."""
+        params = self._history_params(since, until, fields)
+        params["sort"] = "-timestamp"
+
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+
+        response = self._client._request("GET", endpoint, params=params)
+        to_model = self._history_model_func(compact)
+
+        if response is None:
+            return []
+
+        if isinstance(response, list):
+            return [to_model(item) for item in response]
+
+        return [to_model(response)]
+
+    def _history_params(
+        self,
+        since: datetime | int | None,
+        until: datetime | int | None,
+        fields: builtins.list[str] | None,
+    ) -> dict[str, Any]:
+        """Build the filter and field parameters for history queries."""
         if fields is None:
             fields = self._history_fields
 
@@ -470,26 +513,83 @@ class MachineStatsManager(ResourceManager[MachineStats]):
             until_epoch = int(until.timestamp()) if isinstance(until, datetime) else int(until)
             filters.append(f"timestamp le {until_epoch}")
 
-        params: dict[str, Any] = {
-            "filter": " and ".join(filters),
-            "fields": ",".join(fields),
-            "sort": "-timestamp",
-        }
+        return {"filter": " and ".join(filters), "fields": ",".join(fields)}
+
+    def history_columnar(
+        self,
+        long: bool = False,
+        limit: int | None = None,
+        since: datetime | int | None = None,
+        until: datetime | int | None = None,
+        fields: builtins.list[str] | None = None,
+        backend: str | None = None,
+    ) -> ColumnSet:
+        """Get stats history as column arrays, for vectorized analysis.
+
+        Rows are streamed straight into one typed array per field, which
+        takes a fraction of the memory of :meth:`history_short` objects for
+        large ranges.
 
+        Args:
+            long: Read the long-term table instead of the short-term one.
+            limit: Maximum number of records to return.
+            since: Return records after this time (datetime or epoch).
+            until: Return records before this time (datetime or epoch).
+            fields: List of fields to return, one column each.
+            backend: "numpy", "array", or None to use NumPy when installed.
+
+        Returns:
+            ColumnSet sorted by timestamp descending.
+
+        Example:
+            >>> cols = vm.stats.history_columnar(fields=["timestamp", "total_cpu", "ram_used"])
+            >>> cols["total_cpu"].mean(), cols["ram_used"].max()
+        """
+        endpoint = "machine_stats_history_long" if long else "machine_stats_history_short"
+        params = self._history_params(since, until, fields)
+        params["sort"] = "-timestamp"
         if limit is not None:
             params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
 
-        response = self._client._request("GET", endpoint, params=params)
+        rows = self._client._stream(endpoint, params=params)
+        return to_columns(rows, params["fields"].split(","), backend)
 
-        if response is None:
-            return []
+    def iter_history(
+        self,
+        long: bool = False,
+        page_size: int = 1000,
+        since: datetime | int | None = None,
+        until: datetime | int | None = None,
+        fields: builtins.list[str] | None = None,
+        compact: bool = False,
+    ) -> Iterator[MachineStatsHistory]:
+        """Iterate over the full stats history with keyset pagination.
 
-        if isinstance(response, list):
-            return [self._to_history_model(item) for item in response]
+        History tables hold hundreds of thousands of rows; pages are fetched
+        by ``timestamp`` cursor instead of offsets, so each page costs the
+        same and rows written during the scan do not shift the window.
 
-        return [self._to_history_model(response)]
+        Args:
+            long: Read the long-term table instead of the short-term one.
+            page_size: Records requested per page.
+            since: Return records after this time (datetime or epoch).
+            until: Return records before this time (datetime or epoch).
+            fields: List of fields to return.
+            compact: Yield compact read-only records instead of
+                MachineStatsHistory objects.
+
+        Yields:
+            MachineStatsHistory objects, oldest first.
+
+        Example:
+            >>> for point in vm.stats.iter_history(since=datetime(2026, 1, 1)):
+            ...     write_point(point.timestamp, point.total_cpu)
+        """
+        endpoint = "machine_stats_history_long" if long else "machine_stats_history_short"
+        params = self._history_params(since, until, fields)
+        to_model = self._history_model_func(compact)
+        for row in iter_keyset(self._client, endpoint, params, page_size, key_field="timestamp"):
+            yield to_model(row)
 
 
 # =============================================================================
@@ -825,6 +925,9 @@ class MachineLogManager(ResourceManager[MachineLog]):
     def _to_model(self, data: dict[str, Any]) -> MachineLog:
         return MachineLog(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"machine eq {self._machine_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -838,6 +941,7 @@ class MachineLogManager(ResourceManager[MachineLog]):
         warnings_only: bool = False,
         since: datetime | int | None = None,
         until: datetime | int | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[MachineLog]:
         """List machine log entries.
@@ -852,6 +956,7 @@ class MachineLogManager(ResourceManager[MachineLog]):
             warnings_only: Only return warning logs.
             since: Return logs after this time (datetime or epoch microseconds).
             until: Return logs before this time (datetime or epoch microseconds).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -860,7 +965,7 @@ class MachineLogManager(ResourceManager[MachineLog]):
         if fields is None:
             fields = self._default_fields
 
-        filters = [f"machine eq {self._machine_key}"]
+        filters = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -906,10 +1011,11 @@ class MachineLogManager(ResourceManager[MachineLog]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(  # type: ignore[override]
         self,
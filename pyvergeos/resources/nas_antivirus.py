@@ -329,6 +329,11 @@ class VolumeAntivirusManager(ResourceManager[VolumeAntivirus]):
         super().__init__(client)
         self._volume_key = volume_key
 
+    def _scope_filter(self) -> str | None:
+        if self._volume_key is None:
+            return None
+        return f"volume eq '{self._volume_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -337,6 +342,8 @@ class VolumeAntivirusManager(ResourceManager[VolumeAntivirus]):
         offset: int | None = None,
         volume: str | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeAntivirus]:
         """List volume antivirus configurations with optional filtering.
@@ -348,6 +355,7 @@ class VolumeAntivirusManager(ResourceManager[VolumeAntivirus]):
             offset: Skip this many results.
             volume: Filter by volume (key or name). Ignored if manager is scoped.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -418,7 +426,8 @@ class VolumeAntivirusManager(ResourceManager[VolumeAntivirus]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -739,6 +748,8 @@ class VolumeAntivirusStatusManager(ResourceManager[VolumeAntivirusStatus]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeAntivirusStatus]:
         """List volume antivirus status records.
@@ -748,6 +759,7 @@ class VolumeAntivirusStatusManager(ResourceManager[VolumeAntivirusStatus]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -782,7 +794,8 @@ class VolumeAntivirusStatusManager(ResourceManager[VolumeAntivirusStatus]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def _to_model(self, data: dict[str, Any]) -> VolumeAntivirusStatus:
         """Convert API response to VolumeAntivirusStatus object."""
@@ -860,6 +873,8 @@ class VolumeAntivirusStatsManager(ResourceManager[VolumeAntivirusStats]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeAntivirusStats]:
         """List volume antivirus statistics records.
@@ -869,6 +884,7 @@ class VolumeAntivirusStatsManager(ResourceManager[VolumeAntivirusStats]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -903,7 +919,8 @@ class VolumeAntivirusStatsManager(ResourceManager[VolumeAntivirusStats]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def _to_model(self, data: dict[str, Any]) -> VolumeAntivirusStats:
         """Convert API response to VolumeAntivirusStats object."""
@@ -937,12 +954,19 @@ class VolumeAntivirusInfectionManager(ResourceManager[VolumeAntivirusInfection])
         super().__init__(client)
         self._antivirus_key = antivirus_key
 
+    def _scope_filter(self) -> str | None:
+        if self._antivirus_key is None:
+            return None
+        return f"volume_antivirus eq {self._antivirus_key}"
+
     def list(  # noqa: A002
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeAntivirusInfection]:
         """List volume antivirus infection records.
@@ -952,6 +976,7 @@ class VolumeAntivirusInfectionManager(ResourceManager[VolumeAntivirusInfection])
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -970,8 +995,9 @@ class VolumeAntivirusInfectionManager(ResourceManager[VolumeAntivirusInfection])
             filters.append(build_filter(**filter_kwargs))
 
         # Add scoped antivirus filter
-        if self._antivirus_key is not None:
-            filters.append(f"volume_antivirus eq {self._antivirus_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -994,7 +1020,8 @@ class VolumeAntivirusInfectionManager(ResourceManager[VolumeAntivirusInfection])
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def _to_model(self, data: dict[str, Any]) -> VolumeAntivirusInfection:
         """Convert API response to VolumeAntivirusInfection object."""
@@ -1028,6 +1055,11 @@ class VolumeAntivirusLogManager(ResourceManager[VolumeAntivirusLog]):
         super().__init__(client)
         self._antivirus_key = antivirus_key
 
+    def _scope_filter(self) -> str | None:
+        if self._antivirus_key is None:
+            return None
+        return f"volume_antivirus eq {self._antivirus_key}"
+
     def list(  # noqa: A002
         self,
         filter: str | None = None,
@@ -1035,6 +1067,8 @@ class VolumeAntivirusLogManager(ResourceManager[VolumeAntivirusLog]):
         limit: int | None = None,
         offset: int | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeAntivirusLog]:
         """List volume antivirus scan activity logs.
@@ -1045,6 +1079,7 @@ class VolumeAntivirusLogManager(ResourceManager[VolumeAntivirusLog]):
             limit: Maximum number of results.
             offset: Skip this many results.
             level: Filter by log level (audit, message, warning, error, critical, summary, debug).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1063,8 +1098,9 @@ class VolumeAntivirusLogManager(ResourceManager[VolumeAntivirusLog]):
             filters.append(build_filter(**filter_kwargs))
 
         # Add scoped antivirus filter
-        if self._antivirus_key is not None:
-            filters.append(f"volume_antivirus eq {self._antivirus_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         # Add level filter
         if level is not None:
@@ -1091,7 +1127,8 @@ class VolumeAntivirusLogManager(ResourceManager[VolumeAntivirusLog]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def _to_model(self, data: dict[str, Any]) -> VolumeAntivirusLog:
         """Convert API response to VolumeAntivirusLog object."""
@@ -1177,6 +1214,8 @@ class NasServiceAntivirusManager(ResourceManager[NasServiceAntivirus]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NasServiceAntivirus]:
         """List NAS service antivirus configurations.
@@ -1186,6 +1225,7 @@ class NasServiceAntivirusManager(ResourceManager[NasServiceAntivirus]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1220,7 +1260,8 @@ class NasServiceAntivirusManager(ResourceManager[NasServiceAntivirus]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def update(  # type: ignore[override]
         self,
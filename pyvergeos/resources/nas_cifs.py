@@ -190,6 +190,8 @@ class NASCIFSShareManager(ResourceManager["NASCIFSShare"]):
         offset: int | None = None,
         volume: str | int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASCIFSShare]:
         """List CIFS shares with optional filtering.
@@ -201,6 +203,7 @@ class NASCIFSShareManager(ResourceManager["NASCIFSShare"]):
             offset: Skip this many results.
             volume: Filter by volume (key or name).
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -259,7 +262,8 @@ class NASCIFSShareManager(ResourceManager["NASCIFSShare"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -198,6 +198,8 @@ class NASNFSShareManager(ResourceManager["NASNFSShare"]):
         offset: int | None = None,
         volume: str | int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASNFSShare]:
         """List NFS shares with optional filtering.
@@ -209,6 +211,7 @@ class NASNFSShareManager(ResourceManager["NASNFSShare"]):
             offset: Skip this many results.
             volume: Filter by volume (key or name).
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -266,7 +269,8 @@ class NASNFSShareManager(ResourceManager["NASNFSShare"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
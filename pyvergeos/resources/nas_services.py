@@ -5,8 +5,10 @@ from __future__ import annotations
 import builtins
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.constants import NAS_DEPLOY_TIMEOUT, POLL_INTERVAL
 from pyvergeos.exceptions import NotFoundError
 from pyvergeos.filters import build_filter
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -173,6 +175,8 @@ class NASServiceManager(ResourceManager[NASService]):
         limit: int | None = None,
         offset: int | None = None,
         status: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASService]:
         """List NAS services with optional filtering.
@@ -183,6 +187,7 @@ class NASServiceManager(ResourceManager[NASService]):
             limit: Maximum number of results.
             offset: Skip this many results.
             status: Filter by VM status (running, stopped, etc.).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -230,7 +235,8 @@ class NASServiceManager(ResourceManager[NASService]):
         if not isinstance(response, list):
             response = [response]
 
-        results = [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        results = [to_model(item) for item in response if item]
 
         # Post-filter by status if specified
         if status:
@@ -332,7 +338,9 @@ class NASServiceManager(ResourceManager[NASService]):
             Created NASService object.
 
         Raises:
-            ValueError: If Services recipe not found or NAS service already exists.
+            ValueError: If Services recipe not found, NAS service already
+                exists, or the deployed service does not appear within
+                NAS_DEPLOY_TIMEOUT seconds.
 
         Example:
             >>> # Create with defaults
@@ -444,22 +452,17 @@ class NASServiceManager(ResourceManager[NASService]):
         self._client._request("POST", "vm_recipe_instances", json_data=body)
 
         # Wait for the service to be created
-        import time
-
-        max_attempts = 15
-        for _ in range(max_attempts):
-            time.sleep(2)
-            try:
-                service = self.get(name=name)
-                if service:
-                    return service
-            except NotFoundError:
-                pass
-
-        raise ValueError(
-            f"NAS service deployment initiated but service '{name}' not found after waiting. "
-            "It may still be creating."
-        )
+        try:
+            return wait_until_found(
+                lambda: self.get(name=name),
+                timeout=NAS_DEPLOY_TIMEOUT,
+                poll_interval=POLL_INTERVAL,
+            )
+        except NotFoundError:
+            raise ValueError(
+                f"NAS service deployment initiated but service '{name}' not found after "
+                "waiting. It may still be creating."
+            ) from None
 
     def update(  # type: ignore[override]
         self,
@@ -238,6 +238,8 @@ class NASUserManager(ResourceManager["NASUser"]):
         offset: int | None = None,
         service: int | str | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASUser]:
         """List NAS local users with optional filtering.
@@ -249,6 +251,7 @@ class NASUserManager(ResourceManager["NASUser"]):
             offset: Skip this many results.
             service: Filter by NAS service (key or name).
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -306,7 +309,8 @@ class NASUserManager(ResourceManager["NASUser"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import builtins
-import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from pyvergeos.constants import DEFAULT_TIMEOUT, POLL_INTERVAL_FAST
 from pyvergeos.exceptions import APIError, NotFoundError, VergeTimeoutError
+from pyvergeos.polling import poll_until
 
 if TYPE_CHECKING:
     from pyvergeos.client import VergeClient
@@ -288,7 +288,7 @@ class NASVolumeFileManager:
         Args:
             job_key: The browse job key.
             timeout: Maximum seconds to wait.
-            poll_interval: Seconds between polls.
+            poll_interval: Longest wait between polls.
 
         Returns:
             The result data (can be list, dict, or None for empty dirs).
@@ -297,27 +297,26 @@ class NASVolumeFileManager:
             APIError: If the job fails.
             VergeTimeoutError: If timeout is exceeded.
         """
-        max_attempts = int(timeout / poll_interval)
         endpoint = f"{self._endpoint}/{job_key}"
 
-        for _attempt in range(max_attempts):
-            time.sleep(poll_interval)
-
+        def status() -> dict[str, Any]:
             # Must explicitly request the result field - it's not returned by default
             response = self._client._request("GET", endpoint, params={"fields": "id,status,result"})
-
-            if not response or not isinstance(response, dict):
-                continue
-
-            status = response.get("status")
-
-            if status == "complete":
-                return response.get("result")
-            elif status == "error":
-                error_msg = response.get("result", "Unknown error")
-                raise APIError(f"Browse operation failed: {error_msg}")
-
-        raise VergeTimeoutError(f"Browse operation timed out after {timeout} seconds")
+            return response if isinstance(response, dict) else {}
+
+        response = poll_until(
+            status,
+            lambda response: response.get("status") in ("complete", "error"),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_timeout=lambda _: VergeTimeoutError(
+                f"Browse operation timed out after {timeout} seconds"
+            ),
+        )
+        if response.get("status") == "error":
+            error_msg = response.get("result", "Unknown error")
+            raise APIError(f"Browse operation failed: {error_msg}")
+        return response.get("result")
 
 
 def _format_file_size(size_bytes: int) -> str:
@@ -260,6 +260,8 @@ class NASVolumeSyncManager(ResourceManager["NASVolumeSync"]):
         offset: int | None = None,
         service: int | str | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASVolumeSync]:
         """List volume sync jobs with optional filtering.
@@ -271,6 +273,7 @@ class NASVolumeSyncManager(ResourceManager["NASVolumeSync"]):
             offset: Skip this many results.
             service: Filter by NAS service (key or name).
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -342,7 +345,8 @@ class NASVolumeSyncManager(ResourceManager["NASVolumeSync"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -298,6 +298,8 @@ class NASVolumeManager(ResourceManager["NASVolume"]):
         enabled: bool | None = None,
         fs_type: str | None = None,
         service: int | str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASVolume]:
         """List NAS volumes with optional filtering.
@@ -310,6 +312,7 @@ class NASVolumeManager(ResourceManager["NASVolume"]):
             enabled: Filter by enabled state.
             fs_type: Filter by filesystem type (ext4, cifs, nfs, ybfs, verge_vm_export).
             service: Filter by NAS service (key or name).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -385,7 +388,8 @@ class NASVolumeManager(ResourceManager["NASVolume"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -821,6 +825,11 @@ class NASVolumeSnapshotManager(ResourceManager["NASVolumeSnapshot"]):
         super().__init__(client)
         self._volume_key = volume_key
 
+    def _scope_filter(self) -> str | None:
+        if self._volume_key is None:
+            return None
+        return f"volume eq '{self._volume_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -828,6 +837,8 @@ class NASVolumeSnapshotManager(ResourceManager["NASVolumeSnapshot"]):
         limit: int | None = None,
         offset: int | None = None,
         volume: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NASVolumeSnapshot]:
         """List volume snapshots with optional filtering.
@@ -838,6 +849,7 @@ class NASVolumeSnapshotManager(ResourceManager["NASVolumeSnapshot"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             volume: Filter by volume (key or name). Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -908,7 +920,8 @@ class NASVolumeSnapshotManager(ResourceManager["NASVolumeSnapshot"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
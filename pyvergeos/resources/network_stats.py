@@ -867,12 +867,17 @@ class IPSecActiveConnectionManager(ResourceManager[IPSecActiveConnection]):
     def _to_model(self, data: dict[str, Any]) -> IPSecActiveConnection:
         return IPSecActiveConnection(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self._network_key}"
+
     def list(  # noqa: A002
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[IPSecActiveConnection]:
         """List active IPSec connections for this network.
@@ -882,6 +887,7 @@ class IPSecActiveConnectionManager(ResourceManager[IPSecActiveConnection]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter parameters (ignored for scoped manager).
 
         Returns:
@@ -893,7 +899,7 @@ class IPSecActiveConnectionManager(ResourceManager[IPSecActiveConnection]):
         if fields is None:
             fields = self._default_fields
 
-        filters = [f"vnet eq {self._network_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
 
@@ -912,10 +918,11 @@ class IPSecActiveConnectionManager(ResourceManager[IPSecActiveConnection]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def count(self) -> int:
         """Get count of active IPSec connections.
@@ -1034,12 +1041,17 @@ class WireGuardPeerStatusManager(ResourceManager[WireGuardPeerStatus]):
     def _to_model(self, data: dict[str, Any]) -> WireGuardPeerStatus:
         return WireGuardPeerStatus(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"peer#wireguard eq {self._wireguard_key}"
+
     def list(  # noqa: A002
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[WireGuardPeerStatus]:
         """List peer status for this WireGuard interface.
@@ -1049,6 +1061,7 @@ class WireGuardPeerStatusManager(ResourceManager[WireGuardPeerStatus]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter parameters (ignored for scoped manager).
 
         Returns:
@@ -1100,10 +1113,11 @@ class WireGuardPeerStatusManager(ResourceManager[WireGuardPeerStatus]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get_for_peer(self, peer_key: int) -> WireGuardPeerStatus:
         """Get status for a specific peer.
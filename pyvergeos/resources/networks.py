@@ -846,6 +846,8 @@ class NetworkManager(ResourceManager[Network]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Network]:
         """List networks with optional filtering.
@@ -858,6 +860,7 @@ class NetworkManager(ResourceManager[Network]):
             fields: List of fields to return (defaults to common fields).
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -871,6 +874,7 @@ class NetworkManager(ResourceManager[Network]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
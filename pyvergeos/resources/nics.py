@@ -188,10 +188,17 @@ class MachineNICManager(ResourceManager[NIC]):
     def _to_model(self, data: dict[str, Any]) -> NIC:
         return NIC(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._machine_key is None:
+            return None
+        return f"machine eq {self._machine_key}"
+
     def list(  # type: ignore[override]  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> list[NIC]:
         """List NICs with optional filtering.
@@ -202,6 +209,7 @@ class MachineNICManager(ResourceManager[NIC]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -211,9 +219,7 @@ class MachineNICManager(ResourceManager[NIC]):
             fields = self._default_fields
 
         # Scope to machine if set
-        machine_filter: str | None = None
-        if self._machine_key is not None:
-            machine_filter = f"machine eq {self._machine_key}"
+        machine_filter = self._scope_filter()
 
         combined: str | None
         if machine_filter and filter:
@@ -242,10 +248,11 @@ class MachineNICManager(ResourceManager[NIC]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -319,10 +326,15 @@ class NICManager(ResourceManager[NIC]):
     def _to_model(self, data: dict[str, Any]) -> NIC:
         return NIC(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"machine eq {self.machine_key}"
+
     def list(  # type: ignore[override]  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> list[NIC]:
         """List NICs for this VM.
@@ -330,6 +342,7 @@ class NICManager(ResourceManager[NIC]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -339,7 +352,7 @@ class NICManager(ResourceManager[NIC]):
             fields = self._default_fields
 
         # Build filter for this VM's machine
-        machine_filter = f"machine eq {self.machine_key}"
+        machine_filter = self._scope_filter()
         if filter:
             machine_filter = f"{machine_filter} and ({filter})"
 
@@ -354,10 +367,11 @@ class NICManager(ResourceManager[NIC]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -190,12 +190,19 @@ class NodeMemoryManager(ResourceManager[NodeMemory]):
     def _to_model(self, data: dict[str, Any]) -> NodeMemory:
         return NodeMemory(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeMemory]:
         """List node memory DIMMs with optional filtering.
@@ -205,6 +212,7 @@ class NodeMemoryManager(ResourceManager[NodeMemory]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -216,8 +224,9 @@ class NodeMemoryManager(ResourceManager[NodeMemory]):
         if filter:
             filters.append(filter)
 
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
@@ -240,10 +249,11 @@ class NodeMemoryManager(ResourceManager[NodeMemory]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
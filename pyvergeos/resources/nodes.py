@@ -1007,6 +1007,11 @@ class NodeDriverManager(ResourceManager[NodeDriver]):
     def _to_model(self, data: dict[str, Any]) -> NodeDriver:
         return NodeDriver(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -1016,6 +1021,7 @@ class NodeDriverManager(ResourceManager[NodeDriver]):
         *,
         driver_name: str | None = None,
         status: Literal["Installed", "Verifying", "Error"] | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeDriver]:
         """List node drivers with optional filtering.
@@ -1027,6 +1033,7 @@ class NodeDriverManager(ResourceManager[NodeDriver]):
             offset: Skip this many results.
             driver_name: Filter by driver name (contains).
             status: Filter by status (Installed, Verifying, Error).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1049,8 +1056,9 @@ class NodeDriverManager(ResourceManager[NodeDriver]):
             filters.append(filter)
 
         # Scope to node if configured
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if driver_name is not None:
             escaped = driver_name.replace("'", "''")
@@ -1088,10 +1096,11 @@ class NodeDriverManager(ResourceManager[NodeDriver]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1185,6 +1194,11 @@ class NodePCIDeviceManager(ResourceManager[NodePCIDevice]):
     def _to_model(self, data: dict[str, Any]) -> NodePCIDevice:
         return NodePCIDevice(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -1195,6 +1209,7 @@ class NodePCIDeviceManager(ResourceManager[NodePCIDevice]):
         device_type: Literal["GPU", "Network", "Storage"] | None = None,
         device_class: str | None = None,
         vendor: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodePCIDevice]:
         """List PCI devices with optional filtering.
@@ -1207,6 +1222,7 @@ class NodePCIDeviceManager(ResourceManager[NodePCIDevice]):
             device_type: Filter by device type (GPU, Network, Storage).
             device_class: Filter by device class (contains).
             vendor: Filter by vendor name (contains).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1229,8 +1245,9 @@ class NodePCIDeviceManager(ResourceManager[NodePCIDevice]):
             filters.append(filter)
 
         # Scope to node if configured
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         # Device type filter (maps to device_type code)
         if device_type is not None:
@@ -1273,10 +1290,11 @@ class NodePCIDeviceManager(ResourceManager[NodePCIDevice]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1350,6 +1368,11 @@ class NodeUSBDeviceManager(ResourceManager[NodeUSBDevice]):
     def _to_model(self, data: dict[str, Any]) -> NodeUSBDevice:
         return NodeUSBDevice(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -1359,6 +1382,7 @@ class NodeUSBDeviceManager(ResourceManager[NodeUSBDevice]):
         *,
         vendor: str | None = None,
         model: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeUSBDevice]:
         """List USB devices with optional filtering.
@@ -1370,6 +1394,7 @@ class NodeUSBDeviceManager(ResourceManager[NodeUSBDevice]):
             offset: Skip this many results.
             vendor: Filter by vendor name (contains).
             model: Filter by model name (contains).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1389,8 +1414,9 @@ class NodeUSBDeviceManager(ResourceManager[NodeUSBDevice]):
             filters.append(filter)
 
         # Scope to node if configured
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if vendor is not None:
             escaped = vendor.replace("'", "''")
@@ -1423,10 +1449,11 @@ class NodeUSBDeviceManager(ResourceManager[NodeUSBDevice]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1511,6 +1538,11 @@ class NodeSriovNicDeviceManager(ResourceManager[NodeSriovNicDevice]):
     def _to_model(self, data: dict[str, Any]) -> NodeSriovNicDevice:
         return NodeSriovNicDevice(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -1520,6 +1552,7 @@ class NodeSriovNicDeviceManager(ResourceManager[NodeSriovNicDevice]):
         *,
         vendor: str | None = None,
         physical_function: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[NodeSriovNicDevice]:
         """List SR-IOV NIC devices with optional filtering.
@@ -1531,6 +1564,7 @@ class NodeSriovNicDeviceManager(ResourceManager[NodeSriovNicDevice]):
             offset: Skip this many results.
             vendor: Filter by vendor name (contains).
             physical_function: Filter by physical function slot (exact match).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1555,8 +1589,9 @@ class NodeSriovNicDeviceManager(ResourceManager[NodeSriovNicDevice]):
             filters.append(filter)
 
         # Scope to node if configured
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if vendor is not None:
             escaped = vendor.replace("'", "''")
@@ -1589,10 +1624,11 @@ class NodeSriovNicDeviceManager(ResourceManager[NodeSriovNicDevice]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1715,6 +1751,7 @@ class NodeManager(ResourceManager[Node]):
         name: str | None = None,
         cluster: str | None = None,
         maintenance: bool | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Node]:
         """List nodes with optional filtering.
@@ -1727,6 +1764,7 @@ class NodeManager(ResourceManager[Node]):
             name: Filter by node name.
             cluster: Filter by cluster name.
             maintenance: Filter by maintenance mode status.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1783,10 +1821,11 @@ class NodeManager(ResourceManager[Node]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
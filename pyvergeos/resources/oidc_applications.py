@@ -121,6 +121,11 @@ class OidcApplicationUserManager(ResourceManager["OidcApplicationUser"]):
         super().__init__(client)
         self._application_key = application_key
 
+    def _scope_filter(self) -> str | None:
+        if self._application_key is None:
+            return None
+        return f"oidc_application eq {self._application_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -128,6 +133,8 @@ class OidcApplicationUserManager(ResourceManager["OidcApplicationUser"]):
         limit: int | None = None,
         offset: int | None = None,
         oidc_application: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[OidcApplicationUser]:
         """List allowed users with optional filtering.
@@ -138,6 +145,7 @@ class OidcApplicationUserManager(ResourceManager["OidcApplicationUser"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             oidc_application: Filter by application key. Ignored if scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -152,13 +160,12 @@ class OidcApplicationUserManager(ResourceManager["OidcApplicationUser"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add application filter
-        app_key = self._application_key
-        if app_key is None and oidc_application is not None:
-            app_key = oidc_application
-
-        if app_key is not None:
-            filters.append(f"oidc_application eq {app_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if oidc_application is not None and self._application_key is None:
+            filters.append(f"oidc_application eq {oidc_application}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -181,7 +188,8 @@ class OidcApplicationUserManager(ResourceManager["OidcApplicationUser"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -335,6 +343,11 @@ class OidcApplicationGroupManager(ResourceManager["OidcApplicationGroup"]):
         super().__init__(client)
         self._application_key = application_key
 
+    def _scope_filter(self) -> str | None:
+        if self._application_key is None:
+            return None
+        return f"oidc_application eq {self._application_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -342,6 +355,8 @@ class OidcApplicationGroupManager(ResourceManager["OidcApplicationGroup"]):
         limit: int | None = None,
         offset: int | None = None,
         oidc_application: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[OidcApplicationGroup]:
         """List allowed groups with optional filtering.
@@ -352,6 +367,7 @@ class OidcApplicationGroupManager(ResourceManager["OidcApplicationGroup"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             oidc_application: Filter by application key. Ignored if scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -366,13 +382,12 @@ class OidcApplicationGroupManager(ResourceManager["OidcApplicationGroup"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add application filter
-        app_key = self._application_key
-        if app_key is None and oidc_application is not None:
-            app_key = oidc_application
-
-        if app_key is not None:
-            filters.append(f"oidc_application eq {app_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if oidc_application is not None and self._application_key is None:
+            filters.append(f"oidc_application eq {oidc_application}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -395,7 +410,8 @@ class OidcApplicationGroupManager(ResourceManager["OidcApplicationGroup"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -548,6 +564,11 @@ class OidcApplicationLogManager(ResourceManager["OidcApplicationLog"]):
         super().__init__(client)
         self._application_key = application_key
 
+    def _scope_filter(self) -> str | None:
+        if self._application_key is None:
+            return None
+        return f"oidc_application eq {self._application_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -556,6 +577,8 @@ class OidcApplicationLogManager(ResourceManager["OidcApplicationLog"]):
         offset: int | None = None,
         oidc_application: int | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[OidcApplicationLog]:
         """List logs with optional filtering.
@@ -567,6 +590,7 @@ class OidcApplicationLogManager(ResourceManager["OidcApplicationLog"]):
             offset: Skip this many results.
             oidc_application: Filter by application key. Ignored if scoped.
             level: Filter by log level.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -581,13 +605,12 @@ class OidcApplicationLogManager(ResourceManager["OidcApplicationLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add application filter
-        app_key = self._application_key
-        if app_key is None and oidc_application is not None:
-            app_key = oidc_application
-
-        if app_key is not None:
-            filters.append(f"oidc_application eq {app_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if oidc_application is not None and self._application_key is None:
+            filters.append(f"oidc_application eq {oidc_application}")
 
         # Add level filter
         if level is not None:
@@ -617,7 +640,8 @@ class OidcApplicationLogManager(ResourceManager["OidcApplicationLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -945,6 +969,8 @@ class OidcApplicationManager(ResourceManager["OidcApplication"]):
         limit: int | None = None,
         offset: int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[OidcApplication]:
         """List OIDC applications with optional filtering.
@@ -955,6 +981,7 @@ class OidcApplicationManager(ResourceManager["OidcApplication"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -1006,7 +1033,8 @@ class OidcApplicationManager(ResourceManager["OidcApplication"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
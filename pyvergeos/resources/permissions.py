@@ -219,6 +219,8 @@ class PermissionManager(ResourceManager[Permission]):
         group: int | Group | None = None,
         identity_key: int | None = None,
         table: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Permission]:
         """List permissions with optional filtering.
@@ -232,6 +234,7 @@ class PermissionManager(ResourceManager[Permission]):
             group: Group key or Group object to filter by.
             identity_key: Identity key to filter by directly.
             table: Resource table name to filter by (e.g., 'vms', 'vnets').
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -293,7 +296,8 @@ class PermissionManager(ResourceManager[Permission]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -267,6 +267,11 @@ class PhysicalDriveManager(ResourceManager[PhysicalDrive]):
     def _to_model(self, data: dict[str, Any]) -> PhysicalDrive:
         return PhysicalDrive(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._node_key is None:
+            return None
+        return f"node eq {self._node_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -275,6 +280,7 @@ class PhysicalDriveManager(ResourceManager[PhysicalDrive]):
         offset: int | None = None,
         *,
         warnings_only: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[PhysicalDrive]:
         """List physical drives with optional filtering.
@@ -285,6 +291,7 @@ class PhysicalDriveManager(ResourceManager[PhysicalDrive]):
             limit: Maximum number of results.
             offset: Skip this many results.
             warnings_only: If True, only return drives with SMART warnings.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -296,8 +303,9 @@ class PhysicalDriveManager(ResourceManager[PhysicalDrive]):
         if filter:
             filters.append(filter)
 
-        if self._node_key is not None:
-            filters.append(f"node eq {self._node_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if warnings_only:
             warn_conditions = [
@@ -331,10 +339,11 @@ class PhysicalDriveManager(ResourceManager[PhysicalDrive]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import builtins
 import logging
-import time
 from typing import TYPE_CHECKING, Any, Literal
 
 from pyvergeos.exceptions import NotFoundError, VergeTimeoutError
+from pyvergeos.polling import poll_until
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -218,12 +218,17 @@ class QueryManager(ResourceManager[QueryResult]):
     def _to_model(self, data: dict[str, Any]) -> QueryResult:
         return QueryResult(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"{self._parent_field} eq {self._parent_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[QueryResult]:
         """List queries for this parent resource.
@@ -233,6 +238,7 @@ class QueryManager(ResourceManager[QueryResult]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
 
         Returns:
             List of QueryResult objects.
@@ -240,7 +246,7 @@ class QueryManager(ResourceManager[QueryResult]):
         if fields is None:
             fields = QUERY_DEFAULT_FIELDS
 
-        parent_filter = f"{self._parent_field} eq {self._parent_key}"
+        parent_filter = self._scope_filter()
         if filter:
             parent_filter = f"{parent_filter} and ({filter})"
 
@@ -256,9 +262,10 @@ class QueryManager(ResourceManager[QueryResult]):
         response = self._client._request("GET", self._endpoint, params=params)
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -345,7 +352,7 @@ class QueryManager(ResourceManager[QueryResult]):
         Args:
             key: Query $key to poll (SHA1 string or integer).
             timeout: Maximum seconds to wait.
-            poll_interval: Seconds between polls.
+            poll_interval: Longest wait between polls.
 
         Returns:
             Completed QueryResult.
@@ -353,16 +360,15 @@ class QueryManager(ResourceManager[QueryResult]):
         Raises:
             VergeTimeoutError: If query doesn't complete within timeout.
         """
-        deadline = time.monotonic() + timeout
-        while True:
-            result = self.get(key)
-            if result.status in ("complete", "error"):
-                return result
-            if time.monotonic() >= deadline:
-                raise VergeTimeoutError(
-                    f"Query {key} did not complete within {timeout}s (status: {result.status})"
-                )
-            time.sleep(poll_interval)
+        return poll_until(
+            lambda: self.get(key),
+            lambda result: result.status in ("complete", "error"),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_timeout=lambda result: VergeTimeoutError(
+                f"Query {key} did not complete within {timeout}s (status: {result.status})"
+            ),
+        )
 
     def run(
         self,
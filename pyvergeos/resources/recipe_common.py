@@ -223,6 +223,14 @@ class RecipeQuestionManager(ResourceManager["RecipeQuestion"]):
         self._recipe_ref = recipe_ref
         self._section_key = section_key
 
+    def _scope_filter(self) -> str | None:
+        filters: builtins.list[str] = []
+        if self._recipe_ref is not None:
+            filters.append(f"recipe eq '{self._recipe_ref}'")
+        if self._section_key is not None:
+            filters.append(f"section eq {self._section_key}")
+        return " and ".join(filters) or None
+
     def list(
         self,
         filter: str | None = None,
@@ -232,6 +240,8 @@ class RecipeQuestionManager(ResourceManager["RecipeQuestion"]):
         recipe_ref: str | None = None,
         section: int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[RecipeQuestion]:
         """List recipe questions with optional filtering.
@@ -244,6 +254,7 @@ class RecipeQuestionManager(ResourceManager["RecipeQuestion"]):
             recipe_ref: Filter by recipe reference (e.g., "vm_recipes/{id}").
             section: Filter by section key.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, type, etc.).
 
         Returns:
@@ -267,21 +278,15 @@ class RecipeQuestionManager(ResourceManager["RecipeQuestion"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe = self._recipe_ref
-        if recipe is None and recipe_ref is not None:
-            recipe = recipe_ref
-
-        if recipe is not None:
-            filters.append(f"recipe eq '{recipe}'")
-
-        # Add section filter (from scope or parameter)
-        sect = self._section_key
-        if sect is None and section is not None:
-            sect = section
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if recipe_ref is not None and self._recipe_ref is None:
+            filters.append(f"recipe eq '{recipe_ref}'")
 
-        if sect is not None:
-            filters.append(f"section eq {sect}")
+        if section is not None and self._section_key is None:
+            filters.append(f"section eq {section}")
 
         # Add enabled filter
         if enabled is not None:
@@ -313,7 +318,8 @@ class RecipeQuestionManager(ResourceManager["RecipeQuestion"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -638,6 +644,11 @@ class RecipeSectionManager(ResourceManager["RecipeSection"]):
         super().__init__(client)
         self._recipe_ref = recipe_ref
 
+    def _scope_filter(self) -> str | None:
+        if self._recipe_ref is None:
+            return None
+        return f"recipe eq '{self._recipe_ref}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -645,6 +656,8 @@ class RecipeSectionManager(ResourceManager["RecipeSection"]):
         limit: int | None = None,
         offset: int | None = None,
         recipe_ref: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[RecipeSection]:
         """List recipe sections with optional filtering.
@@ -655,6 +668,7 @@ class RecipeSectionManager(ResourceManager["RecipeSection"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             recipe_ref: Filter by recipe reference (e.g., "vm_recipes/{id}").
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -675,13 +689,12 @@ class RecipeSectionManager(ResourceManager["RecipeSection"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe = self._recipe_ref
-        if recipe is None and recipe_ref is not None:
-            recipe = recipe_ref
-
-        if recipe is not None:
-            filters.append(f"recipe eq '{recipe}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if recipe_ref is not None and self._recipe_ref is None:
+            filters.append(f"recipe eq '{recipe_ref}'")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -709,7 +722,8 @@ class RecipeSectionManager(ResourceManager["RecipeSection"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
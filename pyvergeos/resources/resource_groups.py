@@ -266,6 +266,8 @@ class ResourceGroupManager(ResourceManager[ResourceGroup]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[ResourceGroup]:
         """List resource groups with optional filtering.
@@ -275,6 +277,7 @@ class ResourceGroupManager(ResourceManager[ResourceGroup]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -296,7 +299,12 @@ class ResourceGroupManager(ResourceManager[ResourceGroup]):
             fields = self._default_fields
 
         return super().list(
-            filter=filter, fields=fields, limit=limit, offset=offset, **filter_kwargs
+            filter=filter,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            compact=compact,
+            **filter_kwargs,
         )
 
     def get(
@@ -1042,6 +1050,15 @@ class ResourceRuleManager(ResourceManager[ResourceRule]):
     def _to_model(self, data: dict[str, Any]) -> ResourceRule:
         return ResourceRule(data, self)
 
+    def _scope_filter(self) -> str | None:
+        if self._resource_group_key is None:
+            return None
+        # Resource groups use UUID strings, which need quotes in filters
+        rg_key = str(self._resource_group_key)
+        if "-" in rg_key:  # UUID format needs quotes
+            return f"resource_group eq '{rg_key}'"
+        return f"resource_group eq {rg_key}"  # Integer key (for backwards compatibility)
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -1051,6 +1068,7 @@ class ResourceRuleManager(ResourceManager[ResourceRule]):
         *,
         node_key: int | None = None,
         enabled_only: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[ResourceRule]:
         """List resource rules.
@@ -1062,6 +1080,7 @@ class ResourceRuleManager(ResourceManager[ResourceRule]):
             offset: Skip this many results.
             node_key: Filter by node.
             enabled_only: Only return enabled rules.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1075,13 +1094,9 @@ class ResourceRuleManager(ResourceManager[ResourceRule]):
         if filter:
             filters.append(filter)
 
-        if self._resource_group_key is not None:
-            # Resource groups use UUID strings, which need quotes in filters
-            rg_key = str(self._resource_group_key)
-            if "-" in rg_key:  # UUID format needs quotes
-                filters.append(f"resource_group eq '{rg_key}'")
-            else:  # Integer key (for backwards compatibility)
-                filters.append(f"resource_group eq {rg_key}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
 
         if node_key is not None:
             filters.append(f"node eq {node_key}")
@@ -1108,10 +1123,11 @@ class ResourceRuleManager(ResourceManager[ResourceRule]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(
         self,
@@ -267,12 +267,17 @@ class BGPRouterCommandManager(ResourceManager[BGPRouterCommand]):
         data["_router_key"] = self._router.key
         return BGPRouterCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"bgp_router eq {self._router.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPRouterCommand]:
         """List commands for this BGP router.
@@ -282,6 +287,7 @@ class BGPRouterCommandManager(ResourceManager[BGPRouterCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -290,7 +296,7 @@ class BGPRouterCommandManager(ResourceManager[BGPRouterCommand]):
         params: dict[str, Any] = {}
 
         # Always filter by parent router
-        filters = [f"bgp_router eq {self._router.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -310,9 +316,10 @@ class BGPRouterCommandManager(ResourceManager[BGPRouterCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -519,12 +526,17 @@ class BGPRouterManager(ResourceManager[BGPRouter]):
         data["_network_key"] = self._routing_manager._network.key
         return BGPRouter(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPRouter]:
         """List BGP routers for this network.
@@ -534,18 +546,18 @@ class BGPRouterManager(ResourceManager[BGPRouter]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of BGPRouter objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -565,9 +577,10 @@ class BGPRouterManager(ResourceManager[BGPRouter]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -729,12 +742,17 @@ class BGPInterfaceCommandManager(ResourceManager[BGPInterfaceCommand]):
         data["_interface_key"] = self._interface.key
         return BGPInterfaceCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"bgp_interface eq {self._interface.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPInterfaceCommand]:
         """List commands for this interface.
@@ -744,6 +762,7 @@ class BGPInterfaceCommandManager(ResourceManager[BGPInterfaceCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -751,7 +770,7 @@ class BGPInterfaceCommandManager(ResourceManager[BGPInterfaceCommand]):
         """
         params: dict[str, Any] = {}
 
-        filters = [f"bgp_interface eq {self._interface.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -771,9 +790,10 @@ class BGPInterfaceCommandManager(ResourceManager[BGPInterfaceCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -979,12 +999,17 @@ class BGPInterfaceManager(ResourceManager[BGPInterface]):
         data["_network_key"] = self._routing_manager._network.key
         return BGPInterface(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPInterface]:
         """List BGP interfaces for this network.
@@ -994,18 +1019,18 @@ class BGPInterfaceManager(ResourceManager[BGPInterface]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of BGPInterface objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -1025,9 +1050,10 @@ class BGPInterfaceManager(ResourceManager[BGPInterface]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -1240,12 +1266,17 @@ class BGPRouteMapCommandManager(ResourceManager[BGPRouteMapCommand]):
         data["_routemap_key"] = self._routemap.key
         return BGPRouteMapCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"bgp_routemap eq {self._routemap.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPRouteMapCommand]:
         """List commands for this route map.
@@ -1255,6 +1286,7 @@ class BGPRouteMapCommandManager(ResourceManager[BGPRouteMapCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1262,7 +1294,7 @@ class BGPRouteMapCommandManager(ResourceManager[BGPRouteMapCommand]):
         """
         params: dict[str, Any] = {}
 
-        filters = [f"bgp_routemap eq {self._routemap.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -1282,9 +1314,10 @@ class BGPRouteMapCommandManager(ResourceManager[BGPRouteMapCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1483,12 +1516,17 @@ class BGPRouteMapManager(ResourceManager[BGPRouteMap]):
         data["_network_key"] = self._routing_manager._network.key
         return BGPRouteMap(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPRouteMap]:
         """List route maps for this network.
@@ -1498,18 +1536,18 @@ class BGPRouteMapManager(ResourceManager[BGPRouteMap]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of BGPRouteMap objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -1529,9 +1567,10 @@ class BGPRouteMapManager(ResourceManager[BGPRouteMap]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1735,12 +1774,17 @@ class BGPIPCommandManager(ResourceManager[BGPIPCommand]):
         data["_network_key"] = self._routing_manager._network.key
         return BGPIPCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[BGPIPCommand]:
         """List IP commands for this network.
@@ -1750,18 +1794,18 @@ class BGPIPCommandManager(ResourceManager[BGPIPCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of BGPIPCommand objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -1781,9 +1825,10 @@ class BGPIPCommandManager(ResourceManager[BGPIPCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -1975,12 +2020,17 @@ class OSPFCommandManager(ResourceManager[OSPFCommand]):
         data["_network_key"] = self._routing_manager._network.key
         return OSPFCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[OSPFCommand]:
         """List OSPF commands for this network.
@@ -1990,18 +2040,18 @@ class OSPFCommandManager(ResourceManager[OSPFCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of OSPFCommand objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -2021,9 +2071,10 @@ class OSPFCommandManager(ResourceManager[OSPFCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -2228,12 +2279,17 @@ class EIGRPRouterCommandManager(ResourceManager[EIGRPRouterCommand]):
         data["_router_key"] = self._router.key
         return EIGRPRouterCommand(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"eigrp_router eq {self._router.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[EIGRPRouterCommand]:
         """List commands for this EIGRP router.
@@ -2243,6 +2299,7 @@ class EIGRPRouterCommandManager(ResourceManager[EIGRPRouterCommand]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -2250,7 +2307,7 @@ class EIGRPRouterCommandManager(ResourceManager[EIGRPRouterCommand]):
         """
         params: dict[str, Any] = {}
 
-        filters = [f"eigrp_router eq {self._router.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -2270,9 +2327,10 @@ class EIGRPRouterCommandManager(ResourceManager[EIGRPRouterCommand]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -2480,12 +2538,17 @@ class EIGRPRouterManager(ResourceManager[EIGRPRouter]):
         data["_network_key"] = self._routing_manager._network.key
         return EIGRPRouter(data, self)
 
+    def _scope_filter(self) -> str:
+        return self._routing_manager._bgp_filter()
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[EIGRPRouter]:
         """List EIGRP routers for this network.
@@ -2495,18 +2558,18 @@ class EIGRPRouterManager(ResourceManager[EIGRPRouter]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of EIGRPRouter objects.
         """
-        bgp_key = self._routing_manager._get_bgp_config()
-        if bgp_key is None:
+        if self._routing_manager._get_bgp_config() is None:
             return []
 
         params: dict[str, Any] = {}
 
-        filters = [f"bgp eq {bgp_key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -2526,9 +2589,10 @@ class EIGRPRouterManager(ResourceManager[EIGRPRouter]):
 
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -2780,6 +2844,14 @@ class NetworkRoutingManager:
 
         return self._bgp_key
 
+    def _bgp_filter(self) -> str:
+        """Return the filter selecting rows of this network's BGP configuration."""
+        bgp_key = self._get_bgp_config()
+        if bgp_key is None:
+            # Not configured yet, so no rows can belong to it
+            return f"bgp#vnet eq {self._network.key}"
+        return f"bgp eq {bgp_key}"
+
     @property
     def bgp_routers(self) -> BGPRouterManager:
         """Access BGP routers for this network.
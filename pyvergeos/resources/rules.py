@@ -224,6 +224,9 @@ class NetworkRuleManager(ResourceManager[NetworkRule]):
     def _to_model(self, data: dict[str, Any]) -> NetworkRule:
         return NetworkRule(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self.network_key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,
@@ -232,6 +235,8 @@ class NetworkRuleManager(ResourceManager[NetworkRule]):
         action: Action | None = None,
         protocol: Protocol | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[NetworkRule]:
         """List firewall rules for this network.
@@ -243,6 +248,7 @@ class NetworkRuleManager(ResourceManager[NetworkRule]):
             action: Filter by action (accept/drop/reject/translate/route).
             protocol: Filter by protocol (tcp/udp/tcpudp/icmp/any).
             enabled: Filter by enabled status.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -252,7 +258,7 @@ class NetworkRuleManager(ResourceManager[NetworkRule]):
             fields = self._default_fields.copy()
 
         # Build filter for this network
-        filters: builtins.list[str] = [f"vnet eq {self.network_key}"]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if direction:
             filters.append(f"direction eq '{direction}'")
@@ -282,10 +288,11 @@ class NetworkRuleManager(ResourceManager[NetworkRule]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -7,7 +7,9 @@ import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
-from pyvergeos.exceptions import NotFoundError
+from pyvergeos.constants import POLL_INTERVAL_FAST, READY_TIMEOUT
+from pyvergeos.exceptions import NotFoundError, VergeTimeoutError
+from pyvergeos.polling import poll_until
 
 if TYPE_CHECKING:
     from pyvergeos.client import VergeClient
@@ -326,6 +328,8 @@ class SharedObjectManager:
             ValueError: If tenant or VM not specified.
             NotFoundError: If VM not found by name.
             APIError: If snapshot or shared object creation fails.
+            VergeTimeoutError: If the snapshot is not ready in time (it is
+                deleted again).
 
         Example:
             >>> # Share by tenant key and VM key
@@ -345,7 +349,6 @@ class SharedObjectManager:
             ... )
         """
         import random
-        import time
 
         # Resolve tenant_key
         if tenant is not None:
@@ -394,10 +397,10 @@ class SharedObjectManager:
         if not snapshot_key:
             raise ValueError("Machine snapshot created but no key returned")
 
-        # Brief delay to ensure snapshot is ready
-        time.sleep(1)
-
         try:
+            # Wait until the snapshot has its snapshot machine
+            self._wait_for_snapshot(int(snapshot_key))
+
             # Step 2: Create the shared object with the snapshot
             shared_body: dict[str, Any] = {
                 "recipient": tenant_key,
@@ -426,6 +429,20 @@ class SharedObjectManager:
                 self._client._request("DELETE", f"machine_snapshots/{snapshot_key}")
             raise
 
+    def _wait_for_snapshot(self, key: int) -> None:
+        """Wait until a new machine snapshot is ready to be shared."""
+        poll_until(
+            lambda: self._client._request(
+                "GET", f"machine_snapshots/{key}", params={"fields": "$key,snap_machine"}
+            ),
+            lambda snapshot: isinstance(snapshot, dict) and bool(snapshot.get("snap_machine")),
+            timeout=READY_TIMEOUT,
+            poll_interval=POLL_INTERVAL_FAST,
+            on_timeout=lambda _: VergeTimeoutError(
+                f"Machine snapshot {key} was not ready within {READY_TIMEOUT} seconds"
+            ),
+        )
+
     def import_object(self, key: int) -> dict[str, Any] | None:
         """Import a shared object into the tenant.
 
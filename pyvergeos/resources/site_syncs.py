@@ -761,6 +761,7 @@ class SiteSyncOutgoingManager(ResourceManager[SiteSyncOutgoing]):
         site_key: int | None = None,
         site_name: str | None = None,
         enabled: bool | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SiteSyncOutgoing]:
         """List outgoing site syncs.
@@ -773,6 +774,7 @@ class SiteSyncOutgoingManager(ResourceManager[SiteSyncOutgoing]):
             site_key: Filter by site key.
             site_name: Filter by site name (looks up site key).
             enabled: Filter by enabled status.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -828,10 +830,11 @@ class SiteSyncOutgoingManager(ResourceManager[SiteSyncOutgoing]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_enabled(
         self,
@@ -1373,6 +1376,7 @@ class SiteSyncIncomingManager(ResourceManager[SiteSyncIncoming]):
         site_key: int | None = None,
         site_name: str | None = None,
         enabled: bool | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SiteSyncIncoming]:
         """List incoming site syncs.
@@ -1385,6 +1389,7 @@ class SiteSyncIncomingManager(ResourceManager[SiteSyncIncoming]):
             site_key: Filter by site key.
             site_name: Filter by site name (looks up site key).
             enabled: Filter by enabled status.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1440,10 +1445,11 @@ class SiteSyncIncomingManager(ResourceManager[SiteSyncIncoming]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_for_site(
         self,
@@ -1743,6 +1749,7 @@ class SiteSyncScheduleManager(ResourceManager[SiteSyncSchedule]):
         *,
         sync_key: int | None = None,
         sync_name: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SiteSyncSchedule]:
         """List site sync schedules.
@@ -1754,6 +1761,7 @@ class SiteSyncScheduleManager(ResourceManager[SiteSyncSchedule]):
             offset: Skip this many results.
             sync_key: Filter by outgoing sync key.
             sync_name: Filter by outgoing sync name.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1803,10 +1811,11 @@ class SiteSyncScheduleManager(ResourceManager[SiteSyncSchedule]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_for_sync(
         self,
@@ -340,6 +340,7 @@ class SiteManager(ResourceManager[Site]):
         *,
         enabled: bool | None = None,
         status: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Site]:
         """List sites.
@@ -351,6 +352,7 @@ class SiteManager(ResourceManager[Site]):
             offset: Skip this many results.
             enabled: Filter by enabled status.
             status: Filter by status (idle, authenticating, syncing, error, warning).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -401,10 +403,11 @@ class SiteManager(ResourceManager[Site]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_enabled(
         self,
@@ -399,12 +399,17 @@ class SnapshotProfilePeriodManager(ResourceManager[SnapshotProfilePeriod]):
     def _to_model(self, data: dict[str, Any]) -> SnapshotProfilePeriod:
         return SnapshotProfilePeriod(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"profile eq {self._profile_key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SnapshotProfilePeriod]:
         """List periods for this profile.
@@ -414,12 +419,13 @@ class SnapshotProfilePeriodManager(ResourceManager[SnapshotProfilePeriod]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
             List of SnapshotProfilePeriod objects.
         """
-        conditions: builtins.list[str] = [f"profile eq {self._profile_key}"]
+        conditions: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             conditions.append(f"({filter})")
@@ -446,10 +452,11 @@ class SnapshotProfilePeriodManager(ResourceManager[SnapshotProfilePeriod]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -699,6 +706,7 @@ class SnapshotProfileManager(ResourceManager[SnapshotProfile]):
         offset: int | None = None,
         *,
         include_periods: bool = False,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SnapshotProfile]:
         """List snapshot profiles.
@@ -709,11 +717,16 @@ class SnapshotProfileManager(ResourceManager[SnapshotProfile]):
             limit: Maximum number of results.
             offset: Skip this many results.
             include_periods: If True, include schedule periods for each profile.
+            compact: Return compact read-only records instead of resource
+                objects. Cannot be combined with include_periods.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
             List of SnapshotProfile objects sorted by name.
 
+        Raises:
+            ValueError: If compact is combined with include_periods.
+
         Example:
             >>> # All profiles
             >>> profiles = client.snapshot_profiles.list()
@@ -723,6 +736,9 @@ class SnapshotProfileManager(ResourceManager[SnapshotProfile]):
             >>> for profile in profiles:
             ...     print(f"{profile.name}: {len(profile.periods or [])} periods")
         """
+        if compact and include_periods:
+            raise ValueError("compact cannot be combined with include_periods")
+
         conditions: builtins.list[str] = []
 
         if filter:
@@ -755,6 +771,10 @@ class SnapshotProfileManager(ResourceManager[SnapshotProfile]):
         if not isinstance(response, list):
             response = [response]
 
+        if compact:
+            to_model = self._model_func(compact)
+            return [to_model(item) for item in response]
+
         profiles: builtins.list[SnapshotProfile] = []
         for item in response:
             profile_periods = None
@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 import builtins
-import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.bulk import task_key_of
+from pyvergeos.constants import POLL_INTERVAL, TASK_WAIT_TIMEOUT
+from pyvergeos.exceptions import VergeTimeoutError
+from pyvergeos.polling import poll_until
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
     from pyvergeos.client import VergeClient
     from pyvergeos.resources.vms import VM
 
-logger = logging.getLogger(__name__)
-
 # Default fields for snapshots
 SNAPSHOT_DEFAULT_FIELDS = [
     "$key",
@@ -31,6 +32,42 @@ SNAPSHOT_DEFAULT_FIELDS = [
 ]
 
 
+def _power_on_when_ready(
+    client: VergeClient, result: Any, vm_key: int, timeout: int = TASK_WAIT_TIMEOUT
+) -> None:
+    """Power on a VM once the restore or clone that produced it has finished.
+
+    Waits for the task named in the action response. If the response names
+    no task, waits until the VM's machine status is idle (stopped) instead.
+    """
+    task_key = task_key_of(result)
+    if task_key is not None:
+        client.tasks.wait(task_key, timeout=timeout)
+    else:
+        _wait_for_idle_machine(client, vm_key, timeout)
+    client._request("POST", "vm_actions", json_data={"vm": vm_key, "action": "poweron"})
+
+
+def _wait_for_idle_machine(client: VergeClient, vm_key: int, timeout: int) -> None:
+    """Wait until a VM's machine status is stopped."""
+
+    def machine_status() -> str | None:
+        response = client._request(
+            "GET", f"vms/{vm_key}", params={"fields": "$key,machine#status#status as status"}
+        )
+        return response.get("status") if isinstance(response, dict) else None
+
+    poll_until(
+        machine_status,
+        lambda status: status == "stopped",
+        timeout=timeout,
+        poll_interval=POLL_INTERVAL,
+        on_timeout=lambda status: VergeTimeoutError(
+            f"VM {vm_key} was not idle within {timeout} seconds (status: {status})"
+        ),
+    )
+
+
 class VMSnapshot(ResourceObject):
     """VM Snapshot resource object."""
 
@@ -78,15 +115,29 @@ class VMSnapshot(ResourceObject):
         """Check if this is a cloud snapshot."""
         return bool(self.get("snapshot_period"))
 
-    def restore(self, name: str | None = None, power_on: bool = False) -> dict[str, Any] | None:
+    def restore(
+        self,
+        name: str | None = None,
+        power_on: bool = False,
+        timeout: int = TASK_WAIT_TIMEOUT,
+    ) -> dict[str, Any] | None:
         """Restore this snapshot to a new VM.
 
         Args:
             name: Name for the restored VM (default: "{snapshot_name} restored").
-            power_on: Power on the VM after restoration.
+            power_on: Power on the VM once the clone has finished.
+            timeout: Maximum seconds to wait for the clone before powering
+                on (only used with ``power_on``).
 
         Returns:
             Clone task information.
+
+        Raises:
+            TaskError: If ``power_on`` is set and the clone task fails.
+            TaskTimeoutError: If ``power_on`` is set and the clone task is
+                still running after ``timeout``.
+            VergeTimeoutError: If ``power_on`` is set, the response names no
+                task and the VM is not idle after ``timeout``.
         """
         snap_key = self.snap_machine_key
         if snap_key is None:
@@ -105,14 +156,7 @@ class VMSnapshot(ResourceObject):
         if power_on and result and isinstance(result, dict):
             new_vm_key = result.get("$key") or result.get("key")
             if new_vm_key:
-                import time
-
-                time.sleep(2)
-                self._manager._client._request(
-                    "POST",
-                    "vm_actions",
-                    json_data={"vm": new_vm_key, "action": "poweron"},
-                )
+                _power_on_when_ready(self._manager._client, result, int(new_vm_key), timeout)
 
         return result if isinstance(result, dict) else None
 
@@ -141,10 +185,15 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
     def _to_model(self, data: dict[str, Any]) -> VMSnapshot:
         return VMSnapshot(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"machine eq {self.machine_key}"
+
     def list(  # type: ignore[override]  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
         fields: list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> list[VMSnapshot]:
         """List snapshots for this VM.
@@ -152,6 +201,7 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -161,7 +211,7 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
             fields = self._default_fields
 
         # Build filter for this VM's machine
-        machine_filter = f"machine eq {self.machine_key}"
+        machine_filter = self._scope_filter()
         if filter:
             machine_filter = f"{machine_filter} and ({filter})"
 
@@ -176,10 +226,11 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -284,6 +335,7 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
         name: str | None = None,
         replace_original: bool = False,
         power_on: bool = False,
+        timeout: int = TASK_WAIT_TIMEOUT,
     ) -> dict[str, Any] | None:
         """Restore a snapshot.
 
@@ -292,10 +344,19 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
             name: Name for the restored VM (only for clone mode).
             replace_original: If True, revert original VM to snapshot state.
                               WARNING: All changes since snapshot will be lost.
-            power_on: Power on VM after restoration.
+            power_on: Power on VM once the restore has finished.
+            timeout: Maximum seconds to wait for the restore before powering
+                on (only used with ``power_on``).
 
         Returns:
             Restore task information.
+
+        Raises:
+            TaskError: If ``power_on`` is set and the restore task fails.
+            TaskTimeoutError: If ``power_on`` is set and the restore task is
+                still running after ``timeout``.
+            VergeTimeoutError: If ``power_on`` is set, the response names no
+                task and the VM is not idle after ``timeout``.
         """
         snapshot = self.get(key)
         snap_machine_key = snapshot.snap_machine_key
@@ -339,14 +400,7 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
             result = self._client._request("POST", "vm_actions", json_data=body)
 
             if power_on and result:
-                import time
-
-                time.sleep(2)
-                self._client._request(
-                    "POST",
-                    "vm_actions",
-                    json_data={"vm": self._vm.key, "action": "poweron"},
-                )
+                _power_on_when_ready(self._client, result, self._vm.key, timeout)
 
             return result if isinstance(result, dict) else None
         else:
@@ -364,13 +418,6 @@ class VMSnapshotManager(ResourceManager[VMSnapshot]):
             if power_on and result and isinstance(result, dict):
                 new_vm_key = result.get("$key") or result.get("key")
                 if new_vm_key:
-                    import time
-
-                    time.sleep(2)
-                    self._client._request(
-                        "POST",
-                        "vm_actions",
-                        json_data={"vm": new_vm_key, "action": "poweron"},
-                    )
+                    _power_on_when_ready(self._client, result, int(new_vm_key), timeout)
 
             return result if isinstance(result, dict) else None
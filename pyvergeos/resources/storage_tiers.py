@@ -193,6 +193,8 @@ class StorageTierManager(ResourceManager[StorageTier]):
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         include_stats: bool = True,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[StorageTier]:
         """List all storage tiers.
@@ -201,6 +203,7 @@ class StorageTierManager(ResourceManager[StorageTier]):
             filter: OData filter string.
             fields: List of fields to return.
             include_stats: Include I/O statistics (default True).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -227,7 +230,7 @@ class StorageTierManager(ResourceManager[StorageTier]):
                 "stats[reads,writes,read_bytes,write_bytes,rops,wops,rbps,wbps]",
             ]
 
-        return super().list(filter=filter, fields=fields, **filter_kwargs)
+        return super().list(filter=filter, fields=fields, compact=compact, **filter_kwargs)
 
     def get(  # type: ignore[override]
         self,
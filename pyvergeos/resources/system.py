@@ -103,6 +103,8 @@ class SettingsManager(ResourceManager[SystemSetting]):
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         key_contains: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SystemSetting]:
         """List system settings.
@@ -111,6 +113,7 @@ class SettingsManager(ResourceManager[SystemSetting]):
             filter: OData filter string.
             fields: List of fields to return.
             key_contains: Filter settings where key contains this string.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -135,7 +138,7 @@ class SettingsManager(ResourceManager[SystemSetting]):
 
         combined_filter = " and ".join(filters) if filters else None
 
-        return super().list(filter=combined_filter, fields=fields, **filter_kwargs)
+        return super().list(filter=combined_filter, fields=fields, compact=compact, **filter_kwargs)
 
     def get(  # type: ignore[override]
         self,
@@ -413,6 +416,8 @@ class LicenseManager(ResourceManager[License]):
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         name: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[License]:
         """List licenses.
@@ -421,6 +426,7 @@ class LicenseManager(ResourceManager[License]):
             filter: OData filter string.
             fields: List of fields to return.
             name: Filter by license name (supports wildcards).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -457,7 +463,7 @@ class LicenseManager(ResourceManager[License]):
 
         combined_filter = " and ".join(filters) if filters else None
 
-        return super().list(filter=combined_filter, fields=fields, **filter_kwargs)
+        return super().list(filter=combined_filter, fields=fields, compact=compact, **filter_kwargs)
 
     def get(
         self,
@@ -1365,7 +1371,7 @@ class SystemDiagnostic(ResourceObject):
 
         Args:
             timeout: Maximum time to wait in seconds.
-            poll_interval: Time between status checks in seconds.
+            poll_interval: Longest time between status checks in seconds.
 
         Returns:
             The completed SystemDiagnostic object.
@@ -1373,23 +1379,18 @@ class SystemDiagnostic(ResourceObject):
         Raises:
             TaskTimeoutError: If timeout is reached before completion.
         """
-        import time
-
         from pyvergeos.exceptions import TaskTimeoutError
-
-        start_time = time.time()
-        while True:
-            current = self.refresh()
-            if current.is_complete or current.has_error:
-                return current
-
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise TaskTimeoutError(
-                    f"Diagnostic build did not complete within {timeout} seconds"
-                )
-
-            time.sleep(poll_interval)
+        from pyvergeos.polling import poll_until
+
+        return poll_until(
+            self.refresh,
+            lambda current: current.is_complete or current.has_error,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_timeout=lambda _: TaskTimeoutError(
+                f"Diagnostic build did not complete within {timeout} seconds"
+            ),
+        )
 
     def delete(self) -> None:
         """Delete this diagnostic report."""
@@ -1440,6 +1441,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
         offset: int | None = None,
         *,
         status: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[SystemDiagnostic]:
         """List system diagnostic reports.
@@ -1450,6 +1452,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
             limit: Maximum number of results.
             offset: Skip this many results.
             status: Filter by status (initializing, building, complete, error).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1486,6 +1489,7 @@ class SystemDiagnosticManager(ResourceManager[SystemDiagnostic]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
@@ -1783,6 +1787,8 @@ class RootCertificateManager(ResourceManager[RootCertificate]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[RootCertificate]:
         """List trusted root certificates.
@@ -1792,6 +1798,7 @@ class RootCertificateManager(ResourceManager[RootCertificate]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -1818,6 +1825,7 @@ class RootCertificateManager(ResourceManager[RootCertificate]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
@@ -136,6 +136,9 @@ class TagMemberManager(ResourceManager[TagMember]):
         """Convert API response to TagMember object."""
         return TagMember(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tag eq {self._tag_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -143,6 +146,8 @@ class TagMemberManager(ResourceManager[TagMember]):
         limit: int | None = None,
         offset: int | None = None,
         resource_type: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TagMember]:
         """List members of this tag.
@@ -153,6 +158,7 @@ class TagMemberManager(ResourceManager[TagMember]):
             limit: Maximum number of results.
             offset: Skip this many results.
             resource_type: Filter by resource type (vms, vnets, tenants, etc.).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -169,7 +175,7 @@ class TagMemberManager(ResourceManager[TagMember]):
         params: dict[str, Any] = {}
 
         # Build filter - always filter by parent tag
-        filters: builtins.list[str] = [f"tag eq {self._tag_key}"]
+        filters: builtins.list[str] = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -198,7 +204,8 @@ class TagMemberManager(ResourceManager[TagMember]):
         if not isinstance(response, list):
             response = [response]
 
-        result = [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        result = [to_model(item) for item in response if item]
 
         # Filter by resource type if specified
         if resource_type:
@@ -590,6 +597,8 @@ class TagManager(ResourceManager[Tag]):
         offset: int | None = None,
         category_key: int | None = None,
         category_name: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Tag]:
         """List tags with optional filtering.
@@ -601,6 +610,7 @@ class TagManager(ResourceManager[Tag]):
             offset: Skip this many results.
             category_key: Filter by category key.
             category_name: Filter by category name (performs lookup).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -659,7 +669,8 @@ class TagManager(ResourceManager[Tag]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -1064,6 +1075,8 @@ class TagCategoryManager(ResourceManager[TagCategory]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TagCategory]:
         """List tag categories with optional filtering.
@@ -1073,6 +1086,7 @@ class TagCategoryManager(ResourceManager[TagCategory]):
             fields: List of fields to return (uses defaults if not specified).
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -1118,7 +1132,8 @@ class TagCategoryManager(ResourceManager[TagCategory]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
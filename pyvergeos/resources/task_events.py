@@ -203,6 +203,59 @@ class TaskEventManager(ResourceManager[TaskEvent]):
     def _to_model(self, data: dict[str, Any]) -> TaskEvent:
         return TaskEvent(data, self)
 
+    def _scope_filter(self) -> str | None:
+        filters: builtins.list[str] = []
+        if self._task_key is not None:
+            filters.append(f"task eq {self._task_key}")
+        if self._owner_key is not None:
+            filters.append(f"owner eq {self._owner_key}")
+        return " and ".join(filters) or None
+
+    def _list_params(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        *,
+        task: int | None = None,
+        owner: int | None = None,
+        table: str | None = None,
+        event: str | None = None,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters with the scope and event-specific filters."""
+        params: dict[str, Any] = {}
+
+        # Build filter conditions
+        filters: builtins.list[str] = []
+
+        if filter:
+            filters.append(f"({filter})")
+
+        # Use scoped key or parameter
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if task is not None and self._task_key is None:
+            filters.append(f"task eq {task}")
+        if owner is not None and self._owner_key is None:
+            filters.append(f"owner eq {owner}")
+
+        if table is not None:
+            filters.append(f"table eq '{table}'")
+
+        if event is not None:
+            filters.append(f"event eq '{event}'")
+
+        if filter_kwargs:
+            filters.append(build_filter(**filter_kwargs))
+
+        if filters:
+            params["filter"] = " and ".join(filters)
+
+        # Use default fields if not specified
+        params["fields"] = ",".join(fields or self._default_fields)
+        return params
+
     def list(
         self,
         filter: str | None = None,
@@ -214,6 +267,7 @@ class TaskEventManager(ResourceManager[TaskEvent]):
         owner: int | None = None,
         table: str | None = None,
         event: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TaskEvent]:
         """List task events with optional filtering.
@@ -227,6 +281,8 @@ class TaskEventManager(ResourceManager[TaskEvent]):
             owner: Filter by owner resource key. Ignored if manager is scoped.
             table: Filter by owner table name.
             event: Filter by event identifier.
+            compact: Return compact read-only records (same properties as
+                TaskEvent, a fraction of the memory) for large result sets.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -245,40 +301,9 @@ class TaskEventManager(ResourceManager[TaskEvent]):
             >>> # Events for a specific event type
             >>> events = client.task_events.list(event="poweron")
         """
-        params: dict[str, Any] = {}
-
-        # Build filter conditions
-        filters: builtins.list[str] = []
-
-        if filter:
-            filters.append(f"({filter})")
-
-        # Use scoped key or parameter
-        task_filter = self._task_key if self._task_key is not None else task
-        if task_filter is not None:
-            filters.append(f"task eq {task_filter}")
-
-        owner_filter = self._owner_key if self._owner_key is not None else owner
-        if owner_filter is not None:
-            filters.append(f"owner eq {owner_filter}")
-
-        if table is not None:
-            filters.append(f"table eq '{table}'")
-
-        if event is not None:
-            filters.append(f"event eq '{event}'")
-
-        if filter_kwargs:
-            filters.append(build_filter(**filter_kwargs))
-
-        if filters:
-            params["filter"] = " and ".join(filters)
-
-        # Use default fields if not specified
-        if fields:
-            params["fields"] = ",".join(fields)
-        else:
-            params["fields"] = ",".join(self._default_fields)
+        params = self._list_params(
+            filter, fields, task=task, owner=owner, table=table, event=event, **filter_kwargs
+        )
 
         # Pagination
         if limit is not None:
@@ -287,14 +312,15 @@ class TaskEventManager(ResourceManager[TaskEvent]):
             params["offset"] = offset
 
         response = self._client._request("GET", self._endpoint, params=params)
+        to_model = self._model_func(compact)
 
         if response is None:
             return []
 
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
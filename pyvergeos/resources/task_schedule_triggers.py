@@ -155,6 +155,14 @@ class TaskScheduleTriggerManager(ResourceManager[TaskScheduleTrigger]):
     def _to_model(self, data: dict[str, Any]) -> TaskScheduleTrigger:
         return TaskScheduleTrigger(data, self)
 
+    def _scope_filter(self) -> str | None:
+        filters: builtins.list[str] = []
+        if self._task_key is not None:
+            filters.append(f"task eq {self._task_key}")
+        if self._schedule_key is not None:
+            filters.append(f"schedule eq {self._schedule_key}")
+        return " and ".join(filters) or None
+
     def list(
         self,
         filter: str | None = None,
@@ -164,6 +172,7 @@ class TaskScheduleTriggerManager(ResourceManager[TaskScheduleTrigger]):
         *,
         task: int | None = None,
         schedule: int | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TaskScheduleTrigger]:
         """List task schedule triggers with optional filtering.
@@ -175,6 +184,7 @@ class TaskScheduleTriggerManager(ResourceManager[TaskScheduleTrigger]):
             offset: Skip this many results.
             task: Filter by task key. Ignored if manager is scoped to a task.
             schedule: Filter by schedule key. Ignored if manager is scoped to a schedule.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -199,13 +209,13 @@ class TaskScheduleTriggerManager(ResourceManager[TaskScheduleTrigger]):
             filters.append(f"({filter})")
 
         # Use scoped key or parameter
-        task_filter = self._task_key if self._task_key is not None else task
-        if task_filter is not None:
-            filters.append(f"task eq {task_filter}")
-
-        schedule_filter = self._schedule_key if self._schedule_key is not None else schedule
-        if schedule_filter is not None:
-            filters.append(f"schedule eq {schedule_filter}")
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if task is not None and self._task_key is None:
+            filters.append(f"task eq {task}")
+        if schedule is not None and self._schedule_key is None:
+            filters.append(f"schedule eq {schedule}")
 
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
@@ -230,10 +240,11 @@ class TaskScheduleTriggerManager(ResourceManager[TaskScheduleTrigger]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -326,6 +326,7 @@ class TaskScheduleManager(ResourceManager[TaskSchedule]):
         enabled: bool | None = None,
         repeat_every: str | None = None,
         name: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TaskSchedule]:
         """List task schedules with optional filtering.
@@ -338,6 +339,7 @@ class TaskScheduleManager(ResourceManager[TaskSchedule]):
             enabled: Filter by enabled state.
             repeat_every: Filter by repeat interval.
             name: Filter by name.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -399,10 +401,11 @@ class TaskScheduleManager(ResourceManager[TaskSchedule]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
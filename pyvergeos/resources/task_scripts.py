@@ -135,6 +135,7 @@ class TaskScriptManager(ResourceManager[TaskScript]):
         offset: int | None = None,
         *,
         name: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TaskScript]:
         """List task scripts with optional filtering.
@@ -145,6 +146,7 @@ class TaskScriptManager(ResourceManager[TaskScript]):
             limit: Maximum number of results.
             offset: Skip this many results.
             name: Filter by name.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -197,10 +199,11 @@ class TaskScriptManager(ResourceManager[TaskScript]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -48,19 +48,29 @@ Example:
 from __future__ import annotations
 
 import builtins
+import concurrent.futures
+import threading
 import time
-from typing import TYPE_CHECKING, Any
+from collections.abc import Generator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from pyvergeos.constants import POLL_INTERVAL, TASK_WAIT_TIMEOUT
-from pyvergeos.exceptions import NotFoundError, TaskError, TaskTimeoutError
+from pyvergeos.bulk import task_key_of
+from pyvergeos.constants import POLL_INITIAL_INTERVAL, POLL_INTERVAL, TASK_WAIT_TIMEOUT
+from pyvergeos.exceptions import NotFoundError, TaskError, TaskTimeoutError, WaitCancelledError
 from pyvergeos.filters import build_filter
+from pyvergeos.polling import Poller
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
     from pyvergeos.client import VergeClient
+    from pyvergeos.futures import TaskFuture, TaskWatcher
     from pyvergeos.resources.task_events import TaskEventManager
     from pyvergeos.resources.task_schedule_triggers import TaskScheduleTriggerManager
+    from pyvergeos.webhook_receiver import TaskEventReceiver
 
+#: When ``TaskManager.wait_many`` returns: after every task, after the first
+#: finished task(s), or one task at a time as each finishes
+WaitCondition = Literal["all", "first", "each"]
 
 # Default fields to request for task list operations
 _DEFAULT_LIST_FIELDS = [
@@ -272,15 +282,18 @@ class Task(ResourceObject):
     def wait(
         self,
         timeout: int = TASK_WAIT_TIMEOUT,
-        poll_interval: int = POLL_INTERVAL,
+        poll_interval: float = POLL_INTERVAL,
         raise_on_error: bool = True,
+        *,
+        cancel: threading.Event | None = None,
     ) -> Task:
         """Wait for this task to complete.
 
         Args:
             timeout: Maximum wait time in seconds (0 = infinite).
-            poll_interval: Seconds between status checks.
+            poll_interval: Longest wait between status checks.
             raise_on_error: Raise TaskError if task fails.
+            cancel: Event that stops the wait when set.
 
         Returns:
             Completed Task object.
@@ -288,6 +301,7 @@ class Task(ResourceObject):
         Raises:
             TaskTimeoutError: If timeout exceeded.
             TaskError: If task fails and raise_on_error=True.
+            WaitCancelledError: If ``cancel`` is set first.
         """
         from typing import cast
 
@@ -297,8 +311,19 @@ class Task(ResourceObject):
             timeout=timeout,
             poll_interval=poll_interval,
             raise_on_error=raise_on_error,
+            cancel=cancel,
         )
 
+    def future(self, raise_on_error: bool = True) -> TaskFuture:
+        """Return a future that resolves when this task finishes.
+
+        See :meth:`TaskManager.future`.
+        """
+        from typing import cast
+
+        manager = cast("TaskManager", self._manager)
+        return manager.future(self.key, raise_on_error=raise_on_error)
+
 
 class TaskManager(ResourceManager[Task]):
     """Manager for Task operations with wait functionality.
@@ -331,10 +356,74 @@ class TaskManager(ResourceManager[Task]):
 
     def __init__(self, client: VergeClient) -> None:
         super().__init__(client)
+        self._watcher: TaskWatcher | None = None
+        self._watcher_lock = threading.Lock()
+        self._receiver: TaskEventReceiver | None = None
 
     def _to_model(self, data: dict[str, Any]) -> Task:
         return Task(data, self)
 
+    @property
+    def watcher(self) -> TaskWatcher:
+        """Background poller shared by all TaskFutures of this client."""
+        with self._watcher_lock:
+            if self._watcher is None:
+                from pyvergeos.futures import TaskWatcher
+
+                self._watcher = TaskWatcher(self)
+            return self._watcher
+
+    @property
+    def receiver(self) -> TaskEventReceiver | None:
+        """Running webhook receiver that pushes task events, if any.
+
+        See :mod:`pyvergeos.webhook_receiver`.
+        """
+        return self._receiver
+
+    def future(
+        self,
+        ref: int | Task | dict[str, Any] | None,
+        *,
+        raise_on_error: bool = True,
+    ) -> TaskFuture:
+        """Return a future that resolves when a task finishes.
+
+        The future's result is the finished Task. All futures of the client
+        are polled together by one background thread (see
+        :mod:`pyvergeos.futures`), so many operations can run at once
+        without a thread per wait.
+
+        Args:
+            ref: Task $key, Task object, or an action response that
+                references a task (such as the dict returned by
+                ``vm.clone()`` or ``vm.migrate()``).
+            raise_on_error: Resolve the future with TaskError if the task
+                fails. When False, the failed Task is the result.
+
+        Returns:
+            TaskFuture for the task.
+
+        Raises:
+            ValueError: If ``ref`` does not reference a task.
+
+        Example:
+            >>> from pyvergeos.futures import as_completed
+            >>> futures = [client.tasks.future(vm.migrate()) for vm in vms]
+            >>> for future in as_completed(futures):
+            ...     print(f"task {future.key}: {future.result().status}")
+        """
+        response = ref if isinstance(ref, dict) and not isinstance(ref, Task) else None
+        if isinstance(ref, Task):
+            key: int | None = ref.key
+        elif isinstance(ref, dict):
+            key = task_key_of(ref)
+        else:
+            key = ref
+        if key is None:
+            raise ValueError(f"No task referenced by {ref!r}")
+        return self.watcher.watch(int(key), response, raise_on_error=raise_on_error)
+
     def list(
         self,
         filter: str | None = None,
@@ -346,6 +435,7 @@ class TaskManager(ResourceManager[Task]):
         running: bool | None = None,
         enabled: bool | None = None,
         name: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Task]:
         """List tasks with optional filtering.
@@ -359,6 +449,7 @@ class TaskManager(ResourceManager[Task]):
             running: If True, filter for running tasks only.
             enabled: Filter by enabled state.
             name: Filter by name (supports partial match with 'ct' operator).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -429,10 +520,11 @@ class TaskManager(ResourceManager[Task]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def list_running(
         self,
@@ -546,18 +638,25 @@ class TaskManager(ResourceManager[Task]):
         self,
         key: int,
         timeout: int = TASK_WAIT_TIMEOUT,
-        poll_interval: int = POLL_INTERVAL,
+        poll_interval: float = POLL_INTERVAL,
         raise_on_error: bool = True,
+        *,
+        cancel: threading.Event | None = None,
     ) -> Task:
         """Wait for a task to complete.
 
-        Polls the task status until it becomes idle or an error occurs.
+        Polls the task status until it becomes idle or an error occurs. The
+        first check is immediate and the wait between checks grows up to
+        ``poll_interval`` (see :mod:`pyvergeos.polling`). While a
+        :attr:`receiver` is running, the wait is resolved by pushed task
+        events instead, and ``poll_interval`` is not used.
 
         Args:
             key: Task $key.
             timeout: Maximum wait time in seconds (0 = infinite).
-            poll_interval: Seconds between status checks.
+            poll_interval: Longest wait between status checks.
             raise_on_error: Raise TaskError if task fails.
+            cancel: Event that stops the wait when set.
 
         Returns:
             Completed Task object.
@@ -565,6 +664,7 @@ class TaskManager(ResourceManager[Task]):
         Raises:
             TaskTimeoutError: If timeout exceeded.
             TaskError: If task fails and raise_on_error=True.
+            WaitCancelledError: If ``cancel`` is set first.
 
         Example:
             >>> # Wait for task with 5 minute timeout
@@ -578,28 +678,189 @@ class TaskManager(ResourceManager[Task]):
             >>> if task.has_error:
             ...     print(f"Task failed: {task.get('error')}")
         """
-        start_time = time.time()
-
-        while True:
-            task = self.get(key)
+        if self._receiver is not None:
+            return self._wait_pushed(key, timeout, raise_on_error, cancel)
 
-            if task.is_complete:
-                return task
-
-            if task.has_error:
-                if raise_on_error:
+        with Poller(timeout or None, poll_interval, cancel=cancel) as poller:
+            for _ in poller:
+                task = self.get(key)
+                if task.has_error and raise_on_error:
                     error_msg = task.get("error", "Task failed")
                     raise TaskError(str(error_msg), task_id=key)
-                return task
+                if task.is_complete or task.has_error:
+                    poller.finish()
+                    return task
+        raise TaskTimeoutError(
+            f"Task {key} did not complete within {timeout} seconds",
+            task_id=key,
+        )
 
-            # Check timeout
-            if timeout > 0 and (time.time() - start_time) > timeout:
-                raise TaskTimeoutError(
-                    f"Task {key} did not complete within {timeout} seconds",
-                    task_id=key,
-                )
+    def _wait_pushed(
+        self,
+        key: int,
+        timeout: float,
+        raise_on_error: bool,
+        cancel: threading.Event | None,
+    ) -> Task:
+        """Wait for a task through the watcher, which task events wake."""
+        future = self.future(key, raise_on_error=raise_on_error)
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        try:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise WaitCancelledError("Wait cancelled")
+                # With a cancel event, check it between short waits
+                wait = POLL_INITIAL_INTERVAL if cancel is not None else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TaskTimeoutError(
+                            f"Task {key} did not complete within {timeout} seconds",
+                            task_id=key,
+                        )
+                    wait = remaining if wait is None else min(wait, remaining)
+                try:
+                    return future.result(wait)
+                except concurrent.futures.TimeoutError:
+                    continue
+        finally:
+            future.cancel()
+
+    @overload
+    def wait_many(
+        self,
+        keys: Iterable[int],
+        timeout: int = ...,
+        poll_interval: float = ...,
+        *,
+        return_when: Literal["all", "first"] = ...,
+        raise_on_error: bool = ...,
+        cancel: threading.Event | None = ...,
+    ) -> builtins.list[Task]: ...
+
+    @overload
+    def wait_many(
+        self,
+        keys: Iterable[int],
+        timeout: int = ...,
+        poll_interval: float = ...,
+        *,
+        return_when: Literal["each"],
+        raise_on_error: bool = ...,
+        cancel: threading.Event | None = ...,
+    ) -> Iterator[Task]: ...
 
-            time.sleep(poll_interval)
+    def wait_many(
+        self,
+        keys: Iterable[int],
+        timeout: int = TASK_WAIT_TIMEOUT,
+        poll_interval: float = POLL_INTERVAL,
+        *,
+        return_when: WaitCondition = "all",
+        raise_on_error: bool = True,
+        cancel: threading.Event | None = None,
+    ) -> builtins.list[Task] | Iterator[Task]:
+        """Wait for several tasks at once.
+
+        Every poll fetches all unfinished tasks with ``$key in (...)``
+        queries (see :meth:`get_many`), so waiting on hundreds of tasks
+        costs one or two requests per interval instead of one per task.
+
+        Args:
+            keys: Task $keys. Duplicates are waited on once.
+            timeout: Maximum wait time in seconds (0 = infinite).
+            poll_interval: Longest wait between status checks.
+            return_when: ``"all"`` returns every task once all have
+                finished, in the order of ``keys``. ``"first"`` returns the
+                tasks found finished by the first poll that finds any.
+                ``"each"`` returns an iterator that yields tasks as they
+                finish.
+            raise_on_error: Raise TaskError for the first failed task. When
+                False, failed tasks are returned like finished ones; check
+                ``has_error`` on each.
+            cancel: Event that stops the wait when set.
+
+        Returns:
+            Finished Task objects, or an iterator of them for ``"each"``.
+
+        Raises:
+            TaskTimeoutError: If tasks are still running after ``timeout``.
+                ``task_id`` is the first unfinished task.
+            TaskError: If a task fails and raise_on_error=True.
+            WaitCancelledError: If ``cancel`` is set first.
+            NotFoundError: If a task does not exist.
+            ValueError: If ``return_when`` is not a known condition.
+
+        Example:
+            >>> result = client.vms.action_many(vm_keys, "poweron")
+            >>> client.tasks.wait_many(result.task_keys.values(), timeout=900)
+
+            >>> for task in client.tasks.wait_many(keys, return_when="each"):
+            ...     print(f"{task.owner_display} done")
+        """
+        if return_when not in ("all", "first", "each"):
+            raise ValueError(f"Unknown return_when: {return_when!r}")
+        keys = builtins.list(dict.fromkeys(keys))
+        poller = Poller(timeout or None, poll_interval, cancel=cancel)
+        batches = self._finished_batches(
+            keys, poller, raise_on_error, yield_before_error=return_when == "each"
+        )
+
+        if return_when == "each":
+            return (task for batch in batches for task in batch)
+        if return_when == "first":
+            try:
+                return next(batches, [])
+            finally:
+                batches.close()
+
+        finished = {str(task.key): task for batch in batches for task in batch}
+        return [finished[str(key)] for key in keys]
+
+    def _finished_batches(
+        self,
+        keys: builtins.list[int],
+        poller: Poller,
+        raise_on_error: bool,
+        yield_before_error: bool = False,
+    ) -> Generator[builtins.list[Task], None, None]:
+        """Poll ``keys`` and yield the tasks each poll finds finished.
+
+        A poll that finds a failed task raises TaskError at once, unless
+        ``yield_before_error`` is set; then the tasks that finished cleanly
+        in that poll are yielded first.
+        """
+        pending = keys
+        if not pending:
+            return
+
+        with poller:
+            for _ in poller:
+                tasks = self.get_many(pending, fields=_DEFAULT_LIST_FIELDS)
+                finished = [task for task in tasks if task.is_complete or task.has_error]
+                failed = [task for task in finished if task.has_error] if raise_on_error else []
+                if failed:
+                    error_msg = failed[0].get("error", "Task failed")
+                    error = TaskError(str(error_msg), task_id=failed[0].key)
+                    if not yield_before_error:
+                        raise error
+                    finished = [task for task in finished if not task.has_error]
+                if finished:
+                    done = {str(task.key) for task in finished}
+                    pending = [key for key in pending if str(key) not in done]
+                    if not pending and not failed:
+                        poller.finish()
+                    yield finished
+                if failed:
+                    raise error
+                if not pending:
+                    return
+
+        raise TaskTimeoutError(
+            f"{len(pending)} of {len(keys)} tasks did not complete within "
+            f"{poller.timeout} seconds (pending: {pending[:10]})",
+            task_id=pending[0],
+        )
 
     def enable(self, key: int) -> Task:
         """Enable a task.
@@ -6,6 +6,7 @@ import builtins
 import logging
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -123,11 +124,16 @@ class TenantExternalIPManager(ResourceManager[TenantExternalIP]):
     def _to_model(self, data: dict[str, Any]) -> TenantExternalIP:
         return TenantExternalIP(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"owner eq 'tenants/{self._tenant.key}' and type eq 'virtual'"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         ip: str | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantExternalIP]:
         """List external IPs assigned to this tenant.
@@ -136,6 +142,7 @@ class TenantExternalIPManager(ResourceManager[TenantExternalIP]):
             filter: Additional OData filter string.
             fields: List of fields to return.
             ip: Filter by specific IP address.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -145,7 +152,7 @@ class TenantExternalIPManager(ResourceManager[TenantExternalIP]):
             fields = self._default_fields
 
         # Build filter for this tenant's virtual IPs
-        owner_filter = f"owner eq 'tenants/{self._tenant.key}' and type eq 'virtual'"
+        owner_filter = self._scope_filter()
         if ip:
             owner_filter = f"{owner_filter} and ip eq '{ip}'"
         if filter:
@@ -161,10 +168,11 @@ class TenantExternalIPManager(ResourceManager[TenantExternalIP]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -277,13 +285,12 @@ class TenantExternalIPManager(ResourceManager[TenantExternalIP]):
             body["description"] = description
 
         logger.debug(f"Assigning external IP '{ip}' to tenant '{self._tenant.name}'")
-        self._client._request("POST", self._endpoint, json_data=body)
-
-        # Fetch the created IP
-        import time
+        response = self._client._request("POST", self._endpoint, json_data=body)
 
-        time.sleep(0.5)  # Brief wait for API consistency
-        return self.get(ip=ip)
+        # Fetch the created IP, waiting for it to become visible
+        if isinstance(response, dict) and "$key" in response:
+            return self.get(int(response["$key"]))
+        return wait_until_found(lambda: self.get(ip=ip))
 
     def delete(self, key: int) -> None:
         """Remove an external IP assignment.
@@ -6,6 +6,7 @@ import builtins
 import logging
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -131,10 +132,15 @@ class TenantLayer2Manager(ResourceManager[TenantLayer2Network]):
     def _to_model(self, data: dict[str, Any]) -> TenantLayer2Network:
         return TenantLayer2Network(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tenant eq {self._tenant.key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantLayer2Network]:
         """List Layer 2 networks assigned to this tenant.
@@ -142,6 +148,7 @@ class TenantLayer2Manager(ResourceManager[TenantLayer2Network]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -151,7 +158,7 @@ class TenantLayer2Manager(ResourceManager[TenantLayer2Network]):
             fields = self._default_fields
 
         # Build filter for this tenant's L2 networks
-        tenant_filter = f"tenant eq {self._tenant.key}"
+        tenant_filter = self._scope_filter()
         if filter:
             tenant_filter = f"{tenant_filter} and ({filter})"
 
@@ -165,10 +172,11 @@ class TenantLayer2Manager(ResourceManager[TenantLayer2Network]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -293,23 +301,19 @@ class TenantLayer2Manager(ResourceManager[TenantLayer2Network]):
         if isinstance(response, dict) and "$key" in response:
             return self.get(response["$key"])
 
-        # Fallback: fetch by network name if we have it
-        import time
-
-        time.sleep(0.5)  # Brief wait for API consistency
-        if resolved_name:
-            return self.get(network_name=resolved_name)
+        from pyvergeos.exceptions import NotFoundError
 
-        # Last resort: get the most recently created L2 network for this tenant
-        l2_networks = self.list()
-        if l2_networks:
-            # Find the one matching our network key
-            for l2 in l2_networks:
+        def find_created() -> TenantLayer2Network:
+            # Fetch by network name if we have it, else by network key
+            if resolved_name:
+                return self.get(network_name=resolved_name)
+            for l2 in self.list():
                 if l2.network_key == net_key:
                     return l2
-        from pyvergeos.exceptions import NotFoundError
+            raise NotFoundError("Failed to retrieve created Layer 2 network")
 
-        raise NotFoundError("Failed to retrieve created Layer 2 network")
+        # Wait for the assignment to become visible
+        return wait_until_found(find_created)
 
     def update(self, key: int, enabled: bool) -> TenantLayer2Network:  # type: ignore[override]
         """Update a Layer 2 network assignment.
@@ -747,6 +747,8 @@ class TenantManager(ResourceManager[Tenant]):
         limit: int | None = None,
         offset: int | None = None,
         include_snapshots: bool = False,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Tenant]:
         """List tenants with optional filtering.
@@ -757,6 +759,7 @@ class TenantManager(ResourceManager[Tenant]):
             limit: Maximum number of results.
             offset: Skip this many results.
             include_snapshots: Include tenant snapshots (default False).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -776,9 +779,23 @@ class TenantManager(ResourceManager[Tenant]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
+    def _list_params(
+        self,
+        filter: str | None = None,  # noqa: A002
+        fields: builtins.list[str] | None = None,
+        include_snapshots: bool = False,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters, excluding snapshots like :meth:`list`."""
+        if not include_snapshots:
+            snapshot_filter = "is_snapshot eq false"
+            filter = f"({filter}) and {snapshot_filter}" if filter else snapshot_filter
+        return super()._list_params(filter=filter, fields=fields, **filter_kwargs)
+
     def get(
         self,
         key: int | None = None,
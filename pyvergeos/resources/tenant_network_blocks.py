@@ -6,6 +6,7 @@ import builtins
 import logging
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -126,11 +127,16 @@ class TenantNetworkBlockManager(ResourceManager[TenantNetworkBlock]):
     def _to_model(self, data: dict[str, Any]) -> TenantNetworkBlock:
         return TenantNetworkBlock(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"owner eq 'tenants/{self._tenant.key}'"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         cidr: str | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantNetworkBlock]:
         """List network blocks assigned to this tenant.
@@ -139,6 +145,7 @@ class TenantNetworkBlockManager(ResourceManager[TenantNetworkBlock]):
             filter: Additional OData filter string.
             fields: List of fields to return.
             cidr: Filter by specific CIDR block.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -148,7 +155,7 @@ class TenantNetworkBlockManager(ResourceManager[TenantNetworkBlock]):
             fields = self._default_fields
 
         # Build filter for this tenant's blocks
-        owner_filter = f"owner eq 'tenants/{self._tenant.key}'"
+        owner_filter = self._scope_filter()
         if cidr:
             owner_filter = f"{owner_filter} and cidr eq '{cidr}'"
         if filter:
@@ -164,10 +171,11 @@ class TenantNetworkBlockManager(ResourceManager[TenantNetworkBlock]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -275,13 +283,12 @@ class TenantNetworkBlockManager(ResourceManager[TenantNetworkBlock]):
             body["description"] = description
 
         logger.debug(f"Assigning network block '{cidr}' to tenant '{self._tenant.name}'")
-        self._client._request("POST", self._endpoint, json_data=body)
-
-        # Fetch the created block
-        import time
+        response = self._client._request("POST", self._endpoint, json_data=body)
 
-        time.sleep(0.5)  # Brief wait for API consistency
-        return self.get(cidr=cidr)
+        # Fetch the created block, waiting for it to become visible
+        if isinstance(response, dict) and "$key" in response:
+            return self.get(int(response["$key"]))
+        return wait_until_found(lambda: self.get(cidr=cidr))
 
     def delete(self, key: int) -> None:
         """Remove a network block assignment.
@@ -6,6 +6,7 @@ import builtins
 import logging
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -186,10 +187,15 @@ class TenantNodeManager(ResourceManager[TenantNode]):
     def _to_model(self, data: dict[str, Any]) -> TenantNode:
         return TenantNode(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tenant eq {self._tenant.key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantNode]:
         """List nodes for this tenant.
@@ -197,6 +203,7 @@ class TenantNodeManager(ResourceManager[TenantNode]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -206,7 +213,7 @@ class TenantNodeManager(ResourceManager[TenantNode]):
             fields = self._default_fields
 
         # Build filter for this tenant
-        tenant_filter = f"tenant eq {self._tenant.key}"
+        tenant_filter = self._scope_filter()
         if filter:
             tenant_filter = f"{tenant_filter} and ({filter})"
 
@@ -220,10 +227,11 @@ class TenantNodeManager(ResourceManager[TenantNode]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -296,6 +304,7 @@ class TenantNodeManager(ResourceManager[TenantNode]):
 
         Raises:
             ValueError: If tenant is a snapshot or invalid parameters.
+            APIError: If the created node cannot be identified.
         """
         if self._tenant.is_snapshot:
             raise ValueError("Cannot add nodes to a tenant snapshot")
@@ -341,17 +350,18 @@ class TenantNodeManager(ResourceManager[TenantNode]):
             if node_key:
                 return self.get(int(node_key))
 
-        # Fall back to listing and getting the latest
-        import time
-
-        time.sleep(0.5)
-        nodes = self.list()
-        if nodes:
-            return nodes[-1]
+        from pyvergeos.exceptions import APIError, NotFoundError
 
-        from pyvergeos.exceptions import APIError
+        # Without a $key only a name identifies the new node; other nodes of
+        # the tenant may already exist, so never guess
+        if not name:
+            raise APIError("Tenant node created but the response has no $key")
 
-        raise APIError("Failed to create tenant node")
+        # Fall back to looking it up by name, waiting for it to become visible
+        try:
+            return wait_until_found(lambda: self.get(name=name))
+        except NotFoundError:
+            raise APIError("Failed to create tenant node") from None
 
     def update(self, key: int, **kwargs: Any) -> TenantNode:
         """Update a node.
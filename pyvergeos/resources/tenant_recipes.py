@@ -327,6 +327,8 @@ class TenantRecipeManager(ResourceManager["TenantRecipe"]):
         offset: int | None = None,
         catalog: str | int | None = None,
         downloaded: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TenantRecipe]:
         """List tenant recipes with optional filtering.
@@ -338,6 +340,7 @@ class TenantRecipeManager(ResourceManager["TenantRecipe"]):
             offset: Skip this many results.
             catalog: Filter by catalog (key or name).
             downloaded: Filter by downloaded state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -414,7 +417,8 @@ class TenantRecipeManager(ResourceManager["TenantRecipe"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -650,6 +654,11 @@ class TenantRecipeInstanceManager(ResourceManager["TenantRecipeInstance"]):
         super().__init__(client)
         self._recipe_key = recipe_key
 
+    def _scope_filter(self) -> str | None:
+        if self._recipe_key is None:
+            return None
+        return f"recipe eq '{self._recipe_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -657,6 +666,8 @@ class TenantRecipeInstanceManager(ResourceManager["TenantRecipeInstance"]):
         limit: int | None = None,
         offset: int | None = None,
         recipe: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TenantRecipeInstance]:
         """List recipe instances with optional filtering.
@@ -667,6 +678,7 @@ class TenantRecipeInstanceManager(ResourceManager["TenantRecipeInstance"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             recipe: Filter by recipe key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -681,13 +693,12 @@ class TenantRecipeInstanceManager(ResourceManager["TenantRecipeInstance"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe_key = self._recipe_key
-        if recipe_key is None and recipe is not None:
-            recipe_key = recipe
-
-        if recipe_key is not None:
-            filters.append(f"recipe eq '{recipe_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if recipe is not None and self._recipe_key is None:
+            filters.append(f"recipe eq '{recipe}'")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -712,7 +723,8 @@ class TenantRecipeInstanceManager(ResourceManager["TenantRecipeInstance"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -845,6 +857,11 @@ class TenantRecipeLogManager(ResourceManager["TenantRecipeLog"]):
         super().__init__(client)
         self._recipe_key = recipe_key
 
+    def _scope_filter(self) -> str | None:
+        if self._recipe_key is None:
+            return None
+        return f"tenant_recipe eq '{self._recipe_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -853,6 +870,8 @@ class TenantRecipeLogManager(ResourceManager["TenantRecipeLog"]):
         offset: int | None = None,
         tenant_recipe: str | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TenantRecipeLog]:
         """List recipe logs with optional filtering.
@@ -864,6 +883,7 @@ class TenantRecipeLogManager(ResourceManager["TenantRecipeLog"]):
             offset: Skip this many results.
             tenant_recipe: Filter by recipe key. Ignored if manager is scoped.
             level: Filter by log level.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -878,13 +898,12 @@ class TenantRecipeLogManager(ResourceManager["TenantRecipeLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe_key = self._recipe_key
-        if recipe_key is None and tenant_recipe is not None:
-            recipe_key = tenant_recipe
-
-        if recipe_key is not None:
-            filters.append(f"tenant_recipe eq '{recipe_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if tenant_recipe is not None and self._recipe_key is None:
+            filters.append(f"tenant_recipe eq '{tenant_recipe}'")
 
         # Add level filter
         if level is not None:
@@ -916,7 +935,8 @@ class TenantRecipeLogManager(ResourceManager["TenantRecipeLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -7,6 +7,7 @@ import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -108,10 +109,15 @@ class TenantSnapshotManager(ResourceManager[TenantSnapshot]):
     def _to_model(self, data: dict[str, Any]) -> TenantSnapshot:
         return TenantSnapshot(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tenant eq {self._tenant.key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantSnapshot]:
         """List snapshots for this tenant.
@@ -119,6 +125,7 @@ class TenantSnapshotManager(ResourceManager[TenantSnapshot]):
         Args:
             filter: Additional OData filter string.
             fields: List of fields to return.
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -128,7 +135,7 @@ class TenantSnapshotManager(ResourceManager[TenantSnapshot]):
             fields = self._default_fields
 
         # Build filter for this tenant
-        tenant_filter = f"tenant eq {self._tenant.key}"
+        tenant_filter = self._scope_filter()
         if filter:
             tenant_filter = f"{tenant_filter} and ({filter})"
 
@@ -143,10 +150,11 @@ class TenantSnapshotManager(ResourceManager[TenantSnapshot]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -237,13 +245,12 @@ class TenantSnapshotManager(ResourceManager[TenantSnapshot]):
             body["expires"] = int(time.time()) + (expires_in_days * 86400)
 
         logger.debug(f"Creating tenant snapshot '{name}' for tenant '{self._tenant.name}'")
-        self._client._request("POST", self._endpoint, json_data=body)
-
-        # Fetch the created snapshot
-        import time
+        response = self._client._request("POST", self._endpoint, json_data=body)
 
-        time.sleep(0.5)  # Brief wait for API consistency
-        return self.get(name=name)
+        # Fetch the created snapshot, waiting for it to become visible
+        if isinstance(response, dict) and "$key" in response:
+            return self.get(int(response["$key"]))
+        return wait_until_found(lambda: self.get(name=name))
 
     def delete(self, key: int) -> None:
         """Delete a snapshot.
@@ -678,6 +678,9 @@ class TenantLogManager(ResourceManager[TenantLog]):
     def _to_model(self, data: dict[str, Any]) -> TenantLog:
         return TenantLog(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tenant eq {self._tenant_key}"
+
     def list(
         self,
         filter: str | None = None,  # noqa: A002
@@ -691,6 +694,7 @@ class TenantLogManager(ResourceManager[TenantLog]):
         warnings_only: bool = False,
         since: datetime | int | None = None,
         until: datetime | int | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[TenantLog]:
         """List tenant log entries.
@@ -705,6 +709,7 @@ class TenantLogManager(ResourceManager[TenantLog]):
             warnings_only: Only return warning logs.
             since: Return logs after this time (datetime or epoch microseconds).
             until: Return logs before this time (datetime or epoch microseconds).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -713,7 +718,7 @@ class TenantLogManager(ResourceManager[TenantLog]):
         if fields is None:
             fields = self._default_fields
 
-        filters = [f"tenant eq {self._tenant_key}"]
+        filters = [self._scope_filter()]
 
         if filter:
             filters.append(filter)
@@ -759,10 +764,11 @@ class TenantLogManager(ResourceManager[TenantLog]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if isinstance(response, list):
-            return [self._to_model(item) for item in response]
+            return [to_model(item) for item in response]
 
-        return [self._to_model(response)]
+        return [to_model(response)]
 
     def get(  # type: ignore[override]
         self,
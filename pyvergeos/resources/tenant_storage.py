@@ -7,6 +7,7 @@ import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pyvergeos.polling import wait_until_found
 from pyvergeos.resources.base import ResourceManager, ResourceObject
 
 if TYPE_CHECKING:
@@ -177,11 +178,16 @@ class TenantStorageManager(ResourceManager[TenantStorage]):
     def _to_model(self, data: dict[str, Any]) -> TenantStorage:
         return TenantStorage(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"tenant eq {self._tenant.key}"
+
     def list(  # type: ignore[override]
         self,
         filter: str | None = None,  # noqa: A002
         fields: builtins.list[str] | None = None,
         tier: int | None = None,
+        *,
+        compact: bool = False,
         **kwargs: Any,
     ) -> builtins.list[TenantStorage]:
         """List storage allocations for this tenant.
@@ -190,6 +196,7 @@ class TenantStorageManager(ResourceManager[TenantStorage]):
             filter: Additional OData filter string.
             fields: List of fields to return.
             tier: Filter by specific tier number (1-5).
+            compact: Return compact read-only records instead of resource objects.
             **kwargs: Additional filter arguments.
 
         Returns:
@@ -199,7 +206,7 @@ class TenantStorageManager(ResourceManager[TenantStorage]):
             fields = self._default_fields
 
         # Build filter for this tenant
-        tenant_filter = f"tenant eq {self._tenant.key}"
+        tenant_filter = self._scope_filter()
         if filter:
             tenant_filter = f"{tenant_filter} and ({filter})"
 
@@ -213,10 +220,11 @@ class TenantStorageManager(ResourceManager[TenantStorage]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            items = [self._to_model(response)]
+            items = [to_model(response)]
         else:
-            items = [self._to_model(item) for item in response]
+            items = [to_model(item) for item in response]
 
         # Filter by tier number if specified
         if tier is not None:
@@ -339,13 +347,12 @@ class TenantStorageManager(ResourceManager[TenantStorage]):
             f"Creating Tier {tier} storage allocation ({prov_bytes} bytes) "
             f"for tenant '{self._tenant.name}'"
         )
-        self._client._request("POST", self._endpoint, json_data=body)
-
-        # Fetch the created allocation
-        import time
+        response = self._client._request("POST", self._endpoint, json_data=body)
 
-        time.sleep(0.5)  # Brief wait for API consistency
-        return self.get(tier=tier)
+        # Fetch the created allocation, waiting for it to become visible
+        if isinstance(response, dict) and "$key" in response:
+            return self.get(int(response["$key"]))
+        return wait_until_found(lambda: self.get(tier=tier))
 
     def update(self, key: int, **kwargs: Any) -> TenantStorage:
         """Update a storage allocation.
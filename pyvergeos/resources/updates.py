@@ -124,6 +124,8 @@ class UpdateLogManager(ResourceManager["UpdateLog"]):
         limit: int | None = None,
         offset: int | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdateLog]:
         """List update logs with optional filtering.
@@ -134,6 +136,7 @@ class UpdateLogManager(ResourceManager["UpdateLog"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             level: Filter by log level (audit, message, warning, error, critical).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -178,7 +181,8 @@ class UpdateLogManager(ResourceManager["UpdateLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -302,6 +306,8 @@ class UpdateBranchManager(ResourceManager["UpdateBranch"]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdateBranch]:
         """List update branches with optional filtering.
@@ -311,6 +317,7 @@ class UpdateBranchManager(ResourceManager["UpdateBranch"]):
             fields: List of fields to return (uses defaults if not specified).
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -348,7 +355,8 @@ class UpdateBranchManager(ResourceManager["UpdateBranch"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -494,6 +502,11 @@ class UpdateSourceStatusManager(ResourceManager["UpdateSourceStatus"]):
         super().__init__(client)
         self._source_key = source_key
 
+    def _scope_filter(self) -> str | None:
+        if self._source_key is None:
+            return None
+        return f"source eq {self._source_key}"
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -501,6 +514,8 @@ class UpdateSourceStatusManager(ResourceManager["UpdateSourceStatus"]):
         limit: int | None = None,
         offset: int | None = None,
         source: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdateSourceStatus]:
         """List source status records with optional filtering.
@@ -511,6 +526,7 @@ class UpdateSourceStatusManager(ResourceManager["UpdateSourceStatus"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             source: Filter by source key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -525,13 +541,12 @@ class UpdateSourceStatusManager(ResourceManager["UpdateSourceStatus"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add source filter (from scope or parameter)
-        src_key = self._source_key
-        if src_key is None and source is not None:
-            src_key = source
-
-        if src_key is not None:
-            filters.append(f"source eq {src_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if source is not None and self._source_key is None:
+            filters.append(f"source eq {source}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -556,7 +571,8 @@ class UpdateSourceStatusManager(ResourceManager["UpdateSourceStatus"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -708,6 +724,14 @@ class UpdateSourcePackageManager(ResourceManager["UpdateSourcePackage"]):
         self._source_key = source_key
         self._branch_key = branch_key
 
+    def _scope_filter(self) -> str | None:
+        filters: builtins.list[str] = []
+        if self._source_key is not None:
+            filters.append(f"source eq {self._source_key}")
+        if self._branch_key is not None:
+            filters.append(f"branch eq {self._branch_key}")
+        return " and ".join(filters) or None
+
     def list(  # noqa: A003
         self,
         filter: str | None = None,  # noqa: A002
@@ -717,6 +741,8 @@ class UpdateSourcePackageManager(ResourceManager["UpdateSourcePackage"]):
         source: int | None = None,
         branch: int | None = None,
         downloaded: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdateSourcePackage]:
         """List source packages with optional filtering.
@@ -729,6 +755,7 @@ class UpdateSourcePackageManager(ResourceManager["UpdateSourcePackage"]):
             source: Filter by source key. Ignored if manager is scoped.
             branch: Filter by branch key. Ignored if manager is scoped.
             downloaded: Filter by download status.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -743,21 +770,15 @@ class UpdateSourcePackageManager(ResourceManager["UpdateSourcePackage"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add source filter (from scope or parameter)
-        src_key = self._source_key
-        if src_key is None and source is not None:
-            src_key = source
-
-        if src_key is not None:
-            filters.append(f"source eq {src_key}")
-
-        # Add branch filter (from scope or parameter)
-        br_key = self._branch_key
-        if br_key is None and branch is not None:
-            br_key = branch
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if source is not None and self._source_key is None:
+            filters.append(f"source eq {source}")
 
-        if br_key is not None:
-            filters.append(f"branch eq {br_key}")
+        if branch is not None and self._branch_key is None:
+            filters.append(f"branch eq {branch}")
 
         # Add downloaded filter
         if downloaded is not None:
@@ -786,7 +807,8 @@ class UpdateSourcePackageManager(ResourceManager["UpdateSourcePackage"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -967,6 +989,8 @@ class UpdateSourceManager(ResourceManager["UpdateSource"]):
         limit: int | None = None,
         offset: int | None = None,
         enabled: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdateSource]:
         """List update sources with optional filtering.
@@ -977,6 +1001,7 @@ class UpdateSourceManager(ResourceManager["UpdateSource"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             enabled: Filter by enabled state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1018,7 +1043,8 @@ class UpdateSourceManager(ResourceManager["UpdateSource"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -1312,6 +1338,8 @@ class UpdatePackageManager(ResourceManager["UpdatePackage"]):
         limit: int | None = None,
         offset: int | None = None,
         branch: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[UpdatePackage]:
         """List update packages with optional filtering.
@@ -1322,6 +1350,7 @@ class UpdatePackageManager(ResourceManager["UpdatePackage"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             branch: Filter by branch key.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -1363,7 +1392,8 @@ class UpdatePackageManager(ResourceManager["UpdatePackage"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -263,6 +263,50 @@ class UserManager(ResourceManager[User]):
         """Convert API response to User object."""
         return User(data, self)
 
+    def _list_params(
+        self,
+        filter: str | None = None,
+        fields: builtins.list[str] | None = None,
+        user_type: UserType | None = None,
+        enabled: bool | None = None,
+        include_system: bool = False,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters, excluding system users like :meth:`list`."""
+        params: dict[str, Any] = {}
+
+        # Build filter
+        filters: builtins.list[str] = []
+
+        # Exclude system user types by default
+        if not include_system:
+            filters.append("type ne 'site_sync'")
+            filters.append("type ne 'site_user'")
+
+        if filter:
+            filters.append(filter)
+        if filter_kwargs:
+            filters.append(build_filter(**filter_kwargs))
+
+        # Add user_type filter
+        if user_type is not None:
+            filters.append(f"type eq '{user_type}'")
+
+        # Add enabled filter
+        if enabled is not None:
+            filters.append(f"enabled eq {str(enabled).lower()}")
+
+        if filters:
+            params["filter"] = " and ".join(filters)
+
+        # Use default fields if not specified
+        if fields:
+            params["fields"] = ",".join(fields)
+        else:
+            params["fields"] = ",".join(self._default_fields)
+
+        return params
+
     def list(
         self,
         filter: str | None = None,
@@ -272,6 +316,8 @@ class UserManager(ResourceManager[User]):
         user_type: UserType | None = None,
         enabled: bool | None = None,
         include_system: bool = False,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[User]:
         """List users with optional filtering.
@@ -286,6 +332,7 @@ class UserManager(ResourceManager[User]):
             user_type: Filter by user type ('normal', 'api', 'vdi').
             enabled: Filter by enabled status.
             include_system: Include system user types (site_sync, site_user).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -304,37 +351,14 @@ class UserManager(ResourceManager[User]):
             >>> # List by name pattern (exact match)
             >>> users = client.users.list(name="admin")
         """
-        params: dict[str, Any] = {}
-
-        # Build filter
-        filters: builtins.list[str] = []
-
-        # Exclude system user types by default
-        if not include_system:
-            filters.append("type ne 'site_sync'")
-            filters.append("type ne 'site_user'")
-
-        if filter:
-            filters.append(filter)
-        if filter_kwargs:
-            filters.append(build_filter(**filter_kwargs))
-
-        # Add user_type filter
-        if user_type is not None:
-            filters.append(f"type eq '{user_type}'")
-
-        # Add enabled filter
-        if enabled is not None:
-            filters.append(f"enabled eq {str(enabled).lower()}")
-
-        if filters:
-            params["filter"] = " and ".join(filters)
-
-        # Use default fields if not specified
-        if fields:
-            params["fields"] = ",".join(fields)
-        else:
-            params["fields"] = ",".join(self._default_fields)
+        params = self._list_params(
+            filter,
+            fields,
+            user_type=user_type,
+            enabled=enabled,
+            include_system=include_system,
+            **filter_kwargs,
+        )
 
         # Pagination
         if limit is not None:
@@ -350,7 +374,8 @@ class UserManager(ResourceManager[User]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def list_enabled(self) -> builtins.list[User]:
         """List all enabled users.
@@ -238,6 +238,8 @@ class VmImportManager(ResourceManager["VmImport"]):
         limit: int | None = None,
         offset: int | None = None,
         status: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VmImport]:
         """List VM imports with optional filtering.
@@ -248,6 +250,7 @@ class VmImportManager(ResourceManager["VmImport"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             status: Filter by status (initializing, importing, complete, aborted, error).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -299,7 +302,8 @@ class VmImportManager(ResourceManager["VmImport"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -638,6 +642,11 @@ class VmImportLogManager(ResourceManager["VmImportLog"]):
         super().__init__(client)
         self._import_key = import_key
 
+    def _scope_filter(self) -> str | None:
+        if self._import_key is None:
+            return None
+        return f"vm_import eq '{self._import_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -646,6 +655,8 @@ class VmImportLogManager(ResourceManager["VmImportLog"]):
         offset: int | None = None,
         level: str | None = None,
         vm_import: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VmImportLog]:
         """List VM import logs with optional filtering.
@@ -657,6 +668,7 @@ class VmImportLogManager(ResourceManager["VmImportLog"]):
             offset: Skip this many results.
             level: Filter by log level (message, warning, error, critical, debug).
             vm_import: Filter by import key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -681,13 +693,12 @@ class VmImportLogManager(ResourceManager["VmImportLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add import filter (from scope or parameter)
-        import_key = self._import_key
-        if import_key is None and vm_import is not None:
-            import_key = vm_import
-
-        if import_key is not None:
-            filters.append(f"vm_import eq '{import_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if vm_import is not None and self._import_key is None:
+            filters.append(f"vm_import eq '{vm_import}'")
 
         # Add level filter
         if level:
@@ -716,7 +727,8 @@ class VmImportLogManager(ResourceManager["VmImportLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -338,6 +338,8 @@ class VmRecipeManager(ResourceManager["VmRecipe"]):
         offset: int | None = None,
         catalog: str | int | None = None,
         downloaded: bool | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VmRecipe]:
         """List VM recipes with optional filtering.
@@ -349,6 +351,7 @@ class VmRecipeManager(ResourceManager["VmRecipe"]):
             offset: Skip this many results.
             catalog: Filter by catalog (key or name).
             downloaded: Filter by downloaded state.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -425,7 +428,8 @@ class VmRecipeManager(ResourceManager["VmRecipe"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -659,6 +663,11 @@ class VmRecipeInstanceManager(ResourceManager["VmRecipeInstance"]):
         super().__init__(client)
         self._recipe_key = recipe_key
 
+    def _scope_filter(self) -> str | None:
+        if self._recipe_key is None:
+            return None
+        return f"recipe eq '{self._recipe_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -666,6 +675,8 @@ class VmRecipeInstanceManager(ResourceManager["VmRecipeInstance"]):
         limit: int | None = None,
         offset: int | None = None,
         recipe: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VmRecipeInstance]:
         """List recipe instances with optional filtering.
@@ -676,6 +687,7 @@ class VmRecipeInstanceManager(ResourceManager["VmRecipeInstance"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             recipe: Filter by recipe key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (name, etc.).
 
         Returns:
@@ -690,13 +702,12 @@ class VmRecipeInstanceManager(ResourceManager["VmRecipeInstance"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe_key = self._recipe_key
-        if recipe_key is None and recipe is not None:
-            recipe_key = recipe
-
-        if recipe_key is not None:
-            filters.append(f"recipe eq '{recipe_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if recipe is not None and self._recipe_key is None:
+            filters.append(f"recipe eq '{recipe}'")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -721,7 +732,8 @@ class VmRecipeInstanceManager(ResourceManager["VmRecipeInstance"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(
         self,
@@ -960,6 +972,11 @@ class VmRecipeLogManager(ResourceManager["VmRecipeLog"]):
         super().__init__(client)
         self._recipe_key = recipe_key
 
+    def _scope_filter(self) -> str | None:
+        if self._recipe_key is None:
+            return None
+        return f"vm_recipe eq '{self._recipe_key}'"
+
     def list(
         self,
         filter: str | None = None,
@@ -968,6 +985,8 @@ class VmRecipeLogManager(ResourceManager["VmRecipeLog"]):
         offset: int | None = None,
         vm_recipe: str | None = None,
         level: str | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VmRecipeLog]:
         """List recipe logs with optional filtering.
@@ -979,6 +998,7 @@ class VmRecipeLogManager(ResourceManager["VmRecipeLog"]):
             offset: Skip this many results.
             vm_recipe: Filter by recipe key. Ignored if manager is scoped.
             level: Filter by log level.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -993,13 +1013,12 @@ class VmRecipeLogManager(ResourceManager["VmRecipeLog"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add recipe filter (from scope or parameter)
-        recipe_key = self._recipe_key
-        if recipe_key is None and vm_recipe is not None:
-            recipe_key = vm_recipe
-
-        if recipe_key is not None:
-            filters.append(f"vm_recipe eq '{recipe_key}'")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if vm_recipe is not None and self._recipe_key is None:
+            filters.append(f"vm_recipe eq '{vm_recipe}'")
 
         # Add level filter
         if level is not None:
@@ -1031,7 +1050,8 @@ class VmRecipeLogManager(ResourceManager["VmRecipeLog"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
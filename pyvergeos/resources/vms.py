@@ -711,6 +711,8 @@ class VMManager(ResourceManager[VM]):
         limit: int | None = None,
         offset: int | None = None,
         include_snapshots: bool = False,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> list[VM]:
         """List VMs with optional filtering.
@@ -721,6 +723,7 @@ class VMManager(ResourceManager[VM]):
             limit: Maximum number of results.
             offset: Skip this many results.
             include_snapshots: Include VM snapshots (default False).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -740,9 +743,23 @@ class VMManager(ResourceManager[VM]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
+    def _list_params(
+        self,
+        filter: str | None = None,  # noqa: A002
+        fields: builtins.list[str] | None = None,
+        include_snapshots: bool = False,
+        **filter_kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build list parameters, excluding snapshots like :meth:`list`."""
+        if not include_snapshots:
+            snapshot_filter = "is_snapshot eq false"
+            filter = f"({filter}) and {snapshot_filter}" if filter else snapshot_filter
+        return super()._list_params(filter=filter, fields=fields, **filter_kwargs)
+
     def get(
         self,
         key: int | None = None,
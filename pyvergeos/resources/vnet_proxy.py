@@ -115,12 +115,17 @@ class VnetProxyTenantManager(ResourceManager[VnetProxyTenant]):
     def _to_model(self, data: dict[str, Any]) -> VnetProxyTenant:
         return VnetProxyTenant(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"proxy eq {self._proxy.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VnetProxyTenant]:
         """List proxy tenant mappings.
@@ -130,13 +135,14 @@ class VnetProxyTenantManager(ResourceManager[VnetProxyTenant]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
             List of VnetProxyTenant objects.
         """
         # Scope to this proxy
-        proxy_filter = f"proxy eq {self._proxy.key}"
+        proxy_filter = self._scope_filter()
         filter = f"({filter}) and {proxy_filter}" if filter else proxy_filter
 
         if fields is None:
@@ -154,6 +160,7 @@ class VnetProxyTenantManager(ResourceManager[VnetProxyTenant]):
             fields=fields,
             limit=limit,
             offset=offset,
+            compact=compact,
             **filter_kwargs,
         )
 
@@ -189,6 +189,8 @@ class VolumeVmExportManager(ResourceManager["VolumeVmExport"]):
         offset: int | None = None,
         status: str | None = None,
         volume: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeVmExport]:
         """List volume VM exports with optional filtering.
@@ -200,6 +202,7 @@ class VolumeVmExportManager(ResourceManager["VolumeVmExport"]):
             offset: Skip this many results.
             status: Filter by status (idle, building, error, cleaning).
             volume: Filter by volume key.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -252,7 +255,8 @@ class VolumeVmExportManager(ResourceManager["VolumeVmExport"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -536,6 +540,11 @@ class VolumeVmExportStatManager(ResourceManager["VolumeVmExportStat"]):
         super().__init__(client)
         self._export_key = export_key
 
+    def _scope_filter(self) -> str | None:
+        if self._export_key is None:
+            return None
+        return f"volume_vm_exports eq {self._export_key}"
+
     def list(
         self,
         filter: str | None = None,
@@ -543,6 +552,8 @@ class VolumeVmExportStatManager(ResourceManager["VolumeVmExportStat"]):
         limit: int | None = None,
         offset: int | None = None,
         volume_vm_exports: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[VolumeVmExportStat]:
         """List volume VM export statistics with optional filtering.
@@ -553,6 +564,7 @@ class VolumeVmExportStatManager(ResourceManager["VolumeVmExportStat"]):
             limit: Maximum number of results.
             offset: Skip this many results.
             volume_vm_exports: Filter by export key. Ignored if manager is scoped.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments.
 
         Returns:
@@ -574,13 +586,12 @@ class VolumeVmExportStatManager(ResourceManager["VolumeVmExportStat"]):
         if filter_kwargs:
             filters.append(build_filter(**filter_kwargs))
 
-        # Add export filter (from scope or parameter)
-        export_key = self._export_key
-        if export_key is None and volume_vm_exports is not None:
-            export_key = volume_vm_exports
-
-        if export_key is not None:
-            filters.append(f"volume_vm_exports eq {export_key}")
+        # Add scope filter, or filter by parameter if unscoped
+        scope = self._scope_filter()
+        if scope:
+            filters.append(scope)
+        if volume_vm_exports is not None and self._export_key is None:
+            filters.append(f"volume_vm_exports eq {volume_vm_exports}")
 
         if filters:
             params["filter"] = " and ".join(filters)
@@ -605,7 +616,8 @@ class VolumeVmExportStatManager(ResourceManager["VolumeVmExportStat"]):
         if not isinstance(response, list):
             response = [response]
 
-        return [self._to_model(item) for item in response if item]
+        to_model = self._model_func(compact)
+        return [to_model(item) for item in response if item]
 
     def get(  # type: ignore[override]
         self,
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import builtins
-import time
 from typing import TYPE_CHECKING, Any
 
 from pyvergeos.exceptions import NotFoundError, VergeTimeoutError
+from pyvergeos.polling import poll_until
 from pyvergeos.resources.base import ResourceManager
 from pyvergeos.resources.queries import QUERY_DEFAULT_FIELDS, QueryResult
 
@@ -51,6 +51,8 @@ class VsanQueryManager(ResourceManager[QueryResult]):
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[QueryResult]:
         """List vSAN queries.
@@ -60,6 +62,7 @@ class VsanQueryManager(ResourceManager[QueryResult]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
 
         Returns:
             List of QueryResult objects.
@@ -79,9 +82,10 @@ class VsanQueryManager(ResourceManager[QueryResult]):
         response = self._client._request("GET", self._endpoint, params=params)
         if response is None:
             return []
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
-        return [self._to_model(item) for item in response]
+            return [to_model(response)]
+        return [to_model(item) for item in response]
 
     def get(  # type: ignore[override]
         self,
@@ -154,7 +158,7 @@ class VsanQueryManager(ResourceManager[QueryResult]):
         Args:
             key: Query $key to poll.
             timeout: Maximum seconds to wait.
-            poll_interval: Seconds between polls.
+            poll_interval: Longest wait between polls.
 
         Returns:
             Completed QueryResult.
@@ -162,16 +166,15 @@ class VsanQueryManager(ResourceManager[QueryResult]):
         Raises:
             VergeTimeoutError: If query doesn't complete within timeout.
         """
-        deadline = time.monotonic() + timeout
-        while True:
-            result = self.get(key)
-            if result.status in ("complete", "error"):
-                return result
-            if time.monotonic() >= deadline:
-                raise VergeTimeoutError(
-                    f"vSAN query {key} did not complete within {timeout}s (status: {result.status})"
-                )
-            time.sleep(poll_interval)
+        return poll_until(
+            lambda: self.get(key),
+            lambda result: result.status in ("complete", "error"),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_timeout=lambda result: VergeTimeoutError(
+                f"vSAN query {key} did not complete within {timeout}s (status: {result.status})"
+            ),
+        )
 
     def run(
         self,
@@ -330,6 +330,7 @@ class WebhookManager(ResourceManager[Webhook]):
         offset: int | None = None,
         *,
         authorization_type: str | None = None,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[Webhook]:
         """List webhooks with optional filtering.
@@ -340,6 +341,7 @@ class WebhookManager(ResourceManager[Webhook]):
             limit: Maximum number of results.
             offset: Skip this many results.
             authorization_type: Filter by auth type (None, Basic, Bearer, ApiKey).
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Additional filter arguments.
 
         Returns:
@@ -381,10 +383,11 @@ class WebhookManager(ResourceManager[Webhook]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
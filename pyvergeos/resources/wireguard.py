@@ -326,12 +326,17 @@ class WireGuardManager(ResourceManager[WireGuardInterface]):
         data["_network_name"] = self._network.name
         return WireGuardInterface(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"vnet eq {self._network.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[WireGuardInterface]:
         """List WireGuard interfaces on this network.
@@ -341,6 +346,7 @@ class WireGuardManager(ResourceManager[WireGuardInterface]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (e.g., name="wg0").
 
         Returns:
@@ -350,7 +356,7 @@ class WireGuardManager(ResourceManager[WireGuardInterface]):
         params: dict[str, Any] = {}
 
         # Build filter - always include vnet parent filter
-        filters = [f"vnet eq {self._network.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -373,10 +379,11 @@ class WireGuardManager(ResourceManager[WireGuardInterface]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -589,12 +596,17 @@ class WireGuardPeerManager(ResourceManager[WireGuardPeer]):
         data["_interface_name"] = self._interface.name
         return WireGuardPeer(data, self)
 
+    def _scope_filter(self) -> str:
+        return f"wireguard eq {self._interface.key}"
+
     def list(
         self,
         filter: str | None = None,
         fields: builtins.list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        *,
+        compact: bool = False,
         **filter_kwargs: Any,
     ) -> builtins.list[WireGuardPeer]:
         """List peers for this WireGuard interface.
@@ -604,6 +616,7 @@ class WireGuardPeerManager(ResourceManager[WireGuardPeer]):
             fields: List of fields to return.
             limit: Maximum number of results.
             offset: Skip this many results.
+            compact: Return compact read-only records instead of resource objects.
             **filter_kwargs: Shorthand filter arguments (e.g., name="laptop").
 
         Returns:
@@ -612,7 +625,7 @@ class WireGuardPeerManager(ResourceManager[WireGuardPeer]):
         params: dict[str, Any] = {}
 
         # Build filter - always include wireguard parent filter
-        filters = [f"wireguard eq {self._interface.key}"]
+        filters = [self._scope_filter()]
         if filter:
             filters.append(filter)
         params["filter"] = " and ".join(filters)
@@ -635,10 +648,11 @@ class WireGuardPeerManager(ResourceManager[WireGuardPeer]):
         if response is None:
             return []
 
+        to_model = self._model_func(compact)
         if not isinstance(response, builtins.list):
-            return [self._to_model(response)]
+            return [to_model(response)]
 
-        return [self._to_model(item) for item in response]
+        return [to_model(item) for item in response]
 
     def get(
         self,
@@ -0,0 +1,330 @@
+"""Alternative HTTP transports for VergeConnection.
+
+The default transport is a ``requests.Session``. This module provides an
+opt-in HTTP/2 transport built on ``httpx`` that exposes the subset of the
+``requests.Session`` API used by the SDK, so managers work unchanged.
+
+Requires the optional ``http2`` extra (``pip install pyvergeos[http2]``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+
+from pyvergeos.connection import PoolStats
+from pyvergeos.constants import RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES, RETRY_TOTAL
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum number of connections held by the HTTP/2 transport
+HTTP2_MAX_CONNECTIONS = 10
+
+#: Default number of idle keep-alive connections retained by the HTTP/2 transport
+HTTP2_MAX_KEEPALIVE_CONNECTIONS = 10
+
+
+def _import_httpx() -> Any:
+    """Import httpx, raising a helpful error if the extra is missing."""
+    try:
+        import httpx
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "The HTTP/2 transport requires httpx. Install it with: pip install pyvergeos[http2]"
+        ) from e
+    return httpx
+
+
+class HTTPXResponse:
+    """``requests.Response``-compatible view of an ``httpx.Response``.
+
+    Attributes:
+        raw: The wrapped ``httpx.Response``.
+    """
+
+    def __init__(self, response: Any) -> None:
+        self.raw = response
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code."""
+        return int(self.raw.status_code)
+
+    @property
+    def headers(self) -> Any:
+        """Response headers (case-insensitive mapping)."""
+        return self.raw.headers
+
+    @property
+    def url(self) -> str:
+        """Final request URL."""
+        return str(self.raw.url)
+
+    @property
+    def http_version(self) -> str:
+        """Negotiated protocol (e.g. "HTTP/2")."""
+        return str(self.raw.http_version)
+
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes (reads a streamed body on first access)."""
+        return bytes(self.raw.read())
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        self.raw.read()
+        return str(self.raw.text)
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the response body as JSON."""
+        self.raw.read()
+        return self.raw.json(**kwargs)
+
+    def iter_content(self, chunk_size: int | None = 1) -> Iterator[bytes]:
+        """Iterate over the response body in chunks."""
+        try:
+            yield from self.raw.iter_bytes(chunk_size=chunk_size)
+        except Exception as e:
+            raise _translate_error(e) from e
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self.raw.close()
+
+    def __repr__(self) -> str:
+        return f"<HTTPXResponse [{self.status_code}] {self.http_version}>"
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+        now: Current epoch time (default: ``time.time()``).
+
+    Returns:
+        Non-negative delay in seconds, or None if absent or unparsable.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = now if now is not None else time.time()
+    return max(0.0, when.timestamp() - current)
+
+
+def retry_delay(attempt: int, backoff_factor: float, response: Any | None = None) -> float:
+    """Compute the delay before a retry, honoring ``Retry-After``.
+
+    Mirrors the urllib3 policy used by the default transport: no delay before
+    the first retry, then ``backoff_factor * (2 ** (attempt - 1))``.
+
+    Args:
+        attempt: Retry attempt number (1-based).
+        backoff_factor: Backoff factor for retry delay calculation.
+        response: Response that triggered the retry, if any.
+
+    Returns:
+        Delay in seconds.
+    """
+    if response is not None:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+    if attempt <= 1:
+        return 0.0
+    return float(backoff_factor * (2 ** (attempt - 1)))
+
+
+def _translate_error(error: Exception) -> Exception:
+    """Map httpx exceptions onto their ``requests`` equivalents."""
+    httpx = _import_httpx()
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.Timeout(str(error))
+    if isinstance(error, httpx.TransportError):
+        return requests.exceptions.ConnectionError(str(error))
+    return error
+
+
+class HTTPXSession:
+    """``requests.Session``-compatible session backed by ``httpx.Client``.
+
+    With ``http2=True`` every concurrent request to the appserver is
+    multiplexed over a single TLS connection instead of paying a handshake
+    per pooled connection. The client is thread-safe, so one session can be
+    shared by all threads of a VergeClient.
+
+    Transient HTTP status codes are retried with exponential backoff
+    (honoring ``Retry-After``), matching the urllib3 retry policy used by the
+    default transport.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        verify: bool = True,
+        retry_total: int = RETRY_TOTAL,
+        retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        retry_status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        max_connections: int = HTTP2_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+        socket_options: list[Any] | None = None,
+        transport: Any | None = None,
+    ) -> None:
+        """Initialize HTTPXSession.
+
+        Args:
+            http2: Negotiate HTTP/2 via ALPN (falls back to HTTP/1.1).
+            verify: Whether to verify SSL certificates.
+            retry_total: Number of retry attempts for transient failures.
+            retry_backoff_factor: Backoff factor for retry delay calculation.
+            retry_status_codes: HTTP status codes that trigger automatic retry.
+            max_connections: Maximum number of open connections.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            socket_options: Socket options for new connections (e.g. TCP
+                keep-alive, see ``tcp_keepalive_socket_options``).
+            transport: Custom ``httpx.BaseTransport`` (e.g. for testing).
+
+        Raises:
+            ImportError: If httpx (or h2 when ``http2=True``) is not installed.
+        """
+        httpx = _import_httpx()
+
+        self.retry_total = retry_total
+        self.retry_backoff_factor = retry_backoff_factor
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.verify = verify
+
+        if transport is None:
+            try:
+                transport = httpx.HTTPTransport(
+                    http2=http2,
+                    verify=verify,
+                    retries=retry_total,
+                    socket_options=socket_options,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                    ),
+                )
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 support requires the h2 package. "
+                    "Install it with: pip install pyvergeos[http2]"
+                ) from e
+        self._httpx = httpx
+        self._transport = transport
+        self._client = httpx.Client(transport=transport)
+        self.headers = self._client.headers
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> HTTPXResponse:
+        """Send a request.
+
+        Accepts the same keyword arguments as ``requests.Session.request``
+        for the subset the SDK uses.
+
+        Raises:
+            requests.exceptions.Timeout: If the request times out.
+            requests.exceptions.ConnectionError: If the connection fails.
+        """
+        attempt = 0
+        while True:
+            request = self._client.build_request(
+                method,
+                url,
+                params=params,
+                json=json,
+                content=data,
+                headers=headers,
+                timeout=self._httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            )
+            with self._lock:
+                self._requests += 1
+            try:
+                response = self._client.send(request, stream=stream)
+            except Exception as e:
+                raise _translate_error(e) from e
+
+            if response.status_code in self.retry_status_codes and attempt < self.retry_total:
+                attempt += 1
+                delay = retry_delay(attempt, self.retry_backoff_factor, response)
+                response.close()
+                logger.debug(
+                    "Retrying %s %s after HTTP %s (attempt %d, %.1fs)",
+                    method,
+                    url,
+                    response.status_code,
+                    attempt,
+                    delay,
+                )
+                time.sleep(delay)
+                continue
+
+            return HTTPXResponse(response)
+
+    def get(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of pool activity.
+
+        httpx does not expose checkout timings, so only request and
+        connection counts are reported. The connection counts are
+        best-effort: httpx has no public accessor for its pool, so they are
+        read from the httpcore pool behind ``httpx.HTTPTransport`` and are
+        zero for custom transports or httpx versions that move it.
+        """
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return PoolStats(
+            requests=self._requests,
+            connections_in_use=len(connections) - idle,
+            connections_idle=idle,
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._client.close()
@@ -0,0 +1,339 @@
+"""Push-based task completion through a local webhook receiver.
+
+Waiting on tasks normally means polling their status. A
+:class:`TaskEventReceiver` lets VergeOS push instead: it serves a small
+HTTP endpoint in a background thread and registers it with VergeOS as a
+webhook, together with a ``send`` task and ``task_events`` triggers that
+call the webhook when a task completes or fails.
+
+While a receiver is running, every event it receives wakes the client's
+:class:`~pyvergeos.futures.TaskWatcher`. Pending
+:class:`~pyvergeos.futures.TaskFuture` objects and ``client.tasks.wait()``
+calls then resolve with a single status query, right after the push.
+Between events the watcher only polls every
+:data:`~pyvergeos.constants.TASK_EVENT_FALLBACK_INTERVAL` seconds, as a
+fallback for events that were lost.
+
+The endpoint expects ``Authorization: Bearer <token>``. VergeOS sends the
+token because it is stored as the webhook's authorization.
+
+Example:
+    >>> from pyvergeos.webhook_receiver import TaskEventReceiver
+    >>> with TaskEventReceiver(client, port=8443, url="http://10.0.0.5:8443/"):
+    ...     futures = [client.tasks.future(vm.clone()) for vm in vms]
+    ...     tasks = gather(futures, timeout=900)
+
+Applications that already run a web server can feed the events they
+receive to :meth:`TaskEventReceiver.handle_event` instead of serving the
+built-in endpoint.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hmac
+import json
+import logging
+import secrets
+import socket
+import ssl
+import threading
+from collections.abc import Iterable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+from pyvergeos.constants import TASK_EVENT_FALLBACK_INTERVAL, TASK_EVENT_TRIGGERS
+from pyvergeos.exceptions import NotFoundError
+
+if TYPE_CHECKING:
+    from pyvergeos.client import VergeClient
+
+logger = logging.getLogger(__name__)
+
+#: Largest event body the receiver accepts
+MAX_EVENT_SIZE = 1024 * 1024
+
+
+def task_keys_of(payload: Any) -> list[int] | None:
+    """Return the task keys an event payload refers to.
+
+    Understands ``{"task": 12}``, ``{"task": "tasks/12"}``,
+    ``{"task": {"$key": 12}}``, ``{"table": "tasks", "$key": 12}`` and lists
+    of such objects.
+
+    Returns:
+        Task keys, or None if the payload names no task (every pending task
+        should then be checked).
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    keys: list[int] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if "task" in item:
+            ref = item["task"]
+        elif item.get("table") == "tasks":
+            ref = item.get("$key", item.get("key"))
+        else:
+            continue
+        if isinstance(ref, dict):
+            ref = ref.get("$key")
+        if isinstance(ref, str):
+            ref = ref.rpartition("/")[2]
+        try:
+            keys.append(int(ref))
+        except (TypeError, ValueError):
+            continue
+    return keys or None
+
+
+class TaskEventReceiver:
+    """HTTP endpoint that resolves a client's task waits when VergeOS pushes events.
+
+    Use it as a context manager, or call :meth:`start` and :meth:`close`.
+    Starting it serves the endpoint, registers it with VergeOS (unless
+    ``register=False``) and switches the client's task waits to push mode.
+    Closing it removes everything it registered and restores polling. The
+    registered triggers exclude the receiver's own send task, so a delivery
+    finishing does not fire the webhook again.
+
+    Args:
+        client: Client whose task waits the events resolve.
+        host: Address to bind.
+        port: Port to bind (0 picks a free port).
+        url: URL at which VergeOS reaches the endpoint. Defaults to
+            ``http(s)://<host name>:<port>/``.
+        token: Bearer token VergeOS must send. Defaults to a random token.
+        register: Create the webhook, task and event triggers in VergeOS.
+            Pass False when they are managed elsewhere.
+        events: Task events that trigger a push.
+        fallback_interval: Longest wait between status polls while the
+            receiver is running.
+        certfile: PEM certificate to serve HTTPS.
+        keyfile: PEM private key (if not included in ``certfile``).
+        allow_insecure: Let VergeOS accept a self-signed certificate.
+        name: Name of the webhook and task created in VergeOS.
+
+    Attributes:
+        url: URL registered with VergeOS.
+        received: Number of events received.
+        webhook_key: $key of the registered webhook, if any.
+        task_key: $key of the registered send task, if any.
+        event_keys: $keys of the registered task event triggers.
+    """
+
+    def __init__(
+        self,
+        client: VergeClient,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        *,
+        url: str | None = None,
+        token: str | None = None,
+        register: bool = True,
+        events: Iterable[str] = TASK_EVENT_TRIGGERS,
+        fallback_interval: float = TASK_EVENT_FALLBACK_INTERVAL,
+        certfile: str | None = None,
+        keyfile: str | None = None,
+        allow_insecure: bool = False,
+        name: str | None = None,
+    ) -> None:
+        self.received = 0
+        self.webhook_key: int | None = None
+        self.task_key: int | None = None
+        self.event_keys: list[int] = []
+        self._client = client
+        self._address = (host, port)
+        self._url = url
+        self._token = token or secrets.token_urlsafe(32)
+        self._register = register
+        self._events = tuple(events)
+        self._fallback_interval = fallback_interval
+        self._certfile = certfile
+        self._keyfile = keyfile
+        self._allow_insecure = allow_insecure
+        self._name = name or f"pyvergeos-task-events-{secrets.token_hex(4)}"
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._saved_intervals: tuple[float, float] | None = None
+
+    @property
+    def url(self) -> str:
+        """URL at which VergeOS reaches the endpoint."""
+        if self._url is None:
+            raise RuntimeError("Receiver is not started")
+        return self._url
+
+    @property
+    def running(self) -> bool:
+        """Whether the endpoint is being served."""
+        return self._server is not None
+
+    def start(self) -> TaskEventReceiver:
+        """Serve the endpoint, register it and switch task waits to push mode.
+
+        Returns:
+            This receiver.
+        """
+        with self._lock:
+            if self._server is not None:
+                return self
+            self._server = self._serve()
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="pyvergeos-task-events", daemon=True
+            )
+            self._thread.start()
+        try:
+            if self._register:
+                self.register()
+        except BaseException:
+            self.close()
+            raise
+        self._attach()
+        return self
+
+    def close(self) -> None:
+        """Unregister, stop serving and return task waits to polling."""
+        self._detach()
+        self.unregister()
+        with self._lock:
+            server, thread = self._server, self._thread
+            self._server = self._thread = None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if thread is not None:
+            thread.join()
+
+    def register(self) -> None:
+        """Create the webhook, send task and task event triggers in VergeOS."""
+        if self.webhook_key is not None:
+            return
+        client = self._client
+        webhook = client.webhooks.create(
+            self._name,
+            self.url,
+            authorization_type="Bearer",
+            authorization_value=self._token,
+            allow_insecure=self._allow_insecure,
+        )
+        self.webhook_key = webhook.key
+        task = client.tasks.create(
+            self._name,
+            webhook.key,
+            "send",
+            table="webhook_urls",
+            description="Notifies a pyvergeos client when tasks finish",
+        )
+        self.task_key = task.key
+        # The send task's own completion would otherwise fire the webhook again.
+        own_task = {"$key": {"ne": task.key}}
+        for event in self._events:
+            trigger = client.task_events.create(
+                task.key, event, table="tasks", table_event_filters=own_task
+            )
+            self.event_keys.append(trigger.key)
+
+    def unregister(self) -> None:
+        """Delete everything :meth:`register` created. Missing objects are ignored."""
+        client = self._client
+        removals: list[tuple[Any, int]] = [(client.task_events, key) for key in self.event_keys]
+        if self.task_key is not None:
+            removals.append((client.tasks, self.task_key))
+        if self.webhook_key is not None:
+            removals.append((client.webhooks, self.webhook_key))
+        for manager, key in removals:
+            with contextlib.suppress(NotFoundError):
+                manager.delete(key)
+        self.event_keys = []
+        self.task_key = self.webhook_key = None
+
+    def handle_event(self, payload: Any) -> bool:
+        """Process one pushed event.
+
+        Wakes the task watcher if the event concerns a task it watches, or
+        names no task at all. Events about the receiver's own send task are
+        ignored.
+
+        Args:
+            payload: Decoded JSON body of the event.
+
+        Returns:
+            True if the watcher was woken.
+        """
+        with self._lock:
+            self.received += 1
+        keys = task_keys_of(payload)
+        if keys is not None and self.task_key is not None:
+            keys = [key for key in keys if key != self.task_key]
+            if not keys:
+                return False
+        return self._client.tasks.watcher.wake(keys)
+
+    def _attach(self) -> None:
+        tasks = self._client.tasks
+        watcher = tasks.watcher
+        self._saved_intervals = (watcher.poll_interval, watcher.initial_interval)
+        watcher.poll_interval = watcher.initial_interval = self._fallback_interval
+        tasks._receiver = self
+
+    def _detach(self) -> None:
+        tasks = self._client.tasks
+        if tasks._receiver is self:
+            tasks._receiver = None
+        if self._saved_intervals is not None:
+            watcher = tasks.watcher
+            watcher.poll_interval, watcher.initial_interval = self._saved_intervals
+            watcher.wake()
+            self._saved_intervals = None
+
+    def _serve(self) -> ThreadingHTTPServer:
+        receiver = self
+        expected = f"Bearer {self._token}".encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                authorization = self.headers.get("Authorization", "").encode()
+                if not hmac.compare_digest(authorization, expected):
+                    self.send_error(HTTPStatus.UNAUTHORIZED)
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_EVENT_SIZE:
+                    self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    return
+                body = self.rfile.read(length) if length else b""
+                try:
+                    payload = json.loads(body) if body else None
+                except ValueError:
+                    payload = None
+                receiver.handle_event(payload)
+                self.send_response(HTTPStatus.NO_CONTENT)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("Task event receiver: " + format, *args)
+
+        server = ThreadingHTTPServer(self._address, Handler)
+        server.daemon_threads = True
+        scheme = "http"
+        if self._certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self._certfile, self._keyfile)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            scheme = "https"
+        if self._url is None:
+            host, port = server.server_address[:2]
+            if isinstance(host, bytes):
+                host = host.decode()
+            if host in ("", "0.0.0.0", "::"):
+                host = socket.getfqdn()
+            self._url = f"{scheme}://{host}:{port}/"
+        return server
+
+    def __enter__(self) -> TaskEventReceiver:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
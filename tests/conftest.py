@@ -1,5 +1,6 @@
 """Pytest fixtures for pyvergeos tests."""
 
+import json
 import os
 from collections.abc import Generator
 from typing import Any
@@ -8,6 +9,39 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from pyvergeos import VergeClient
+from pyvergeos.emulator import VergeEmulator
+
+#: ``GET system`` payload the client validates its connection with
+SYSTEM_INFO = {
+    "$key": 1,
+    "yb_version": "4.12.0",
+    "os_version": "26.0",
+    "cloud_name": "test-cloud",
+}
+
+
+def make_response(
+    status: int, body: Any = None, headers: dict[str, str] | None = None
+) -> MagicMock:
+    """Create a mock ``requests.Response`` with a JSON body."""
+    response = MagicMock()
+    response.status_code = status
+    response.content = json.dumps(body).encode() if body is not None else b""
+    response.text = response.content.decode()
+    response.json.return_value = body
+    response.headers = headers or {}
+    return response
+
+
+def stream_response(body: bytes, status_code: int = 200, chunk: int = 7) -> MagicMock:
+    """Create a mock streamed response delivering ``body`` in small chunks."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = body
+    response.iter_content.side_effect = lambda chunk_size: iter(
+        [body[i : i + chunk] for i in range(0, len(body), chunk)]
+    )
+    return response
 
 
 @pytest.fixture
@@ -37,12 +71,7 @@ def mock_client(mock_session: MagicMock) -> VergeClient:
     Use this for unit tests that don't need real API calls.
     """
     # Mock the system validation response
-    mock_session.request.return_value.json.return_value = {
-        "$key": 1,
-        "yb_version": "4.12.0",
-        "os_version": "26.0",
-        "cloud_name": "test-cloud",
-    }
+    mock_session.request.return_value.json.return_value = dict(SYSTEM_INFO)
 
     client = VergeClient(
         host="test.example.com",
@@ -53,6 +82,37 @@ def mock_client(mock_session: MagicMock) -> VergeClient:
     return client
 
 
+@pytest.fixture
+def emulator(request: pytest.FixtureRequest) -> VergeEmulator:
+    """Create an in-process VergeOS emulator holding ``vm0`` to ``vm19``.
+
+    Options come from the ``emulator`` marker: ``vms`` sets how many VMs
+    are created and the rest are passed to VergeEmulator, e.g.
+    ``pytestmark = pytest.mark.emulator(task_duration=0.05)``.
+    """
+    marker = request.node.get_closest_marker("emulator")
+    options = dict(marker.kwargs) if marker else {}
+    vms = options.pop("vms", 20)
+
+    emulator = VergeEmulator(**options)
+    emulator.populate(
+        "vms",
+        vms,
+        name=lambda i: f"vm{i}",
+        ram=lambda i: 1024 * (i % 4 + 1),
+        is_snapshot=False,
+    )
+    return emulator
+
+
+@pytest.fixture
+def client(emulator: VergeEmulator) -> Generator[VergeClient, None, None]:
+    """Create a VergeClient connected to the ``emulator`` fixture."""
+    client = emulator.client()
+    yield client
+    client.disconnect()
+
+
 @pytest.fixture
 def sample_vm_data() -> dict[str, Any]:
     """Sample VM data for tests."""
@@ -0,0 +1,309 @@
+"""Tests for AsyncVergeClient."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import pytest
+
+from pyvergeos import AsyncVergeClient
+from pyvergeos.exceptions import (
+    AuthenticationError,
+    NotConnectedError,
+    NotFoundError,
+    VergeConnectionError,
+)
+from pyvergeos.resources.async_base import AsyncResourceManager, model_for_manager
+from pyvergeos.resources.base import ResourceObject
+from pyvergeos.resources.nodes import Node, NodeManager
+from pyvergeos.resources.vms import VM
+from tests.conftest import SYSTEM_INFO
+
+httpx = pytest.importorskip("httpx")
+
+
+Handler = Callable[[Any], Any]
+
+
+def make_client(handler: Handler, **kwargs: Any) -> AsyncVergeClient:
+    """Create an AsyncVergeClient backed by a mock transport."""
+
+    def dispatch(request: Any) -> Any:
+        if request.url.path == "/api/v4/system":
+            return httpx.Response(200, json=SYSTEM_INFO)
+        return handler(request)
+
+    return AsyncVergeClient(
+        host="test.example.com",
+        username="admin",
+        password="secret",
+        transport=httpx.MockTransport(dispatch),
+        **kwargs,
+    )
+
+
+def run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+class TestAsyncVergeClient:
+    """Tests for AsyncVergeClient connection handling."""
+
+    def test_requires_credentials(self) -> None:
+        with pytest.raises(ValueError, match="Either token or username/password"):
+            AsyncVergeClient(host="test.example.com")
+
+    def test_connect_and_disconnect(self) -> None:
+        async def scenario() -> AsyncVergeClient:
+            async with make_client(lambda r: httpx.Response(204)) as client:
+                assert client.is_connected
+                assert client.version == "4.12.0"
+                assert client.cloud_name == "test-cloud"
+            return client
+
+        client = run(scenario())
+        assert not client.is_connected
+
+    def test_connect_auth_failure(self) -> None:
+        client = AsyncVergeClient(
+            host="test.example.com",
+            token="bad",
+            transport=httpx.MockTransport(
+                lambda r: httpx.Response(401, json={"err": "Invalid token"})
+            ),
+        )
+        with pytest.raises(AuthenticationError, match="Invalid token"):
+            run(client.connect())
+        assert not client.is_connected
+
+    def test_connect_unexpected_response(self) -> None:
+        client = AsyncVergeClient(
+            host="test.example.com",
+            token="t",
+            transport=httpx.MockTransport(lambda r: httpx.Response(500, text="boom")),
+            retry_total=0,
+        )
+        with pytest.raises(VergeConnectionError):
+            run(client.connect())
+
+    def test_request_when_not_connected(self) -> None:
+        client = make_client(lambda r: httpx.Response(204))
+        with pytest.raises(NotConnectedError):
+            run(client._request("GET", "vms"))
+
+    def test_auth_header_sent(self) -> None:
+        seen: list[str] = []
+
+        def handler(request: Any) -> Any:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json=[])
+
+        async def scenario() -> None:
+            async with make_client(handler) as client:
+                await client.resource("alarms").list()
+
+        run(scenario())
+        assert seen == ["Basic YWRtaW46c2VjcmV0"]
+
+    def test_retry_on_status(self) -> None:
+        calls: list[int] = []
+
+        def handler(request: Any) -> Any:
+            calls.append(1)
+            if len(calls) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"$key": 5})
+
+        async def scenario() -> Any:
+            async with make_client(handler, retry_backoff_factor=0) as client:
+                return await client._request("GET", "vms/5")
+
+        assert run(scenario()) == {"$key": 5}
+        assert len(calls) == 3
+
+    def test_error_mapping(self) -> None:
+        async def scenario() -> None:
+            async with make_client(
+                lambda r: httpx.Response(404, json={"err": "not here"})
+            ) as client:
+                await client._request("GET", "vms/99")
+
+        with pytest.raises(NotFoundError, match="not here"):
+            run(scenario())
+
+
+class TestAsyncResourceManager:
+    """Tests for AsyncResourceManager CRUD operations."""
+
+    def test_model_for_manager(self) -> None:
+        assert model_for_manager(NodeManager) is Node
+        assert model_for_manager(AsyncResourceManager) is ResourceObject  # type: ignore[arg-type]
+
+    def test_list_uses_model_and_default_fields(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def handler(request: Any) -> Any:
+            captured.update(dict(request.url.params))
+            return httpx.Response(200, json=[{"$key": 1, "name": "vm1"}])
+
+        async def scenario() -> Any:
+            async with make_client(handler) as client:
+                return await client.vms.list(filter="name eq 'vm1'")
+
+        vms = run(scenario())
+        assert isinstance(vms[0], VM)
+        assert vms[0].name == "vm1"
+        assert captured["filter"] == "(name eq 'vm1') and is_snapshot eq false"
+        assert "$key" in captured["fields"].split(",")
+
+    def test_get_by_key_and_name(self) -> None:
+        def handler(request: Any) -> Any:
+            if request.url.path.endswith("/nodes/3"):
+                return httpx.Response(200, json={"$key": 3, "name": "node3"})
+            return httpx.Response(200, json=[{"$key": 4, "name": "node4"}])
+
+        async def scenario() -> tuple[Any, Any]:
+            async with make_client(handler) as client:
+                by_key = await client.nodes.get(3)
+                by_name = await client.nodes.get(name="node4")
+                return by_key, by_name
+
+        by_key, by_name = run(scenario())
+        assert by_key.key == 3
+        assert by_name.key == 4
+
+    def test_get_requires_key_or_name(self) -> None:
+        async def scenario() -> None:
+            async with make_client(lambda r: httpx.Response(204)) as client:
+                await client.nodes.get()
+
+        with pytest.raises(ValueError):
+            run(scenario())
+
+    def test_create_update_delete_action(self) -> None:
+        requests_seen: list[tuple[str, str, Any]] = []
+
+        def handler(request: Any) -> Any:
+            body = json.loads(request.content) if request.content else None
+            requests_seen.append((request.method, str(request.url), body))
+            if request.method == "POST":
+                return httpx.Response(201, json={"$key": 10, **body})
+            if request.method == "PUT" and "action=" in str(request.url):
+                return httpx.Response(200, json={"task": 77})
+            if request.method == "PUT":
+                return httpx.Response(200, json={"$key": 10, "name": "renamed"})
+            return httpx.Response(204)
+
+        async def scenario() -> tuple[Any, Any, Any]:
+            async with make_client(handler) as client:
+                tags = client.resource("tags")
+                created = await tags.create(name="t1")
+                updated = await tags.update(10, name="renamed")
+                result = await tags.action(10, "refresh", force=True)
+                await tags.delete(10)
+                return created, updated, result
+
+        created, updated, result = run(scenario())
+        assert created.key == 10
+        assert updated.name == "renamed"
+        assert result == {"task": 77}
+        methods = [m for m, _, _ in requests_seen]
+        assert methods == ["POST", "PUT", "PUT", "DELETE"]
+        assert requests_seen[2][1].endswith("tags/10?action=refresh")
+        assert requests_seen[2][2] == {"force": True}
+
+    def test_iter_all_pages(self) -> None:
+        rows = [{"$key": i} for i in range(5)]
+
+        def handler(request: Any) -> Any:
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json=rows[offset : offset + limit])
+
+        async def scenario() -> list[int]:
+            async with make_client(handler) as client:
+                return [obj.key async for obj in client.resource("logs").iter_all(page_size=2)]
+
+        assert run(scenario()) == [0, 1, 2, 3, 4]
+
+    def test_iter_all_prefetch(self) -> None:
+        rows = [{"$key": i} for i in range(7)]
+        offsets: list[int] = []
+
+        def handler(request: Any) -> Any:
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            offsets.append(offset)
+            return httpx.Response(200, json=rows[offset : offset + limit])
+
+        async def scenario() -> list[int]:
+            async with make_client(handler) as client:
+                logs = client.resource("logs")
+                return [obj.key async for obj in logs.iter_all(page_size=2, prefetch=3)]
+
+        assert run(scenario()) == list(range(7))
+        assert sorted(offsets)[:4] == [0, 2, 4, 6]
+
+    def test_get_many(self) -> None:
+        filters: list[str] = []
+
+        def handler(request: Any) -> Any:
+            flt = request.url.params["filter"]
+            filters.append(flt)
+            keys = [int(k) for k in flt[len("$key in (") : -1].split(",")]
+            return httpx.Response(200, json=[{"$key": k} for k in sorted(keys) if k != 3])
+
+        async def scenario() -> list[int]:
+            async with make_client(handler) as client:
+                tags = await client.resource("tags").get_many(
+                    range(250, 0, -1), ignore_missing=True
+                )
+                return [t.key for t in tags]
+
+        assert run(scenario()) == [k for k in range(250, 0, -1) if k != 3]
+        assert len(filters) == 2
+
+    def test_bulk_crud(self) -> None:
+        seen: list[tuple[str, str]] = []
+
+        def handler(request: Any) -> Any:
+            seen.append((request.method, request.url.path.rsplit("/", 1)[-1]))
+            if request.method == "POST":
+                body = json.loads(request.content)
+                if body["name"] == "dup":
+                    return httpx.Response(409, json={"err": "exists"})
+                return httpx.Response(201, json={"$key": len(seen), **body})
+            if request.method == "PUT":
+                return httpx.Response(200, json={"$key": 1, "name": "renamed"})
+            return httpx.Response(204)
+
+        async def scenario() -> tuple[Any, Any, Any]:
+            async with make_client(handler) as client:
+                tags = client.resource("tags")
+                created = await tags.create_many(
+                    [{"name": "a"}, {"name": "dup"}, {"name": "c"}], ordered=True
+                )
+                updated = await tags.update_many({1: {"name": "renamed"}})
+                deleted = await tags.delete_many([1, 2])
+                return created, updated, deleted
+
+        created, updated, deleted = run(scenario())
+        assert created.failed == [1]
+        assert created.results[2]["name"] == "c"
+        assert updated.results[1]["name"] == "renamed"
+        assert deleted.ok
+        assert [m for m, _ in seen] == ["POST", "POST", "POST", "PUT", "DELETE", "DELETE"]
+
+    def test_concurrent_requests_share_client(self) -> None:
+        def handler(request: Any) -> Any:
+            key = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"$key": key})
+
+        async def scenario() -> list[int]:
+            async with make_client(handler) as client:
+                results = await asyncio.gather(*(client.nodes.get(k) for k in range(20)))
+                return [r.key for r in results]
+
+        assert run(scenario()) == list(range(20))
@@ -0,0 +1,220 @@
+"""Tests for session-token authentication."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import AsyncVergeClient, VergeClient
+from pyvergeos.auth import parse_expires, parse_token
+from pyvergeos.connection import AuthMethod, build_auth_header
+from pyvergeos.exceptions import AuthenticationError
+from tests.conftest import SYSTEM_INFO, make_response
+
+TOKEN_URL = "https://test.example.com/api/sys/tokens"
+
+
+class FakeAppserver:
+    """Routes session requests: token login/lookup/revoke and API calls."""
+
+    def __init__(self, session: MagicMock, lifetime: float = 900, login_delay: float = 0) -> None:
+        self.session = session
+        self.lifetime = lifetime
+        self.login_delay = login_delay
+        self.logins: list[dict[str, Any]] = []
+        self.revoked: list[str] = []
+        self.valid: set[str] = set()
+        self.lock = threading.Lock()
+        session.headers = {}
+        session.request.side_effect = self.request
+
+    def request(self, method: str, url: str, **kwargs: Any) -> MagicMock:
+        if url == TOKEN_URL and method == "POST":
+            time.sleep(self.login_delay)
+            with self.lock:
+                self.logins.append(kwargs["json"])
+                token = f"tok{len(self.logins)}"
+                self.valid.add(token)
+            return make_response(201, {"$key": token, "location": f"/sys/tokens/{token}"})
+        if url.startswith(TOKEN_URL + "/") and method == "GET":
+            return make_response(200, {"expires": time.time() + self.lifetime})
+        if url.startswith(TOKEN_URL + "/") and method == "DELETE":
+            self.revoked.append(url.rsplit("/", 1)[-1])
+            return make_response(200)
+        token = self.session.headers.get("x-yottabyte-token")
+        if token not in self.valid:
+            return make_response(401, {"err": "Invalid token"})
+        if url.endswith("/system"):
+            return make_response(200, SYSTEM_INFO)
+        return make_response(200, [{"$key": 1}])
+
+
+def session_client() -> VergeClient:
+    return VergeClient(
+        host="test.example.com", username="admin", password="secret", auth_method="session"
+    )
+
+
+class TestSessionAuth:
+    """Tests for VergeClient with auth_method="session"."""
+
+    def test_login_once(self, mock_session: MagicMock) -> None:
+        server = FakeAppserver(mock_session)
+        client = session_client()
+
+        client._request("GET", "vms")
+        client._request("GET", "vms")
+
+        assert server.logins == [{"login": "admin", "password": "secret"}]
+        assert mock_session.headers["x-yottabyte-token"] == "tok1"
+        assert "Authorization" not in mock_session.headers
+        assert client._connection is not None
+        assert client._connection.token == "tok1"
+        assert client._connection.token_expires is not None
+        assert client._connection.is_token_valid()
+
+    def test_expiry_from_login_response(self, mock_session: MagicMock) -> None:
+        FakeAppserver(mock_session)
+        expires = int(time.time()) + 600
+        login = make_response(201, {"$key": "abc", "expires": expires})
+        system = make_response(200, SYSTEM_INFO)
+        mock_session.request.side_effect = [login, system]
+
+        client = session_client()
+
+        assert client._connection is not None
+        assert client._connection.token_expires is not None
+        assert client._connection.token_expires.timestamp() == expires
+        assert mock_session.request.call_count == 2
+
+    def test_renews_before_expiry(self, mock_session: MagicMock) -> None:
+        # Shorter than twice the refresh margin: renewed halfway through
+        server = FakeAppserver(mock_session, lifetime=0.2)
+        client = session_client()
+        time.sleep(0.15)
+
+        client._request("GET", "vms")
+
+        assert len(server.logins) == 2
+        assert mock_session.headers["x-yottabyte-token"] == "tok2"
+
+    def test_rejected_token_is_renewed(self, mock_session: MagicMock) -> None:
+        server = FakeAppserver(mock_session)
+        client = session_client()
+        server.valid.clear()
+
+        assert client._request("GET", "vms") == [{"$key": 1}]
+        assert len(server.logins) == 2
+
+    def test_concurrent_renewal_logs_in_once(self, mock_session: MagicMock) -> None:
+        server = FakeAppserver(mock_session, login_delay=0.05)
+        client = session_client()
+        assert client._session_auth is not None
+        client._session_auth._refresh_at = 0.0
+
+        threads = [threading.Thread(target=client._request, args=("GET", "vms")) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(server.logins) == 2
+        assert client._session_auth.logins == 2
+
+    def test_disconnect_revokes_token(self, mock_session: MagicMock) -> None:
+        server = FakeAppserver(mock_session)
+        client = session_client()
+        client.disconnect()
+        assert server.revoked == ["tok1"]
+
+    def test_bad_credentials(self, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = make_response(401, {"err": "Invalid login"})
+        with pytest.raises(AuthenticationError):
+            session_client()
+
+    def test_requires_password(self, mock_session: MagicMock) -> None:
+        with pytest.raises(ValueError, match="session auth"):
+            VergeClient(host="test.example.com", token="x", auth_method=AuthMethod.SESSION)
+
+    def test_unknown_auth_method(self) -> None:
+        with pytest.raises(ValueError):
+            VergeClient(host="h", username="u", password="p", auth_method="kerberos")
+
+    def test_basic_auth_unchanged(self, mock_session: MagicMock) -> None:
+        server = FakeAppserver(mock_session)
+        mock_session.request.side_effect = None
+        mock_session.request.return_value = make_response(200, SYSTEM_INFO)
+        VergeClient(host="test.example.com", username="admin", password="secret")
+        assert server.logins == []
+        assert "Authorization" in mock_session.headers
+
+
+class TestTokenParsing:
+    """Tests for login response parsing helpers."""
+
+    def test_parse_token(self) -> None:
+        assert parse_token({"$key": "abc"}) == "abc"
+        assert parse_token({"location": "/sys/tokens/def"}) == "def"
+        with pytest.raises(AuthenticationError):
+            parse_token({})
+
+    def test_parse_expires(self) -> None:
+        assert parse_expires([{"expires": 1700000000}]) == 1700000000.0
+        assert parse_expires({"expires": 0}) is None
+        assert parse_expires(None) is None
+
+    def test_session_header(self) -> None:
+        assert build_auth_header(AuthMethod.SESSION, token="t") == {"x-yottabyte-token": "t"}
+        with pytest.raises(ValueError):
+            build_auth_header(AuthMethod.SESSION)
+
+
+class TestAsyncSessionAuth:
+    """Tests for AsyncVergeClient with auth_method="session"."""
+
+    def test_login_and_renew(self) -> None:
+        httpx = pytest.importorskip("httpx")
+        logins: list[Any] = []
+        valid: set[str] = set()
+        revoked: list[str] = []
+
+        def handler(request: Any) -> Any:
+            path = request.url.path
+            if path == "/api/sys/tokens":
+                logins.append(json.loads(request.content))
+                token = f"tok{len(logins)}"
+                valid.add(token)
+                return httpx.Response(201, json={"$key": token, "expires": time.time() + 900})
+            if path.startswith("/api/sys/tokens/"):
+                revoked.append(path.rsplit("/", 1)[-1])
+                return httpx.Response(200)
+            if request.headers.get("x-yottabyte-token") not in valid:
+                return httpx.Response(401, json={"err": "Invalid token"})
+            if path == "/api/v4/system":
+                return httpx.Response(200, json=SYSTEM_INFO)
+            return httpx.Response(200, json=[{"$key": 1}])
+
+        async def scenario() -> None:
+            client = AsyncVergeClient(
+                host="test.example.com",
+                username="admin",
+                password="secret",
+                auth_method="session",
+                transport=httpx.MockTransport(handler),
+            )
+            async with client:
+                await asyncio.gather(*(client._request("GET", "vms") for _ in range(5)))
+                assert len(logins) == 1
+                valid.clear()
+                assert await client._request("GET", "vms") == [{"$key": 1}]
+                assert len(logins) == 2
+
+        asyncio.run(scenario())
+        assert logins[0] == {"login": "admin", "password": "secret"}
+        assert revoked == ["tok2"]
@@ -0,0 +1,290 @@
+"""Tests for bulk operations."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.bulk import BulkResult, run_bulk, run_bulk_async, task_key_of
+from pyvergeos.exceptions import BulkOperationError, ConflictError
+from pyvergeos.resources.base import ResourceManager, ResourceObject
+
+
+class Tracker:
+    """Operation recording peak concurrency overall and per group."""
+
+    def __init__(self, groups: dict[int, str] | None = None, delay: float = 0.01) -> None:
+        self.groups = groups or {}
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+
+    def _enter(self, key: int) -> None:
+        with self.lock:
+            for name in ("*", self.groups.get(key, "")):
+                self.active[name] += 1
+                self.peak[name] = max(self.peak[name], self.active[name])
+
+    def _exit(self, key: int) -> None:
+        with self.lock:
+            for name in ("*", self.groups.get(key, "")):
+                self.active[name] -= 1
+
+    def __call__(self, key: int) -> dict[str, Any]:
+        self._enter(key)
+        try:
+            time.sleep(self.delay)
+            if key < 0:
+                raise ConflictError(f"bad key {key}")
+            return {"task": key + 1000}
+        finally:
+            self._exit(key)
+
+    async def async_call(self, key: int) -> dict[str, Any]:
+        self._enter(key)
+        try:
+            await asyncio.sleep(self.delay)
+            if key < 0:
+                raise ConflictError(f"bad key {key}")
+            return {"task": key + 1000}
+        finally:
+            self._exit(key)
+
+
+class TestRunBulk:
+    """Tests for the threaded bulk runner."""
+
+    def test_results_in_input_order(self) -> None:
+        result = run_bulk([3, 1, 2], Tracker(), concurrency=3)
+        assert [item.key for item in result] == [3, 1, 2]
+        assert result.ok
+        assert result.task_keys == {3: 1003, 1: 1001, 2: 1002}
+
+    def test_concurrency_bounded(self) -> None:
+        tracker = Tracker()
+        run_bulk(list(range(40)), tracker, concurrency=5)
+        assert 1 < tracker.peak["*"] <= 5
+
+    def test_errors_collected_per_key(self) -> None:
+        result = run_bulk([1, -2, 3, -4], Tracker(delay=0), concurrency=2)
+        assert result.succeeded == [1, 3]
+        assert result.failed == [-2, -4]
+        assert isinstance(result.errors[-2], ConflictError)
+        assert not result.ok
+        with pytest.raises(BulkOperationError, match="2 of 4") as exc_info:
+            result.raise_for_errors()
+        assert exc_info.value.result is result
+
+    def test_per_group_cap(self) -> None:
+        groups = {key: f"node{key % 2}" for key in range(30)}
+        tracker = Tracker(groups)
+        result = run_bulk(
+            list(range(30)), tracker, concurrency=6, group_by=groups.__getitem__, per_group=2
+        )
+        assert result.ok
+        assert tracker.peak["node0"] <= 2
+        assert tracker.peak["node1"] <= 2
+        # Both groups run side by side
+        assert tracker.peak["*"] > 2
+
+    def test_capped_group_does_not_block_others(self) -> None:
+        groups = {key: "big" if key < 20 else f"small{key}" for key in range(25)}
+        tracker = Tracker(groups)
+        order: list[int] = []
+
+        def op(key: int) -> Any:
+            order.append(key)
+            return tracker(key)
+
+        run_bulk(list(range(25)), op, concurrency=4, group_by=groups.__getitem__, per_group=1)
+        assert tracker.peak["big"] == 1
+        # The small groups start long before the big group is drained
+        assert max(order.index(k) for k in range(20, 25)) < 10
+
+    def test_empty(self) -> None:
+        assert len(run_bulk([], Tracker())) == 0
+
+    @pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"per_group": 0}])
+    def test_invalid_limits(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            run_bulk([1], Tracker(), **kwargs)
+
+    def test_task_key_of(self) -> None:
+        assert task_key_of({"task": 5}) == 5
+        assert task_key_of({"task": "7"}) == 7
+        assert task_key_of({"task": True}) is None
+        assert task_key_of(None) is None
+
+
+class TestRunBulkAsync:
+    """Tests for the asyncio bulk runner."""
+
+    def test_bounded_with_group_caps(self) -> None:
+        groups = {key: f"node{key % 3}" for key in range(30)}
+        tracker = Tracker(groups)
+
+        result = asyncio.run(
+            run_bulk_async(
+                list(range(-1, 30)),
+                tracker.async_call,
+                concurrency=5,
+                group_by=lambda key: groups.get(key, "x"),
+                per_group=1,
+            )
+        )
+
+        assert isinstance(result, BulkResult)
+        assert result.failed == [-1]
+        assert [item.key for item in result] == list(range(-1, 30))
+        assert all(tracker.peak[f"node{i}"] == 1 for i in range(3))
+        assert tracker.peak["*"] <= 5
+
+
+class TestActionMany:
+    """Tests for ResourceManager.action_many."""
+
+    def test_puts_action_per_key(self, mock_client: VergeClient) -> None:
+        request = MagicMock(side_effect=lambda method, endpoint, **kw: {"task": 50})
+        mock_client._request = request  # type: ignore[method-assign]
+
+        result = mock_client.tasks.action_many([1, 2, 3], "execute", concurrency=2, force=True)
+
+        assert result.ok
+        assert result.task_keys == {1: 50, 2: 50, 3: 50}
+        endpoints = sorted(call.args[1] for call in request.call_args_list)
+        assert endpoints == [f"tasks/{k}?action=execute" for k in (1, 2, 3)]
+        assert all(call.args[0] == "PUT" for call in request.call_args_list)
+        assert all(call.kwargs["json_data"] == {"force": True} for call in request.call_args_list)
+
+    def test_group_by_field(self, mock_client: VergeClient) -> None:
+        def request(method: str, endpoint: str, **kwargs: Any) -> Any:
+            if method == "GET":
+                assert kwargs["params"]["fields"] == "machine#cluster as cluster_key,$key"
+                return [{"$key": k, "cluster_key": k % 2} for k in (1, 2, 3, 4)]
+            return None
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        result = mock_client.vms.action_many(
+            [1, 2, 3, 4],
+            "poweron",
+            group_by="machine#cluster as cluster_key",
+            per_group=1,
+        )
+        assert result.succeeded == [1, 2, 3, 4]
+        assert result.task_keys == {}
+
+
+class ItemManager(ResourceManager[ResourceObject]):
+    """Manager using the generic CRUD methods."""
+
+    _endpoint = "items"
+
+
+class TestCrudMany:
+    """Tests for create_many, update_many and delete_many."""
+
+    @staticmethod
+    def fake_api(fail_names: tuple[str, ...] = ()) -> MagicMock:
+        lock = threading.Lock()
+        state = {"next": 100}
+        log: list[tuple[str, str, Any]] = []
+
+        def request(method: str, endpoint: str, json_data: Any = None, **kwargs: Any) -> Any:
+            with lock:
+                log.append((method, endpoint, json_data))
+            if json_data and json_data.get("name") in fail_names:
+                raise ConflictError("duplicate name", status_code=409)
+            if method == "POST":
+                with lock:
+                    state["next"] += 1
+                    return {"$key": state["next"], **json_data}
+            if method == "PUT":
+                return {"$key": int(endpoint.rsplit("/", 1)[-1]), **json_data}
+            return None
+
+        api = MagicMock(side_effect=request)
+        api.log = log
+        return api
+
+    def test_create_many_reports_per_index(self, mock_client: VergeClient) -> None:
+        api = self.fake_api(fail_names=("b",))
+        mock_client._request = api  # type: ignore[method-assign]
+
+        report = ItemManager(mock_client).create_many(
+            [{"name": "a"}, {"name": "b"}, {"name": "c"}], concurrency=3
+        )
+
+        assert report.succeeded == [0, 2]
+        assert report.failed == [1]
+        assert report.results[0]["name"] == "a"
+        assert report.results[2]["name"] == "c"
+        assert isinstance(report.errors[1], ConflictError)
+        assert report.task_keys == {}
+
+    def test_create_many_ordered(self, mock_client: VergeClient) -> None:
+        api = self.fake_api()
+        mock_client._request = api  # type: ignore[method-assign]
+        names = [f"r{i}" for i in range(20)]
+
+        report = ItemManager(mock_client).create_many([{"name": n} for n in names], ordered=True)
+
+        assert report.ok
+        assert [data["name"] for _, _, data in api.log] == names
+
+    def test_create_many_in_order_per_group(self, mock_client: VergeClient) -> None:
+        api = self.fake_api()
+        mock_client._request = api  # type: ignore[method-assign]
+        items = [{"name": f"r{i}", "network": i % 3} for i in range(30)]
+
+        report = ItemManager(mock_client).create_many(items, group_by="network", per_group=1)
+
+        assert report.ok
+        for network in range(3):
+            sent = [data["name"] for _, _, data in api.log if data["network"] == network]
+            assert sent == [item["name"] for item in items if item["network"] == network]
+
+    def test_update_many(self, mock_client: VergeClient) -> None:
+        api = self.fake_api(fail_names=("bad",))
+        mock_client._request = api  # type: ignore[method-assign]
+
+        report = ItemManager(mock_client).update_many({5: {"name": "x"}, 6: {"name": "bad"}})
+
+        assert report.succeeded == [5]
+        assert report.failed == [6]
+        assert report.results[5]["name"] == "x"
+        assert sorted(endpoint for _, endpoint, _ in api.log) == ["items/5", "items/6"]
+
+    def test_update_many_pairs(self, mock_client: VergeClient) -> None:
+        mock_client._request = self.fake_api()  # type: ignore[method-assign]
+        report = ItemManager(mock_client).update_many([(1, {"name": "a"}), (2, {"name": "b"})])
+        assert [item.key for item in report] == [1, 2]
+
+    def test_update_many_duplicate_keys(self, mock_client: VergeClient) -> None:
+        api = self.fake_api()
+        mock_client._request = api  # type: ignore[method-assign]
+
+        with pytest.raises(ValueError, match="Duplicate key"):
+            ItemManager(mock_client).update_many([(1, {"name": "a"}), (1, {"name": "b"})])
+        assert api.log == []
+
+    def test_delete_many(self, mock_client: VergeClient) -> None:
+        api = self.fake_api()
+        mock_client._request = api  # type: ignore[method-assign]
+
+        report = ItemManager(mock_client).delete_many([3, 1, 2], concurrency=2)
+
+        assert report.ok
+        assert [item.key for item in report] == [3, 1, 2]
+        assert sorted(endpoint for method, endpoint, _ in api.log if method == "DELETE") == [
+            "items/1",
+            "items/2",
+            "items/3",
+        ]
@@ -0,0 +1,227 @@
+"""Tests for the GET response cache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.cache import ResponseCache, endpoint_base, invalidation_targets
+from pyvergeos.exceptions import APIError, NotConnectedError
+
+
+def counting_fetch(value: Any) -> MagicMock:
+    """Return a mock fetch function returning ``value``."""
+    return MagicMock(return_value=value)
+
+
+class TestEndpointHelpers:
+    """Tests for endpoint_base and invalidation_targets."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "base"),
+        [
+            ("vms", "vms"),
+            ("vms/12", "vms"),
+            ("vms/12?action=poweron", "vms"),
+            ("/settings", "settings"),
+        ],
+    )
+    def test_endpoint_base(self, endpoint: str, base: str) -> None:
+        assert endpoint_base(endpoint) == base
+
+    def test_action_endpoint_invalidates_subject(self) -> None:
+        assert invalidation_targets("vm_actions") == {"vm_actions", "vm", "vms"}
+        assert invalidation_targets("clusters/1") == {"clusters"}
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_cacheable_endpoint_hits(self) -> None:
+        cache = ResponseCache()
+        fetch = counting_fetch([{"$key": 1, "name": "c1"}])
+
+        first = cache.get_or_fetch("k", "clusters", fetch)
+        second = cache.get_or_fetch("k", "clusters", fetch)
+
+        assert first == second == [{"$key": 1, "name": "c1"}]
+        assert fetch.call_count == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_uncached_endpoint_passes_through(self) -> None:
+        cache = ResponseCache()
+        fetch = counting_fetch({"$key": 1})
+        cache.get_or_fetch("k", "vms/1", fetch)
+        cache.get_or_fetch("k", "vms/1", fetch)
+        assert fetch.call_count == 2
+        assert len(cache) == 0
+        assert cache.stats().misses == 0
+
+    def test_ttl_overrides_and_default(self) -> None:
+        cache = ResponseCache(ttls={"vms": 5, "clusters": 0}, default_ttl=1)
+        assert cache.ttl_for("vms/3") == 5
+        assert cache.ttl_for("clusters") == 0
+        assert cache.ttl_for("settings") == 300
+        assert cache.ttl_for("nodes") == 1
+
+    def test_entries_expire(self) -> None:
+        cache = ResponseCache(ttls={"machine_status": 2})
+        fetch = counting_fetch({"status": "running"})
+        with patch("pyvergeos.cache.time.monotonic", return_value=100.0):
+            cache.get_or_fetch("k", "machine_status", fetch)
+        with patch("pyvergeos.cache.time.monotonic", return_value=101.0):
+            cache.get_or_fetch("k", "machine_status", fetch)
+        assert fetch.call_count == 1
+        with patch("pyvergeos.cache.time.monotonic", return_value=102.5):
+            cache.get_or_fetch("k", "machine_status", fetch)
+        assert fetch.call_count == 2
+
+    def test_callers_get_private_copies(self) -> None:
+        cache = ResponseCache()
+        fetched = cache.get_or_fetch("k", "settings", lambda: {"tags": ["a"]})
+        fetched["tags"].append("mutated")
+        cached = cache.get_or_fetch("k", "settings", lambda: None)
+        cached["tags"].append("again")
+        assert cache.get_or_fetch("k", "settings", lambda: None) == {"tags": ["a"]}
+
+    def test_lru_eviction_by_entries(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        cache.get_or_fetch("a", "clusters", lambda: 1)
+        cache.get_or_fetch("b", "clusters", lambda: 2)
+        cache.get_or_fetch("a", "clusters", lambda: 0)  # touch a
+        cache.get_or_fetch("c", "clusters", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.stats().evictions == 1
+        assert cache.get_or_fetch("a", "clusters", lambda: "refetched") == 1
+        assert cache.get_or_fetch("b", "clusters", lambda: "refetched") == "refetched"
+
+    def test_eviction_by_bytes(self) -> None:
+        cache = ResponseCache(max_bytes=100)
+        cache.get_or_fetch("a", "clusters", lambda: "x" * 60)
+        cache.get_or_fetch("b", "clusters", lambda: "y" * 60)
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.bytes <= 100
+
+    def test_invalidate(self) -> None:
+        cache = ResponseCache()
+        cache.get_or_fetch("a", "clusters", lambda: 1)
+        cache.get_or_fetch("b", "clusters/1", lambda: 2)
+        cache.get_or_fetch("c", "settings", lambda: 3)
+
+        assert cache.invalidate("clusters/1?action=refresh") == 2
+        assert len(cache) == 1
+        assert cache.stats().invalidations == 2
+
+    def test_write_during_fetch_not_stored(self) -> None:
+        cache = ResponseCache()
+
+        def fetch_racing_write() -> int:
+            cache.invalidate("clusters/1")
+            return 1
+
+        cache.get_or_fetch("a", "clusters", fetch_racing_write)
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        cache = ResponseCache()
+
+        def fetch_racing_clear() -> int:
+            cache.clear()
+            return 1
+
+        cache.get_or_fetch("a", "settings", lambda: 1)
+        cache.get_or_fetch("b", "clusters", fetch_racing_clear)
+        assert len(cache) == 0
+
+    def test_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+        with pytest.raises(ValueError):
+            ResponseCache(max_bytes=0)
+
+
+class TestVergeClientCache:
+    """Tests for the cache option on VergeClient."""
+
+    @pytest.fixture
+    def client(self, mock_session: MagicMock) -> VergeClient:
+        mock_session.request.return_value.json.return_value = {
+            "$key": 1,
+            "yb_version": "4.12.0",
+        }
+        client = VergeClient(host="test.example.com", token="t", cache=True)
+        mock_session.request.reset_mock()
+        return client
+
+    def test_disabled_by_default(self, mock_client: VergeClient) -> None:
+        assert mock_client.cache is None
+
+    def test_gets_cached(self, client: VergeClient, mock_session: MagicMock) -> None:
+        client._request("GET", "clusters", params={"fields": "all"})
+        client._request("GET", "clusters", params={"fields": "all"})
+        client._request("GET", "clusters", params={"fields": "name"})
+        assert mock_session.request.call_count == 2
+
+    def test_writes_invalidate_endpoint(self, client: VergeClient, mock_session: MagicMock) -> None:
+        client._request("GET", "clusters")
+        client._request("PUT", "clusters/1", json_data={"name": "x"})
+        client._request("GET", "clusters")
+        assert mock_session.request.call_count == 3
+
+    def test_failed_write_still_invalidates(
+        self, client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        client._request("GET", "settings")
+        assert client.cache is not None
+        assert len(client.cache) == 1
+        mock_session.request.return_value.status_code = 500
+        mock_session.request.return_value.json.return_value = {"err": "boom"}
+        with pytest.raises(APIError, match="boom"):
+            client._request("PUT", "settings/1", json_data={"value": "x"})
+        assert len(client.cache) == 0
+
+    def test_manager_action_invalidates(self, client: VergeClient, mock_session: MagicMock) -> None:
+        client.storage_tiers.list()
+        client.storage_tiers.action(1, "refresh")
+        client.storage_tiers.list()
+        assert mock_session.request.call_count == 3
+
+    def test_custom_cache_instance(self, mock_session: MagicMock) -> None:
+        cache = ResponseCache(ttls={"vms": 10})
+        client = VergeClient(host="test.example.com", token="t", cache=cache)
+        assert client.cache is cache
+
+    def test_shared_cache_scoped_per_identity(self, mock_session: MagicMock) -> None:
+        cache = ResponseCache()
+        clients = [
+            VergeClient(host="test.example.com", token="t", cache=cache),
+            VergeClient(host="test.example.com", token="other", cache=cache),
+            VergeClient(host="other.example.com", token="t", cache=cache),
+        ]
+        mock_session.request.reset_mock()
+
+        for client in clients:
+            client._request("GET", "clusters")
+        clients[0]._request("GET", "clusters")
+
+        assert mock_session.request.call_count == 3
+        assert len(cache) == 3
+
+    def test_not_connected_bypasses_cache(self, client: VergeClient) -> None:
+        client._request("GET", "clusters")
+        client.disconnect()
+        with pytest.raises(NotConnectedError):
+            client._request("GET", "clusters")
+
+    def test_from_env(self, mock_session: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("VERGE_HOST", "test.example.com")
+        monkeypatch.setenv("VERGE_TOKEN", "t")
+        monkeypatch.setenv("VERGE_CACHE", "1")
+        assert VergeClient.from_env().cache is not None
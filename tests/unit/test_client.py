@@ -262,3 +262,47 @@ class TestVergeClientRetryConfig:
         assert client._connection is not None
         assert client._connection.retry_total == 7
         client.disconnect()
+
+
+class TestVergeClientPoolConfig:
+    """Tests for VergeClient connection pool configuration."""
+
+    def test_pool_params_passed_to_connection(self, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = {"$key": 1}
+
+        client = VergeClient(
+            host="test.example.com",
+            username="admin",
+            password="secret",
+            pool_maxsize=50,
+            pool_block=True,
+            tcp_keepalive=True,
+        )
+
+        assert client._connection is not None
+        assert client._connection.pool_maxsize == 50
+        assert client._connection.pool_block is True
+        assert client._connection.tcp_keepalive is True
+        client.disconnect()
+
+    def test_pool_params_from_env(
+        self, mock_session: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock_session.request.return_value.json.return_value = {"$key": 1}
+        monkeypatch.setenv("VERGE_HOST", "test.example.com")
+        monkeypatch.setenv("VERGE_TOKEN", "token")
+        monkeypatch.setenv("VERGE_POOL_MAXSIZE", "25")
+        monkeypatch.setenv("VERGE_POOL_BLOCK", "true")
+
+        client = VergeClient.from_env()
+
+        assert client._pool_maxsize == 25
+        assert client._pool_block is True
+        assert client._tcp_keepalive is False
+        client.disconnect()
+
+    def test_pool_stats(self, mock_client: VergeClient) -> None:
+        stats = mock_client.pool_stats
+        assert stats.requests == 0
+        mock_client.disconnect()
+        assert mock_client.pool_stats.requests == 0
@@ -0,0 +1,157 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.coalesce import SingleFlight, request_key
+
+
+def run_concurrently(count: int, target: Any) -> list[Any]:
+    """Run ``target`` in ``count`` threads released at the same moment."""
+    barrier = threading.Barrier(count)
+    results: list[Any] = [None] * count
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestRequestKey:
+    """Tests for request_key."""
+
+    def test_param_order_ignored(self) -> None:
+        assert request_key("GET", "vms", {"a": 1, "b": 2}) == request_key(
+            "get", "vms", {"b": 2, "a": 1}
+        )
+
+    def test_distinct_requests(self) -> None:
+        assert request_key("GET", "vms") != request_key("GET", "nodes")
+        assert request_key("GET", "vms", {"limit": 1}) != request_key("GET", "vms", {"limit": 2})
+        assert request_key("GET", "vms", None) == request_key("GET", "vms", {})
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_sequential_calls_not_shared(self) -> None:
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.calls == 2
+        assert flight.coalesced == 0
+        assert flight.inflight == 0
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        executions: list[int] = []
+
+        def slow() -> dict[str, Any]:
+            executions.append(1)
+            time.sleep(0.1)
+            return {"$key": 1, "nested": {"v": 1}}
+
+        results = run_concurrently(10, lambda: flight.do("k", slow))
+
+        assert len(executions) == 1
+        assert flight.calls == 1
+        assert flight.coalesced == 9
+        assert all(r == {"$key": 1, "nested": {"v": 1}} for r in results)
+        # Each caller gets its own copy
+        assert len({id(r) for r in results}) == 10
+        assert len({id(r["nested"]) for r in results}) == 10
+
+    def test_errors_propagate_to_waiters(self) -> None:
+        flight = SingleFlight()
+
+        def boom() -> None:
+            time.sleep(0.1)
+            raise RuntimeError("down")
+
+        results = run_concurrently(5, lambda: flight.do("k", boom))
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.calls == 1
+        assert flight.inflight == 0
+
+    def test_different_keys_not_shared(self) -> None:
+        flight = SingleFlight()
+        keys = iter(["a", "b", "c", "a", "b", "c"])
+        lock = threading.Lock()
+
+        def call() -> Any:
+            with lock:
+                key = next(keys)
+            return flight.do(key, lambda: (time.sleep(0.1), key)[1])
+
+        results = run_concurrently(6, call)
+
+        assert sorted(results) == ["a", "a", "b", "b", "c", "c"]
+        assert flight.calls == 3
+        assert flight.coalesced == 3
+
+
+class TestVergeClientCoalescing:
+    """Tests for the coalesce_requests option."""
+
+    @pytest.fixture
+    def slow_session(self, mock_session: MagicMock) -> MagicMock:
+        def respond(**kwargs: Any) -> MagicMock:
+            time.sleep(0.1)
+            response = MagicMock()
+            response.status_code = 200
+            response.text = "{}"
+            response.json.return_value = {"$key": 1, "yb_version": "4.12.0"}
+            return response
+
+        mock_session.request.side_effect = respond
+        return mock_session
+
+    def make_client(self, **kwargs: Any) -> VergeClient:
+        return VergeClient(host="test.example.com", token="t", **kwargs)
+
+    def test_disabled_by_default(self, slow_session: MagicMock) -> None:
+        client = self.make_client()
+        slow_session.request.reset_mock()
+        run_concurrently(5, lambda: client._request("GET", "system"))
+        assert slow_session.request.call_count == 5
+
+    def test_concurrent_gets_coalesced(self, slow_session: MagicMock) -> None:
+        client = self.make_client(coalesce_requests=True)
+        slow_session.request.reset_mock()
+
+        results = run_concurrently(
+            20, lambda: client._request("GET", "clusters", params={"fields": "all"})
+        )
+
+        assert slow_session.request.call_count == 1
+        assert all(r == {"$key": 1, "yb_version": "4.12.0"} for r in results)
+
+    def test_writes_never_coalesced(self, slow_session: MagicMock) -> None:
+        client = self.make_client(coalesce_requests=True)
+        slow_session.request.reset_mock()
+        run_concurrently(4, lambda: client._request("PUT", "vms/1", json_data={"a": 1}))
+        assert slow_session.request.call_count == 4
+
+    def test_from_env(self, mock_session: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("VERGE_HOST", "test.example.com")
+        monkeypatch.setenv("VERGE_TOKEN", "t")
+        monkeypatch.setenv("VERGE_COALESCE_REQUESTS", "true")
+        client = VergeClient.from_env()
+        assert client._singleflight is not None
@@ -0,0 +1,173 @@
+"""Tests for the pluggable JSON decoder."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+import requests
+
+from pyvergeos import codec
+from pyvergeos.client import handle_response
+from pyvergeos.exceptions import NotFoundError
+
+
+def make_response(body: bytes, status_code: int = 200) -> requests.Response:
+    """Build a real requests.Response with the given body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def restore_decoder() -> Generator[None, None, None]:
+    """Restore auto-detected decoder after each test."""
+    yield
+    codec.set_json_decoder(None)
+
+
+class TestCodec:
+    """Tests for backend selection."""
+
+    def test_auto_detects_a_backend(self) -> None:
+        assert codec.json_backend() in codec.BACKENDS
+
+    def test_force_stdlib(self) -> None:
+        codec.set_json_decoder("json")
+        assert codec.json_backend() == "json"
+        assert codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_orjson_backend(self) -> None:
+        pytest.importorskip("orjson")
+        codec.set_json_decoder("orjson")
+        assert codec.json_backend() == "orjson"
+        assert codec.loads(b'[{"$key": 1}]') == [{"$key": 1}]
+
+    def test_msgspec_backend(self) -> None:
+        pytest.importorskip("msgspec")
+        codec.set_json_decoder("msgspec")
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+        with pytest.raises(ValueError):
+            codec.loads(b"{")
+
+    def test_custom_decoder(self) -> None:
+        calls: list[Any] = []
+
+        def decoder(data: bytes | str) -> Any:
+            calls.append(data)
+            return json.loads(data)
+
+        codec.set_json_decoder(decoder)
+        assert codec.json_backend() == "custom"
+        assert codec.loads(b"{}") == {}
+        assert calls == [b"{}"]
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            codec.set_json_decoder("yaml")
+
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    def test_invalid_json_raises_value_error(self, backend: str) -> None:
+        if backend != "json":
+            pytest.importorskip(backend)
+        codec.set_json_decoder(backend)
+        with pytest.raises(ValueError):
+            codec.loads(b"not json")
+
+
+class TestHandleResponseDecoding:
+    """Tests for the single decode path in handle_response."""
+
+    def test_decodes_content_once(self) -> None:
+        calls: list[Any] = []
+
+        def decoder(data: bytes | str) -> Any:
+            calls.append(data)
+            return json.loads(data)
+
+        codec.set_json_decoder(decoder)
+        response = make_response(b'[{"$key": 1, "name": "vm1"}]')
+
+        assert handle_response(response) == [{"$key": 1, "name": "vm1"}]
+        assert calls == [b'[{"$key": 1, "name": "vm1"}]']
+
+    def test_empty_body_returns_none(self) -> None:
+        assert handle_response(make_response(b"")) is None
+
+    def test_unicode_body(self) -> None:
+        body = json.dumps({"name": "réseau-ü"}, ensure_ascii=False).encode()
+        assert handle_response(make_response(body)) == {"name": "réseau-ü"}
+
+    def test_errors_still_mapped(self) -> None:
+        with pytest.raises(NotFoundError, match="gone"):
+            handle_response(make_response(b'{"err": "gone"}', status_code=404))
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    """Split ``body`` into chunks of ``size`` bytes."""
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class TestIterJsonArray:
+    """Tests for incremental array decoding."""
+
+    ROWS: list[Any] = [
+        {"$key": i, "text": "réseau ü" * (i % 3), "vals": [1.5, None, True], "n": 123456789}
+        for i in range(50)
+    ] + [7, "s", [], {}]
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 100_000])
+    def test_any_chunking(self, size: int) -> None:
+        body = json.dumps(self.ROWS, ensure_ascii=False).encode()
+        assert list(codec.iter_json_array(chunked(body, size))) == self.ROWS
+
+    def test_numbers_split_across_chunks(self) -> None:
+        assert list(codec.iter_json_array([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b"[1.5, 2]",
+            b"[1.5e3, -2.25E-2,7]",
+            b'[0.125,{"a": 1e-7}, 3.0 ,true,null, false]',
+            b"[12345.678e+10]",
+        ],
+    )
+    def test_split_at_every_offset(self, body: bytes) -> None:
+        expected = json.loads(body)
+        for offset in range(len(body) + 1):
+            chunks = [body[:offset], body[offset:]]
+            assert list(codec.iter_json_array(chunks)) == expected, offset
+
+    def test_float_split_after_dot_or_exponent(self) -> None:
+        assert list(codec.iter_json_array([b"[1.", b"5, 2]"])) == [1.5, 2]
+        assert list(codec.iter_json_array([b"[1.5e", b"3, 2]"])) == [1500.0, 2]
+
+    def test_yields_before_body_complete(self) -> None:
+        consumed: list[int] = []
+
+        def chunks() -> Any:
+            for i, chunk in enumerate([b'[{"a": 1},', b'{"a": 2}', b"]"]):
+                consumed.append(i)
+                yield chunk
+
+        items = codec.iter_json_array(chunks())
+        assert next(items) == {"a": 1}
+        assert consumed == [0]
+        assert list(items) == [{"a": 2}]
+
+    def test_empty(self) -> None:
+        assert list(codec.iter_json_array([])) == []
+        assert list(codec.iter_json_array([b" [ ] "])) == []
+
+    def test_single_object(self) -> None:
+        assert list(codec.iter_json_array([b'{"$key":', b" 1}"])) == [{"$key": 1}]
+
+    @pytest.mark.parametrize("body", [b"[1,]", b"[1 2]", b"[1", b"[,1]", b"[1] x", b"[tru]"])
+    def test_invalid(self, body: bytes) -> None:
+        with pytest.raises(ValueError):
+            list(codec.iter_json_array(chunked(body, 2)))
@@ -0,0 +1,195 @@
+"""Tests for columnar result sets."""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.columnar import ColumnSet, column_name, resolve_backend, to_columns
+from pyvergeos.resources.drives import DriveManager
+from pyvergeos.resources.machine_stats import MachineStatsManager
+from pyvergeos.resources.tags import TagMemberManager
+from tests.conftest import stream_response
+
+ROWS: list[dict[str, Any]] = [
+    {"$key": 1, "timestamp": 100, "total_cpu": 5, "ram_pct": 1.5, "up": True, "name": "a"},
+    {"$key": 2, "timestamp": 101, "total_cpu": 7, "ram_pct": 2, "up": False, "name": "b"},
+    {"$key": 3, "timestamp": 102, "total_cpu": None, "ram_pct": 3.0, "up": True, "name": None},
+]
+
+
+class TestToColumns:
+    """Tests for column building with the stdlib backend."""
+
+    def test_types(self) -> None:
+        cols = to_columns(
+            ROWS, ["$key", "timestamp", "total_cpu", "ram_pct", "up", "name"], "array"
+        )
+
+        assert cols.num_rows == 3
+        assert cols.columns == ["$key", "timestamp", "total_cpu", "ram_pct", "up", "name"]
+        assert cols["timestamp"] == array("q", [100, 101, 102])
+        # Integers with a null become floats with NaN
+        assert cols["total_cpu"].typecode == "d"
+        assert list(cols["total_cpu"])[:2] == [5.0, 7.0]
+        assert math.isnan(cols["total_cpu"][2])
+        assert cols["ram_pct"] == array("d", [1.5, 2.0, 3.0])
+        assert cols["up"] == array("b", [1, 0, 1])
+        assert cols["name"] == ["a", "b", None]
+
+    def test_leading_nulls(self) -> None:
+        cols = to_columns([{"a": None}, {"a": None}, {"a": 4}], ["a"], "array")
+        assert cols["a"].typecode == "d"
+        assert [math.isnan(v) for v in cols["a"]] == [True, True, False]
+
+    def test_mixed_values_become_objects(self) -> None:
+        cols = to_columns([{"a": 1}, {"a": "x"}, {"a": True}, {"a": [1, 2]}], ["a"], "array")
+        assert cols["a"] == [1, "x", True, [1, 2]]
+
+    def test_bool_then_null(self) -> None:
+        cols = to_columns([{"a": True}, {"a": None}], ["a"], "array")
+        assert cols["a"] == [True, None]
+
+    def test_huge_int(self) -> None:
+        cols = to_columns([{"a": 1}, {"a": 2**70}], ["a"], "array")
+        assert cols["a"] == [1, 2**70]
+
+    def test_aliases_and_missing_fields(self) -> None:
+        cols = to_columns([{"node_key": 4}], ["machine#status#node as node_key", "other"], "array")
+        assert cols["node_key"] == array("q", [4])
+        assert cols["other"] == [None]
+
+    def test_discovers_columns(self) -> None:
+        cols = to_columns([{"a": 1}, {"a": 2, "b": 3.5}], backend="array")
+        assert cols.columns == ["a", "b"]
+        assert math.isnan(cols["b"][0])
+        assert cols["b"][1] == 3.5
+
+    def test_rows_round_trip(self) -> None:
+        cols = to_columns([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}], ["a", "b"], "array")
+        assert list(cols.rows()) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+        assert dict(cols) == {"a": array("q", [1, 2]), "b": ["x", "y"]}
+
+    def test_empty(self) -> None:
+        cols = to_columns([], ["a"], "array")
+        assert cols.num_rows == 0
+        assert cols["a"] == []
+
+    def test_column_name(self) -> None:
+        assert column_name("machine#status#node as node_key") == "node_key"
+        assert column_name("$key") == "$key"
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError):
+            resolve_backend("arrow")
+
+
+class TestNumpyBackend:
+    """Tests for NumPy columns."""
+
+    def test_dtypes(self) -> None:
+        np = pytest.importorskip("numpy")
+        cols = to_columns(ROWS, ["timestamp", "total_cpu", "up", "name"], "numpy")
+
+        assert cols["timestamp"].dtype == np.int64
+        assert cols["timestamp"].sum() == 303
+        assert cols["total_cpu"].dtype == np.float64
+        assert np.nanmean(cols["total_cpu"]) == 6.0
+        assert cols["up"].dtype == bool
+        assert cols["name"].dtype == object
+
+    def test_list_values_kept_whole(self) -> None:
+        pytest.importorskip("numpy")
+        cols = to_columns([{"a": [1, 2]}, {"a": [3, 4]}], ["a"], "numpy")
+        assert cols["a"][1] == [3, 4]
+
+    def test_empty_numeric(self) -> None:
+        pytest.importorskip("numpy")
+        cols = to_columns([], ["a"], "numpy")
+        assert len(cols["a"]) == 0
+        cols = to_columns([{"a": None}], ["a"], "numpy")
+        assert cols["a"].dtype == object
+
+
+class TestManagerColumnar:
+    """Tests for list_columnar, iter_columnar and history_columnar."""
+
+    def test_list_columnar_streams(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = stream_response(json.dumps(ROWS).encode(), chunk=50)
+
+        cols = mock_client.logs.list_columnar(
+            fields=["timestamp", "name"], level="error", backend="array"
+        )
+
+        assert isinstance(cols, ColumnSet)
+        assert cols["timestamp"] == array("q", [100, 101, 102])
+        call = mock_session.request.call_args
+        assert call.kwargs["stream"] is True
+        assert call.kwargs["params"]["filter"] == "level eq 'error'"
+
+    def test_iter_columnar_offset(self, mock_client: VergeClient) -> None:
+        rows = [{"$key": k, "value": k * 2} for k in range(1, 26)]
+
+        def request(method: str, endpoint: str, params: dict[str, Any]) -> Any:
+            return rows[params["offset"] : params["offset"] + params["limit"]]
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        batches = list(
+            mock_client.tags.iter_columnar(["$key", "value"], page_size=10, backend="array")
+        )
+
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert sum(sum(b["value"]) for b in batches) == sum(r["value"] for r in rows)
+
+    def test_iter_columnar_keyset(self, mock_client: VergeClient) -> None:
+        rows = [{"$key": k, "value": k} for k in range(1, 21)]
+
+        def request(method: str, endpoint: str, params: dict[str, Any]) -> Any:
+            after = int(params["filter"].rsplit(" ", 1)[-1]) if "filter" in params else 0
+            return [r for r in rows if r["$key"] > after][: params["limit"]]
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        batches = list(
+            mock_client.tags.iter_columnar(["value"], page_size=8, keyset=True, backend="array")
+        )
+
+        assert [b.num_rows for b in batches] == [8, 8, 4]
+        assert [v for b in batches for v in b["value"]] == list(range(1, 21))
+
+    def test_list_columnar_scoped(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = stream_response(json.dumps(ROWS).encode(), chunk=50)
+        vm = MagicMock()
+        vm.get.return_value = 8
+
+        DriveManager(mock_client, vm).list_columnar(fields=["name"], media="disk", backend="array")
+
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "machine eq 8 and media eq 'disk'"
+
+    def test_iter_columnar_scoped(self, mock_client: VergeClient) -> None:
+        mock_client._request = MagicMock(return_value=[])  # type: ignore[method-assign]
+        members = TagMemberManager(mock_client, tag_key=4)
+
+        assert list(members.iter_columnar(["member"], backend="array")) == []
+        assert list(members.iter_columnar(["member"], keyset=True, backend="array")) == []
+
+        filters = [call.kwargs["params"]["filter"] for call in mock_client._request.call_args_list]
+        assert filters == ["tag eq 4", "(tag eq 4)"]
+
+    def test_history_columnar(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = stream_response(json.dumps(ROWS).encode(), chunk=50)
+        stats = MachineStatsManager(mock_client, machine_key=9)
+
+        cols = stats.history_columnar(long=True, fields=["timestamp", "total_cpu"], backend="array")
+
+        assert cols.columns == ["timestamp", "total_cpu"]
+        call = mock_session.request.call_args
+        assert call.kwargs["url"].endswith("/machine_stats_history_long")
+        assert call.kwargs["params"]["filter"] == "machine eq 9"
+        assert call.kwargs["params"]["sort"] == "-timestamp"
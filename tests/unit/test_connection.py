@@ -1,12 +1,32 @@
 """Tests for connection module."""
 
+import socket
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
-
-from pyvergeos.connection import AuthMethod, VergeConnection, build_auth_header
-from pyvergeos.constants import RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES, RETRY_TOTAL
+import requests
+
+from pyvergeos.connection import (
+    AuthMethod,
+    InstrumentedHTTPAdapter,
+    PoolStats,
+    VergeConnection,
+    build_auth_header,
+    tcp_keepalive_socket_options,
+)
+from pyvergeos.constants import (
+    POOL_BLOCK,
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_CODES,
+    RETRY_TOTAL,
+)
 
 
 class TestAuthMethod:
@@ -152,3 +172,126 @@ class TestVergeConnectionRetryConfig:
         assert conn.retry_total == 10
         assert conn.retry_backoff_factor == 0.5
         assert conn.retry_status_codes == custom_codes
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that holds each request briefly."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(0.05)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server() -> Generator[str, None, None]:
+    """Local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _session_with(adapter: InstrumentedHTTPAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+class TestVergeConnectionPoolConfig:
+    """Tests for connection pool configuration."""
+
+    def test_default_pool_values(self) -> None:
+        conn = VergeConnection(host="test.local")
+        assert conn.pool_maxsize == POOL_MAXSIZE
+        assert conn.pool_block == POOL_BLOCK
+        assert conn.tcp_keepalive is False
+        assert conn._adapter is not None
+        assert conn._adapter._pool_maxsize == POOL_MAXSIZE
+
+    def test_custom_pool_values(self) -> None:
+        conn = VergeConnection(
+            host="test.local", pool_connections=2, pool_maxsize=32, pool_block=True
+        )
+        assert conn._adapter is not None
+        assert conn._adapter._pool_connections == 2
+        assert conn._adapter._pool_maxsize == 32
+        assert conn._adapter._pool_block is True
+
+    def test_tcp_keepalive_socket_options(self) -> None:
+        options = tcp_keepalive_socket_options()
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_tcp_keepalive_applied_to_pools(self) -> None:
+        conn = VergeConnection(host="test.local", tcp_keepalive=True)
+        assert conn._adapter is not None
+        pool_kw = conn._adapter.poolmanager.connection_pool_kw
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kw["socket_options"]
+
+    def test_pool_stats_empty(self) -> None:
+        conn = VergeConnection(host="test.local")
+        assert conn.pool_stats() == PoolStats()
+
+    def test_pool_stats_without_adapter(self) -> None:
+        conn = VergeConnection(host="test.local")
+        conn._adapter = None
+        conn._session = None
+        assert conn.pool_stats() == PoolStats()
+
+
+class TestPoolStats:
+    """Tests for PoolStats accounting against a local server."""
+
+    def test_derived_values(self) -> None:
+        stats = PoolStats(requests=4, connections_reused=3, wait_time_total=2.0)
+        assert stats.reuse_ratio == 0.75
+        assert stats.wait_time_avg == 0.5
+        assert PoolStats().wait_time_avg == 0.0
+
+    def test_sequential_requests_reuse_connection(self, local_server: str) -> None:
+        adapter = InstrumentedHTTPAdapter(pool_maxsize=2)
+        session = _session_with(adapter)
+        for _ in range(5):
+            session.get(local_server).json()
+
+        stats = adapter.pool_stats()
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 4
+        assert stats.connections_discarded == 0
+        assert stats.connections_in_use == 0
+        assert stats.connections_idle == 1
+
+    def test_overflow_connections_are_discarded(self, local_server: str) -> None:
+        adapter = InstrumentedHTTPAdapter(pool_maxsize=1)
+        session = _session_with(adapter)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: session.get(local_server).json(), range(4)))
+
+        stats = adapter.pool_stats()
+        assert stats.requests == 4
+        assert stats.connections_opened > 1
+        assert stats.connections_discarded == stats.connections_opened - 1
+
+    def test_blocking_pool_waits_instead_of_discarding(self, local_server: str) -> None:
+        adapter = InstrumentedHTTPAdapter(pool_maxsize=1, pool_block=True)
+        session = _session_with(adapter)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: session.get(local_server).json(), range(4)))
+
+        stats = adapter.pool_stats()
+        assert stats.connections_opened == 1
+        assert stats.connections_discarded == 0
+        assert stats.wait_time_max > 0
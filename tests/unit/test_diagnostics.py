@@ -225,7 +225,7 @@ class TestSystemDiagnosticManager:
         body = post_call.kwargs["json_data"]
         assert body["send2support"] is True
 
-    @patch("pyvergeos.resources.diagnostics.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_wait_complete(
         self,
         mock_sleep: MagicMock,
@@ -237,8 +237,8 @@ class TestSystemDiagnosticManager:
         diag = manager.wait(1, timeout=10)
         assert diag.is_complete
 
-    @patch("pyvergeos.resources.diagnostics.time.sleep")
-    @patch("pyvergeos.resources.diagnostics.time.monotonic")
+    @patch("pyvergeos.polling.time.sleep")
+    @patch("pyvergeos.polling.time.monotonic")
     def test_wait_timeout(
         self,
         mock_monotonic: MagicMock,
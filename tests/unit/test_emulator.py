@@ -0,0 +1,218 @@
+"""Tests for the in-process VergeOS API emulator."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+from pyvergeos import AsyncVergeClient, VergeClient
+from pyvergeos.emulator import FilterSyntaxError, VergeEmulator, parse_filter
+from pyvergeos.exceptions import APIError, AuthenticationError, NotFoundError
+from pyvergeos.ratelimit import RateLimiter
+
+pytestmark = pytest.mark.emulator(task_duration=0.1, seed=1)
+
+
+class TestParseFilter:
+    """Tests for the emulator's filter parser."""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("name eq 'web'", True),
+            ("name ne 'web'", False),
+            ("ram ge 2048 and ram lt 4096", True),
+            ("ram gt 2048 or name like 'w%'", True),
+            ("(ram gt 4096 or name eq 'db') and $key in (1, 2)", False),
+            ("$key in (1, 2)", True),
+            ("name like 'W_B'", True),
+            ("note eq null", True),
+            ("enabled eq true", True),
+            ("name eq 'it''s'", False),
+        ],
+    )
+    def test_expressions(self, expression: str, expected: bool) -> None:
+        row = {"$key": 2, "name": "web", "ram": 2048, "enabled": True, "note": None}
+        assert parse_filter(expression)(row) is expected
+
+    @pytest.mark.parametrize("expression", ["name eq", "name foo 'x'", "(name eq 'x'", "a eq 1 b"])
+    def test_invalid(self, expression: str) -> None:
+        with pytest.raises(FilterSyntaxError):
+            parse_filter(expression)
+
+
+class TestEmulatorQueries:
+    """Tests for list/get queries through VergeClient."""
+
+    def test_connects(self, client: VergeClient) -> None:
+        assert client.is_connected
+        assert client.cloud_name == "emulator"
+
+    def test_filter_limit_offset(self, client: VergeClient) -> None:
+        vms = client.vms.list(filter="ram ge 3072", limit=3, offset=1)
+        assert [vm.name for vm in vms] == ["vm3", "vm6", "vm7"]
+
+    def test_fields_and_sort(self, client: VergeClient) -> None:
+        rows = client._request("GET", "vms", params={"fields": "$key,name as n", "sort": "-name"})
+        assert isinstance(rows, list)
+        assert rows[0] == {"$key": 10, "n": "vm9"}
+        assert set(rows[-1]) == {"$key", "n"}
+
+    def test_get_and_missing(self, client: VergeClient) -> None:
+        assert client.vms.get(3).name == "vm2"
+        with pytest.raises(NotFoundError):
+            client.vms.get(999)
+
+    def test_bad_filter_is_rejected(self, client: VergeClient) -> None:
+        with pytest.raises(APIError, match="filter"):
+            client._request("GET", "vms", params={"filter": "name eq"})
+
+    def test_pagination_and_streaming(self, client: VergeClient) -> None:
+        assert len(list(client.vms.iter_all(page_size=6))) == 20
+        assert len(list(client.vms.iter_all(page_size=6, keyset=True))) == 20
+        assert len(list(client.vms.stream())) == 20
+
+    def test_create_update_delete(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        created = client._request("POST", "networks", json_data={"name": "lan"})
+        assert isinstance(created, dict)
+        key = created["$key"]
+        client._request("PUT", f"networks/{key}", json_data={"description": "x"})
+        assert emulator.records("networks") == [{"$key": key, "name": "lan", "description": "x"}]
+        client._request("DELETE", f"networks/{key}")
+        assert emulator.records("networks") == []
+
+
+class TestEmulatorTasks:
+    """Tests for actions and task progress."""
+
+    def test_action_task_completes(self, client: VergeClient) -> None:
+        response = client._request("POST", "vm_actions", json_data={"vm": 3, "action": "poweron"})
+        assert isinstance(response, dict)
+        task = client.tasks.get(response["task"])
+        assert task.is_running
+
+        done = client.tasks.wait(response["task"], poll_interval=0.02, timeout=5)
+        assert done.is_complete
+
+    def test_put_action(self, client: VergeClient) -> None:
+        response = client.vms.action(3, "snapshot")
+        assert response is not None and "task" in response
+
+
+class TestEmulatorFiles:
+    """Tests for chunked uploads and downloads."""
+
+    def test_upload_and_download(
+        self, client: VergeClient, emulator: VergeEmulator, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "disk.img"
+        data = bytes(range(256)) * 3000
+        source.write_bytes(data)
+
+        uploaded = client.files.upload(source)
+
+        assert uploaded.size_bytes == len(data)
+        assert emulator.file_content(uploaded.key) == data
+        assert emulator.requests["PUT files"] > 1
+
+        target = client.files.download(uploaded.key, destination=tmp_path / "copy.img")
+        assert target.read_bytes() == data
+
+
+class TestEmulatorInjection:
+    """Tests for latency, error injection and authentication."""
+
+    def test_latency(self, emulator: VergeEmulator, client: VergeClient) -> None:
+        emulator.latency = 0.02
+        start = time.monotonic()
+        client.vms.list()
+        assert time.monotonic() - start >= 0.02
+
+    def test_scripted_errors_with_rate_limiter(self, emulator: VergeEmulator) -> None:
+        client = emulator.client(rate_limit=RateLimiter(rate=None))
+        emulator.inject_error("^vms$", status=429, times=2, retry_after=0.01)
+
+        assert len(client.vms.list()) == 20
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.stats().throttled == 2
+
+    def test_random_errors(self) -> None:
+        emulator = VergeEmulator(error_rate=1.0, error_status=500, seed=3)
+        with pytest.raises(Exception, match="500|Injected"):
+            emulator.client()
+
+    def test_credentials(self) -> None:
+        emulator = VergeEmulator(credentials={"admin": "secret"})
+        assert emulator.client(password="secret").is_connected
+        with pytest.raises(AuthenticationError):
+            emulator.client(password="wrong")
+
+    def test_session_auth(self) -> None:
+        emulator = VergeEmulator(credentials={"admin": "secret"})
+        client = emulator.client(password="secret", auth_method="session")
+        assert client.vms.list() == []
+        client.disconnect()
+        assert emulator.requests.get("GET vms") == 1
+
+
+class TestEmulatorFrontEnds:
+    """Tests for the async transport and the socket server."""
+
+    def test_async_transport(self, emulator: VergeEmulator) -> None:
+        pytest.importorskip("httpx")
+        emulator.latency = 0.05
+
+        async def scenario() -> float:
+            async with AsyncVergeClient(
+                host="emulator.invalid",
+                username="admin",
+                password="admin",
+                transport=emulator.async_transport(),
+            ) as client:
+                start = time.monotonic()
+                results = await asyncio.gather(*(client.vms.list() for _ in range(10)))
+                assert all(len(vms) == 20 for vms in results)
+                return time.monotonic() - start
+
+        # Latency overlaps: ten requests take far less than ten delays
+        assert asyncio.run(scenario()) < 0.3
+
+    def test_transport_not_supported_with_http2(self, emulator: VergeEmulator) -> None:
+        with pytest.raises(ValueError, match="http2"):
+            emulator.client(http2=True)
+
+    def test_plain_http_server(self, emulator: VergeEmulator) -> None:
+        with emulator.serve() as server:
+            response = requests.get(f"{server.url}/api/v4/vms", params={"limit": 2}, timeout=5)
+        assert response.status_code == 200
+        assert [vm["name"] for vm in response.json()] == ["vm0", "vm1"]
+
+    def test_https_server_with_client(
+        self, emulator: VergeEmulator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # A CA bundle from the environment would override verify_ssl=False
+        monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+        monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+        openssl = shutil.which("openssl")
+        if openssl is None:
+            pytest.skip("openssl not available")
+        cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+        subprocess.run(
+            [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=localhost", "-keyout", str(key), "-out", str(cert)],
+            check=True,
+            capture_output=True,
+        )  # fmt: skip
+
+        with emulator.serve(certfile=str(cert), keyfile=str(key)) as server:
+            client = VergeClient(
+                host=server.host, username="admin", password="admin", verify_ssl=False
+            )
+            assert len(client.vms.list()) == 20
+            client.disconnect()
@@ -1,6 +1,8 @@
 """Tests for filter builder."""
 
-from pyvergeos.filters import Filter, build_filter
+from urllib.parse import quote
+
+from pyvergeos.filters import Filter, build_filter, chunk_in_filters
 
 
 class TestFilter:
@@ -116,3 +118,28 @@ class TestBuildFilter:
     def test_none_values_skipped(self) -> None:
         result = build_filter(status="running", name=None)
         assert result == "status eq 'running'"
+
+
+class TestChunkInFilters:
+    """Tests for chunk_in_filters function."""
+
+    def test_single_chunk(self) -> None:
+        assert list(chunk_in_filters("$key", [1, 2, 3])) == [([1, 2, 3], "$key in (1,2,3)")]
+
+    def test_max_values(self) -> None:
+        chunks = list(chunk_in_filters("$key", range(450), max_values=200))
+        assert [len(values) for values, _ in chunks] == [200, 200, 50]
+        assert [v for values, _ in chunks for v in values] == list(range(450))
+
+    def test_max_length(self) -> None:
+        names = [f"name-{i:04d}" for i in range(300)]
+        chunks = list(chunk_in_filters("name", names, max_values=1000, max_length=500))
+        assert len(chunks) > 1
+        assert all(len(quote(f, safe="")) <= 500 for _, f in chunks)
+        assert [v for values, _ in chunks for v in values] == names
+
+    def test_string_values_quoted(self) -> None:
+        assert list(chunk_in_filters("name", ["a'b"])) == [(["a'b"], "name in ('a''b')")]
+
+    def test_empty(self) -> None:
+        assert list(chunk_in_filters("$key", [])) == []
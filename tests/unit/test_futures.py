@@ -0,0 +1,188 @@
+"""Unit tests for TaskFuture and the shared task watcher."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.emulator import VergeEmulator
+from pyvergeos.exceptions import APIError, NotFoundError, TaskError, TaskTimeoutError
+from pyvergeos.futures import TaskFuture, as_completed, gather
+from pyvergeos.resources.tasks import _DEFAULT_LIST_FIELDS
+
+pytestmark = pytest.mark.emulator(task_duration=0.05)
+
+
+def start_clones(client: VergeClient, count: int) -> list[TaskFuture]:
+    return [client.tasks.future(vm.clone()) for vm in client.vms.list(limit=count)]
+
+
+class TestTaskFuture:
+    """Unit tests for TaskFuture resolution."""
+
+    def test_result_is_finished_task(self, client: VergeClient) -> None:
+        """Test a future made from an action response resolves to the idle task."""
+        vm = client.vms.list(limit=1)[0]
+        response = vm.clone(name="copy")
+
+        future = client.tasks.future(response)
+
+        assert isinstance(future, concurrent.futures.Future)
+        assert future.response == response
+        task = future.result(timeout=5)
+        assert future.done()
+        assert task.key == future.key
+        assert task.is_complete
+
+    def test_accepts_key_and_task(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test futures can be made from a task key or a Task object."""
+        record = emulator.add("tasks", name="backup", status="idle")
+        task = client.tasks.get(record["$key"])
+
+        assert client.tasks.future(record["$key"]).result(timeout=5).key == task.key
+        assert task.future().result(timeout=5).key == task.key
+
+    def test_response_without_task(self, client: VergeClient) -> None:
+        """Test a response that references no task is rejected."""
+        with pytest.raises(ValueError, match="No task"):
+            client.tasks.future({"$key": 1})
+
+    def test_failed_task(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test a failed task raises TaskError, or is returned with raise_on_error=False."""
+        record = emulator.add("tasks", name="sync", status="error", error="Disk full")
+
+        with pytest.raises(TaskError) as exc_info:
+            client.tasks.future(record["$key"]).result(timeout=5)
+        assert exc_info.value.task_id == record["$key"]
+        task = client.tasks.future(record["$key"], raise_on_error=False).result(timeout=5)
+        assert task.has_error
+
+    def test_missing_task(self, client: VergeClient) -> None:
+        """Test a task that does not exist resolves with NotFoundError."""
+        with pytest.raises(NotFoundError):
+            client.tasks.future(9999).result(timeout=5)
+
+    def test_done_callback(self, client: VergeClient) -> None:
+        """Test callbacks run once the task finishes."""
+        finished: list[int] = []
+        future = start_clones(client, 1)[0]
+        future.add_done_callback(lambda f: finished.append(f.result().key))
+
+        future.result(timeout=5)
+        deadline = time.monotonic() + 5
+        while not finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert finished == [future.key]
+
+    def test_cancel_stops_watching(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test a cancelled future is dropped and the watcher thread exits."""
+        record = emulator.add("tasks", name="long", status="running")
+        future = client.tasks.future(record["$key"])
+
+        assert future.cancel()
+        deadline = time.monotonic() + 5
+        while client.tasks.watcher.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert client.tasks.watcher.pending == 0
+        assert future.cancelled()
+
+
+class TestSharedPolling:
+    """Unit tests for the shared polling engine and helpers."""
+
+    def test_transient_poll_failure_retried(self, client: VergeClient) -> None:
+        """Test one failed poll does not fail the watched futures."""
+        get_many = client.tasks.get_many
+        calls: list[int] = []
+
+        def flaky(*args: Any, **kwargs: Any) -> Any:
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIError("Bad gateway", status_code=502)
+            return get_many(*args, **kwargs)
+
+        with patch.object(client.tasks, "get_many", side_effect=flaky):
+            futures = start_clones(client, 3)
+            tasks = gather(futures, timeout=10)
+
+        assert all(task.is_complete for task in tasks)
+        assert len(calls) > 1
+
+    def test_repeated_poll_failures_fail_futures(self, client: VergeClient) -> None:
+        """Test futures fail once transient errors persist past max_failures."""
+        watcher = client.tasks.watcher
+        watcher.poll_interval = watcher.initial_interval = 0.01
+        error = APIError("Bad gateway", status_code=502)
+
+        with patch.object(client.tasks, "get_many", side_effect=error) as get_many:
+            future = start_clones(client, 1)[0]
+            with pytest.raises(APIError, match="Bad gateway"):
+                future.result(timeout=10)
+
+        assert get_many.call_count == watcher.max_failures
+
+    def test_permanent_poll_failure_not_retried(self, client: VergeClient) -> None:
+        """Test errors that are not transient fail the futures at once."""
+        error = APIError("Forbidden", status_code=403)
+
+        with patch.object(client.tasks, "get_many", side_effect=error) as get_many:
+            future = start_clones(client, 1)[0]
+            with pytest.raises(APIError, match="Forbidden"):
+                future.result(timeout=10)
+
+        assert get_many.call_count == 1
+
+    def test_one_poll_covers_all_futures(
+        self, client: VergeClient, emulator: VergeEmulator
+    ) -> None:
+        """Test many futures are polled with list queries, not one request each."""
+        futures = start_clones(client, 20)
+        tasks = gather(futures, timeout=10)
+
+        assert [task.key for task in tasks] == [f.key for f in futures]
+        assert emulator.requests["GET tasks"] < len(futures)
+
+    def test_poll_requests_list_fields(self, client: VergeClient) -> None:
+        """Test the watcher asks for the task list fields, not every field."""
+        with patch.object(client.tasks, "get_many", wraps=client.tasks.get_many) as get_many:
+            gather(start_clones(client, 2), timeout=10)
+
+        assert get_many.call_args.kwargs["fields"] == _DEFAULT_LIST_FIELDS
+
+    def test_as_completed(self, client: VergeClient) -> None:
+        """Test as_completed yields every future once."""
+        futures = start_clones(client, 5)
+
+        done = list(as_completed(futures, timeout=10))
+
+        assert sorted(f.key for f in done) == sorted(f.key for f in futures)
+
+    def test_gather_return_exceptions(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test gather can return failures in place instead of raising."""
+        failed = emulator.add("tasks", name="sync", status="error")
+        futures = [*start_clones(client, 1), client.tasks.future(failed["$key"])]
+
+        with pytest.raises(TaskError):
+            gather(futures, timeout=10)
+        results = gather(futures, timeout=10, return_exceptions=True)
+
+        assert results[0].is_complete
+        assert isinstance(results[1], TaskError)
+
+    def test_gather_timeout(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test gather raises TaskTimeoutError naming the first unfinished task."""
+        record = emulator.add("tasks", name="long", status="running")
+        future = client.tasks.future(record["$key"])
+
+        with pytest.raises(TaskTimeoutError) as exc_info:
+            gather([future], timeout=0.05)
+
+        assert exc_info.value.task_id == record["$key"]
+        future.cancel()
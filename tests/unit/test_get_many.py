@@ -0,0 +1,87 @@
+"""Tests for batched key lookups."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.exceptions import NotFoundError
+from pyvergeos.resources.vms import VM
+
+IN_FILTER = re.compile(r"^\$key in \((.*)\)$")
+
+
+def serve_keys(existing: set[int]) -> Any:
+    """Return a _request side effect answering ``$key in (...)`` queries."""
+
+    def request(method: str, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        match = IN_FILTER.match(params["filter"])
+        assert match is not None
+        keys = [int(k) for k in match.group(1).split(",")]
+        # Server order is unrelated to the requested order
+        return [{"$key": k, "name": f"vm{k}"} for k in sorted(keys) if k in existing]
+
+    return request
+
+
+class TestGetMany:
+    """Tests for ResourceManager.get_many."""
+
+    def test_single_request_in_input_order(self, mock_client: VergeClient) -> None:
+        request = MagicMock(side_effect=serve_keys({1, 2, 3, 4}))
+        mock_client._request = request  # type: ignore[method-assign]
+
+        vms = mock_client.vms.get_many([3, 1, 4, 2])
+
+        assert [vm.key for vm in vms] == [3, 1, 4, 2]
+        assert all(isinstance(vm, VM) for vm in vms)
+        assert request.call_count == 1
+        params = request.call_args.kwargs["params"]
+        assert params["filter"] == "$key in (3,1,4,2)"
+        assert params["limit"] == 4
+        # VMManager's default fields, plus nothing else
+        assert "$key" in params["fields"].split(",")
+        assert "is_snapshot" not in params["filter"]
+
+    def test_chunks_large_key_lists(self, mock_client: VergeClient) -> None:
+        keys = list(range(1000, 1450))
+        request = MagicMock(side_effect=serve_keys(set(keys)))
+        mock_client._request = request  # type: ignore[method-assign]
+
+        tags = mock_client.tags.get_many(reversed(keys))
+
+        assert [t.key for t in tags] == list(reversed(keys))
+        assert request.call_count == 3
+
+    def test_missing_keys_raise(self, mock_client: VergeClient) -> None:
+        mock_client._request = MagicMock(side_effect=serve_keys({1}))  # type: ignore[method-assign]
+        with pytest.raises(NotFoundError, match="keys: 5, 9"):
+            mock_client.tags.get_many([1, 5, 9])
+
+    def test_ignore_missing(self, mock_client: VergeClient) -> None:
+        mock_client._request = MagicMock(side_effect=serve_keys({1, 9}))  # type: ignore[method-assign]
+        tags = mock_client.tags.get_many([9, 5, 1], ignore_missing=True)
+        assert [t.key for t in tags] == [9, 1]
+
+    def test_duplicates_fetched_once(self, mock_client: VergeClient) -> None:
+        request = MagicMock(side_effect=serve_keys({1, 2}))
+        mock_client._request = request  # type: ignore[method-assign]
+        tags = mock_client.tags.get_many([2, 1, 2])
+        assert [t.key for t in tags] == [2, 1, 2]
+        assert request.call_args.kwargs["params"]["filter"] == "$key in (2,1)"
+
+    def test_fields_include_key(self, mock_client: VergeClient) -> None:
+        request = MagicMock(side_effect=serve_keys({1}))
+        mock_client._request = request  # type: ignore[method-assign]
+        mock_client.tags.get_many([1], fields=["name"])
+        assert request.call_args.kwargs["params"]["fields"] == "name,$key"
+
+    def test_empty(self, mock_client: VergeClient) -> None:
+        request = MagicMock()
+        mock_client._request = request  # type: ignore[method-assign]
+        assert mock_client.tags.get_many([]) == []
+        request.assert_not_called()
@@ -0,0 +1,87 @@
+"""Tests for lazy package exports."""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pyvergeos
+import pyvergeos.resources
+
+RESOURCES_INIT = Path(pyvergeos.resources.__file__)
+
+
+def run_python(code: str) -> str:
+    """Run ``code`` in a fresh interpreter and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    """Tests for module-level __getattr__ exports."""
+
+    def test_import_loads_no_resource_modules(self) -> None:
+        out = run_python(
+            "import sys, pyvergeos; "
+            "print(sorted(m for m in sys.modules if m.startswith('pyvergeos.resources')))"
+        )
+        assert out == "[]"
+
+    def test_import_does_not_load_async_client(self) -> None:
+        out = run_python("import sys, pyvergeos; print('pyvergeos.async_client' in sys.modules)")
+        assert out == "False"
+
+    def test_from_import_loads_only_its_module(self) -> None:
+        out = run_python(
+            "import sys; from pyvergeos.resources import BillingManager; "
+            "print(BillingManager.__module__, 'pyvergeos.resources.tenants' in sys.modules)"
+        )
+        assert out == "pyvergeos.resources.billing False"
+
+    def test_package_exports_resolve(self) -> None:
+        for name in pyvergeos.__all__:
+            assert getattr(pyvergeos, name) is not None
+
+    @pytest.mark.parametrize("name", pyvergeos.resources.__all__)
+    def test_resource_exports_resolve(self, name: str) -> None:
+        value = getattr(pyvergeos.resources, name)
+        module = importlib.import_module(
+            f"pyvergeos.resources.{pyvergeos.resources._EXPORTS[name]}"
+        )
+        assert value is getattr(module, name)
+
+    def test_resource_exports_match_type_checking_imports(self) -> None:
+        tree = ast.parse(RESOURCES_INIT.read_text())
+        block = next(node for node in tree.body if isinstance(node, ast.If))
+        imported = {
+            alias.name: node.module.rsplit(".", 1)[-1]
+            for node in block.body
+            if isinstance(node, ast.ImportFrom) and node.module
+            for alias in node.names
+        }
+        assert imported == pyvergeos.resources._EXPORTS
+        assert set(imported) == set(pyvergeos.resources.__all__)
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="NoSuchManager"):
+            pyvergeos.resources.NoSuchManager  # noqa: B018
+        with pytest.raises(AttributeError):
+            pyvergeos.NoSuchThing  # noqa: B018
+
+    def test_submodule_attribute_access(self) -> None:
+        out = run_python(
+            "import pyvergeos; "
+            "print(pyvergeos.resources.groups.__name__, pyvergeos.webhook_receiver.__name__)"
+        )
+        assert out == "pyvergeos.resources.groups pyvergeos.webhook_receiver"
+
+    def test_dir_lists_lazy_names(self) -> None:
+        assert "BillingManager" in dir(pyvergeos.resources)
+        assert "AsyncVergeClient" in dir(pyvergeos)
@@ -0,0 +1,263 @@
+"""Tests for request instrumentation hooks and exporters."""
+
+from __future__ import annotations
+
+import json
+import sys
+import types
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.exceptions import NotFoundError
+from pyvergeos.metrics import (
+    OpenTelemetryHook,
+    RequestEvent,
+    RequestMetrics,
+    endpoint_template,
+)
+from tests.conftest import SYSTEM_INFO, make_response
+
+
+@pytest.fixture
+def events() -> list[RequestEvent]:
+    return []
+
+
+@pytest.fixture
+def client(mock_session: MagicMock, events: list[RequestEvent]) -> VergeClient:
+    mock_session.request.return_value = make_response(200, SYSTEM_INFO)
+    return VergeClient(
+        host="test.example.com", username="admin", password="secret", hooks=[events.append]
+    )
+
+
+def event(endpoint: str = "vms", latency: float = 0.01, **kwargs: Any) -> RequestEvent:
+    return RequestEvent(method="GET", endpoint=endpoint, status_code=200, latency=latency, **kwargs)
+
+
+class TestEndpointTemplate:
+    """Tests for endpoint_template."""
+
+    def test_keys_replaced(self) -> None:
+        assert endpoint_template("vms") == "vms"
+        assert endpoint_template("vms/42") == "vms/{key}"
+        assert endpoint_template("/machine_stats/7?fields=all") == "machine_stats/{key}"
+        assert endpoint_template("files/" + "a1" * 20) == "files/{key}"
+        assert endpoint_template("vm_actions") == "vm_actions"
+
+    def test_action_kept(self) -> None:
+        assert endpoint_template("vms/42?action=poweron") == "vms/{key}?action=poweron"
+        assert endpoint_template("vms/42?action=kill") == "vms/{key}?action=kill"
+        assert endpoint_template("vm_actions?fields=all&action=poweron") == (
+            "vm_actions?action=poweron"
+        )
+
+
+class TestClientHooks:
+    """Tests for VergeClient hooks and middleware."""
+
+    def test_event_per_request(
+        self, client: VergeClient, mock_session: MagicMock, events: list[RequestEvent]
+    ) -> None:
+        body = [{"$key": 1, "name": "vm1"}]
+        mock_session.request.return_value = make_response(200, body)
+        mock_session.request.return_value.request.body = b'{"name": "x"}'
+
+        client._request("GET", "vms/1", params={"fields": "all"})
+
+        assert len(events) == 1
+        e = events[0]
+        assert (e.method, e.endpoint, e.status_code) == ("GET", "vms/{key}", 200)
+        assert e.retries == 0
+        assert e.bytes_received == len(json.dumps(body))
+        assert e.bytes_sent == len(b'{"name": "x"}')
+        assert e.latency >= e.decode_time > 0
+        assert e.error is None and not e.streamed
+
+    def test_error_is_recorded(
+        self, client: VergeClient, mock_session: MagicMock, events: list[RequestEvent]
+    ) -> None:
+        mock_session.request.return_value = make_response(404, {"err": "missing"})
+
+        with pytest.raises(NotFoundError):
+            client._request("GET", "vms/9")
+
+        assert events[0].status_code == 404
+        assert events[0].error == "NotFoundError"
+
+    def test_transport_retries_counted(
+        self, client: VergeClient, mock_session: MagicMock, events: list[RequestEvent]
+    ) -> None:
+        response = make_response(200, [])
+        response.raw.retries.history = ("503", "503")
+        mock_session.request.return_value = response
+
+        client._request("GET", "vms")
+
+        assert events[0].retries == 2
+
+    def test_streamed_request(
+        self, client: VergeClient, mock_session: MagicMock, events: list[RequestEvent]
+    ) -> None:
+        payload = json.dumps([{"$key": i} for i in range(10)]).encode()
+        response = make_response(200)
+        response.iter_content.return_value = iter([payload[:20], payload[20:]])
+        mock_session.request.return_value = response
+
+        assert len(list(client._stream("logs"))) == 10
+
+        assert events[0].streamed
+        assert events[0].bytes_received == len(payload)
+
+    def test_failing_hook_does_not_break_requests(
+        self, client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        def broken(event: RequestEvent) -> None:
+            raise RuntimeError("boom")
+
+        client.add_hook(broken)
+        mock_session.request.return_value = make_response(200, [])
+        assert client._request("GET", "vms") == []
+
+        client.remove_hook(broken)
+        with pytest.raises(ValueError):
+            client.remove_hook(broken)
+
+    def test_no_hooks_no_events(self, mock_client: VergeClient) -> None:
+        assert mock_client._hooks == ()
+
+    def test_middleware_wraps_send(self, client: VergeClient, mock_session: MagicMock) -> None:
+        calls: list[str] = []
+
+        def outer(request: dict[str, Any], send: Any) -> Any:
+            calls.append("outer")
+            request["headers"] = {"X-Job": "nightly"}
+            return send(request)
+
+        def inner(request: dict[str, Any], send: Any) -> Any:
+            calls.append("inner")
+            response = send(request)
+            calls.append(f"status {response.status_code}")
+            return response
+
+        client.add_middleware(outer)
+        client.add_middleware(inner)
+        mock_session.request.return_value = make_response(200, [])
+
+        client._request("GET", "vms")
+
+        assert calls == ["outer", "inner", "status 200"]
+        assert mock_session.request.call_args.kwargs["headers"] == {"X-Job": "nightly"}
+
+
+class TestRequestMetrics:
+    """Tests for RequestMetrics aggregation and Prometheus export."""
+
+    def test_aggregates_per_endpoint(self) -> None:
+        metrics = RequestMetrics(buckets=[0.1, 1.0])
+        metrics(event(latency=0.05, bytes_received=100))
+        metrics(event(latency=0.5, retries=1))
+        metrics(event(latency=5.0, error="VergeTimeoutError"))
+        metrics(event("nodes", latency=0.01))
+
+        vms = next(s for s in metrics.snapshot() if s.endpoint == "vms")
+        assert vms.count == 3
+        assert vms.bucket_counts == [1, 1, 1]
+        assert vms.errors == 1 and vms.retries == 1
+        assert vms.bytes_received == 100
+        assert vms.statuses == {200: 3}
+        assert vms.latency_max == 5.0
+        assert vms.latency_avg == pytest.approx(5.55 / 3)
+        assert [s.endpoint for s in metrics.slowest(2)] == ["vms", "nodes"]
+
+        metrics.reset()
+        assert metrics.snapshot() == []
+
+    def test_prometheus_text(self) -> None:
+        metrics = RequestMetrics(buckets=[0.1, 1.0])
+        metrics(event(latency=0.05))
+        metrics(event(latency=0.5))
+        metrics(RequestEvent("POST", 'odd"name', 500, 2.0))
+
+        text = metrics.to_prometheus()
+
+        labels = 'method="GET",endpoint="vms"'
+        assert "# TYPE pyvergeos_request_duration_seconds histogram" in text
+        assert f'pyvergeos_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'pyvergeos_request_duration_seconds_bucket{{{labels},le="1"}} 2' in text
+        assert f'pyvergeos_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"pyvergeos_request_duration_seconds_count{{{labels}}} 2" in text
+        assert f'pyvergeos_requests_total{{{labels},status="200"}} 2' in text
+        assert 'endpoint="odd\\"name",status="500"' in text
+        assert text.endswith("\n")
+
+
+class FakeSpan:
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        self.name = name
+        self.kwargs = kwargs
+        self.status: Any = None
+        self.end_time: int | None = None
+
+    def set_status(self, status: Any) -> None:
+        self.status = status
+
+    def end(self, end_time: int | None = None) -> None:
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    def start_span(self, name: str, **kwargs: Any) -> FakeSpan:
+        span = FakeSpan(name, **kwargs)
+        self.spans.append(span)
+        return span
+
+
+@pytest.fixture
+def fake_otel(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    trace = types.ModuleType("opentelemetry.trace")
+    trace.SpanKind = types.SimpleNamespace(CLIENT="client")  # type: ignore[attr-defined]
+    trace.StatusCode = types.SimpleNamespace(ERROR="error")  # type: ignore[attr-defined]
+    trace.Status = lambda code: ("status", code)  # type: ignore[attr-defined]
+    trace.get_tracer = lambda name: FakeTracer()  # type: ignore[attr-defined]
+    package = types.ModuleType("opentelemetry")
+    package.trace = trace  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "opentelemetry", package)
+    monkeypatch.setitem(sys.modules, "opentelemetry.trace", trace)
+    return trace
+
+
+class TestOpenTelemetryHook:
+    """Tests for OpenTelemetryHook."""
+
+    def test_span_per_event(self, fake_otel: types.ModuleType) -> None:
+        tracer = FakeTracer()
+        hook = OpenTelemetryHook(tracer=tracer, host="test.example.com")
+
+        hook(event("vms/{key}", latency=0.25, started_at=1_000_000_000, retries=2))
+        hook(RequestEvent("DELETE", "vms/{key}", 409, 0.1))
+
+        ok, failed = tracer.spans
+        assert ok.name == "GET vms/{key}"
+        assert ok.kwargs["kind"] == "client"
+        assert ok.kwargs["start_time"] == 1_000_000_000
+        assert ok.end_time == 1_250_000_000
+        assert ok.kwargs["attributes"]["http.response.status_code"] == 200
+        assert ok.kwargs["attributes"]["pyvergeos.retries"] == 2
+        assert ok.kwargs["attributes"]["server.address"] == "test.example.com"
+        assert ok.status is None
+        assert failed.status == ("status", "error")
+
+    def test_default_tracer(self, fake_otel: types.ModuleType) -> None:
+        assert isinstance(OpenTelemetryHook()._tracer, FakeTracer)
+
+    def test_missing_dependency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "opentelemetry", None)
+        with pytest.raises(ImportError, match="opentelemetry-api"):
+            OpenTelemetryHook()
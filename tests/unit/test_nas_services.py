@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -291,6 +292,50 @@ class TestNASServiceManager:
         assert result == {"task": 126}
 
 
+class TestNASServiceCreate:
+    """Unit tests for deploying a NAS service."""
+
+    @staticmethod
+    def deploying_client(appears_after: int | None) -> MagicMock:
+        """Mock client whose new service is listed after ``appears_after`` lookups."""
+        client = MagicMock()
+        lookups = itertools.count()
+
+        def request(method: str, endpoint: str, **kwargs: Any) -> Any:
+            if endpoint == "vm_recipes":
+                return [{"id": "services"}]
+            if endpoint == "vnets":
+                return [{"$key": 3}]
+            if method == "POST":
+                return {"$key": 9}
+            # The first lookup is the duplicate-name check before deploying
+            found = appears_after is not None and next(lookups) > appears_after
+            return [{"$key": 1, "name": "NAS01"}] if found else []
+
+        client._request.side_effect = request
+        return client
+
+    def test_create_waits_for_service(self) -> None:
+        """Test create returns the service once the recipe has created it."""
+        manager = NASServiceManager(self.deploying_client(appears_after=2))
+
+        with patch("pyvergeos.polling.time.sleep"):
+            service = manager.create("NAS01")
+
+        assert service.name == "NAS01"
+
+    def test_create_timeout(self) -> None:
+        """Test create raises ValueError when the service never appears."""
+        manager = NASServiceManager(self.deploying_client(appears_after=None))
+
+        with (
+            patch("pyvergeos.polling.time.sleep"),
+            patch("pyvergeos.polling.time.monotonic", side_effect=itertools.count(0, 10)),
+            pytest.raises(ValueError, match="may still be creating"),
+        ):
+            manager.create("NAS01")
+
+
 class TestNASServiceCIFSSettings:
     """Tests for CIFS settings operations."""
 
@@ -1,5 +1,6 @@
 """Unit tests for NAS volume browser."""
 
+import itertools
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -273,7 +274,11 @@ class TestNASVolumeFileManager:
             {"$key": "job444"},
         ] + [{"id": "job444", "status": "running"}] * 100  # Always running
 
-        with patch("time.sleep"), pytest.raises(VergeTimeoutError, match="timed out"):
+        with (
+            patch("time.sleep"),
+            patch("time.monotonic", side_effect=itertools.count()),
+            pytest.raises(VergeTimeoutError, match="timed out"),
+        ):
             file_manager.list("/", timeout=5)
 
     def test_list_error_status(self, file_manager, mock_client):
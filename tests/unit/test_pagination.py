@@ -0,0 +1,346 @@
+"""Tests for keyset pagination."""
+
+from __future__ import annotations
+
+import operator
+import re
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.pagination import filter_literal, iter_keyset, iter_offset_pages
+from pyvergeos.resources.drives import DriveManager
+from pyvergeos.resources.logs import Log
+from pyvergeos.resources.machine_stats import MachineStatsManager
+from pyvergeos.resources.task_events import TaskEventManager
+
+OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+CURSOR = re.compile(r"(\$key|timestamp|created) (gt|ge|lt|le) (\d+)")
+
+
+class FakeTable:
+    """Minimal server-side table honoring cursor filters, sort and limit."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.requests: list[dict[str, Any]] = []
+
+    def request(self, method: str, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        self.requests.append(dict(params))
+        rows = self.rows
+        for field, op, value in CURSOR.findall(params.get("filter", "")):
+            rows = [r for r in rows if OPS[op](r[field], int(value))]
+        sort = params["sort"]
+        field = sort.lstrip("-")
+        # Ties are returned in arbitrary (here: reverse key) order
+        rows = sorted(rows, key=lambda r: (r[field], -r["$key"]), reverse=sort.startswith("-"))
+        return rows[: params["limit"]]
+
+
+def fake_client(table: FakeTable) -> MagicMock:
+    client = MagicMock()
+    client._request.side_effect = lambda method, endpoint, params=None: table.request(
+        method, endpoint, params or {}
+    )
+    return client
+
+
+class TestIterKeyset:
+    """Tests for iter_keyset."""
+
+    def test_pages_by_key(self) -> None:
+        table = FakeTable([{"$key": k} for k in range(1, 26)])
+        rows = list(iter_keyset(fake_client(table), "vms", {"filter": "x eq 1"}, page_size=10))
+
+        assert [r["$key"] for r in rows] == list(range(1, 26))
+        assert [p.get("filter") for p in table.requests] == [
+            "(x eq 1)",
+            "(x eq 1) and $key gt 10",
+            "(x eq 1) and $key gt 20",
+        ]
+        assert all(p["sort"] == "$key" and "offset" not in p for p in table.requests)
+
+    def test_exact_multiple_of_page_size(self) -> None:
+        table = FakeTable([{"$key": k} for k in range(1, 21)])
+        rows = list(iter_keyset(fake_client(table), "vms", page_size=10))
+        assert len(rows) == 20
+        assert len(table.requests) == 3
+
+    def test_descending(self) -> None:
+        table = FakeTable([{"$key": k} for k in range(1, 8)])
+        rows = list(iter_keyset(fake_client(table), "vms", page_size=3, descending=True))
+        assert [r["$key"] for r in rows] == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_non_unique_timestamp_cursor(self) -> None:
+        # Five rows share timestamp 100, more than one page's worth
+        timestamps = [50, 100, 100, 100, 100, 100, 150, 150, 200]
+        table = FakeTable([{"$key": i + 1, "timestamp": ts} for i, ts in enumerate(timestamps)])
+
+        rows = list(iter_keyset(fake_client(table), "logs", page_size=3, key_field="timestamp"))
+
+        assert sorted(r["$key"] for r in rows) == list(range(1, 10))
+        assert len(rows) == 9
+        assert [r["timestamp"] for r in rows] == sorted(timestamps)
+
+    def test_adds_cursor_columns_to_fields(self) -> None:
+        table = FakeTable([{"$key": 1, "timestamp": 5}])
+        list(iter_keyset(fake_client(table), "logs", {"fields": "text"}, key_field="timestamp"))
+        assert table.requests[0]["fields"] == "text,$key,timestamp"
+
+    def test_rows_inserted_during_scan_not_duplicated(self) -> None:
+        table = FakeTable([{"$key": k} for k in range(1, 11)])
+        seen = []
+        for row in iter_keyset(fake_client(table), "vms", page_size=4):
+            seen.append(row["$key"])
+            if row["$key"] == 2:
+                # A row deleted before the cursor would shift offsets
+                table.rows = [r for r in table.rows if r["$key"] != 1]
+        assert seen == list(range(1, 11))
+
+    def test_invalid_page_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_keyset(MagicMock(), "vms", page_size=0))
+
+    def test_prefetch_requests_next_page_before_consuming(self) -> None:
+        table = FakeTable([{"$key": k} for k in range(1, 26)])
+        rows = iter_keyset(fake_client(table), "vms", page_size=10, prefetch=True)
+        assert next(rows)["$key"] == 1
+        time.sleep(0.05)
+        assert len(table.requests) == 2
+        assert [r["$key"] for r in rows] == list(range(2, 26))
+        assert len(table.requests) == 3
+
+    def test_prefetch_with_ties(self) -> None:
+        timestamps = [50, 100, 100, 100, 100, 100, 150, 150, 200]
+        table = FakeTable([{"$key": i + 1, "timestamp": ts} for i, ts in enumerate(timestamps)])
+        rows = list(
+            iter_keyset(
+                fake_client(table), "logs", page_size=3, key_field="timestamp", prefetch=True
+            )
+        )
+        assert sorted(r["$key"] for r in rows) == list(range(1, 10))
+
+    def test_filter_literal(self) -> None:
+        assert filter_literal(5) == "5"
+        assert filter_literal(True) == "true"
+        assert filter_literal("it's") == "'it''s'"
+
+
+class TestIterOffsetPages:
+    """Tests for offset pagination with prefetch."""
+
+    @staticmethod
+    def pages(total: int) -> tuple[Callable[[int, int], list[int]], list[int]]:
+        offsets: list[int] = []
+        lock = threading.Lock()
+
+        def fetch(limit: int, offset: int) -> list[int]:
+            with lock:
+                offsets.append(offset)
+            return list(range(total))[offset : offset + limit]
+
+        return fetch, offsets
+
+    def test_sequential(self) -> None:
+        fetch, offsets = self.pages(25)
+        pages = list(iter_offset_pages(fetch, 10))
+        assert [len(p) for p in pages] == [10, 10, 5]
+        assert offsets == [0, 10, 20]
+
+    @pytest.mark.parametrize("total", [0, 5, 10, 25, 40])
+    def test_prefetch_preserves_order(self, total: int) -> None:
+        fetch, offsets = self.pages(total)
+        rows = [row for page in iter_offset_pages(fetch, 10, prefetch=3) for row in page]
+        assert rows == list(range(total))
+        # Requests past the end are bounded by the prefetch depth
+        assert len(offsets) <= total // 10 + 1 + 3
+
+    def test_short_first_page_does_not_prefetch(self) -> None:
+        fetch, offsets = self.pages(5)
+        assert list(iter_offset_pages(fetch, 10, prefetch=4)) == [[0, 1, 2, 3, 4]]
+        assert offsets == [0]
+
+    def test_pages_fetched_concurrently(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(limit: int, offset: int) -> list[int]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return list(range(offset, min(offset + limit, 100)))
+
+        rows = [row for page in iter_offset_pages(fetch, 10, prefetch=4) for row in page]
+        assert rows == list(range(100))
+        assert peak > 1
+
+    def test_bounded_in_flight(self) -> None:
+        fetch, offsets = self.pages(1000)
+        pages = iter_offset_pages(fetch, 10, prefetch=2)
+        next(pages)
+        next(pages)
+        time.sleep(0.05)
+        # Page 0 and 1 consumed, pages 2 and 3 in flight
+        assert sorted(offsets) == [0, 10, 20, 30]
+        pages.close()
+
+    def test_error_propagates(self) -> None:
+        def fetch(limit: int, offset: int) -> list[int]:
+            if offset == 20:
+                raise RuntimeError("boom")
+            return list(range(limit))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(iter_offset_pages(fetch, 10, prefetch=2))
+
+    def test_invalid_prefetch(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_offset_pages(lambda limit, offset: [], prefetch=-1))
+
+
+class TestIterAllKeyset:
+    """Tests for ResourceManager.iter_all(keyset=True)."""
+
+    def test_vms_keyset_keeps_snapshot_filter(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 1}, {"$key": 2}]
+
+        vms = list(mock_client.vms.iter_all(keyset=True, page_size=5, filter="ram gt 1024"))
+
+        assert [vm.key for vm in vms] == [1, 2]
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "((ram gt 1024) and is_snapshot eq false)"
+        assert params["sort"] == "$key"
+        assert params["limit"] == 5
+
+    def test_logs_keyset_uses_timestamp(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 9, "timestamp": 1000, "level": "audit"}
+        ]
+
+        logs = list(mock_client.logs.iter_all(keyset=True, level="audit"))
+
+        assert isinstance(logs[0], Log)
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["sort"] == "timestamp"
+        assert params["filter"] == "(level eq 'audit')"
+        assert "timestamp" in params["fields"].split(",")
+
+    def test_billing_keyset_uses_created(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = []
+        assert list(mock_client.billing.iter_all(keyset=True, since=10)) == []
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["sort"] == "created"
+        assert params["filter"] == "(created ge 10)"
+
+    def test_scoped_manager_keeps_scope(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 1}]
+        events = TaskEventManager(mock_client, task_key=5, owner_key=9)
+
+        list(events.iter_all(keyset=True, table="vms"))
+
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "(task eq 5 and owner eq 9 and table eq 'vms')"
+
+    def test_drives_keyset_scoped_to_machine(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = []
+        vm = MagicMock()
+        vm.get.return_value = 8
+
+        list(DriveManager(mock_client, vm).iter_all(keyset=True, filter="media eq 'disk'"))
+
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "(machine eq 8 and (media eq 'disk'))"
+
+    def test_offset_prefetch(self, mock_client: VergeClient) -> None:
+        rows = [{"$key": k} for k in range(1, 24)]
+
+        def request(method: str, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            return rows[params["offset"] : params["offset"] + params["limit"]]
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        tags = list(mock_client.tags.iter_all(page_size=5, prefetch=3))
+        assert [t.key for t in tags] == list(range(1, 24))
+
+    def test_offset_mode_unchanged(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 1}]
+        list(mock_client.tags.iter_all(page_size=10))
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["offset"] == 0
+        assert "sort" not in params
+
+    def test_machine_stats_iter_history(self, mock_client: VergeClient) -> None:
+        table = FakeTable([{"$key": k, "timestamp": 1000 + k // 2} for k in range(1, 12)])
+        mock_client._request = fake_client(table)._request  # type: ignore[method-assign]
+        stats = MachineStatsManager(mock_client, machine_key=7)
+        points = list(stats.iter_history(page_size=4, long=True))
+
+        assert len(points) == 11
+        assert table.requests[0]["filter"] == "(machine eq 7)"
+        assert table.requests[0]["sort"] == "timestamp"
+
+
+class TestListParity:
+    """Managers whose list() adds implicit filters keep them in every list mode."""
+
+    @pytest.mark.parametrize(
+        ("manager", "implicit"),
+        [
+            ("vms", "is_snapshot eq false"),
+            ("tenants", "is_snapshot eq false"),
+            ("users", "type ne 'site_sync' and type ne 'site_user'"),
+            ("alarms", "(snooze eq 0 or snooze le {$now})"),
+            ("cloud_snapshots", "(expires eq 0 or expires gt 1700000000)"),
+        ],
+    )
+    def test_implicit_filter_in_every_mode(
+        self, mock_client: VergeClient, manager: str, implicit: str
+    ) -> None:
+        filters: list[str] = []
+
+        def request(method: str, endpoint: str, params: dict[str, Any]) -> list[Any]:
+            filters.append(params.get("filter", ""))
+            return []
+
+        def stream(endpoint: str, params: dict[str, Any], **kwargs: Any) -> Iterator[Any]:
+            filters.append(params.get("filter", ""))
+            return iter([])
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        mock_client._stream = MagicMock(side_effect=stream)  # type: ignore[method-assign]
+        resource = getattr(mock_client, manager)
+
+        with patch("time.time", return_value=1_700_000_000):
+            resource.list()
+            list(resource.iter_all())
+            list(resource.iter_all(keyset=True))
+            list(resource.stream())
+            resource.list_columnar(fields=["$key"])
+            list(resource.iter_columnar(["$key"], keyset=True))
+
+        assert len(filters) == 6
+        assert all(implicit in f for f in filters), filters
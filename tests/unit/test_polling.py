@@ -0,0 +1,289 @@
+"""Unit tests for the adaptive status poller."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.exceptions import (
+    NotFoundError,
+    TaskError,
+    VergeTimeoutError,
+    WaitCancelledError,
+)
+from pyvergeos.polling import (
+    Poller,
+    poll_stats,
+    poll_until,
+    reset_poll_stats,
+    wait_until_found,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_stats() -> Iterator[None]:
+    reset_poll_stats()
+    yield
+    reset_poll_stats()
+
+
+@pytest.fixture
+def sleep() -> Iterator[MagicMock]:
+    with patch("pyvergeos.polling.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestPoller:
+    """Unit tests for Poller."""
+
+    def test_first_probe_is_immediate(self, sleep: MagicMock) -> None:
+        """Test an operation that is already done is returned without sleeping."""
+        result = poll_until(
+            lambda: "done",
+            lambda state: state == "done",
+            timeout=10,
+            poll_interval=2,
+            on_timeout=lambda _: VergeTimeoutError("timeout"),
+        )
+
+        assert result == "done"
+        sleep.assert_not_called()
+
+    def test_backoff_grows_to_poll_interval(self, sleep: MagicMock) -> None:
+        """Test waits double from the initial interval and stop at poll_interval."""
+        states = iter(["running"] * 6 + ["done"])
+
+        poll_until(
+            lambda: next(states),
+            lambda state: state == "done",
+            timeout=None,
+            poll_interval=1,
+            on_timeout=lambda _: VergeTimeoutError("timeout"),
+        )
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert len(delays) == 6
+        for delay, expected in zip(delays, [0.1, 0.2, 0.4, 0.8, 1, 1]):
+            assert expected * 0.8 <= delay <= expected * 1.2
+
+    def test_no_jitter(self, sleep: MagicMock) -> None:
+        """Test jitter=0 gives the exact backoff schedule."""
+        poller = Poller(None, 0.5, initial_interval=0.1, multiplier=3, jitter=0)
+        for polls in poller:
+            if polls == 4:
+                poller.finish()
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, pytest.approx(0.3), 0.5]
+
+    def test_timeout_raises_with_last_state(self, sleep: MagicMock) -> None:
+        """Test the deadline uses the monotonic clock and on_timeout sees the last state."""
+        states = iter(["queued", "running", "running"])
+
+        with (
+            patch("pyvergeos.polling.time.monotonic", side_effect=itertools.count(0, 4)),
+            pytest.raises(VergeTimeoutError, match="last: running"),
+        ):
+            poll_until(
+                lambda: next(states),
+                lambda state: state == "done",
+                timeout=10,
+                poll_interval=5,
+                on_timeout=lambda state: VergeTimeoutError(f"last: {state}"),
+            )
+
+        assert poll_stats().timed_out == 1
+
+    def test_sleep_never_passes_deadline(self, sleep: MagicMock) -> None:
+        """Test the last wait is cut short at the deadline."""
+        clock = iter([0.0, 9.5, 11.0])
+
+        with patch("pyvergeos.polling.time.monotonic", side_effect=lambda: next(clock)):
+            poller = Poller(10, 5, initial_interval=5, jitter=0)
+            assert list(poller) == [1, 2]
+
+        assert [c.args[0] for c in sleep.call_args_list] == [pytest.approx(0.5)]
+
+    def test_zero_timeout_probes_once(self, sleep: MagicMock) -> None:
+        """Test timeout=0 gives up after a single probe instead of waiting forever."""
+        probes = []
+
+        with pytest.raises(VergeTimeoutError):
+            poll_until(
+                lambda: probes.append(1),
+                lambda _: False,
+                timeout=0,
+                poll_interval=1,
+                on_timeout=lambda _: VergeTimeoutError("timeout"),
+            )
+
+        assert len(probes) == 1
+        sleep.assert_not_called()
+        assert poll_stats().timed_out == 1
+
+    def test_cancel_stops_wait(self) -> None:
+        """Test setting the cancel event ends the wait with WaitCancelledError."""
+        cancel = threading.Event()
+        probes = []
+
+        def probe() -> str:
+            probes.append(1)
+            if len(probes) == 2:
+                cancel.set()
+            return "running"
+
+        with pytest.raises(WaitCancelledError):
+            poll_until(
+                probe,
+                lambda state: state == "done",
+                timeout=None,
+                poll_interval=60,
+                cancel=cancel,
+                on_timeout=lambda _: VergeTimeoutError("timeout"),
+            )
+
+        assert len(probes) == 2
+        assert poll_stats().cancelled == 1
+
+    def test_stats_count_failed_probe(self, sleep: MagicMock) -> None:
+        """Test a wait ended by a probe that raises is counted as failed."""
+
+        def probe() -> str:
+            raise NotFoundError("gone")
+
+        with pytest.raises(NotFoundError):
+            poll_until(
+                probe,
+                lambda state: state == "done",
+                timeout=10,
+                poll_interval=1,
+                on_timeout=lambda _: VergeTimeoutError("timeout"),
+            )
+
+        stats = poll_stats()
+        assert (stats.failed, stats.completed, stats.polls) == (1, 0, 1)
+
+    def test_stats_count_polls_per_wait(self, sleep: MagicMock) -> None:
+        """Test completed waits report their probe count and duration."""
+        for runs in (1, 3):
+            states = iter(["running"] * (runs - 1) + ["done"])
+            poll_until(
+                lambda states=states: next(states),
+                lambda state: state == "done",
+                timeout=10,
+                poll_interval=1,
+                on_timeout=lambda _: VergeTimeoutError("timeout"),
+            )
+
+        stats = poll_stats()
+        assert stats.completed == 2
+        assert stats.polls == 4
+        assert stats.polls_per_wait == 2.0
+        assert stats.wait_time_avg >= 0
+
+
+class TestWaitUntilFound:
+    """Unit tests for wait_until_found."""
+
+    def test_returns_once_visible(self, sleep: MagicMock) -> None:
+        """Test lookups are retried with backoff until the object appears."""
+        results: list[Any] = [NotFoundError("missing"), NotFoundError("missing"), "created"]
+
+        def lookup() -> str:
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return str(result)
+
+        assert wait_until_found(lookup) == "created"
+        assert sleep.call_count == 2
+        assert sleep.call_args_list[0].args[0] <= 0.12
+
+    def test_raises_last_error(self, sleep: MagicMock) -> None:
+        """Test the last NotFoundError is raised once the timeout passes."""
+
+        def lookup() -> str:
+            raise NotFoundError("storage tier 1 not found")
+
+        with (
+            patch("pyvergeos.polling.time.monotonic", side_effect=itertools.count(0, 4)),
+            pytest.raises(NotFoundError, match="storage tier 1"),
+        ):
+            wait_until_found(lookup, timeout=10)
+
+
+class TestTaskWaitPolling:
+    """Unit tests for task waits built on the poller."""
+
+    def test_task_wait_cancel(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        """Test TaskManager.wait stops when its cancel event is set."""
+        mock_session.request.return_value.json.return_value = {"$key": 1, "status": "running"}
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(WaitCancelledError):
+            mock_client.tasks.wait(1, cancel=cancel)
+
+    def test_task_wait_records_stats(
+        self, mock_client: VergeClient, mock_session: MagicMock, sleep: MagicMock
+    ) -> None:
+        """Test a task wait is counted once with all of its polls."""
+        mock_session.request.return_value.json.side_effect = [
+            {"$key": 1, "status": "running"},
+            {"$key": 1, "status": "idle"},
+        ]
+
+        mock_client.tasks.wait(1)
+
+        assert poll_stats().completed_polls == 2
+        assert sleep.call_count == 1
+
+    def test_task_wait_error_counted_as_failed(
+        self, mock_client: VergeClient, mock_session: MagicMock, sleep: MagicMock
+    ) -> None:
+        """Test a task wait that raises TaskError is counted as failed."""
+        mock_session.request.return_value.json.return_value = {
+            "$key": 1,
+            "status": "error",
+            "error": "Disk full",
+        }
+
+        with pytest.raises(TaskError):
+            mock_client.tasks.wait(1)
+
+        stats = poll_stats()
+        assert (stats.failed, stats.completed) == (1, 0)
+
+    def test_wait_many_first_counts_abandoned_wait(
+        self, mock_client: VergeClient, mock_session: MagicMock, sleep: MagicMock
+    ) -> None:
+        """Test return_when='first' counts the wait on the tasks left running."""
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "running"},
+        ]
+
+        mock_client.tasks.wait_many([1, 2], return_when="first")
+
+        stats = poll_stats()
+        assert (stats.abandoned, stats.polls) == (1, 1)
+
+    def test_wait_many_each_counts_abandoned_iterator(
+        self, mock_client: VergeClient, mock_session: MagicMock, sleep: MagicMock
+    ) -> None:
+        """Test closing a return_when='each' iterator early counts as abandoned."""
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "running"},
+        ]
+
+        waiter = mock_client.tasks.wait_many([1, 2], return_when="each")
+        assert next(waiter).key == 1
+        waiter.close()
+
+        assert poll_stats().abandoned == 1
@@ -261,7 +261,7 @@ class TestVNetQueryManager:
         assert "params" not in body
         assert body["query"] == "arp"
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_wait_complete(
         self,
         mock_sleep: MagicMock,
@@ -273,8 +273,8 @@ class TestVNetQueryManager:
         result = manager.wait(1, timeout=10)
         assert result.is_complete
 
-    @patch("pyvergeos.resources.queries.time.sleep")
-    @patch("pyvergeos.resources.queries.time.monotonic")
+    @patch("pyvergeos.polling.time.sleep")
+    @patch("pyvergeos.polling.time.monotonic")
     def test_wait_timeout(
         self,
         mock_monotonic: MagicMock,
@@ -288,7 +288,20 @@ class TestVNetQueryManager:
         with pytest.raises(VergeTimeoutError, match="did not complete"):
             manager.wait(2, timeout=10)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
+    def test_wait_zero_timeout_checks_once(
+        self,
+        mock_sleep: MagicMock,
+        mock_client: MagicMock,
+        sample_running_query: dict[str, Any],
+    ) -> None:
+        mock_client._request.return_value = sample_running_query
+        manager = VNetQueryManager(mock_client, parent_key=10)
+        with pytest.raises(VergeTimeoutError, match="did not complete"):
+            manager.wait(2, timeout=0)
+        assert mock_client._request.call_count == 1
+
+    @patch("pyvergeos.polling.time.sleep")
     def test_wait_error_returns(
         self,
         mock_sleep: MagicMock,
@@ -300,7 +313,7 @@ class TestVNetQueryManager:
         result = manager.wait(3, timeout=10)
         assert result.is_error
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_run_creates_and_waits(
         self,
         mock_sleep: MagicMock,
@@ -314,7 +327,7 @@ class TestVNetQueryManager:
 
     # Convenience method tests
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_ping(
         self,
         mock_sleep: MagicMock,
@@ -326,7 +339,7 @@ class TestVNetQueryManager:
         result = manager.ping("8.8.8.8")
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_dns(
         self,
         mock_sleep: MagicMock,
@@ -338,7 +351,7 @@ class TestVNetQueryManager:
         result = manager.dns("example.com")
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_traceroute(
         self,
         mock_sleep: MagicMock,
@@ -350,7 +363,7 @@ class TestVNetQueryManager:
         result = manager.traceroute("8.8.8.8")
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_arp(
         self,
         mock_sleep: MagicMock,
@@ -362,7 +375,7 @@ class TestVNetQueryManager:
         result = manager.arp()
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_firewall(
         self,
         mock_sleep: MagicMock,
@@ -374,7 +387,7 @@ class TestVNetQueryManager:
         result = manager.firewall()
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_trace(
         self,
         mock_sleep: MagicMock,
@@ -400,7 +413,7 @@ class TestNodeQueryManager:
         assert manager._endpoint == "node_queries"
         assert manager._parent_field == "node"
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_smartctl(
         self,
         mock_sleep: MagicMock,
@@ -412,7 +425,7 @@ class TestNodeQueryManager:
         result = manager.smartctl("/dev/sda")
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_lsblk(
         self,
         mock_sleep: MagicMock,
@@ -424,7 +437,7 @@ class TestNodeQueryManager:
         result = manager.lsblk()
         assert isinstance(result, QueryResult)
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_dmidecode(
         self,
         mock_sleep: MagicMock,
@@ -450,7 +463,7 @@ class TestServiceContainerQueryManager:
         assert manager._endpoint == "service_container_queries"
         assert manager._parent_field == "service_container"
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_ping(
         self,
         mock_sleep: MagicMock,
@@ -476,7 +489,7 @@ class TestTenantNodeQueryManager:
         assert manager._endpoint == "tenant_node_queries"
         assert manager._parent_field == "tenant_node"
 
-    @patch("pyvergeos.resources.queries.time.sleep")
+    @patch("pyvergeos.polling.time.sleep")
     def test_dns(
         self,
         mock_sleep: MagicMock,
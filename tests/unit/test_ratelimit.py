@@ -0,0 +1,206 @@
+"""Tests for the client-wide rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.exceptions import APIError
+from pyvergeos.ratelimit import RateLimiter
+from pyvergeos.transport import parse_retry_after
+from tests.conftest import SYSTEM_INFO, make_response
+
+
+def limited_client(mock_session: MagicMock, limiter: RateLimiter | bool = True) -> VergeClient:
+    mock_session.request.return_value = make_response(200, SYSTEM_INFO)
+    return VergeClient(
+        host="test.example.com", username="admin", password="secret", rate_limit=limiter
+    )
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_additive_increase(self) -> None:
+        limiter = RateLimiter(rate=None, max_concurrency=8, latency_tolerance=None)
+        limiter._limit = 2.0
+        for _ in range(4):
+            limiter.record(200, 0.01)
+        assert 3.0 <= limiter.concurrency_limit < 4.0
+
+    def test_multiplicative_decrease(self) -> None:
+        limiter = RateLimiter(rate=None, max_concurrency=16, min_concurrency=2)
+        limiter.record(429, 0.01)
+        assert limiter.concurrency_limit == 8.0
+        # A burst of throttled responses shrinks the window once
+        limiter.record(503, 0.01)
+        assert limiter.concurrency_limit == 8.0
+
+        limiter._last_decrease = 0.0
+        for _ in range(5):
+            limiter._last_decrease = 0.0
+            limiter.record(429, 0.01)
+        assert limiter.concurrency_limit == 2.0
+        assert limiter.stats().throttled == 7
+
+    def test_latency_inflation_decreases(self) -> None:
+        limiter = RateLimiter(rate=None, max_concurrency=16, latency_tolerance=2.0)
+        for _ in range(30):
+            limiter.record(200, 0.01)
+        assert limiter.concurrency_limit == 16.0
+        for _ in range(30):
+            limiter.record(200, 0.2)
+        assert limiter.concurrency_limit < 16.0
+        assert limiter.stats().latency_backoffs >= 1
+
+    def test_latency_ignored_when_disabled(self) -> None:
+        limiter = RateLimiter(rate=None, latency_tolerance=None)
+        for latency in [0.01] * 30 + [1.0] * 30:
+            limiter.record(200, latency)
+        assert limiter.concurrency_limit == limiter.max_concurrency
+
+    def test_concurrency_window_blocks(self) -> None:
+        limiter = RateLimiter(rate=None, max_concurrency=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal active, peak
+            with limiter.slot():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert limiter.stats().in_flight == 0
+        assert limiter.stats().requests == 8
+
+    def test_token_bucket_caps_rate(self) -> None:
+        limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+        for _ in range(11):
+            with limiter.slot():
+                pass
+        # One burst token, then 10 more at 100/s
+        assert time.monotonic() - start >= 0.09
+
+    def test_retry_after_pauses_all_requests(self) -> None:
+        limiter = RateLimiter(rate=None)
+        limiter.record(429, 0.01, {"Retry-After": "0.1"})
+        assert limiter.stats().paused_until > time.time()
+
+        start = time.monotonic()
+        with limiter.slot():
+            pass
+        assert time.monotonic() - start >= 0.09
+
+    def test_slot_records_response(self) -> None:
+        limiter = RateLimiter(rate=None)
+        with limiter.slot() as slot:
+            slot.record(make_response(503, headers={"Retry-After": "0"}))
+        assert limiter.stats().throttled == 1
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(min_concurrency=4, max_concurrency=2)
+        with pytest.raises(ValueError):
+            RateLimiter(decrease_factor=1.0)
+        with pytest.raises(ValueError):
+            RateLimiter(latency_tolerance=0.5)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("-3") == 0.0
+
+    def test_http_date(self) -> None:
+        now = 1_700_000_000.0
+        assert parse_retry_after("Tue, 14 Nov 2023 22:13:40 GMT", now=now) == 20.0
+
+    def test_invalid(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestClientRateLimit:
+    """Tests for VergeClient(rate_limit=...)."""
+
+    def test_disabled_by_default(self, mock_client: VergeClient) -> None:
+        assert mock_client.rate_limiter is None
+
+    def test_requests_pass_through_limiter(self, mock_session: MagicMock) -> None:
+        client = limited_client(mock_session)
+        assert client.rate_limiter is not None
+        mock_session.request.return_value = make_response(200, [{"$key": 1}])
+
+        client._request("GET", "vms")
+
+        assert client.rate_limiter.stats().requests == 1
+
+    def test_throttle_codes_removed_from_transport_retries(self, mock_session: MagicMock) -> None:
+        client = limited_client(mock_session)
+        assert client._connection is not None
+        codes = client._connection.retry_status_codes
+        assert 500 in codes
+        assert 429 not in codes and 503 not in codes
+
+    def test_throttled_request_is_retried(self, mock_session: MagicMock) -> None:
+        limiter = RateLimiter(rate=None)
+        client = limited_client(mock_session, limiter)
+        mock_session.request.side_effect = [
+            make_response(429, {}, {"Retry-After": "0.05"}),
+            make_response(200, [{"$key": 1}]),
+        ]
+
+        start = time.monotonic()
+        assert client._request("GET", "vms") == [{"$key": 1}]
+
+        assert time.monotonic() - start >= 0.04
+        assert limiter.stats().throttled == 1
+        assert limiter.stats().requests == 2
+        assert limiter.concurrency_limit < limiter.max_concurrency
+
+    def test_retries_exhausted(self, mock_session: MagicMock) -> None:
+        client = VergeClient(
+            host="test.example.com",
+            username="admin",
+            password="secret",
+            rate_limit=RateLimiter(rate=None),
+            retry_total=2,
+            retry_backoff_factor=0,
+            auto_connect=False,
+        )
+        mock_session.request.return_value = make_response(200, SYSTEM_INFO)
+        client.connect()
+        mock_session.request.return_value = make_response(503, {"err": "busy"})
+
+        with pytest.raises(APIError):
+            client._request("GET", "vms")
+        assert mock_session.request.call_count == 4  # validate + 1 try + 2 retries
+
+    def test_from_env(self, mock_session: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_session.request.return_value = make_response(200, SYSTEM_INFO)
+        monkeypatch.setenv("VERGE_HOST", "test.example.com")
+        monkeypatch.setenv("VERGE_TOKEN", "t")
+        monkeypatch.setenv("VERGE_RATE_LIMIT", "true")
+        assert VergeClient.from_env().rate_limiter is not None
@@ -0,0 +1,237 @@
+"""Tests for compact read-only records."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import pickle
+import pkgutil
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import pyvergeos.resources
+from pyvergeos import VergeClient
+from pyvergeos.records import CompactRecord, compact_factory, record_class
+from pyvergeos.resources.base import ResourceManager
+from pyvergeos.resources.billing import BillingRecord
+from pyvergeos.resources.dns import DNSZoneManager
+from pyvergeos.resources.logs import Log
+from pyvergeos.resources.machine_stats import MachineStatsHistory, MachineStatsManager
+from pyvergeos.resources.routing import NetworkRoutingManager
+from pyvergeos.resources.vms import VM
+
+LOG_ROW = {
+    "$key": 7,
+    "level": "audit",
+    "text": "User admin logged in",
+    "timestamp": 1_700_000_000_000_000,
+    "user": "admin",
+    "object_type": "vm",
+}
+
+
+# Every manager that overrides list() rather than inheriting it
+LIST_OVERRIDES = sorted(
+    {
+        cls
+        for info in pkgutil.iter_modules(pyvergeos.resources.__path__)
+        for _, cls in inspect.getmembers(
+            importlib.import_module(f"pyvergeos.resources.{info.name}"), inspect.isclass
+        )
+        if issubclass(cls, ResourceManager) and "list" in vars(cls)
+    },
+    key=lambda cls: cls.__qualname__,
+)
+
+
+def _parent() -> MagicMock:
+    """Stand-in for the parent object a scoped manager is built from."""
+    parent = MagicMock(key=1)
+    parent.get.return_value = 1
+    return parent
+
+
+def _build_manager(cls: type[ResourceManager[Any]], client: VergeClient) -> Any:
+    if cls is DNSZoneManager:
+        return cls(client, network=_parent())
+    kwargs: dict[str, Any] = {}
+    for name, param in list(inspect.signature(cls.__init__).parameters.items())[2:]:
+        if param.default is not inspect.Parameter.empty or param.kind in (
+            param.VAR_POSITIONAL,
+            param.VAR_KEYWORD,
+        ):
+            continue
+        if param.annotation == "NetworkRoutingManager":
+            kwargs[name] = NetworkRoutingManager(client, _parent())
+        elif param.annotation == "int":
+            kwargs[name] = 1
+        else:
+            kwargs[name] = _parent()
+    return cls(client, **kwargs)
+
+
+class TestCompactRecord:
+    """Tests for compact record classes."""
+
+    def test_model_properties(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+        log = Log(LOG_ROW, MagicMock())
+
+        assert record.level_display == log.level_display == "Audit"
+        assert record.object_type_display == "VM"
+        assert record.created_at == log.created_at
+        assert record.key == 7
+        assert repr(record) == repr(log)
+
+    def test_mapping_access(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+
+        assert record["text"] == "User admin logged in"
+        assert record.get("missing", "x") == "x"
+        assert "level" in record
+        assert "missing" not in record
+        assert list(record) == list(LOG_ROW)
+        assert dict(record.items()) == LOG_ROW
+        assert record.to_dict() == LOG_ROW
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_equals_dict(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+        assert record == LOG_ROW
+        assert record == Log(LOG_ROW, MagicMock())
+        assert record != {**LOG_ROW, "level": "error"}
+
+    def test_read_only(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+        with pytest.raises(TypeError):
+            record["level"] = "error"  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            record.level = "error"  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            record.__dict__  # noqa: B018
+
+    def test_no_manager(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+        with pytest.raises(AttributeError, match="refresh"):
+            record.refresh()
+
+    def test_class_shared_per_layout(self) -> None:
+        make = compact_factory(Log)
+        a = make(LOG_ROW)
+        b = make({**LOG_ROW, "$key": 8})
+        c = make({"$key": 9})
+
+        assert type(a) is type(b)
+        assert type(c) is not type(a)
+        assert type(a) is record_class(Log, tuple(LOG_ROW))
+        assert type(a).__name__ == "CompactLog"
+        assert isinstance(a, CompactRecord)
+
+    def test_missing_key(self) -> None:
+        record = compact_factory(Log)({"text": "x"})
+        with pytest.raises(ValueError):
+            record.key  # noqa: B018
+
+    def test_pickles_as_dict(self) -> None:
+        record = compact_factory(Log)(LOG_ROW)
+        assert pickle.loads(pickle.dumps(record)) == LOG_ROW
+
+
+class TestCompactManagers:
+    """Tests for compact=True on manager list and iterate calls."""
+
+    def test_logs_list(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = [LOG_ROW]
+
+        logs = mock_client.logs.list(compact=True)
+
+        assert type(logs[0]).__name__ == "CompactLog"
+        assert logs[0].level_display == "Audit"
+
+    def test_billing_list(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 1, "created": 100}]
+
+        records = mock_client.billing.list(compact=True)
+
+        assert not isinstance(records[0], BillingRecord)
+        assert records[0].key == 1
+
+    def test_task_events_list(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 3, "event": "poweron"}]
+        events = mock_client.task_events.list(compact=True)
+        assert events[0]["event"] == "poweron"
+
+    def test_default_unchanged(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value.json.return_value = [LOG_ROW]
+        assert isinstance(mock_client.logs.list()[0], Log)
+
+    def test_iter_all(self, mock_client: VergeClient) -> None:
+        rows = [{**LOG_ROW, "$key": k} for k in range(1, 8)]
+
+        def request(method: str, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            offset = params.get("offset", 0)
+            return rows[offset : offset + params.get("limit", len(rows))]
+
+        mock_client._request = MagicMock(side_effect=request)  # type: ignore[method-assign]
+        logs = list(mock_client.logs.iter_all(page_size=3, compact=True))
+
+        assert [log.key for log in logs] == list(range(1, 8))
+        assert all(type(log).__name__ == "CompactLog" for log in logs)
+        # The manager itself still builds full models
+        assert isinstance(mock_client.logs.list()[0], Log)
+
+    def test_iter_all_without_compact_list(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value.json.return_value = [{"$key": 4, "name": "web"}]
+
+        vms = list(mock_client.vms.iter_all(compact=True))
+
+        assert type(vms[0]).__name__ == "CompactVM"
+        assert vms[0].name == "web"
+        params = mock_session.request.call_args.kwargs["params"]
+        assert "compact" not in params["filter"]
+        assert "is_snapshot eq false" in params["filter"]
+        assert isinstance(mock_client.vms.list()[0], VM)
+
+    def test_compact_rejects_child_includes(self, mock_client: VergeClient) -> None:
+        mock_client._request = MagicMock(return_value=[])  # type: ignore[method-assign]
+
+        with pytest.raises(ValueError, match="include_vms"):
+            mock_client.cloud_snapshots.list(compact=True, include_vms=True)
+        with pytest.raises(ValueError, match="include_periods"):
+            mock_client.snapshot_profiles.list(compact=True, include_periods=True)
+        mock_client._request.assert_not_called()
+
+    def test_machine_stats_history(self, mock_client: VergeClient) -> None:
+        mock_client._request = MagicMock(  # type: ignore[method-assign]
+            return_value=[{"machine": 7, "timestamp": 1_700_000_000, "total_cpu": 42}]
+        )
+        stats = MachineStatsManager(mock_client, machine_key=7)
+
+        points = stats.history_short(compact=True)
+
+        assert not isinstance(points[0], MachineStatsHistory)
+        assert points[0].total_cpu == 42
+        assert points[0].timestamp_epoch == 1_700_000_000
+
+
+class TestCompactListParity:
+    """Every list() override honors compact=True instead of filtering on it."""
+
+    @pytest.mark.parametrize("cls", LIST_OVERRIDES, ids=lambda cls: cls.__name__)
+    def test_list_compact(self, mock_client: VergeClient, cls: type[ResourceManager[Any]]) -> None:
+        manager = _build_manager(cls, mock_client)
+        mock_client._request = MagicMock(  # type: ignore[method-assign]
+            return_value=[{"$key": 1, "name": "x"}]
+        )
+
+        records = manager.list(compact=True)
+
+        assert records
+        assert all(isinstance(record, CompactRecord) for record in records)
+        for call in mock_client._request.call_args_list:
+            assert "compact" not in str(call.kwargs.get("params", ""))
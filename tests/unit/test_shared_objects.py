@@ -148,10 +148,11 @@ class TestSharedObjectManager:
 
     def test_create_shared_object(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
         """Test creating a shared object."""
-        # Responses: VM get, snapshot create, shared object create, get shared object
+        # Responses: VM get, snapshot create, snapshot check, shared object create, get
         mock_session.request.return_value.json.side_effect = [
             {"$key": 100, "name": "template-vm", "machine": 200},  # GET vm
             {"$key": 50, "name": "share-template-vm-12345"},  # POST snapshot
+            {"$key": 50, "snap_machine": 500},  # GET snapshot readiness
             {"$key": 1, "name": "template-vm"},  # POST shared_objects
             [{"$key": 1, "name": "template-vm", "recipient": 10}],  # GET shared_objects
         ]
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import itertools
 from datetime import datetime, timezone
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from pyvergeos import VergeClient
-from pyvergeos.exceptions import NotFoundError
+from pyvergeos.exceptions import NotFoundError, TaskError, TaskTimeoutError
 from pyvergeos.resources.snapshots import VMSnapshot, VMSnapshotManager
 from pyvergeos.resources.vms import VM
 
@@ -204,6 +205,88 @@ class TestVMSnapshotManager:
         body = call_args.kwargs.get("json", {})
         assert body["params"]["name"] == "CustomName"
 
+    def test_restore_power_on_waits_for_clone_task(
+        self, mock_client: VergeClient, mock_session: MagicMock, vm: VM
+    ) -> None:
+        """Test power on is sent only after the clone task has finished."""
+        mock_session.request.return_value.json.side_effect = [
+            {"$key": 1, "name": "Daily", "snap_machine": 999},
+            [{"$key": 888, "name": "snap_vm", "machine": 999, "is_snapshot": True}],
+            {"$key": 101, "task": 7},  # clone action
+            {"$key": 7, "status": "idle"},  # GET tasks/7
+            {},  # power on action
+        ]
+        mock_session.request.reset_mock()
+
+        vm.snapshots.restore(1, power_on=True)
+
+        calls = [(c.kwargs["method"], c.kwargs["url"]) for c in mock_session.request.call_args_list]
+        assert calls[-2][0] == "GET" and calls[-2][1].endswith("tasks/7")
+        power_on = mock_session.request.call_args_list[-1].kwargs
+        assert power_on["json"] == {"vm": 101, "action": "poweron"}
+
+    def test_restore_power_on_task_failure(
+        self, mock_client: VergeClient, mock_session: MagicMock, vm: VM
+    ) -> None:
+        """Test a failed restore task raises instead of powering on."""
+        mock_session.request.return_value.json.side_effect = [
+            {"$key": 1, "name": "Daily", "snap_machine": 999},
+            [{"$key": 888, "name": "snap_vm", "machine": 999, "is_snapshot": True}],
+            {"task": 7},  # restore action
+            {"$key": 7, "status": "error", "error": "restore failed"},
+        ]
+
+        with pytest.raises(TaskError, match="restore failed"):
+            vm.snapshots.restore(1, replace_original=True, power_on=True)
+
+        methods = [c.kwargs["method"] for c in mock_session.request.call_args_list]
+        assert methods.count("POST") == 1
+
+    def test_restore_power_on_without_task(
+        self, mock_client: VergeClient, mock_session: MagicMock, vm: VM
+    ) -> None:
+        """Test a restore without a task powers on once the machine is idle."""
+        mock_session.request.return_value.json.side_effect = [
+            {"$key": 1, "name": "Daily", "snap_machine": 999},
+            [{"$key": 888, "name": "snap_vm", "machine": 999, "is_snapshot": True}],
+            {"$key": 888},  # restore action
+            {"$key": 100, "status": "importing"},  # GET vms/100
+            {"$key": 100, "status": "stopped"},  # GET vms/100
+            {},  # power on action
+        ]
+        mock_session.request.reset_mock()
+
+        with patch("pyvergeos.polling.time.sleep"):
+            result = vm.snapshots.restore(1, replace_original=True, power_on=True)
+
+        assert result == {"$key": 888}
+        polls = mock_session.request.call_args_list[-3:-1]
+        assert all(c.kwargs["url"].endswith("vms/100") for c in polls)
+        assert "machine#status#status" in polls[0].kwargs["params"]["fields"]
+        power_on = mock_session.request.call_args_list[-1].kwargs
+        assert power_on["json"] == {"vm": 100, "action": "poweron"}
+
+    def test_restore_power_on_timeout(
+        self, mock_client: VergeClient, mock_session: MagicMock, vm: VM
+    ) -> None:
+        """Test the restore timeout is passed to the task wait."""
+        mock_session.request.return_value.json.side_effect = [
+            {"$key": 1, "name": "Daily", "snap_machine": 999},
+            [{"$key": 888, "name": "snap_vm", "machine": 999, "is_snapshot": True}],
+            {"task": 7},  # restore action
+            {"$key": 7, "status": "running"},  # GET tasks/7
+        ]
+
+        with (
+            patch("pyvergeos.polling.time.monotonic", side_effect=itertools.count(0, 30)),
+            patch("pyvergeos.polling.time.sleep"),
+            pytest.raises(TaskTimeoutError, match="within 20 seconds"),
+        ):
+            vm.snapshots.restore(1, replace_original=True, power_on=True, timeout=20)
+
+        methods = [c.kwargs["method"] for c in mock_session.request.call_args_list]
+        assert methods.count("POST") == 1
+
 
 class TestVMSnapshot:
     """Unit tests for VMSnapshot object."""
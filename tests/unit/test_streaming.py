@@ -0,0 +1,128 @@
+"""Tests for streaming list responses."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pyvergeos import VergeClient
+from pyvergeos.exceptions import NotConnectedError, NotFoundError, VergeConnectionError
+from pyvergeos.resources.billing import BillingRecord
+from pyvergeos.resources.logs import Log
+from pyvergeos.resources.rules import NetworkRuleManager
+from pyvergeos.resources.task_events import TaskEventManager
+from tests.conftest import stream_response
+
+
+class TestClientStream:
+    """Tests for VergeClient._stream."""
+
+    def test_streams_elements(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        rows = [{"$key": i} for i in range(20)]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+
+        assert list(mock_client._stream("vms", params={"limit": 20})) == rows
+
+        call = mock_session.request.call_args
+        assert call.kwargs["stream"] is True
+        assert call.kwargs["params"] == {"limit": 20}
+        mock_session.request.return_value.close.assert_called_once()
+
+    def test_error_response_raises(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = stream_response(b'{"err": "nope"}', status_code=404)
+        mock_session.request.return_value.json.return_value = {"err": "nope"}
+        with pytest.raises(NotFoundError, match="nope"):
+            list(mock_client._stream("vms"))
+
+    def test_no_content(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = stream_response(b"", status_code=204)
+        assert list(mock_client._stream("vms")) == []
+
+    def test_connection_error_mapped(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        response = stream_response(b"[1, 2")
+        response.iter_content.side_effect = requests.exceptions.ChunkedEncodingError("reset")
+        mock_session.request.return_value = response
+        with pytest.raises(VergeConnectionError):
+            list(mock_client._stream("logs"))
+        response.close.assert_called_once()
+
+    def test_not_connected(self) -> None:
+        client = VergeClient(host="test.example.com", token="t", auto_connect=False)
+        with pytest.raises(NotConnectedError):
+            list(client._stream("vms"))
+
+    def test_early_stop_closes_response(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        rows = [{"$key": i} for i in range(100)]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+        items = mock_client._stream("vms")
+        assert next(items) == {"$key": 0}
+        items.close()
+        mock_session.request.return_value.close.assert_called_once()
+
+
+class TestManagerStream:
+    """Tests for ResourceManager.stream and its overrides."""
+
+    def test_base_stream(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        rows = [{"$key": 1, "name": "n1"}, {"$key": 2, "name": "n2"}]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+
+        tags = list(mock_client.tags.stream(name="n1", fields=["$key", "name"], sort="name"))
+
+        assert [t.key for t in tags] == [1, 2]
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params == {"filter": "name eq 'n1'", "fields": "$key,name", "sort": "name"}
+
+    def test_logs_stream_uses_log_filters(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        rows: list[dict[str, Any]] = [{"$key": i, "level": "audit"} for i in range(5)]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+
+        logs = list(mock_client.logs.stream(level="audit", user="admin"))
+
+        assert all(isinstance(log, Log) for log in logs)
+        assert len(logs) == 5
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "level eq 'audit' and user ct 'admin'"
+        assert params["sort"] == "-timestamp"
+        assert "limit" not in params
+
+    def test_scoped_manager_stream(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        rows = [{"$key": 1, "event": "poweron"}]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+        events = TaskEventManager(mock_client, owner_key=9)
+
+        assert [e.key for e in events.stream(event="poweron")] == [1]
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "owner eq 9 and event eq 'poweron'"
+
+    def test_stream_adds_scope_to_filter(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = stream_response(b"[]")
+        network = MagicMock(key=3)
+
+        list(NetworkRuleManager(mock_client, network).stream(filter="enabled eq true"))
+
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "vnet eq 3 and (enabled eq true)"
+
+    def test_billing_stream(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        rows = [{"$key": i, "created": 1700000000 + i} for i in range(3)]
+        mock_session.request.return_value = stream_response(json.dumps(rows).encode())
+
+        records = list(mock_client.billing.stream(since=1700000000))
+
+        assert all(isinstance(r, BillingRecord) for r in records)
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["filter"] == "created ge 1700000000"
+        assert params["sort"] == "-created"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -547,7 +548,7 @@ class TestTaskManagerWait:
             {"$key": 1, "name": "Task", "status": "idle"},
         ]
 
-        with patch("pyvergeos.resources.tasks.time.sleep"):
+        with patch("pyvergeos.polling.time.sleep"):
             task = mock_client.tasks.wait(1, poll_interval=1)
 
         assert task.is_complete is True
@@ -561,11 +562,11 @@ class TestTaskManagerWait:
         }
 
         with (
-            patch("pyvergeos.resources.tasks.time.sleep"),
-            patch("pyvergeos.resources.tasks.time.time") as mock_time,
+            patch("pyvergeos.polling.time.sleep"),
+            patch("pyvergeos.polling.time.monotonic") as mock_time,
         ):
             # Simulate time passing beyond timeout
-            mock_time.side_effect = [0, 0, 10]  # Start, first check, timeout check
+            mock_time.side_effect = [0, 10]  # Start, timeout check
             with pytest.raises(TaskTimeoutError) as exc_info:
                 mock_client.tasks.wait(1, timeout=5)
 
@@ -608,7 +609,7 @@ class TestTaskManagerWait:
             {"$key": 1, "status": "idle"},
         ]
 
-        with patch("pyvergeos.resources.tasks.time.sleep"):
+        with patch("pyvergeos.polling.time.sleep"):
             task = mock_client.tasks.wait(1, timeout=0, poll_interval=1)
 
         assert task.is_complete is True
@@ -628,6 +629,135 @@ class TestTaskManagerWait:
         assert completed.is_complete is True
 
 
+class TestTaskManagerWaitMany:
+    """Unit tests for TaskManager.wait_many."""
+
+    def test_wait_many_polls_all_tasks_in_one_request(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test each poll fetches every pending task with one in-filter query."""
+        mock_session.request.reset_mock()
+        mock_session.request.return_value.json.side_effect = [
+            [
+                {"$key": 1, "status": "running"},
+                {"$key": 2, "status": "idle"},
+                {"$key": 3, "status": "running"},
+            ],
+            [{"$key": 1, "status": "idle"}, {"$key": 3, "status": "running"}],
+            [{"$key": 3, "status": "idle"}],
+        ]
+
+        with patch("pyvergeos.polling.time.sleep") as sleep:
+            tasks = mock_client.tasks.wait_many([3, 1, 2, 1], poll_interval=1)
+
+        assert [task.key for task in tasks] == [3, 1, 2]
+        assert sleep.call_count == 2
+        filters = [c.kwargs["params"]["filter"] for c in mock_session.request.call_args_list]
+        assert filters == ["$key in (3,1,2)", "$key in (3,1)", "$key in (3)"]
+
+    def test_wait_many_each_yields_as_tasks_finish(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test return_when='each' yields tasks in completion order."""
+        mock_session.request.reset_mock()
+        mock_session.request.return_value.json.side_effect = [
+            [{"$key": 1, "status": "running"}, {"$key": 2, "status": "idle"}],
+            [{"$key": 1, "status": "idle"}],
+        ]
+
+        with patch("pyvergeos.polling.time.sleep"):
+            waiter = mock_client.tasks.wait_many([1, 2], return_when="each")
+            assert mock_session.request.call_count == 0
+            assert next(waiter).key == 2
+            assert mock_session.request.call_count == 1
+            assert [task.key for task in waiter] == [1]
+
+    def test_wait_many_first_returns_first_finished(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test return_when='first' stops at the first poll that finds a finished task."""
+        mock_session.request.reset_mock()
+        mock_session.request.return_value.json.side_effect = [
+            [{"$key": 1, "status": "running"}, {"$key": 2, "status": "running"}],
+            [{"$key": 1, "status": "idle"}, {"$key": 2, "status": "running"}],
+        ]
+
+        with patch("pyvergeos.polling.time.sleep"):
+            tasks = mock_client.tasks.wait_many([1, 2], return_when="first")
+
+        assert [task.key for task in tasks] == [1]
+        assert mock_session.request.call_count == 2
+
+    def test_wait_many_raises_task_error(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test a failed task raises TaskError after clean ones are yielded."""
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "error", "error": "Disk full"},
+        ]
+
+        waiter = mock_client.tasks.wait_many([1, 2], return_when="each")
+        assert next(waiter).key == 1
+        with pytest.raises(TaskError, match="Disk full") as exc_info:
+            next(waiter)
+
+        assert exc_info.value.task_id == 2
+
+    def test_wait_many_first_raises_when_a_task_fails_in_the_same_poll(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test return_when='first' raises when one task finishes and another fails together."""
+        mock_session.request.reset_mock()
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "error", "error": "Disk full"},
+        ]
+
+        with pytest.raises(TaskError, match="Disk full") as exc_info:
+            mock_client.tasks.wait_many([1, 2], return_when="first")
+
+        assert exc_info.value.task_id == 2
+        assert mock_session.request.call_count == 1
+
+    def test_wait_many_collects_errors(
+        self, mock_client: VergeClient, mock_session: MagicMock
+    ) -> None:
+        """Test raise_on_error=False returns failed tasks with the others."""
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "error"},
+        ]
+
+        tasks = mock_client.tasks.wait_many([1, 2], raise_on_error=False)
+
+        assert [task.has_error for task in tasks] == [False, True]
+
+    def test_wait_many_timeout(self, mock_client: VergeClient, mock_session: MagicMock) -> None:
+        """Test tasks still running after the timeout raise TaskTimeoutError."""
+        mock_session.request.return_value.json.return_value = [
+            {"$key": 1, "status": "idle"},
+            {"$key": 2, "status": "running"},
+        ]
+
+        clock = itertools.count(0, 10)
+        with (
+            patch("pyvergeos.polling.time.sleep"),
+            patch("pyvergeos.polling.time.monotonic", side_effect=clock),
+            pytest.raises(TaskTimeoutError, match="1 of 2 tasks") as exc_info,
+        ):
+            mock_client.tasks.wait_many([1, 2], timeout=5)
+
+        assert exc_info.value.task_id == 2
+
+    def test_wait_many_empty_and_invalid(self, mock_client: VergeClient) -> None:
+        """Test no keys returns nothing and unknown conditions are rejected."""
+        assert mock_client.tasks.wait_many([]) == []
+        assert mock_client.tasks.wait_many([], return_when="first") == []
+        with pytest.raises(ValueError, match="return_when"):
+            mock_client.tasks.wait_many([1], return_when="any")  # type: ignore[call-overload]
+
+
 # =============================================================================
 # TaskManager Tests - Cancel Operation
 # =============================================================================
@@ -356,10 +356,12 @@ class TestSharedObjectManager:
         # The create method now:
         # 1. Gets VM to get machine key
         # 2. Creates machine snapshot
-        # 3. Creates shared object
-        # 4. Gets the created shared object
+        # 3. Waits for the snapshot to be ready
+        # 4. Creates shared object
+        # 5. Gets the created shared object
         mock_client._request.side_effect = [
             {"$key": "99"},  # Create snapshot response
+            {"$key": 99, "snap_machine": 500},  # Snapshot readiness check
             {"$key": "42"},  # Create shared object response
             [{"$key": 42, "name": "VM Template", "recipient": 123}],  # Get response
         ]
@@ -379,8 +381,12 @@ class TestSharedObjectManager:
         assert snapshot_call[0][1] == "machine_snapshots"
         assert snapshot_call[1]["json_data"]["machine"] == 789
 
+        # Verify the snapshot was checked before sharing
+        ready_call = mock_client._request.call_args_list[1]
+        assert ready_call[0] == ("GET", "machine_snapshots/99")
+
         # Verify shared object POST was called with correct body
-        shared_call = mock_client._request.call_args_list[1]
+        shared_call = mock_client._request.call_args_list[2]
         assert shared_call[0][0] == "POST"
         assert shared_call[0][1] == "shared_objects"
         assert shared_call[1]["json_data"]["recipient"] == 123
@@ -392,6 +398,7 @@ class TestSharedObjectManager:
         mock_client = MagicMock()
         mock_client._request.side_effect = [
             {"$key": "99"},  # Create snapshot response
+            {"$key": 99, "snap_machine": 500},  # Snapshot readiness check
             {"$key": "42"},  # Create shared object response
             [{"$key": 42, "name": "My VM", "recipient": 123}],  # Get response
         ]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -584,32 +585,53 @@ class TestTenantNodeManager:
         mock_tenant: MagicMock,
         sample_node_data: dict[str, Any],
     ) -> None:
-        """Test create fallback when POST doesn't return key."""
+        """Test create fallback looks the node up by name when POST doesn't return key."""
         mock_client._request.side_effect = [
             {},  # POST response without key
             [sample_node_data],  # List response
         ]
         manager = TenantNodeManager(mock_client, mock_tenant)
 
-        node = manager.create()
+        node = manager.create(name="node1")
 
         assert node.name == "node1"
+        list_call = mock_client._request.call_args_list[1]
+        assert "name eq 'node1'" in list_call[1]["params"]["filter"]
 
-    def test_create_node_failure(
+    def test_create_node_without_key_or_name(
         self,
         mock_client: MagicMock,
         mock_tenant: MagicMock,
     ) -> None:
-        """Test create when node creation fails."""
-        mock_client._request.side_effect = [
-            {},  # POST response without key
-            [],  # Empty list response
-        ]
+        """Test create does not guess which node is new without a key or name."""
+        mock_client._request.return_value = {}
         manager = TenantNodeManager(mock_client, mock_tenant)
 
-        with pytest.raises(APIError, match="Failed to create tenant node"):
+        with pytest.raises(APIError, match="no \\$key"):
             manager.create()
 
+        assert mock_client._request.call_count == 1
+
+    def test_create_node_failure(
+        self,
+        mock_client: MagicMock,
+        mock_tenant: MagicMock,
+    ) -> None:
+        """Test create when the node never shows up."""
+        mock_client._request.side_effect = lambda method, *args, **kwargs: (
+            {} if method == "POST" else []  # POST response without key, then empty lists
+        )
+        manager = TenantNodeManager(mock_client, mock_tenant)
+
+        with (
+            patch("pyvergeos.polling.time.sleep"),
+            patch("pyvergeos.polling.time.monotonic", side_effect=itertools.count(0, 4)),
+            pytest.raises(APIError, match="Failed to create tenant node"),
+        ):
+            manager.create(name="node9")
+
+        assert mock_client._request.call_count == 4
+
     def test_update_node(
         self,
         mock_client: MagicMock,
@@ -0,0 +1,233 @@
+"""Tests for the httpx-based HTTP/2 transport."""
+
+from __future__ import annotations
+
+import email.utils
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyvergeos import VergeClient
+from pyvergeos.connection import PoolStats, VergeConnection
+from pyvergeos.exceptions import NotFoundError, VergeConnectionError, VergeTimeoutError
+from pyvergeos.transport import HTTPXResponse, HTTPXSession, retry_delay
+from tests.conftest import SYSTEM_INFO
+
+httpx = pytest.importorskip("httpx")
+
+
+def api_handler(request: Any) -> Any:
+    """Minimal VergeOS API stand-in."""
+    path = request.url.path
+    if path == "/api/v4/system":
+        return httpx.Response(200, json=SYSTEM_INFO)
+    if path == "/api/v4/vms/1":
+        return httpx.Response(200, json={"$key": 1, "name": "vm1"})
+    if path == "/api/v4/vms":
+        return httpx.Response(200, json=[{"$key": 1, "name": "vm1"}])
+    return httpx.Response(404, json={"err": "not found"})
+
+
+@pytest.fixture
+def http2_client() -> Any:
+    """VergeClient using the HTTP/2 transport over a mock httpx transport."""
+    with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(api_handler)):
+        client = VergeClient(
+            host="test.example.com",
+            username="admin",
+            password="secret",
+            http2=True,
+        )
+    yield client
+    client.disconnect()
+
+
+class TestRetryDelay:
+    """Tests for retry_delay."""
+
+    def test_first_retry_is_immediate(self) -> None:
+        assert retry_delay(1, 1.0) == 0.0
+
+    def test_exponential_backoff(self) -> None:
+        assert retry_delay(2, 1.0) == 2.0
+        assert retry_delay(3, 0.5) == 2.0
+
+    def test_retry_after_header(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        assert retry_delay(3, 1.0, response) == 7.0
+
+    def test_retry_after_http_date(self) -> None:
+        when = email.utils.formatdate(time.time() + 30, usegmt=True)
+        response = httpx.Response(503, headers={"Retry-After": when})
+        assert 28 <= retry_delay(1, 1.0, response) <= 30
+
+    def test_invalid_retry_after_falls_back(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "soon"})
+        assert retry_delay(2, 1.0, response) == 2.0
+
+
+class TestHTTPXSession:
+    """Tests for HTTPXSession."""
+
+    def test_request_returns_requests_compatible_response(self) -> None:
+        session = HTTPXSession(transport=httpx.MockTransport(api_handler))
+        response = session.get("https://h/api/v4/vms/1")
+
+        assert isinstance(response, HTTPXResponse)
+        assert response.status_code == 200
+        assert response.json() == {"$key": 1, "name": "vm1"}
+        assert json.loads(response.content) == {"$key": 1, "name": "vm1"}
+        assert response.text
+        session.close()
+
+    def test_headers_are_shared_with_client(self) -> None:
+        seen: list[str] = []
+
+        def handler(request: Any) -> Any:
+            seen.append(request.headers.get("Authorization", ""))
+            return httpx.Response(204)
+
+        session = HTTPXSession(transport=httpx.MockTransport(handler))
+        session.headers.update({"Authorization": "Bearer abc"})
+        session.request(method="DELETE", url="https://h/api/v4/vms/1")
+        assert seen == ["Bearer abc"]
+
+    def test_put_sends_raw_data(self) -> None:
+        bodies: list[bytes] = []
+
+        def handler(request: Any) -> Any:
+            bodies.append(request.content)
+            return httpx.Response(200)
+
+        session = HTTPXSession(transport=httpx.MockTransport(handler))
+        session.put("https://h/files/1?filepos=0", data=b"\x00\x01")
+        assert bodies == [b"\x00\x01"]
+
+    def test_stream_iter_content(self) -> None:
+        payload = b"x" * 1000
+        session = HTTPXSession(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, content=payload))
+        )
+        response = session.get("https://h/files/1?download=1", stream=True)
+        chunks = list(response.iter_content(chunk_size=256))
+        assert b"".join(chunks) == payload
+        assert max(len(c) for c in chunks) <= 256
+
+    def test_retries_transient_status(self) -> None:
+        calls: list[int] = []
+
+        def handler(request: Any) -> Any:
+            calls.append(1)
+            if len(calls) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        session = HTTPXSession(transport=httpx.MockTransport(handler), retry_backoff_factor=0)
+        assert session.get("https://h/x").json() == {"ok": True}
+        assert len(calls) == 2
+
+    def test_retries_exhausted_returns_last_response(self) -> None:
+        session = HTTPXSession(
+            transport=httpx.MockTransport(lambda r: httpx.Response(503)),
+            retry_total=1,
+            retry_backoff_factor=0,
+        )
+        assert session.get("https://h/x").status_code == 503
+
+    def test_pool_stats_counts_requests(self) -> None:
+        session = HTTPXSession(transport=httpx.MockTransport(api_handler))
+        session.get("https://h/api/v4/vms")
+        session.get("https://h/api/v4/vms/1")
+        stats = session.pool_stats()
+        assert stats.requests == 2
+        assert stats.connections_in_use == 0
+
+    def test_pool_stats_reads_httpcore_pool(self) -> None:
+        """The connection counts depend on this private httpx attribute path."""
+        session = HTTPXSession(http2=False)
+        try:
+            assert isinstance(session._transport._pool.connections, list)
+            assert session.pool_stats() == PoolStats()
+        finally:
+            session.close()
+
+    def test_timeout_translated(self) -> None:
+        def handler(request: Any) -> Any:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        session = HTTPXSession(transport=httpx.MockTransport(handler))
+        with pytest.raises(requests.exceptions.Timeout):
+            session.get("https://h/x")
+
+    def test_connect_error_translated(self) -> None:
+        def handler(request: Any) -> Any:
+            raise httpx.ConnectError("refused", request=request)
+
+        session = HTTPXSession(transport=httpx.MockTransport(handler))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get("https://h/x")
+
+
+class TestVergeConnectionHTTP2:
+    """Tests for the http2 option on VergeConnection."""
+
+    def test_http2_creates_httpx_session(self) -> None:
+        pytest.importorskip("h2")
+        conn = VergeConnection(host="test.example.com", http2=True)
+        assert isinstance(conn._session, HTTPXSession)
+        conn.disconnect()
+
+    def test_default_uses_requests(self) -> None:
+        conn = VergeConnection(host="test.example.com")
+        assert isinstance(conn._session, requests.Session)
+
+
+class TestVergeClientHTTP2:
+    """End-to-end tests of VergeClient over the HTTP/2 transport."""
+
+    def test_connect(self, http2_client: VergeClient) -> None:
+        assert http2_client.is_connected
+        assert http2_client.version == "4.12.0"
+        assert http2_client._connection is not None
+        assert isinstance(http2_client._connection._session, HTTPXSession)
+
+    def test_managers_work(self, http2_client: VergeClient) -> None:
+        vm = http2_client.vms.get(1)
+        assert vm.name == "vm1"
+        assert [v.key for v in http2_client.vms.list()] == [1]
+
+    def test_error_mapping(self, http2_client: VergeClient) -> None:
+        with pytest.raises(NotFoundError):
+            http2_client._request("GET", "nope/1")
+
+    def test_transport_errors_mapped(self, http2_client: VergeClient) -> None:
+        assert http2_client._connection is not None
+        session = http2_client._connection._session
+        assert isinstance(session, HTTPXSession)
+
+        def timeout(request: Any) -> Any:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        session._client._transport = httpx.MockTransport(timeout)
+        with pytest.raises(VergeTimeoutError):
+            http2_client._request("GET", "vms")
+
+        def refused(request: Any) -> Any:
+            raise httpx.ConnectError("refused", request=request)
+
+        session._client._transport = httpx.MockTransport(refused)
+        with pytest.raises(VergeConnectionError):
+            http2_client._request("GET", "vms")
+
+    def test_from_env_http2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("VERGE_HOST", "test.example.com")
+        monkeypatch.setenv("VERGE_TOKEN", "t")
+        monkeypatch.setenv("VERGE_HTTP2", "true")
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(api_handler)):
+            client = VergeClient.from_env()
+        assert client._http2 is True
+        client.disconnect()
@@ -0,0 +1,216 @@
+"""Unit tests for the task event webhook receiver."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from pyvergeos import VergeClient
+from pyvergeos.emulator import VergeEmulator
+from pyvergeos.exceptions import TaskTimeoutError, WaitCancelledError
+from pyvergeos.webhook_receiver import TaskEventReceiver, task_keys_of
+
+TOKEN = "secret-token"
+
+
+pytestmark = pytest.mark.emulator(vms=0)
+
+
+@pytest.fixture
+def receiver(client: VergeClient) -> Iterator[TaskEventReceiver]:
+    with TaskEventReceiver(client, "127.0.0.1", token=TOKEN, fallback_interval=60) as receiver:
+        yield receiver
+
+
+def push(receiver: TaskEventReceiver, payload: Any, token: str = TOKEN) -> int:
+    """Post an event to the receiver the way a VergeOS webhook would."""
+    request = urllib.request.Request(
+        receiver.url,
+        data=json.dumps(payload).encode(),
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return int(response.status)
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def finish(emulator: VergeEmulator, key: int, status: str = "idle") -> None:
+    emulator.add("tasks", **{"$key": key, "name": "job", "status": status})
+
+
+def task_polls(emulator: VergeEmulator) -> int:
+    return emulator.requests.get("GET tasks", 0)
+
+
+def wait_for_poll(emulator: VergeEmulator, after: int) -> None:
+    """Wait until the watcher has polled task status since ``after`` polls."""
+    deadline = time.monotonic() + 5
+    while task_polls(emulator) <= after and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestTaskKeysOf:
+    """Unit tests for task_keys_of."""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"task": 12},
+            {"task": "tasks/12"},
+            {"task": {"$key": 12}},
+            {"table": "tasks", "$key": 12},
+            [{"task": 12}],
+        ],
+    )
+    def test_payload_shapes(self, payload: Any) -> None:
+        """Test the supported ways an event names a task."""
+        assert task_keys_of(payload) == [12]
+
+    @pytest.mark.parametrize("payload", [None, "text", {"text": "hello"}, {"task": "x"}])
+    def test_no_task(self, payload: Any) -> None:
+        """Test payloads without a task key return None."""
+        assert task_keys_of(payload) is None
+
+
+class TestRegistration:
+    """Unit tests for registering the receiver with VergeOS."""
+
+    def test_registers_webhook_task_and_triggers(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test starting creates a bearer webhook, a send task and one trigger per event."""
+        webhook = emulator.records("webhook_urls")[0]
+        assert webhook["url"] == receiver.url
+        assert webhook["authorization_type"] == "bearer"
+        assert webhook["authorization_value"] == TOKEN
+
+        task = next(t for t in emulator.records("tasks") if t["$key"] == receiver.task_key)
+        assert task["action"] == "send"
+        assert task["owner"] == f"webhook_urls/{receiver.webhook_key}"
+
+        triggers = emulator.records("task_events")
+        assert sorted(t["event"] for t in triggers) == ["complete", "error"]
+        assert all(t["task"] == receiver.task_key and t["table"] == "tasks" for t in triggers)
+        assert client.tasks.receiver is receiver
+
+    def test_triggers_exclude_own_task(
+        self, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test the triggers skip the send task, so deliveries do not loop."""
+        for trigger in emulator.records("task_events"):
+            assert trigger["table_event_filters"] == {"$key": {"ne": receiver.task_key}}
+
+    def test_close_unregisters(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test closing removes what was registered and restores polling."""
+        receiver = TaskEventReceiver(client, "127.0.0.1").start()
+        task_key = receiver.task_key
+
+        receiver.close()
+
+        assert emulator.records("webhook_urls") == []
+        assert emulator.records("task_events") == []
+        assert all(t["$key"] != task_key for t in emulator.records("tasks"))
+        assert client.tasks.receiver is None
+        assert client.tasks.watcher.poll_interval == 2
+        assert not receiver.running
+
+    def test_without_register(self, client: VergeClient, emulator: VergeEmulator) -> None:
+        """Test register=False only serves the endpoint."""
+        with TaskEventReceiver(client, "127.0.0.1", register=False) as receiver:
+            assert receiver.webhook_key is None
+            assert client.tasks.receiver is receiver
+
+        assert emulator.records("webhook_urls") == []
+
+
+class TestPushedEvents:
+    """Unit tests for resolving waits from pushed events."""
+
+    def test_event_resolves_future(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test a push resolves a future long before the fallback poll."""
+        record = emulator.add("tasks", name="clone", status="running")
+        polls = task_polls(emulator)
+        future = client.tasks.future(record["$key"])
+        wait_for_poll(emulator, polls)
+
+        finish(emulator, record["$key"])
+        assert push(receiver, {"task": record["$key"]}) == 204
+
+        assert future.result(timeout=5).is_complete
+        assert receiver.received == 1
+
+    def test_event_resolves_wait(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test tasks.wait returns as soon as its task event arrives."""
+        record = emulator.add("tasks", name="clone", status="running")
+        polls = task_polls(emulator)
+
+        def complete() -> None:
+            wait_for_poll(emulator, polls)
+            finish(emulator, record["$key"])
+            push(receiver, {"table": "tasks", "$key": record["$key"]})
+
+        pusher = threading.Thread(target=complete)
+        pusher.start()
+        start = time.monotonic()
+        task = client.tasks.wait(record["$key"], timeout=30)
+        pusher.join()
+
+        assert task.is_complete
+        assert time.monotonic() - start < 5
+        assert task_polls(emulator) == polls + 2
+
+    def test_unrelated_event_does_not_poll(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test events for tasks nobody waits on are ignored."""
+        record = emulator.add("tasks", name="clone", status="running")
+        polls = task_polls(emulator)
+        future = client.tasks.future(record["$key"])
+        wait_for_poll(emulator, polls)
+
+        push(receiver, {"task": 9999})
+        time.sleep(0.1)
+
+        assert task_polls(emulator) == polls + 1
+        future.cancel()
+
+    def test_own_task_event_ignored(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test an event about the receiver's send task does not wake the watcher."""
+        assert receiver.handle_event({"task": receiver.task_key}) is False
+        assert receiver.received == 1
+
+    def test_rejects_wrong_token(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test events without the bearer token are refused."""
+        assert push(receiver, {"task": 1}, token="wrong") == 401
+        assert receiver.received == 0
+
+    def test_wait_timeout_and_cancel(
+        self, client: VergeClient, emulator: VergeEmulator, receiver: TaskEventReceiver
+    ) -> None:
+        """Test pushed waits still honour timeout and cancel."""
+        record = emulator.add("tasks", name="long", status="running")
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(TaskTimeoutError):
+            client.tasks.wait(record["$key"], timeout=0.2)
+        with pytest.raises(WaitCancelledError):
+            client.tasks.wait(record["$key"], cancel=cancel)